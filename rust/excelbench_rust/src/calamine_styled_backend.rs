@@ -1,7 +1,8 @@
 use pyo3::exceptions::{PyIOError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
+use pyo3::types::{PyBytes, PyDict, PyList};
 
+use std::borrow::Cow;
 use std::collections::HashMap;
 use std::fs::File;
 use std::io::BufReader;
@@ -19,21 +20,11 @@ use quick_xml::Reader as XmlReader;
 use zip::ZipArchive;
 
 use crate::ooxml_util;
-use crate::util::{a1_to_row_col, cell_blank, cell_with_value, parse_iso_date, parse_iso_datetime};
-
-fn map_error_value(err_str: &str) -> &'static str {
-    let e = err_str.to_ascii_uppercase();
-    match e.as_str() {
-        "DIV0" | "DIV/0" | "#DIV/0!" => "#DIV/0!",
-        "NA" | "#N/A" => "#N/A",
-        "VALUE" | "#VALUE!" => "#VALUE!",
-        "REF" | "#REF!" => "#REF!",
-        "NAME" | "#NAME?" => "#NAME?",
-        "NUM" | "#NUM!" => "#NUM!",
-        "NULL" | "#NULL!" => "#NULL!",
-        _ => "#ERROR!",
-    }
-}
+use crate::util::{
+    a1_to_row_col, cell_blank, data_to_py, intern_str, map_error_value, parse_iso_date,
+    parse_iso_datetime, pod_bytes, resolve_bounds, used_bounds, COL_BLANK, COL_BOOLEAN, COL_DATE,
+    COL_DATETIME, COL_ERROR, COL_FORMULA, COL_NUMBER, COL_STRING,
+};
 
 fn map_error_formula(formula: &str) -> Option<&'static str> {
     // Must match ERROR_FORMULA_MAP in openpyxl_adapter.py.
@@ -133,50 +124,51 @@ fn strip_excel_padding(raw: f64) -> f64 {
     (raw * 10000.0).round() / 10000.0
 }
 
-fn data_to_py(py: Python<'_>, value: &Data) -> PyResult<PyObject> {
+/// Columnar counterpart of `data_to_py()`: (type code, f64 value, string payload).
+fn data_to_columnar(value: &Data) -> (u8, f64, Option<Cow<'_, str>>) {
     match value {
-        Data::Empty => cell_blank(py),
-        Data::String(s) => cell_with_value(py, "string", s.clone()),
-        Data::Float(f) => cell_with_value(py, "number", *f),
-        Data::Int(i) => cell_with_value(py, "number", *i as f64),
-        Data::Bool(b) => cell_with_value(py, "boolean", *b),
+        Data::Empty => (COL_BLANK, f64::NAN, None),
+        Data::String(s) => (COL_STRING, f64::NAN, Some(Cow::Borrowed(s.as_str()))),
+        Data::Float(f) => (COL_NUMBER, *f, None),
+        Data::Int(i) => (COL_NUMBER, *i as f64, None),
+        Data::Bool(b) => (COL_BOOLEAN, if *b { 1.0 } else { 0.0 }, None),
         Data::DateTime(dt) => {
             if let Some(ndt) = dt.as_datetime() {
                 let midnight = NaiveTime::from_hms_opt(0, 0, 0).unwrap();
                 if ndt.time() == midnight {
                     let s = ndt.date().format("%Y-%m-%d").to_string();
-                    cell_with_value(py, "date", s)
+                    (COL_DATE, f64::NAN, Some(Cow::Owned(s)))
                 } else {
                     let s = ndt.format("%Y-%m-%dT%H:%M:%S").to_string();
-                    cell_with_value(py, "datetime", s)
+                    (COL_DATETIME, f64::NAN, Some(Cow::Owned(s)))
                 }
             } else {
-                cell_with_value(py, "number", dt.as_f64())
+                (COL_NUMBER, dt.as_f64(), None)
             }
         }
         Data::DateTimeIso(s) => {
             let raw = s.trim_end_matches('Z');
             if let Some(d) = parse_iso_date(raw) {
-                cell_with_value(py, "date", d.format("%Y-%m-%d").to_string())
+                let s = d.format("%Y-%m-%d").to_string();
+                (COL_DATE, f64::NAN, Some(Cow::Owned(s)))
             } else if let Some(ndt) = parse_iso_datetime(raw) {
                 let midnight = NaiveTime::from_hms_opt(0, 0, 0).unwrap();
                 if ndt.time() == midnight {
-                    cell_with_value(py, "date", ndt.date().format("%Y-%m-%d").to_string())
+                    let s = ndt.date().format("%Y-%m-%d").to_string();
+                    (COL_DATE, f64::NAN, Some(Cow::Owned(s)))
                 } else {
-                    cell_with_value(py, "datetime", ndt.format("%Y-%m-%dT%H:%M:%S").to_string())
+                    let s = ndt.format("%Y-%m-%dT%H:%M:%S").to_string();
+                    (COL_DATETIME, f64::NAN, Some(Cow::Owned(s)))
                 }
             } else {
-                cell_with_value(py, "datetime", s.clone())
+                (COL_DATETIME, f64::NAN, Some(Cow::Borrowed(s.as_str())))
             }
         }
-        Data::DurationIso(s) => cell_with_value(py, "string", s.clone()),
-        Data::RichText(rt) => cell_with_value(py, "string", rt.plain_text()),
+        Data::DurationIso(s) => (COL_STRING, f64::NAN, Some(Cow::Borrowed(s.as_str()))),
+        Data::RichText(rt) => (COL_STRING, f64::NAN, Some(Cow::Owned(rt.plain_text()))),
         Data::Error(e) => {
             let normalized = map_error_value(&format!("{e:?}"));
-            let d = PyDict::new(py);
-            d.set_item("type", "error")?;
-            d.set_item("value", normalized)?;
-            Ok(d.into())
+            (COL_ERROR, f64::NAN, Some(Cow::Borrowed(normalized)))
         }
     }
 }
@@ -399,40 +391,10 @@ impl CalamineStyledBook {
 
         let range = self.range_cache.get(sheet).unwrap();
 
-        let (start_row, start_col, end_row, end_col) = if let Some(cr) = cell_range {
-            if !cr.is_empty() {
-                // Parse A1:B2 style range.
-                let clean = cr.replace('$', "").to_ascii_uppercase();
-                let parts: Vec<&str> = clean.split(':').collect();
-                let a = parts[0];
-                let b = if parts.len() > 1 { parts[1] } else { a };
-                let (r0, c0) =
-                    a1_to_row_col(a).map_err(|msg| PyErr::new::<PyValueError, _>(msg))?;
-                let (r1, c1) =
-                    a1_to_row_col(b).map_err(|msg| PyErr::new::<PyValueError, _>(msg))?;
-                (r0.min(r1), c0.min(c1), r0.max(r1), c0.max(c1))
-            } else {
-                let (h, w) = range.get_size();
-                let start = range.start().unwrap_or((0, 0));
-                (
-                    start.0,
-                    start.1,
-                    start.0 + h as u32 - 1,
-                    start.1 + w as u32 - 1,
-                )
-            }
-        } else {
-            let (h, w) = range.get_size();
-            if h == 0 || w == 0 {
-                return Ok(PyList::empty(py).into());
-            }
-            let start = range.start().unwrap_or((0, 0));
-            (
-                start.0,
-                start.1,
-                start.0 + h as u32 - 1,
-                start.1 + w as u32 - 1,
-            )
+        let Some((start_row, start_col, end_row, end_col)) =
+            resolve_bounds(cell_range, || used_bounds(range))?
+        else {
+            return Ok(PyList::empty(py).into());
         };
 
         // Use the fast formula map for formula lookups.
@@ -477,6 +439,98 @@ impl CalamineStyledBook {
         Ok(outer.into())
     }
 
+    /// Bulk-read a sheet (or sub-range) into typed columnar buffers.
+    ///
+    /// Returns a dict with `rows`, `cols`, and row-major native-endian
+    /// buffers: `type_codes` (uint8), `values` (float64; NaN unless number
+    /// or boolean), `string_index` (int32 into the interned `strings` list,
+    /// -1 for none), plus a sparse `formulas` dict keyed by `(row, col)`
+    /// offsets. Avoids allocating a Python dict per cell.
+    pub fn read_sheet_values_columnar(
+        &mut self,
+        py: Python<'_>,
+        sheet: &str,
+        cell_range: Option<&str>,
+    ) -> PyResult<PyObject> {
+        self.ensure_sheet_exists(sheet)?;
+        self.ensure_value_caches(sheet)?;
+
+        let range = self.range_cache.get(sheet).unwrap();
+        let fmap = self.formula_map_cache.get(sheet);
+
+        let (start_row, start_col, n_rows, n_cols) =
+            match resolve_bounds(cell_range, || used_bounds(range))? {
+                Some((r0, c0, r1, c1)) => (r0, c0, (r1 - r0 + 1) as usize, (c1 - c0 + 1) as usize),
+                None => (0, 0, 0, 0),
+            };
+        let n = n_rows * n_cols;
+
+        let mut type_codes: Vec<u8> = Vec::with_capacity(n);
+        let mut values: Vec<f64> = Vec::with_capacity(n);
+        let mut string_index: Vec<i32> = Vec::with_capacity(n);
+        let mut strings: Vec<Cow<'_, str>> = Vec::new();
+        let mut interned: HashMap<Cow<'_, str>, i32> = HashMap::new();
+        let formulas = PyDict::new(py);
+
+        for dr in 0..n_rows {
+            let row = start_row + dr as u32;
+            for dc in 0..n_cols {
+                let col = start_col + dc as u32;
+                if let Some(f) = fmap.and_then(|fm| fm.get(&(row, col))) {
+                    let formula = if f.starts_with('=') {
+                        f.clone()
+                    } else {
+                        format!("={f}")
+                    };
+                    if let Some(err_val) = map_error_formula(&formula) {
+                        type_codes.push(COL_ERROR);
+                        values.push(f64::NAN);
+                        let idx = intern_str(Cow::Borrowed(err_val), &mut strings, &mut interned);
+                        string_index.push(idx);
+                    } else {
+                        type_codes.push(COL_FORMULA);
+                        values.push(f64::NAN);
+                        string_index.push(-1);
+                        formulas.set_item((dr, dc), formula)?;
+                    }
+                    continue;
+                }
+                let (code, value, text) = match range.get_value((row, col)) {
+                    None => (COL_BLANK, f64::NAN, None),
+                    Some(v) => data_to_columnar(v),
+                };
+                type_codes.push(code);
+                values.push(value);
+                string_index.push(match text {
+                    Some(t) => intern_str(t, &mut strings, &mut interned),
+                    None => -1,
+                });
+            }
+        }
+
+        let out = PyDict::new(py);
+        out.set_item("rows", n_rows)?;
+        out.set_item("cols", n_cols)?;
+        out.set_item("type_codes", PyBytes::new(py, &type_codes))?;
+        out.set_item("values", pod_bytes(py, &values, f64::to_ne_bytes)?)?;
+        out.set_item(
+            "string_index",
+            pod_bytes(py, &string_index, i32::to_ne_bytes)?,
+        )?;
+        out.set_item("strings", PyList::new(py, strings.iter().map(|s| &**s))?)?;
+        out.set_item("formulas", formulas)?;
+        Ok(out.into())
+    }
+
+    /// Used range of a sheet as inclusive 0-based `(r0, c0, r1, c1)`, or
+    /// `None` when the sheet is empty.
+    pub fn sheet_bounds(&mut self, sheet: &str) -> PyResult<Option<(u32, u32, u32, u32)>> {
+        self.ensure_sheet_exists(sheet)?;
+        self.ensure_value_caches(sheet)?;
+        let range = self.range_cache.get(sheet).unwrap();
+        Ok(used_bounds(range))
+    }
+
     pub fn read_cell_formula(
         &mut self,
         py: Python<'_>,
@@ -2,8 +2,10 @@ use pyo3::exceptions::{PyIOError, PyValueError};
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 
+use std::collections::hash_map::Entry;
 use std::collections::{HashMap, HashSet};
 use std::fs::File;
+use std::hash::{Hash, Hasher};
 use std::io::{Read, Write};
 
 use indexmap::IndexMap;
@@ -35,14 +37,33 @@ struct CellPayload {
     formula: Option<String>,
 }
 
+/// `f64` compared and hashed by bit pattern so it can be part of a style key.
+#[derive(Clone, Copy, Debug)]
+struct F64Bits(f64);
+
+impl PartialEq for F64Bits {
+    fn eq(&self, other: &Self) -> bool {
+        self.0.to_bits() == other.0.to_bits()
+    }
+}
+
+impl Eq for F64Bits {}
+
+impl Hash for F64Bits {
+    fn hash<H: Hasher>(&self, state: &mut H) {
+        self.0.to_bits().hash(state);
+    }
+}
+
 /// Queued per-cell format dict fields.
+#[derive(Clone, PartialEq, Eq, Hash)]
 struct FormatFields {
     bold: Option<bool>,
     italic: Option<bool>,
     underline: Option<String>,
     strikethrough: Option<bool>,
     font_name: Option<String>,
-    font_size: Option<f64>,
+    font_size: Option<F64Bits>,
     font_color: Option<String>,
     bg_color: Option<String>,
     number_format: Option<String>,
@@ -54,6 +75,7 @@ struct FormatFields {
 }
 
 /// Queued per-cell border dict fields.
+#[derive(Clone, PartialEq, Eq, Hash)]
 struct BorderFields {
     top_style: Option<String>,
     top_color: Option<String>,
@@ -141,12 +163,55 @@ enum PaneSetting {
 
 type CellKey = (String, u32, u16); // (sheet, row, col)
 
+/// Interned style records: identical field sets share one compact id, so a
+/// styled grid stores O(distinct styles) records plus a `u32` per cell.
+struct StyleTable<T> {
+    ids: HashMap<T, u32>,
+    entries: Vec<T>,
+}
+
+impl<T: Clone + Eq + Hash> StyleTable<T> {
+    fn new() -> Self {
+        Self {
+            ids: HashMap::new(),
+            entries: Vec::new(),
+        }
+    }
+
+    fn intern(&mut self, fields: T) -> u32 {
+        if let Some(&id) = self.ids.get(&fields) {
+            return id;
+        }
+        let id = self.entries.len() as u32;
+        self.entries.push(fields.clone());
+        self.ids.insert(fields, id);
+        id
+    }
+
+    fn get(&self, id: u32) -> &T {
+        &self.entries[id as usize]
+    }
+}
+
+/// Default number format applied to date/datetime cells without a user format.
+#[derive(Clone, Copy, PartialEq, Eq, Hash)]
+enum DefaultNumFormat {
+    Plain,
+    Date,
+    DateTime,
+}
+
+/// Key of a fully built `Format`: (format id, border id, default number format).
+type StyleKey = (Option<u32>, Option<u32>, DefaultNumFormat);
+
 #[pyclass(unsendable)]
 pub struct RustXlsxWriterBook {
     sheet_names: Vec<String>,
     values: IndexMap<CellKey, CellPayload>,
-    formats: HashMap<CellKey, FormatFields>,
-    borders: HashMap<CellKey, BorderFields>,
+    formats: HashMap<CellKey, u32>,
+    borders: HashMap<CellKey, u32>,
+    format_table: StyleTable<FormatFields>,
+    border_table: StyleTable<BorderFields>,
     row_heights: HashMap<(String, u32), f64>,
     col_widths: HashMap<(String, u16), f64>,
     merge_ranges: Vec<MergeRange>,
@@ -250,7 +315,7 @@ fn build_format(fmt: Option<&FormatFields>, bdr: Option<&BorderFields>) -> PyRes
             f = f.set_font_name(name);
         }
         if let Some(size) = ff.font_size {
-            f = f.set_font_size(size);
+            f = f.set_font_size(size.0);
         }
         if let Some(ref color) = ff.font_color {
             f = f.set_font_color(parse_hex_color(color));
@@ -352,7 +417,10 @@ fn extract_format_fields(dict: &Bound<'_, PyDict>) -> PyResult<FormatFields> {
             .get_item("strikethrough")?
             .and_then(|v| v.extract().ok()),
         font_name: dict.get_item("font_name")?.and_then(|v| v.extract().ok()),
-        font_size: dict.get_item("font_size")?.and_then(|v| v.extract().ok()),
+        font_size: dict
+            .get_item("font_size")?
+            .and_then(|v| v.extract::<f64>().ok())
+            .map(F64Bits),
         font_color: dict.get_item("font_color")?.and_then(|v| v.extract().ok()),
         bg_color: dict.get_item("bg_color")?.and_then(|v| v.extract().ok()),
         number_format: dict
@@ -571,6 +639,45 @@ impl RustXlsxWriterBook {
             )))
         }
     }
+
+    /// Return the built `Format` for a cell's interned style, constructing it
+    /// only the first time that (format, border, default number format)
+    /// combination is seen.
+    fn cached_format<'a>(
+        &self,
+        cache: &'a mut HashMap<StyleKey, Format>,
+        key: &CellKey,
+        type_str: Option<&str>,
+    ) -> PyResult<&'a Format> {
+        let fmt_id = self.formats.get(key).copied();
+        let bdr_id = self.borders.get(key).copied();
+        let fmt_fields = fmt_id.map(|id| self.format_table.get(id));
+        let bdr_fields = bdr_id.map(|id| self.border_table.get(id));
+
+        // Apply default date/datetime number format only if the user
+        // didn't already provide one via write_cell_format.
+        let has_user_nf = fmt_fields.and_then(|f| f.number_format.as_ref()).is_some();
+        let default_nf = match type_str {
+            Some("date") if !has_user_nf => DefaultNumFormat::Date,
+            Some("datetime") if !has_user_nf => DefaultNumFormat::DateTime,
+            _ => DefaultNumFormat::Plain,
+        };
+
+        match cache.entry((fmt_id, bdr_id, default_nf)) {
+            Entry::Occupied(e) => Ok(e.into_mut()),
+            Entry::Vacant(e) => {
+                let mut format = build_format(fmt_fields, bdr_fields)?;
+                match default_nf {
+                    DefaultNumFormat::Date => format = format.set_num_format("yyyy-mm-dd"),
+                    DefaultNumFormat::DateTime => {
+                        format = format.set_num_format("yyyy-mm-dd hh:mm:ss")
+                    }
+                    DefaultNumFormat::Plain => {}
+                }
+                Ok(e.insert(format))
+            }
+        }
+    }
 }
 
 fn quote_sheet_name(sheet: &str) -> String {
@@ -1186,6 +1293,8 @@ impl RustXlsxWriterBook {
             values: IndexMap::new(),
             formats: HashMap::new(),
             borders: HashMap::new(),
+            format_table: StyleTable::new(),
+            border_table: StyleTable::new(),
             row_heights: HashMap::new(),
             col_widths: HashMap::new(),
             merge_ranges: Vec::new(),
@@ -1337,7 +1446,8 @@ impl RustXlsxWriterBook {
             .downcast::<PyDict>()
             .map_err(|_| PyErr::new::<PyValueError, _>("format_dict must be a dict"))?;
         let fields = extract_format_fields(dict)?;
-        self.formats.insert(key, fields);
+        let id = self.format_table.intern(fields);
+        self.formats.insert(key, id);
         Ok(())
     }
 
@@ -1353,7 +1463,8 @@ impl RustXlsxWriterBook {
             .downcast::<PyDict>()
             .map_err(|_| PyErr::new::<PyValueError, _>("border_dict must be a dict"))?;
         let fields = extract_border_fields(dict)?;
-        self.borders.insert(key, fields);
+        let id = self.border_table.intern(fields);
+        self.borders.insert(key, id);
         Ok(())
     }
 
@@ -1852,29 +1963,19 @@ impl RustXlsxWriterBook {
             }
         }
 
-        // Write all cells with merged format+border.
+        // Write all cells with merged format+border. Formats are built once
+        // per distinct interned style, not once per cell.
+        let mut format_cache: HashMap<StyleKey, Format> = HashMap::new();
         for (key, payload) in &self.values {
             let (ref sheet, row, col) = *key;
-            let fmt_fields = self.formats.get(key);
-            let bdr_fields = self.borders.get(key);
-            let mut format = build_format(fmt_fields, bdr_fields)?;
-
-            // Apply default date/datetime number format only if the user
-            // didn't already provide one via write_cell_format.
-            let has_user_nf = fmt_fields.and_then(|f| f.number_format.as_ref()).is_some();
-            if !has_user_nf {
-                if payload.type_str == "date" {
-                    format = format.set_num_format("yyyy-mm-dd");
-                } else if payload.type_str == "datetime" {
-                    format = format.set_num_format("yyyy-mm-dd hh:mm:ss");
-                }
-            }
+            let format =
+                self.cached_format(&mut format_cache, key, Some(payload.type_str.as_str()))?;
 
             let ws = ws_map
                 .get_mut(sheet)
                 .ok_or_else(|| PyErr::new::<PyValueError, _>(format!("Unknown sheet: {sheet}")))?;
 
-            write_cell(ws, row, col, payload, &format)?;
+            write_cell(ws, row, col, payload, format)?;
         }
 
         // Write formats for cells that have format/border but no value
@@ -1887,11 +1988,9 @@ impl RustXlsxWriterBook {
             .collect();
         for key in format_only_keys {
             let (ref sheet, row, col) = *key;
-            let fmt_fields = self.formats.get(key);
-            let bdr_fields = self.borders.get(key);
-            let format = build_format(fmt_fields, bdr_fields)?;
+            let format = self.cached_format(&mut format_cache, key, None)?;
             if let Some(ws) = ws_map.get_mut(sheet) {
-                ws.write_blank(row, col, &format)
+                ws.write_blank(row, col, format)
                     .map_err(|e| PyErr::new::<PyIOError, _>(format!("write_blank failed: {e}")))?;
             }
         }
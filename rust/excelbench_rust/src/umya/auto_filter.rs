@@ -6,7 +6,8 @@ use super::UmyaBook;
 #[pymethods]
 impl UmyaBook {
     /// Read the auto filter range for a sheet, or None if not set.
-    pub fn get_auto_filter(&self, sheet: &str) -> PyResult<Option<String>> {
+    pub fn get_auto_filter(&mut self, sheet: &str) -> PyResult<Option<String>> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
@@ -40,7 +41,8 @@ impl UmyaBook {
     }
 
     /// Check if a sheet has an auto filter.
-    pub fn has_auto_filter(&self, sheet: &str) -> PyResult<bool> {
+    pub fn has_auto_filter(&mut self, sheet: &str) -> PyResult<bool> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
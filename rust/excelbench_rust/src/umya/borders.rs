@@ -9,7 +9,13 @@ use super::UmyaBook;
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_cell_border(&self, py: Python<'_>, sheet: &str, a1: &str) -> PyResult<PyObject> {
+    pub fn read_cell_border(
+        &mut self,
+        py: Python<'_>,
+        sheet: &str,
+        a1: &str,
+    ) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
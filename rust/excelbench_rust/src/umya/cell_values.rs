@@ -1,21 +1,126 @@
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyBytes, PyDict, PyList};
+
+use std::borrow::Cow;
+use std::collections::HashMap;
 
 use chrono::NaiveTime;
 
-use umya_spreadsheet::NumberingFormat;
+use umya_spreadsheet::{Cell, NumberingFormat};
 
-use crate::util::{a1_to_row_col, cell_blank, cell_with_value, parse_iso_date, parse_iso_datetime};
+use crate::util::{
+    a1_to_row_col, cell_blank, cell_with_value, intern_str, parse_iso_date, parse_iso_datetime,
+    pod_bytes, resolve_bounds, COL_BLANK, COL_BOOLEAN, COL_DATE, COL_DATETIME, COL_ERROR,
+    COL_FORMULA, COL_NUMBER, COL_STRING,
+};
 
 use super::util::{
     excel_serial_to_naive_datetime, looks_like_date_format, naive_datetime_to_excel_serial,
+    used_bounds,
 };
 use super::UmyaBook;
 
+/// A cell value classified the way `read_cell_value()` reports it.
+enum UmyaValue {
+    Blank,
+    Number(f64),
+    Boolean(bool),
+    Text(String),
+    Date(String),
+    DateTime(String),
+    Error(String),
+    Formula(String),
+}
+
+fn classify_cell(cell: &Cell) -> UmyaValue {
+    // Formula wins over value.
+    let formula = cell.get_formula();
+    if !formula.is_empty() {
+        // Map well-known error formulas to error tokens (similar to OpenpyxlAdapter).
+        let norm = if formula.starts_with('=') {
+            formula.to_string()
+        } else {
+            format!("={formula}")
+        };
+        let token = match norm.as_str() {
+            "=1/0" => Some("#DIV/0!"),
+            "=NA()" => Some("#N/A"),
+            "=\"text\"+1" => Some("#VALUE!"),
+            _ => None,
+        };
+        if let Some(t) = token {
+            return UmyaValue::Error(t.to_string());
+        }
+        return UmyaValue::Formula(norm);
+    }
+
+    // Numeric typed access.
+    if let Some(f) = cell.get_value_number() {
+        if let Some(nf) = cell.get_style().get_number_format() {
+            let code = nf.get_format_code();
+            if looks_like_date_format(code) {
+                if let Some(ndt) = excel_serial_to_naive_datetime(f) {
+                    let midnight = NaiveTime::from_hms_opt(0, 0, 0).unwrap();
+                    if ndt.time() == midnight {
+                        return UmyaValue::Date(ndt.date().format("%Y-%m-%d").to_string());
+                    }
+                    return UmyaValue::DateTime(ndt.format("%Y-%m-%dT%H:%M:%S").to_string());
+                }
+            }
+        }
+
+        return UmyaValue::Number(f);
+    }
+
+    let raw = cell
+        .get_value()
+        .into_owned()
+        .replace("\r\n", "\n")
+        .replace('\r', "\n");
+
+    // Errors
+    if raw == "#N/A" || (raw.starts_with('#') && raw.ends_with('!')) {
+        return UmyaValue::Error(raw);
+    }
+    // Boolean
+    if raw.eq_ignore_ascii_case("true") {
+        return UmyaValue::Boolean(true);
+    }
+    if raw.eq_ignore_ascii_case("false") {
+        return UmyaValue::Boolean(false);
+    }
+
+    if raw.is_empty() {
+        return UmyaValue::Blank;
+    }
+
+    UmyaValue::Text(raw)
+}
+
+fn value_to_py(py: Python<'_>, value: UmyaValue) -> PyResult<PyObject> {
+    match value {
+        UmyaValue::Blank => cell_blank(py),
+        UmyaValue::Number(f) => cell_with_value(py, "number", f),
+        UmyaValue::Boolean(b) => cell_with_value(py, "boolean", b),
+        UmyaValue::Text(s) => cell_with_value(py, "string", s),
+        UmyaValue::Date(s) => cell_with_value(py, "date", s),
+        UmyaValue::DateTime(s) => cell_with_value(py, "datetime", s),
+        UmyaValue::Error(s) => cell_with_value(py, "error", s),
+        UmyaValue::Formula(f) => {
+            let d = PyDict::new(py);
+            d.set_item("type", "formula")?;
+            d.set_item("formula", &f)?;
+            d.set_item("value", &f)?;
+            Ok(d.into())
+        }
+    }
+}
+
 #[pymethods]
 impl UmyaBook {
-    pub fn read_cell_value(&self, py: Python<'_>, sheet: &str, a1: &str) -> PyResult<PyObject> {
+    pub fn read_cell_value(&mut self, py: Python<'_>, sheet: &str, a1: &str) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
@@ -24,80 +129,135 @@ impl UmyaBook {
         let (row0, col0) = a1_to_row_col(a1).map_err(|msg| PyErr::new::<PyValueError, _>(msg))?;
         let coord = (col0 + 1, row0 + 1);
 
-        let cell = match ws.get_cell(coord) {
-            Some(c) => c,
-            None => return cell_blank(py),
-        };
+        match ws.get_cell(coord) {
+            Some(c) => value_to_py(py, classify_cell(c)),
+            None => cell_blank(py),
+        }
+    }
 
-        // Formula wins over value.
-        let formula = cell.get_formula();
-        if !formula.is_empty() {
-            // Map well-known error formulas to error tokens (similar to OpenpyxlAdapter).
-            let norm = if formula.starts_with('=') {
-                formula.to_string()
-            } else {
-                format!("={formula}")
-            };
-            let token = match norm.as_str() {
-                "=1/0" => Some("#DIV/0!"),
-                "=NA()" => Some("#N/A"),
-                "=\"text\"+1" => Some("#VALUE!"),
-                _ => None,
-            };
-            if let Some(t) = token {
-                return cell_with_value(py, "error", t);
-            }
+    /// Bulk-read all cell values from a sheet (or a rectangular sub-range).
+    ///
+    /// Returns `list[list[dict]]` where each dict has the same shape as
+    /// `read_cell_value()`, in a single FFI call. Without a range the grid
+    /// runs from A1 to the sheet's highest used row and column.
+    pub fn read_sheet_values(
+        &mut self,
+        py: Python<'_>,
+        sheet: &str,
+        cell_range: Option<&str>,
+    ) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
+        let ws = self
+            .book
+            .get_sheet_by_name(sheet)
+            .ok_or_else(|| PyErr::new::<PyValueError, _>(format!("Unknown sheet: {sheet}")))?;
 
-            let d = PyDict::new(py);
-            d.set_item("type", "formula")?;
-            d.set_item("formula", &norm)?;
-            d.set_item("value", &norm)?;
-            return Ok(d.into());
-        }
+        let outer = PyList::empty(py);
+        let Some((start_row, start_col, end_row, end_col)) =
+            resolve_bounds(cell_range, || used_bounds(ws))?
+        else {
+            return Ok(outer.into());
+        };
 
-        // Numeric typed access.
-        if let Some(f) = cell.get_value_number() {
-            if let Some(nf) = cell.get_style().get_number_format() {
-                let code = nf.get_format_code();
-                if looks_like_date_format(code) {
-                    if let Some(ndt) = excel_serial_to_naive_datetime(f) {
-                        let midnight = NaiveTime::from_hms_opt(0, 0, 0).unwrap();
-                        if ndt.time() == midnight {
-                            let s = ndt.date().format("%Y-%m-%d").to_string();
-                            return cell_with_value(py, "date", s);
-                        }
-                        let s = ndt.format("%Y-%m-%dT%H:%M:%S").to_string();
-                        return cell_with_value(py, "datetime", s);
-                    }
+        for row in start_row..=end_row {
+            let inner = PyList::empty(py);
+            for col in start_col..=end_col {
+                match ws.get_cell((col + 1, row + 1)) {
+                    Some(c) => inner.append(value_to_py(py, classify_cell(c))?)?,
+                    None => inner.append(cell_blank(py)?)?,
                 }
             }
-
-            return cell_with_value(py, "number", f);
+            outer.append(inner)?;
         }
 
-        let raw = cell
-            .get_value()
-            .into_owned()
-            .replace("\r\n", "\n")
-            .replace('\r', "\n");
+        Ok(outer.into())
+    }
 
-        // Errors
-        if raw == "#N/A" || (raw.starts_with('#') && raw.ends_with('!')) {
-            return cell_with_value(py, "error", raw);
-        }
-        // Boolean
-        if raw.eq_ignore_ascii_case("true") {
-            return cell_with_value(py, "boolean", true);
-        }
-        if raw.eq_ignore_ascii_case("false") {
-            return cell_with_value(py, "boolean", false);
-        }
+    /// Bulk-read a sheet (or sub-range) into typed columnar buffers.
+    ///
+    /// Same layout as `CalamineStyledBook.read_sheet_values_columnar()`:
+    /// `rows`, `cols`, row-major native-endian `type_codes` (uint8), `values`
+    /// (float64), `string_index` (int32 into the interned `strings` list) and a
+    /// sparse `formulas` dict keyed by `(row, col)` offsets.
+    pub fn read_sheet_values_columnar(
+        &mut self,
+        py: Python<'_>,
+        sheet: &str,
+        cell_range: Option<&str>,
+    ) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
+        let ws = self
+            .book
+            .get_sheet_by_name(sheet)
+            .ok_or_else(|| PyErr::new::<PyValueError, _>(format!("Unknown sheet: {sheet}")))?;
 
-        if raw.is_empty() {
-            return cell_blank(py);
+        let (start_row, start_col, n_rows, n_cols) =
+            match resolve_bounds(cell_range, || used_bounds(ws))? {
+                Some((r0, c0, r1, c1)) => (r0, c0, (r1 - r0 + 1) as usize, (c1 - c0 + 1) as usize),
+                None => (0, 0, 0, 0),
+            };
+        let n = n_rows * n_cols;
+
+        let mut type_codes: Vec<u8> = Vec::with_capacity(n);
+        let mut values: Vec<f64> = Vec::with_capacity(n);
+        let mut string_index: Vec<i32> = Vec::with_capacity(n);
+        let mut strings: Vec<Cow<'_, str>> = Vec::new();
+        let mut interned: HashMap<Cow<'_, str>, i32> = HashMap::new();
+        let formulas = PyDict::new(py);
+
+        for dr in 0..n_rows {
+            let row = start_row + dr as u32;
+            for dc in 0..n_cols {
+                let col = start_col + dc as u32;
+                let value = match ws.get_cell((col + 1, row + 1)) {
+                    Some(c) => classify_cell(c),
+                    None => UmyaValue::Blank,
+                };
+                let (code, number, text) = match value {
+                    UmyaValue::Blank => (COL_BLANK, f64::NAN, None),
+                    UmyaValue::Number(f) => (COL_NUMBER, f, None),
+                    UmyaValue::Boolean(b) => (COL_BOOLEAN, if b { 1.0 } else { 0.0 }, None),
+                    UmyaValue::Text(t) => (COL_STRING, f64::NAN, Some(t)),
+                    UmyaValue::Date(t) => (COL_DATE, f64::NAN, Some(t)),
+                    UmyaValue::DateTime(t) => (COL_DATETIME, f64::NAN, Some(t)),
+                    UmyaValue::Error(t) => (COL_ERROR, f64::NAN, Some(t)),
+                    UmyaValue::Formula(f) => {
+                        formulas.set_item((dr, dc), f)?;
+                        (COL_FORMULA, f64::NAN, None)
+                    }
+                };
+                type_codes.push(code);
+                values.push(number);
+                string_index.push(match text {
+                    Some(t) => intern_str(Cow::Owned(t), &mut strings, &mut interned),
+                    None => -1,
+                });
+            }
         }
 
-        cell_with_value(py, "string", raw)
+        let out = PyDict::new(py);
+        out.set_item("rows", n_rows)?;
+        out.set_item("cols", n_cols)?;
+        out.set_item("type_codes", PyBytes::new(py, &type_codes))?;
+        out.set_item("values", pod_bytes(py, &values, f64::to_ne_bytes)?)?;
+        out.set_item(
+            "string_index",
+            pod_bytes(py, &string_index, i32::to_ne_bytes)?,
+        )?;
+        out.set_item("strings", PyList::new(py, strings.iter().map(|s| &**s))?)?;
+        out.set_item("formulas", formulas)?;
+        Ok(out.into())
+    }
+
+    /// Used range of a sheet as inclusive 0-based `(r0, c0, r1, c1)`, or
+    /// `None` when the sheet is empty. The range always starts at A1.
+    pub fn sheet_bounds(&mut self, sheet: &str) -> PyResult<Option<(u32, u32, u32, u32)>> {
+        self.load_sheet(sheet);
+        let ws = self
+            .book
+            .get_sheet_by_name(sheet)
+            .ok_or_else(|| PyErr::new::<PyValueError, _>(format!("Unknown sheet: {sheet}")))?;
+        Ok(used_bounds(ws))
     }
 
     pub fn write_cell_value(
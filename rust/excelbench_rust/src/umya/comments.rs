@@ -22,7 +22,8 @@ fn extract_comment_text(comment: &Comment) -> String {
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_comments(&self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+    pub fn read_comments(&mut self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
@@ -71,7 +71,8 @@ fn argb_to_hex(color: &Color) -> Option<String> {
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_conditional_formats(&self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+    pub fn read_conditional_formats(&mut self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
@@ -62,7 +62,8 @@ fn str_to_dv_op(s: &str) -> DataValidationOperatorValues {
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_data_validations(&self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+    pub fn read_data_validations(&mut self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
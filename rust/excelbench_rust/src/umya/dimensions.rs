@@ -6,7 +6,8 @@ use super::UmyaBook;
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_row_height(&self, sheet: &str, row: u32) -> PyResult<Option<f64>> {
+    pub fn read_row_height(&mut self, sheet: &str, row: u32) -> PyResult<Option<f64>> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
@@ -22,7 +23,8 @@ impl UmyaBook {
         Ok(None)
     }
 
-    pub fn read_column_width(&self, sheet: &str, col_str: &str) -> PyResult<Option<f64>> {
+    pub fn read_column_width(&mut self, sheet: &str, col_str: &str) -> PyResult<Option<f64>> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
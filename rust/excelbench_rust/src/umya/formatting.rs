@@ -15,7 +15,13 @@ use super::UmyaBook;
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_cell_format(&self, py: Python<'_>, sheet: &str, a1: &str) -> PyResult<PyObject> {
+    pub fn read_cell_format(
+        &mut self,
+        py: Python<'_>,
+        sheet: &str,
+        a1: &str,
+    ) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
@@ -43,7 +43,8 @@ fn split_to_top_left(row: u32, col: u32) -> String {
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_freeze_panes(&self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+    pub fn read_freeze_panes(&mut self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
@@ -9,7 +9,8 @@ use super::UmyaBook;
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_images(&self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+    pub fn read_images(&mut self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
@@ -5,7 +5,8 @@ use super::UmyaBook;
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_merged_ranges(&self, sheet: &str) -> PyResult<Vec<String>> {
+    pub fn read_merged_ranges(&mut self, sheet: &str) -> PyResult<Vec<String>> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
@@ -25,6 +25,26 @@ mod util;
 pub struct UmyaBook {
     pub(super) book: Spreadsheet,
     pub(super) saved: bool,
+    /// Opened with `lazy=True`: worksheets stay serialized until first access.
+    pub(super) lazy: bool,
+}
+
+impl UmyaBook {
+    /// Deserialize `name` if the book was opened lazily and it has not been
+    /// touched yet. Unknown names are left for the caller to report.
+    pub(super) fn load_sheet(&mut self, name: &str) {
+        if !self.lazy {
+            return;
+        }
+        let pending = self
+            .book
+            .get_sheet_collection_no_check()
+            .iter()
+            .position(|ws| ws.get_name() == name && !ws.is_deserialized());
+        if let Some(idx) = pending {
+            self.book.read_sheet(idx);
+        }
+    }
 }
 
 #[pymethods]
@@ -33,20 +53,73 @@ impl UmyaBook {
     pub fn new() -> Self {
         let mut book = new_file();
         let _ = book.remove_sheet_by_name("Sheet1");
-        Self { book, saved: false }
+        Self {
+            book,
+            saved: false,
+            lazy: false,
+        }
     }
 
+    /// Open an xlsx file.
+    ///
+    /// With `lazy=True` only the workbook shell (sheet list, shared strings,
+    /// styles) is parsed; each worksheet is deserialized on first access or
+    /// via `preload()`, so open time and memory track the sheets actually read.
     #[staticmethod]
-    pub fn open(path: &str) -> PyResult<Self> {
+    #[pyo3(signature = (path, lazy=false))]
+    pub fn open(path: &str, lazy: bool) -> PyResult<Self> {
         let p = Path::new(path);
-        let book = reader::xlsx::read(p)
+        let result = if lazy {
+            reader::xlsx::lazy_read(p)
+        } else {
+            reader::xlsx::read(p)
+        };
+        let book = result
             .map_err(|e| PyErr::new::<PyIOError, _>(format!("Failed to open workbook: {e}")))?;
-        Ok(Self { book, saved: false })
+        Ok(Self {
+            book,
+            saved: false,
+            lazy,
+        })
+    }
+
+    /// Deserialize `sheets` (all sheets when omitted) of a lazily opened book.
+    #[pyo3(signature = (sheets=None))]
+    pub fn preload(&mut self, sheets: Option<Vec<String>>) -> PyResult<()> {
+        let Some(names) = sheets else {
+            self.book.read_sheet_collection();
+            return Ok(());
+        };
+        for name in &names {
+            let known = self
+                .book
+                .get_sheet_collection_no_check()
+                .iter()
+                .any(|ws| ws.get_name() == name);
+            if !known {
+                return Err(PyErr::new::<PyValueError, _>(format!(
+                    "Unknown sheet: {name}"
+                )));
+            }
+            self.load_sheet(name);
+        }
+        Ok(())
+    }
+
+    /// Names of worksheets that have been deserialized so far.
+    pub fn loaded_sheets(&self) -> PyResult<Vec<String>> {
+        Ok(self
+            .book
+            .get_sheet_collection_no_check()
+            .iter()
+            .filter(|ws| ws.is_deserialized())
+            .map(|ws| ws.get_name().to_string())
+            .collect())
     }
 
     pub fn sheet_names(&self) -> PyResult<Vec<String>> {
         let mut names: Vec<String> = Vec::new();
-        for sheet in self.book.get_sheet_collection().iter() {
+        for sheet in self.book.get_sheet_collection_no_check().iter() {
             names.push(sheet.get_name().to_string());
         }
         Ok(names)
@@ -66,6 +139,10 @@ impl UmyaBook {
             ));
         }
         self.saved = true;
+        if self.lazy {
+            // The writer walks every worksheet.
+            self.book.read_sheet_collection();
+        }
 
         let p = Path::new(path);
         writer::xlsx::write(&self.book, p)
@@ -27,7 +27,7 @@ fn normalize_address(raw: &str) -> String {
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_named_ranges(&self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+    pub fn read_named_ranges(&mut self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
         let result = PyList::empty(py);
 
         // 1. Workbook-level defined names (no localSheetId).
@@ -46,6 +46,7 @@ impl UmyaBook {
         //    umya puts workbook-scoped names that reference a sheet onto the
         //    worksheet, so we include both those and truly sheet-scoped ones.
         //    We need the sheet index to detect localSheetId.
+        self.load_sheet(sheet);
         if let Some(ws) = self.book.get_sheet_by_name(sheet) {
             for dn in ws.get_defined_names() {
                 let d = PyDict::new(py);
@@ -114,7 +115,7 @@ impl UmyaBook {
             // Find the sheet index to use as localSheetId.
             let sheet_names: Vec<String> = self
                 .book
-                .get_sheet_collection()
+                .get_sheet_collection_no_check()
                 .iter()
                 .map(|s| s.get_name().to_string())
                 .collect();
@@ -26,7 +26,8 @@ fn parse_range_ref(range_ref: &str) -> Option<(&str, &str)> {
 
 #[pymethods]
 impl UmyaBook {
-    pub fn read_tables(&self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+    pub fn read_tables(&mut self, py: Python<'_>, sheet: &str) -> PyResult<PyObject> {
+        self.load_sheet(sheet);
         let ws = self
             .book
             .get_sheet_by_name(sheet)
@@ -24,6 +24,16 @@ pub(super) fn naive_datetime_to_excel_serial(dt: NaiveDateTime) -> Option<f64> {
     Some(total_ms as f64 / 86_400_000.0)
 }
 
+/// Used range of an umya sheet (always anchored at A1), for
+/// `crate::util::resolve_bounds()`. `None` when the sheet is empty.
+pub(super) fn used_bounds(ws: &umya_spreadsheet::Worksheet) -> Option<(u32, u32, u32, u32)> {
+    let (max_col, max_row) = ws.get_highest_column_and_row();
+    if max_col == 0 || max_row == 0 {
+        return None;
+    }
+    Some((0, 0, max_row - 1, max_col - 1))
+}
+
 // ---------------------------------------------------------------------------
 // Color helpers: ARGB <-> hex
 // ---------------------------------------------------------------------------
@@ -5,6 +5,15 @@ use pyo3::IntoPyObject;
 #[cfg(any(feature = "calamine", feature = "rust_xlsxwriter", feature = "umya"))]
 use chrono::{NaiveDate, NaiveDateTime};
 
+#[cfg(any(feature = "calamine", feature = "umya"))]
+use pyo3::exceptions::PyValueError;
+#[cfg(any(feature = "calamine", feature = "umya"))]
+use pyo3::types::PyBytes;
+#[cfg(any(feature = "calamine", feature = "umya"))]
+use std::borrow::Cow;
+#[cfg(any(feature = "calamine", feature = "umya"))]
+use std::collections::HashMap;
+
 pub fn a1_to_row_col(a1: &str) -> Result<(u32, u32), String> {
     let mut col: u32 = 0;
     let mut row_digits = String::new();
@@ -65,3 +74,166 @@ pub(crate) fn parse_iso_datetime(s: &str) -> Option<NaiveDateTime> {
         .ok()
         .or_else(|| NaiveDateTime::parse_from_str(raw, "%Y-%m-%dT%H:%M:%S%.f").ok())
 }
+
+/// Resolve an optional "A1:B2" range into inclusive 0-based `(r0, c0, r1, c1)`
+/// bounds. `None`/empty falls back to `used()`, the sheet's used range, which
+/// returns `None` for an empty sheet.
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) fn resolve_bounds(
+    cell_range: Option<&str>,
+    used: impl FnOnce() -> Option<(u32, u32, u32, u32)>,
+) -> PyResult<Option<(u32, u32, u32, u32)>> {
+    let Some(cr) = cell_range.filter(|cr| !cr.is_empty()) else {
+        return Ok(used());
+    };
+    let clean = cr.replace('$', "").to_ascii_uppercase();
+    let (a, b) = clean
+        .split_once(':')
+        .unwrap_or((clean.as_str(), clean.as_str()));
+    let (r0, c0) = a1_to_row_col(a).map_err(|msg| PyErr::new::<PyValueError, _>(msg))?;
+    let (r1, c1) = a1_to_row_col(b).map_err(|msg| PyErr::new::<PyValueError, _>(msg))?;
+    Ok(Some((r0.min(r1), c0.min(c1), r0.max(r1), c0.max(c1))))
+}
+
+/// Used range of a calamine sheet, for `resolve_bounds()`.
+#[cfg(feature = "calamine")]
+pub(crate) fn used_bounds(range: &calamine::Range<calamine::Data>) -> Option<(u32, u32, u32, u32)> {
+    match (range.start(), range.end()) {
+        (Some((r0, c0)), Some((r1, c1))) => Some((r0, c0, r1, c1)),
+        _ => None,
+    }
+}
+
+/// Normalize a calamine error value to its Excel token.
+#[cfg(feature = "calamine")]
+pub(crate) fn map_error_value(err_str: &str) -> &'static str {
+    // Best-effort normalization. If the underlying error representation changes,
+    // callers still get a stable Excel-like token.
+    let e = err_str.to_ascii_uppercase();
+    match e.as_str() {
+        "DIV0" | "DIV/0" | "#DIV/0!" => "#DIV/0!",
+        "NA" | "#N/A" => "#N/A",
+        "VALUE" | "#VALUE!" => "#VALUE!",
+        "REF" | "#REF!" => "#REF!",
+        "NAME" | "#NAME?" => "#NAME?",
+        "NUM" | "#NUM!" => "#NUM!",
+        "NULL" | "#NULL!" => "#NULL!",
+        _ => "#ERROR!",
+    }
+}
+
+/// Convert a calamine cell value into the harness's `{"type", "value"}` dict.
+#[cfg(feature = "calamine")]
+pub(crate) fn data_to_py(py: Python<'_>, value: &calamine::Data) -> PyResult<PyObject> {
+    use calamine::Data;
+    use chrono::NaiveTime;
+
+    match value {
+        Data::Empty => cell_blank(py),
+        Data::String(s) => cell_with_value(py, "string", s.clone()),
+        Data::Float(f) => cell_with_value(py, "number", *f),
+        Data::Int(i) => cell_with_value(py, "number", *i as f64),
+        Data::Bool(b) => cell_with_value(py, "boolean", *b),
+
+        // Date/datetime and durations: avoid debug-string garbage.
+        // - DateTime(f64): Excel serial date/time
+        // - DateTimeIso(String): ISO-8601-like string
+        // - Duration(f64): numeric duration
+        // - DurationIso(String): ISO duration string
+        Data::DateTime(dt) => {
+            // Preserve date vs datetime semantics for the harness.
+            // If time component is midnight, surface as a DATE.
+            if let Some(ndt) = dt.as_datetime() {
+                let midnight = NaiveTime::from_hms_opt(0, 0, 0).unwrap();
+                if ndt.time() == midnight {
+                    let s = ndt.date().format("%Y-%m-%d").to_string();
+                    cell_with_value(py, "date", s)
+                } else {
+                    let s = ndt.format("%Y-%m-%dT%H:%M:%S").to_string();
+                    cell_with_value(py, "datetime", s)
+                }
+            } else {
+                // Fallback: report the raw Excel serial.
+                cell_with_value(py, "number", dt.as_f64())
+            }
+        }
+        Data::DateTimeIso(s) => {
+            // Best-effort parse for midnight -> date.
+            let raw = s.trim_end_matches('Z');
+            if let Some(d) = parse_iso_date(raw) {
+                cell_with_value(py, "date", d.format("%Y-%m-%d").to_string())
+            } else if let Some(ndt) = parse_iso_datetime(raw) {
+                let midnight = NaiveTime::from_hms_opt(0, 0, 0).unwrap();
+                if ndt.time() == midnight {
+                    cell_with_value(py, "date", ndt.date().format("%Y-%m-%d").to_string())
+                } else {
+                    cell_with_value(py, "datetime", ndt.format("%Y-%m-%dT%H:%M:%S").to_string())
+                }
+            } else {
+                // If parsing fails (timezone offsets, etc), keep the ISO string.
+                cell_with_value(py, "datetime", s.clone())
+            }
+        }
+        Data::DurationIso(s) => cell_with_value(py, "string", s.clone()),
+
+        Data::RichText(rt) => cell_with_value(py, "string", rt.plain_text()),
+
+        Data::Error(e) => {
+            let normalized = map_error_value(&format!("{e:?}"));
+            let d = PyDict::new(py);
+            d.set_item("type", "error")?;
+            d.set_item("value", normalized)?;
+            Ok(d.into())
+        }
+    }
+}
+
+// Type codes for `read_sheet_values_columnar()`.
+// Must match COLUMNAR_CELL_TYPES in excelbench/models.py.
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) const COL_BLANK: u8 = 0;
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) const COL_NUMBER: u8 = 1;
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) const COL_STRING: u8 = 2;
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) const COL_BOOLEAN: u8 = 3;
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) const COL_DATE: u8 = 4;
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) const COL_DATETIME: u8 = 5;
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) const COL_ERROR: u8 = 6;
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) const COL_FORMULA: u8 = 7;
+
+/// Return the index of `text` in the interned string table, appending it once.
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) fn intern_str<'a>(
+    text: Cow<'a, str>,
+    strings: &mut Vec<Cow<'a, str>>,
+    interned: &mut HashMap<Cow<'a, str>, i32>,
+) -> i32 {
+    if let Some(&idx) = interned.get(&*text) {
+        return idx;
+    }
+    let idx = strings.len() as i32;
+    interned.insert(text.clone(), idx);
+    strings.push(text);
+    idx
+}
+
+/// Copy a slice of plain numeric values into a native-endian `bytes` object.
+#[cfg(any(feature = "calamine", feature = "umya"))]
+pub(crate) fn pod_bytes<'py, T: Copy, const N: usize>(
+    py: Python<'py>,
+    items: &[T],
+    to_bytes: fn(T) -> [u8; N],
+) -> PyResult<Bound<'py, PyBytes>> {
+    PyBytes::new_with(py, items.len() * N, |buf| {
+        for (chunk, item) in buf.chunks_exact_mut(N).zip(items) {
+            chunk.copy_from_slice(&to_bytes(*item));
+        }
+        Ok(())
+    })
+}
@@ -226,36 +226,35 @@ impl XlsxPatcher {
         let mut zip = ZipArchive::new(f)
             .map_err(|e| PyErr::new::<PyIOError, _>(format!("ZIP read error: {e}")))?;
 
-        // --- Phase 1: Parse styles.xml if we have format patches ---
+        // --- Phase 1: Parse styles.xml once and intern format patches ---
+        // Identical FormatSpecs share one xf index, and styles.xml is
+        // serialized once, so cost scales with distinct styles, not cells.
         let mut styles_xml: Option<String> = None;
-        let mut style_assignments: HashMap<String, u32> = HashMap::new(); // "sheet:cell" → xf_index
+        let mut style_assignments: HashMap<&(String, String), u32> = HashMap::new();
 
         if !self.format_patches.is_empty() {
             let raw = ooxml_util::zip_read_to_string_opt(&mut zip, "xl/styles.xml")?
                 .unwrap_or_else(|| minimal_styles_xml());
-            let mut xml = raw;
+            let mut registry = styles::StyleRegistry::parse(&raw);
 
-            for ((sheet, cell), spec) in &self.format_patches {
-                let (updated, xf_idx) = styles::apply_format_spec(&xml, spec);
-                xml = updated;
-                style_assignments.insert(format!("{sheet}:{cell}"), xf_idx);
+            for (key, spec) in &self.format_patches {
+                style_assignments.insert(key, registry.intern(spec));
             }
-            styles_xml = Some(xml);
+            styles_xml = Some(registry.serialize());
         }
 
         // --- Phase 2: Build cell patches per sheet ---
         let mut sheet_cell_patches: HashMap<String, Vec<CellPatch>> = HashMap::new();
 
         // Value patches
-        for ((sheet, cell), patch) in &self.value_patches {
-            let sheet_path = self.sheet_paths.get(sheet);
+        for (key, patch) in &self.value_patches {
+            let sheet_path = self.sheet_paths.get(&key.0);
             if sheet_path.is_none() {
                 continue;
             }
             let mut p = patch.clone();
             // Check if there's also a style assignment for this cell
-            let key = format!("{sheet}:{cell}");
-            if let Some(&xf_idx) = style_assignments.get(&key) {
+            if let Some(&xf_idx) = style_assignments.get(key) {
                 p.style_index = Some(xf_idx);
             }
             sheet_cell_patches
@@ -265,17 +264,16 @@ impl XlsxPatcher {
         }
 
         // Format-only patches (no value change)
-        for ((sheet, cell), _) in &self.format_patches {
-            let val_key = (sheet.clone(), cell.clone());
-            if self.value_patches.contains_key(&val_key) {
+        for key in self.format_patches.keys() {
+            if self.value_patches.contains_key(key) {
                 continue; // already handled above
             }
+            let (sheet, cell) = key;
             let sheet_path = self.sheet_paths.get(sheet);
             if sheet_path.is_none() {
                 continue;
             }
-            let key = format!("{sheet}:{cell}");
-            if let Some(&xf_idx) = style_assignments.get(&key) {
+            if let Some(&xf_idx) = style_assignments.get(key) {
                 let (row, col) = crate::util::a1_to_row_col(cell)
                     .map_err(|e| PyErr::new::<PyValueError, _>(e))?;
                 let patch = CellPatch {
@@ -7,7 +7,7 @@
 //! WolfXL uses **inline strings** (`t="str"`) for all new string values.  This
 //! avoids modifying the shared string table for the common case.
 
-use std::collections::BTreeMap;
+use std::collections::{BTreeMap, HashSet};
 use std::io::Write;
 
 use quick_xml::events::{BytesEnd, BytesStart, BytesText, Event};
@@ -80,8 +80,10 @@ pub fn patch_worksheet(xml: &str, patches: &[CellPatch]) -> Result<String, Strin
     // State tracking
     let mut in_sheet_data = false;
     let mut current_row: Option<u32> = None;
-    let mut current_row_cols_seen: Vec<u32> = Vec::new(); // cols we've seen in current row
-    let mut rows_seen: Vec<u32> = Vec::new();
+    let mut current_row_cols_seen: HashSet<u32> = HashSet::new(); // cols we've seen in current row
+    let mut rows_seen: HashSet<u32> = HashSet::new();
+    // Highest row number passed so far; pending inserts below it are already written.
+    let mut last_row: u32 = 0;
     let mut skip_until_cell_end = false; // skip children of a cell being replaced
 
     loop {
@@ -98,22 +100,24 @@ pub fn patch_worksheet(xml: &str, patches: &[CellPatch]) -> Result<String, Strin
                         .unwrap_or(0);
 
                     // Insert any missing rows that should come before this one
-                    for &pr in row_patches.keys() {
-                        if pr < row_num && !rows_seen.contains(&pr) {
-                            write_new_row(&mut writer, pr, row_patches.get(&pr).unwrap())?;
-                            rows_seen.push(pr);
+                    if row_num > last_row + 1 {
+                        for (&pr, row_map) in row_patches.range(last_row + 1..row_num) {
+                            if rows_seen.insert(pr) {
+                                write_new_row(&mut writer, pr, row_map)?;
+                            }
                         }
                     }
+                    last_row = last_row.max(row_num);
 
                     current_row = Some(row_num);
                     current_row_cols_seen.clear();
-                    rows_seen.push(row_num);
+                    rows_seen.insert(row_num);
                     write_event(&mut writer, Event::Start(e.to_owned()))?;
                 } else if tag == b"c" && in_sheet_data {
                     let cell_ref = attr_value(e, b"r").unwrap_or_default();
                     let (_, col) = parse_cell_ref(&cell_ref);
 
-                    current_row_cols_seen.push(col);
+                    current_row_cols_seen.insert(col);
 
                     if let Some(row_map) = current_row.and_then(|r| row_patches.get(&r)) {
                         if let Some(patch) = row_map.get(&col) {
@@ -150,13 +154,15 @@ pub fn patch_worksheet(xml: &str, patches: &[CellPatch]) -> Result<String, Strin
                         .and_then(|s| s.parse::<u32>().ok())
                         .unwrap_or(0);
 
-                    for &pr in row_patches.keys() {
-                        if pr < row_num && !rows_seen.contains(&pr) {
-                            write_new_row(&mut writer, pr, row_patches.get(&pr).unwrap())?;
-                            rows_seen.push(pr);
+                    if row_num > last_row + 1 {
+                        for (&pr, row_map) in row_patches.range(last_row + 1..row_num) {
+                            if rows_seen.insert(pr) {
+                                write_new_row(&mut writer, pr, row_map)?;
+                            }
                         }
                     }
-                    rows_seen.push(row_num);
+                    last_row = last_row.max(row_num);
+                    rows_seen.insert(row_num);
 
                     // If this empty row has patches, expand it
                     if let Some(row_map) = row_patches.get(&row_num) {
@@ -169,7 +175,7 @@ pub fn patch_worksheet(xml: &str, patches: &[CellPatch]) -> Result<String, Strin
                     let cell_ref = attr_value(e, b"r").unwrap_or_default();
                     let (_, col) = parse_cell_ref(&cell_ref);
 
-                    current_row_cols_seen.push(col);
+                    current_row_cols_seen.insert(col);
 
                     if let Some(row_map) = current_row.and_then(|r| row_patches.get(&r)) {
                         if let Some(patch) = row_map.get(&col) {
@@ -186,7 +192,7 @@ pub fn patch_worksheet(xml: &str, patches: &[CellPatch]) -> Result<String, Strin
                     write_event(&mut writer, Event::Start(start))?;
                     for (&row_num, row_map) in &row_patches {
                         write_new_row(&mut writer, row_num, row_map)?;
-                        rows_seen.push(row_num);
+                        rows_seen.insert(row_num);
                     }
                     write_event(&mut writer, Event::End(BytesEnd::new("sheetData")))?;
                 } else {
@@ -10,7 +10,10 @@
 //! A cellXfs `<xf>` combines fontId + fillId + borderId + numFmtId.
 //!
 //! For patching, WolfXL appends new component entries and a new `<xf>`,
-//! then sets the cell's `s` attribute to the new xf index.
+//! then sets the cell's `s` attribute to the new xf index. A [`StyleRegistry`]
+//! parses styles.xml once, dedupes identical specs, and serializes once.
+
+use std::collections::HashMap;
 
 use quick_xml::events::{BytesStart, Event};
 use quick_xml::Reader as XmlReader;
@@ -76,7 +79,7 @@ pub struct AlignmentSpec {
 }
 
 /// Full format spec for a cell — used to find-or-create a style.
-#[derive(Debug, Clone, Default)]
+#[derive(Debug, Clone, Default, PartialEq, Eq, Hash)]
 pub struct FormatSpec {
     pub font: Option<FontSpec>,
     pub fill: Option<FillSpec>,
@@ -489,64 +492,277 @@ fn xml_escape(s: &str) -> String {
         .replace('"', "&quot;")
 }
 
-/// Convenience: apply a full FormatSpec to styles.xml, returning updated XML and the xf index.
-pub fn apply_format_spec(xml: &str, spec: &FormatSpec) -> (String, u32) {
-    let mut xml = xml.to_string();
+// ---------------------------------------------------------------------------
+// Style registry (parse once, intern, serialize once)
+// ---------------------------------------------------------------------------
 
-    // 1. Font
-    let font_id = if let Some(ref font) = spec.font {
-        let font_xml = font_to_xml(font);
-        let (updated, id) = inject_into_section(&xml, "fonts", &font_xml);
-        xml = updated;
-        id
-    } else {
-        0
-    };
+/// In-memory view of styles.xml used to assign xf indices for many cells.
+///
+/// Existing entries are only counted; new fonts/fills/borders/numFmts/xfs are
+/// interned (identical specs share one index) and spliced into the original
+/// XML in a single [`StyleRegistry::serialize`] call.
+pub struct StyleRegistry {
+    xml: String,
+    font_count: u32,
+    fill_count: u32,
+    border_count: u32,
+    xf_count: u32,
+    max_num_fmt_id: u32,
+    num_fmt_ids: HashMap<String, u32>,
+    font_ids: HashMap<FontSpec, u32>,
+    fill_ids: HashMap<FillSpec, u32>,
+    border_ids: HashMap<BorderSpec, u32>,
+    xf_ids: HashMap<FormatSpec, u32>,
+    new_fonts: Vec<String>,
+    new_fills: Vec<String>,
+    new_borders: Vec<String>,
+    new_num_fmts: Vec<String>,
+    new_xfs: Vec<String>,
+}
 
-    // 2. Fill
-    let fill_id = if let Some(ref fill) = spec.fill {
-        let fill_xml = fill_to_xml(fill);
-        let (updated, id) = inject_into_section(&xml, "fills", &fill_xml);
-        xml = updated;
-        id
-    } else {
-        0
-    };
+impl StyleRegistry {
+    /// Parse section sizes and existing custom number formats in one pass.
+    pub fn parse(xml: &str) -> Self {
+        let mut reader = XmlReader::from_str(xml);
+        reader.config_mut().trim_text(true);
+        let mut buf: Vec<u8> = Vec::new();
+
+        let mut section: Option<Vec<u8>> = None;
+        let mut counts: HashMap<Vec<u8>, u32> = HashMap::new();
+        let mut num_fmt_ids: HashMap<String, u32> = HashMap::new();
+        let mut max_num_fmt_id: u32 = 163; // custom IDs start at 164
+
+        loop {
+            let event = match reader.read_event_into(&mut buf) {
+                Ok(Event::Eof) | Err(_) => break,
+                Ok(event) => event,
+            };
+            match event {
+                Event::Start(ref e) | Event::Empty(ref e) => {
+                    let name = e.name().as_ref().to_vec();
+                    match name.as_slice() {
+                        b"fonts" | b"fills" | b"borders" | b"cellXfs" => {
+                            counts.entry(name.clone()).or_insert(0);
+                            // A self-closing section has no children to count.
+                            if matches!(event, Event::Start(_)) {
+                                section = Some(name);
+                            }
+                        }
+                        b"numFmt" => {
+                            let id = attr_value(e, b"numFmtId")
+                                .and_then(|s| s.parse::<u32>().ok())
+                                .unwrap_or(0);
+                            if let Some(code) = attr_value(e, b"formatCode") {
+                                num_fmt_ids.entry(code).or_insert(id);
+                            }
+                            max_num_fmt_id = max_num_fmt_id.max(id);
+                        }
+                        child => {
+                            if let Some(ref sec) = section {
+                                if section_child_tag(sec) == child {
+                                    *counts.entry(sec.clone()).or_insert(0) += 1;
+                                }
+                            }
+                        }
+                    }
+                }
+                Event::End(ref e) => {
+                    if section.as_deref() == Some(e.name().as_ref()) {
+                        section = None;
+                    }
+                }
+                _ => {}
+            }
+            buf.clear();
+        }
 
-    // 3. Border
-    let border_id = if let Some(ref border) = spec.border {
-        let border_xml = border_to_xml(border);
-        let (updated, id) = inject_into_section(&xml, "borders", &border_xml);
-        xml = updated;
-        id
-    } else {
-        0
-    };
+        let count = |tag: &[u8]| counts.get(tag).copied().unwrap_or(0);
+        StyleRegistry {
+            xml: xml.to_string(),
+            font_count: count(b"fonts"),
+            fill_count: count(b"fills"),
+            border_count: count(b"borders"),
+            xf_count: count(b"cellXfs"),
+            max_num_fmt_id,
+            num_fmt_ids,
+            font_ids: HashMap::new(),
+            fill_ids: HashMap::new(),
+            border_ids: HashMap::new(),
+            xf_ids: HashMap::new(),
+            new_fonts: Vec::new(),
+            new_fills: Vec::new(),
+            new_borders: Vec::new(),
+            new_num_fmts: Vec::new(),
+            new_xfs: Vec::new(),
+        }
+    }
+
+    /// Return the xf index for `spec`, appending a new `<xf>` (and components)
+    /// only the first time an identical spec is seen.
+    pub fn intern(&mut self, spec: &FormatSpec) -> u32 {
+        if let Some(&idx) = self.xf_ids.get(spec) {
+            return idx;
+        }
 
-    // 4. Number format
-    let num_fmt_id = if let Some(ref code) = spec.number_format {
-        let (updated, id) = find_or_create_num_fmt(&xml, code);
-        xml = updated;
+        let font_id = match spec.font {
+            Some(ref font) => intern_component(
+                &mut self.font_ids,
+                &mut self.new_fonts,
+                self.font_count,
+                font,
+                font_to_xml,
+            ),
+            None => 0,
+        };
+        let fill_id = match spec.fill {
+            Some(ref fill) => intern_component(
+                &mut self.fill_ids,
+                &mut self.new_fills,
+                self.fill_count,
+                fill,
+                fill_to_xml,
+            ),
+            None => 0,
+        };
+        let border_id = match spec.border {
+            Some(ref border) => intern_component(
+                &mut self.border_ids,
+                &mut self.new_borders,
+                self.border_count,
+                border,
+                border_to_xml,
+            ),
+            None => 0,
+        };
+        let num_fmt_id = match spec.number_format {
+            Some(ref code) => self.intern_num_fmt(code),
+            None => 0,
+        };
+
+        let xf_xml = xf_to_xml(
+            font_id,
+            fill_id,
+            border_id,
+            num_fmt_id,
+            spec.alignment.as_ref(),
+            spec.font.is_some(),
+            spec.fill.is_some(),
+            spec.border.is_some(),
+            spec.number_format.is_some(),
+        );
+        let idx = self.xf_count + self.new_xfs.len() as u32;
+        self.new_xfs.push(xf_xml);
+        self.xf_ids.insert(spec.clone(), idx);
+        idx
+    }
+
+    fn intern_num_fmt(&mut self, code: &str) -> u32 {
+        if let Some(id) = builtin_num_fmt_id(code) {
+            return id;
+        }
+        if let Some(&id) = self.num_fmt_ids.get(code) {
+            return id;
+        }
+        self.max_num_fmt_id += 1;
+        let id = self.max_num_fmt_id;
+        self.new_num_fmts.push(format!(
+            "<numFmt numFmtId=\"{id}\" formatCode=\"{}\"/>",
+            xml_escape(code)
+        ));
+        self.num_fmt_ids.insert(code.to_string(), id);
         id
-    } else {
-        0
+    }
+
+    /// True if any entry was appended since parsing.
+    pub fn is_dirty(&self) -> bool {
+        !self.new_xfs.is_empty()
+    }
+
+    /// Splice all appended entries into styles.xml (one pass per section).
+    pub fn serialize(&self) -> String {
+        if !self.is_dirty() {
+            return self.xml.clone();
+        }
+        let mut xml = self.xml.clone();
+        if !self.new_num_fmts.is_empty() {
+            let elements = self.new_num_fmts.concat();
+            if xml.contains("<numFmts") {
+                xml = append_to_section(&xml, "numFmts", &elements, self.new_num_fmts.len());
+            } else if let Some(pos) = xml.find("<fonts") {
+                let section = format!(
+                    "<numFmts count=\"{}\">{elements}</numFmts>",
+                    self.new_num_fmts.len()
+                );
+                xml.insert_str(pos, &section);
+            }
+        }
+        for (tag, elements) in [
+            ("fonts", &self.new_fonts),
+            ("fills", &self.new_fills),
+            ("borders", &self.new_borders),
+            ("cellXfs", &self.new_xfs),
+        ] {
+            if !elements.is_empty() {
+                xml = append_to_section(&xml, tag, &elements.concat(), elements.len());
+            }
+        }
+        xml
+    }
+}
+
+fn intern_component<T: Clone + Eq + std::hash::Hash>(
+    ids: &mut HashMap<T, u32>,
+    new_xml: &mut Vec<String>,
+    existing: u32,
+    spec: &T,
+    to_xml: fn(&T) -> String,
+) -> u32 {
+    if let Some(&id) = ids.get(spec) {
+        return id;
+    }
+    let id = existing + new_xml.len() as u32;
+    new_xml.push(to_xml(spec));
+    ids.insert(spec.clone(), id);
+    id
+}
+
+/// Child element tag for a styles.xml section (`fonts` -> `font`, `cellXfs` -> `xf`).
+fn section_child_tag(section: &[u8]) -> &[u8] {
+    match section {
+        b"cellXfs" => b"xf",
+        b"fonts" => b"font",
+        b"fills" => b"fill",
+        b"borders" => b"border",
+        other => other,
+    }
+}
+
+/// Insert `new_elements` before `</section_tag>` and bump `count` by `added`.
+fn append_to_section(xml: &str, section_tag: &str, new_elements: &str, added: usize) -> String {
+    let close_tag = format!("</{section_tag}>");
+    let open_prefix = format!("<{section_tag}");
+    let (Some(close_pos), Some(open_pos)) = (xml.find(&close_tag), xml.find(&open_prefix)) else {
+        return xml.to_string();
     };
+    let open_end = xml[open_pos..].find('>').unwrap_or(0) + open_pos;
+    let open_tag_str = &xml[open_pos..=open_end];
+    let existing_count = extract_count_attr(open_tag_str).unwrap_or(0);
+    let updated_open = update_count_attr(open_tag_str, existing_count + added as u32);
 
-    // 5. Create cellXfs entry
-    let xf_xml = xf_to_xml(
-        font_id,
-        fill_id,
-        border_id,
-        num_fmt_id,
-        spec.alignment.as_ref(),
-        spec.font.is_some(),
-        spec.fill.is_some(),
-        spec.border.is_some(),
-        spec.number_format.is_some(),
-    );
-    let (xml, xf_index) = inject_into_section(&xml, "cellXfs", &xf_xml);
+    let mut result = String::with_capacity(xml.len() + new_elements.len() + 32);
+    result.push_str(&xml[..open_pos]);
+    result.push_str(&updated_open);
+    result.push_str(&xml[open_end + 1..close_pos]);
+    result.push_str(new_elements);
+    result.push_str(&xml[close_pos..]);
+    result
+}
 
-    (xml, xf_index)
+/// Convenience: apply a full FormatSpec to styles.xml, returning updated XML and the xf index.
+pub fn apply_format_spec(xml: &str, spec: &FormatSpec) -> (String, u32) {
+    let mut registry = StyleRegistry::parse(xml);
+    let xf_index = registry.intern(spec);
+    (registry.serialize(), xf_index)
 }
 
 #[cfg(test)]
@@ -617,6 +833,55 @@ mod tests {
         assert!(updated.contains("fillId=\"2\""));
     }
 
+    #[test]
+    fn test_registry_dedupes_identical_specs() {
+        let red = FormatSpec {
+            fill: Some(FillSpec {
+                pattern_type: "solid".to_string(),
+                fg_color_rgb: Some("FFFF0000".to_string()),
+            }),
+            number_format: Some("$#,##0.00".to_string()),
+            ..Default::default()
+        };
+        let bold_red = FormatSpec {
+            font: Some(FontSpec {
+                bold: true,
+                ..Default::default()
+            }),
+            ..red.clone()
+        };
+
+        let mut registry = StyleRegistry::parse(MINIMAL_STYLES);
+        let ids: Vec<u32> = (0..1000)
+            .map(|i| registry.intern(if i % 2 == 0 { &red } else { &bold_red }))
+            .collect();
+        assert_eq!(ids[0], 1);
+        assert_eq!(ids[1], 2);
+        assert!(ids.iter().all(|&id| id == 1 || id == 2));
+
+        let updated = registry.serialize();
+        assert!(updated.contains("<cellXfs count=\"3\">"));
+        // Both xfs share the one new fill and number format.
+        assert!(updated.contains("<fills count=\"3\">"));
+        assert_eq!(updated.matches("FFFF0000").count(), 1);
+        assert!(updated.contains("<numFmts count=\"1\">"));
+        assert_eq!(updated.matches("numFmtId=\"164\" fontId=\"0\"").count(), 1);
+        assert_eq!(updated.matches("numFmtId=\"164\" fontId=\"1\"").count(), 1);
+
+        // A second parse sees the appended entries.
+        let mut again = StyleRegistry::parse(&updated);
+        let xf = again.intern(&FormatSpec::default());
+        assert_eq!(xf, 3);
+        assert_eq!(again.intern_num_fmt("$#,##0.00"), 164);
+    }
+
+    #[test]
+    fn test_registry_unchanged_without_interning() {
+        let registry = StyleRegistry::parse(MINIMAL_STYLES);
+        assert!(!registry.is_dirty());
+        assert_eq!(registry.serialize(), MINIMAL_STYLES);
+    }
+
     #[test]
     fn test_builtin_num_fmt() {
         let (unchanged, id) = find_or_create_num_fmt(MINIMAL_STYLES, "General");
@@ -10,16 +10,27 @@ Default output is under `test_files/` so it stays gitignored.
 from __future__ import annotations
 
 import argparse
-from collections.abc import Iterator
+import functools
+import inspect
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import xlsxwriter
 from xlsxwriter.worksheet import Worksheet
 
 from excelbench.generator.generate import write_manifest
 from excelbench.models import Importance, Manifest, TestCase, TestFile
+from excelbench.perf.fixture_cache import DEFAULT_MAX_BYTES, FixtureCache
+
+# Part of every fixture cache key: bump when generator output changes.
+GENERATOR_VERSION = "throughput-0.1.0"
+
+# Fixture files queued by @_fixture_job generators: (generator name, path, kwargs).
+_GENERATION_JOBS: list[tuple[str, Path, dict[str, Any]]] = []
 
 
 @contextmanager
@@ -34,6 +45,74 @@ def _xlsx_workbook(path: Path, sheet: str) -> Iterator[tuple[xlsxwriter.Workbook
         wb.close()
 
 
+def _fixture_job(fn: Callable[..., None]) -> Callable[..., None]:
+    """Queue a ``_generate_*(path=..., ...)`` call instead of running it.
+
+    main() builds the manifest in a fixed order while queueing files; the
+    files are then written by _run_generation_jobs(), optionally across a
+    process pool, so ``--jobs`` never changes manifest.json.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*, path: Path, **kwargs: Any) -> None:
+        _GENERATION_JOBS.append((fn.__name__, path, kwargs))
+
+    return wrapper
+
+
+def _generation_spec(name: str, kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Fixture cache key: generator name, bound arguments (defaults included) and version."""
+    fn = globals()[name].__wrapped__
+    bound = inspect.signature(fn).bind(path=None, **kwargs)
+    bound.apply_defaults()
+    spec = {k: v for k, v in bound.arguments.items() if k != "path"}
+    spec["scenario"] = name.removeprefix("_generate_")
+    spec["generator_version"] = GENERATOR_VERSION
+    return spec
+
+
+def _run_generation_job(
+    name: str,
+    path: Path,
+    kwargs: dict[str, Any],
+    cache_dir: Path | None,
+    cache_max_bytes: int | None,
+) -> bool:
+    """Write one queued fixture (process-pool entry point).
+
+    ``cache_max_bytes=None`` disables the fixture cache. Returns True when
+    the file was copied from the cache.
+    """
+    fn = globals()[name].__wrapped__
+    if cache_max_bytes is None:
+        fn(path=path, **kwargs)
+        return False
+    cache = FixtureCache(cache_dir, max_bytes=cache_max_bytes)
+    return cache.fetch(_generation_spec(name, kwargs), path, lambda tmp: fn(path=tmp, **kwargs))
+
+
+def _run_generation_jobs(
+    *, jobs: int, cache_dir: Path | None, cache_max_bytes: int | None
+) -> tuple[int, int]:
+    """Drain the generation queue; returns (files written, cache hits).
+
+    With ``jobs > 1`` the largest grids are submitted first so the pool
+    stays busy until the end.
+    """
+    queued = [
+        (name, path, kwargs, cache_dir, cache_max_bytes) for name, path, kwargs in _GENERATION_JOBS
+    ]
+    _GENERATION_JOBS.clear()
+    if jobs == 1 or len(queued) <= 1:
+        hits = [_run_generation_job(*job) for job in queued]
+    else:
+        queued.sort(key=lambda job: -int(job[2].get("rows", 0)) * int(job[2].get("cols", 0)))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(_run_generation_job, *job) for job in queued]
+            hits = [f.result() for f in futures]
+    return len(queued), sum(hits)
+
+
 def _coord_to_cell(row: int, col: int) -> str:
     letters = ""
     c = col
@@ -43,6 +122,7 @@ def _coord_to_cell(row: int, col: int) -> str:
     return f"{letters}{row}"
 
 
+@_fixture_job
 def _generate_cell_values_grid(
     *,
     path: Path,
@@ -60,6 +140,7 @@ def _generate_cell_values_grid(
                 value += step
 
 
+@_fixture_job
 def _generate_strings_grid(
     *,
     path: Path,
@@ -88,6 +169,7 @@ def _generate_strings_grid(
                 value += 1
 
 
+@_fixture_job
 def _generate_formulas_grid(
     *,
     path: Path,
@@ -102,6 +184,7 @@ def _generate_formulas_grid(
                 ws.write_formula(r, c, formula)
 
 
+@_fixture_job
 def _generate_bg_colors_grid(
     *,
     path: Path,
@@ -118,6 +201,7 @@ def _generate_bg_colors_grid(
                 ws.write_string(r, c, "Color", fmt)
 
 
+@_fixture_job
 def _generate_number_formats_grid(
     *,
     path: Path,
@@ -135,6 +219,7 @@ def _generate_number_formats_grid(
                 value += 1.0
 
 
+@_fixture_job
 def _generate_alignment_grid(
     *,
     path: Path,
@@ -158,6 +243,7 @@ def _generate_alignment_grid(
                 ws.write_string(r, c, "Align", fmt)
 
 
+@_fixture_job
 def _generate_borders_grid(
     *,
     path: Path,
@@ -176,6 +262,105 @@ def _generate_borders_grid(
                 ws.write_string(r, c, "Border", fmt)
 
 
+def _modify_test_files(*, path: str, sheet: str, rows: int, cols: int, size: str) -> list[TestFile]:
+    """Modify workloads (open -> edit -> save) against an existing values grid.
+
+    Patch counts vary at a fixed file size and the same patch counts are
+    reused for every grid size, giving time-vs-patch-count and
+    time-vs-file-size curves.
+    """
+    specs: list[tuple[str, str, dict[str, object]]] = []
+    for patch_rows, patch_label in ((1, "100"), (10, "1k")):
+        # 100-column blocks, so the same patch counts fit every grid (cols >= 100).
+        rng = f"A1:{_coord_to_cell(patch_rows, 100)}"
+        specs.append(
+            (
+                f"modify_patch_{patch_label}_{size}",
+                f"Modify: patch {patch_label} cells in {size}-cell file",
+                {"op": "modify_patch_cells", "range": rng, "start": -1, "step": -1},
+            )
+        )
+    specs.append(
+        (
+            f"modify_restyle_{size}",
+            f"Modify: restyle first 10 rows of {size}-cell file",
+            {"op": "modify_restyle_range", "range": f"A1:{_coord_to_cell(10, cols)}"},
+        )
+    )
+    specs.append(
+        (
+            f"modify_append_rows_{size}",
+            f"Modify: append 10 rows to {size}-cell file",
+            {
+                "op": "modify_append_rows",
+                "range": f"A{rows + 1}:{_coord_to_cell(rows + 10, cols)}",
+                "start": 1,
+                "step": 1,
+            },
+        )
+    )
+
+    return [
+        TestFile(
+            path=path,
+            feature=scenario,
+            tier=0,
+            file_format="xlsx",
+            test_cases=[
+                TestCase(
+                    id=scenario,
+                    label=label,
+                    row=1,
+                    expected={
+                        "workload": {
+                            "scenario": scenario,
+                            "operations": ["modify"],
+                            "sheet": sheet,
+                            **workload,
+                        }
+                    },
+                    importance=Importance.BASIC,
+                )
+            ],
+        )
+        for scenario, label, workload in specs
+    ]
+
+
+def _stream_write_test_file(*, path: str, sheet: str, rows: int, cols: int, size: str) -> TestFile:
+    """Streaming write workload: a lazy row generator fed to append_rows().
+
+    Write workloads never read ``path``; it only anchors the manifest entry,
+    so the grid can be far larger than any generated input file.
+    """
+    scenario = f"cell_values_{size}_stream_write"
+    return TestFile(
+        path=path,
+        feature=scenario,
+        tier=0,
+        file_format="xlsx",
+        test_cases=[
+            TestCase(
+                id=scenario,
+                label=f"Throughput: cell values streaming row write ({size} cells)",
+                row=1,
+                expected={
+                    "workload": {
+                        "scenario": scenario,
+                        "op": "stream_write_rows",
+                        "operations": ["write"],
+                        "sheet": sheet,
+                        "range": f"A1:{_coord_to_cell(rows, cols)}",
+                        "start": 1,
+                        "step": 1,
+                    }
+                },
+                importance=Importance.BASIC,
+            )
+        ],
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Generate ExcelBench throughput fixtures")
     parser.add_argument(
@@ -190,7 +375,43 @@ def main() -> None:
         action="store_true",
         help="Also generate a ~100k-cell fixture (can take a while).",
     )
+    parser.add_argument(
+        "--include-1m",
+        action="store_true",
+        help="Also generate a 1M-cell grid with bulk read/write workloads (use --jobs).",
+    )
+    parser.add_argument(
+        "--include-10m-stream",
+        action="store_true",
+        help="Also add a 10M-cell streaming write workload (no input file; slow to run).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Fixture cache directory (default: ~/.cache/excelbench/fixtures).",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Evict least recently used cached fixtures beyond this size (default: 2048).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate every fixture instead of copying cached ones.",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Worker processes for writing fixture files (default: 1).",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be >= 1")
 
     out = Path(args.output)
     tier_dir = out / "tier0"
@@ -287,6 +508,61 @@ def main() -> None:
         )
     )
 
+    # Bulk read columnar variant (typed buffers instead of per-cell objects)
+    files.append(
+        TestFile(
+            path=f"tier0/{filename}",
+            feature="cell_values_10k_bulk_read_columnar",
+            tier=0,
+            file_format="xlsx",
+            test_cases=[
+                TestCase(
+                    id="cell_values_10k_bulk_read_columnar",
+                    label="Throughput: cell values bulk read columnar (10k cells)",
+                    row=1,
+                    expected={
+                        "workload": {
+                            "scenario": "cell_values_10k_bulk_read_columnar",
+                            "op": "bulk_sheet_values_columnar",
+                            "operations": ["read"],
+                            "sheet": sheet,
+                            "range": rng,
+                        }
+                    },
+                    importance=Importance.BASIC,
+                )
+            ],
+        )
+    )
+
+    # Streaming row read variant (constant-memory row batches)
+    files.append(
+        TestFile(
+            path=f"tier0/{filename}",
+            feature="cell_values_10k_stream_rows",
+            tier=0,
+            file_format="xlsx",
+            test_cases=[
+                TestCase(
+                    id="cell_values_10k_stream_rows",
+                    label="Throughput: cell values streaming row read (10k cells)",
+                    row=1,
+                    expected={
+                        "workload": {
+                            "scenario": "cell_values_10k_stream_rows",
+                            "op": "stream_rows",
+                            "operations": ["read"],
+                            "sheet": sheet,
+                            "range": rng,
+                            "batch_size": 1000,
+                        }
+                    },
+                    importance=Importance.BASIC,
+                )
+            ],
+        )
+    )
+
     # Bulk write variant (create -> bulk write -> save)
     files.append(
         TestFile(
@@ -1337,6 +1613,17 @@ def main() -> None:
         )
     )
 
+    files.extend(
+        _modify_test_files(
+            path="tier0/00_cell_values_10k.xlsx", sheet="S1", rows=100, cols=100, size="10k"
+        )
+    )
+    files.append(
+        _stream_write_test_file(
+            path="tier0/00_cell_values_10k.xlsx", sheet="S1", rows=100, cols=100, size="10k"
+        )
+    )
+
     if args.include_100k:
         # ~100k = 316x316 = 99856 cells
         scenario = "cell_values_100k"
@@ -1424,6 +1711,57 @@ def main() -> None:
                 ],
             )
         )
+        files.append(
+            TestFile(
+                path=f"tier0/{filename}",
+                feature="cell_values_100k_bulk_read_columnar",
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    TestCase(
+                        id="cell_values_100k_bulk_read_columnar",
+                        label="Throughput: cell values bulk read columnar (~100k cells)",
+                        row=1,
+                        expected={
+                            "workload": {
+                                "scenario": "cell_values_100k_bulk_read_columnar",
+                                "op": "bulk_sheet_values_columnar",
+                                "operations": ["read"],
+                                "sheet": sheet,
+                                "range": rng,
+                            }
+                        },
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        )
+        files.append(
+            TestFile(
+                path=f"tier0/{filename}",
+                feature="cell_values_100k_stream_rows",
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    TestCase(
+                        id="cell_values_100k_stream_rows",
+                        label="Throughput: cell values streaming row read (~100k cells)",
+                        row=1,
+                        expected={
+                            "workload": {
+                                "scenario": "cell_values_100k_stream_rows",
+                                "op": "stream_rows",
+                                "operations": ["read"],
+                                "sheet": sheet,
+                                "range": rng,
+                                "batch_size": 1000,
+                            }
+                        },
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        )
         files.append(
             TestFile(
                 path=f"tier0/{filename}",
@@ -1451,17 +1789,96 @@ def main() -> None:
                 ],
             )
         )
+        files.extend(
+            _modify_test_files(
+                path=f"tier0/{filename}", sheet=sheet, rows=rows, cols=cols, size="100k"
+            )
+        )
+        files.append(
+            _stream_write_test_file(
+                path=f"tier0/{filename}", sheet=sheet, rows=rows, cols=cols, size="100k"
+            )
+        )
+
+    if args.include_1m:
+        # 1M = 1000x1000
+        sheet = "S1"
+        rows, cols = 1000, 1000
+        rng = f"A1:{_coord_to_cell(rows, cols)}"
+        filename = "00_cell_values_1m.xlsx"
+        _generate_cell_values_grid(path=tier_dir / filename, sheet=sheet, rows=rows, cols=cols)
+        specs_1m: list[tuple[str, str, dict[str, object]]] = [
+            (
+                "cell_values_1m_bulk_read",
+                "Throughput: cell values bulk read (1M cells)",
+                {"op": "bulk_sheet_values", "operations": ["read"]},
+            ),
+            (
+                "cell_values_1m_bulk_write",
+                "Throughput: cell values bulk write (1M cells)",
+                {"op": "bulk_write_grid", "operations": ["write"], "start": 1, "step": 1},
+            ),
+        ]
+        for feature, label, workload in specs_1m:
+            files.append(
+                TestFile(
+                    path=f"tier0/{filename}",
+                    feature=feature,
+                    tier=0,
+                    file_format="xlsx",
+                    test_cases=[
+                        TestCase(
+                            id=feature,
+                            label=label,
+                            row=1,
+                            expected={
+                                "workload": {
+                                    "scenario": feature,
+                                    "sheet": sheet,
+                                    "range": rng,
+                                    **workload,
+                                }
+                            },
+                            importance=Importance.BASIC,
+                        )
+                    ],
+                )
+            )
+        files.append(
+            _stream_write_test_file(
+                path=f"tier0/{filename}", sheet=sheet, rows=rows, cols=cols, size="1m"
+            )
+        )
+
+    if args.include_10m_stream:
+        # 10,000 rows x 1,000 cols; only the write path runs, so no input file.
+        files.append(
+            _stream_write_test_file(
+                path="tier0/00_cell_values_10k.xlsx",
+                sheet="S1",
+                rows=10_000,
+                cols=1_000,
+                size="10m",
+            )
+        )
+
+    written, hits = _run_generation_jobs(
+        jobs=args.jobs,
+        cache_dir=args.cache_dir,
+        cache_max_bytes=None if args.no_cache else args.cache_max_mb * 1024 * 1024,
+    )
 
     manifest = Manifest(
         generated_at=datetime.now(UTC),
         excel_version="xlsxwriter-generated",
-        generator_version="throughput-0.1.0",
+        generator_version=GENERATOR_VERSION,
         file_format="xlsx",
         files=files,
     )
     write_manifest(manifest, out / "manifest.json")
 
     print(f"✓ Wrote {len(files)} throughput fixture(s) to {out}")
+    print(f"  Files: {written} ({hits} from cache, jobs={args.jobs})")
     print(f"  Manifest: {out / 'manifest.json'}")
 
 
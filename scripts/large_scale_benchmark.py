@@ -3,8 +3,8 @@
 """Large-scale speed benchmark for Excel adapters.
 
 Generates fixtures at 1M and 10M cell scales, then measures bulk read/write
-throughput for key adapters. Uses subprocess isolation for accurate memory
-measurement.
+throughput for key adapters. Each measurement runs in a fresh worker process
+via ``excelbench.perf.run_isolated_workload`` for accurate memory measurement.
 
 Usage:
     uv run python scripts/large_scale_benchmark.py [--scales 1m,5m] [--iters 3]
@@ -14,10 +14,9 @@ from __future__ import annotations
 
 import argparse
 import json
-import subprocess
-import sys
 import time
 from pathlib import Path
+from typing import Any
 
 # Scale definitions: name -> (rows, cols, approx_cells)
 SCALES = {
@@ -33,14 +32,13 @@ WRITE_ADAPTERS = ["wolfxl", "rust_xlsxwriter", "openpyxl", "xlsxwriter"]
 FIXTURE_DIR = Path("test_files/throughput_xlsx/large_scale")
 
 
-def generate_fixture(rows: int, cols: int, path: Path) -> float:
-    """Generate a numeric grid fixture with xlsxwriter. Returns generation time."""
-    path.parent.mkdir(parents=True, exist_ok=True)
+# Part of the fixture cache key: bump when _write_fixture output changes.
+FIXTURE_GENERATOR_VERSION = "large-scale-0.1.0"
+
+
+def _write_fixture(rows: int, cols: int, path: Path) -> None:
     import xlsxwriter
 
-    total_cells = rows * cols
-    print(f"  Generating {total_cells:,} cells ({rows}x{cols}) ...", end=" ", flush=True)
-    t0 = time.perf_counter()
     wb = xlsxwriter.Workbook(str(path), {"constant_memory": True})
     ws = wb.add_worksheet("S1")
     value = 1
@@ -49,215 +47,128 @@ def generate_fixture(rows: int, cols: int, path: Path) -> float:
             ws.write_number(r, c, value)
             value += 1
     wb.close()
+
+
+def generate_fixture(rows: int, cols: int, path: Path, cache: Any | None = None) -> float:
+    """Generate a numeric grid fixture with xlsxwriter. Returns generation time.
+
+    With a FixtureCache the file is copied from the cache when an intact
+    entry for (rows, cols, generator version) exists.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    total_cells = rows * cols
+    print(f"  Generating {total_cells:,} cells ({rows}x{cols}) ...", end=" ", flush=True)
+    t0 = time.perf_counter()
+    hit = False
+    if cache is None:
+        _write_fixture(rows, cols, path)
+    else:
+        spec = {
+            "scenario": "large_scale_cell_values",
+            "rows": rows,
+            "cols": cols,
+            "value_type": "number",
+            "sheet": "S1",
+            "generator_version": FIXTURE_GENERATOR_VERSION,
+        }
+        hit = cache.fetch(spec, path, lambda tmp: _write_fixture(rows, cols, tmp))
     elapsed = time.perf_counter() - t0
     size_mb = path.stat().st_size / (1024 * 1024)
-    print(f"done in {elapsed:.1f}s ({size_mb:.1f} MB)")
+    source = "copied from cache" if hit else "done"
+    print(f"{source} in {elapsed:.1f}s ({size_mb:.1f} MB)")
     return elapsed
 
 
-def run_read_benchmark(adapter: str, fixture_path: str, iters: int) -> dict | None:
-    """Run a bulk-read benchmark in a subprocess."""
-    script = f"""
-import gc, json, resource, sys, time, platform
-from pathlib import Path
+def _find_adapter(name: str) -> Any | None:
+    from excelbench.harness.adapters import get_all_adapters
 
-adapter_name = "{adapter}"
-fixture_path = Path("{fixture_path}")
-iters = {iters}
-
-from excelbench.harness.adapters import get_all_adapters
-adapter = None
-for a in get_all_adapters():
-    if a.name == adapter_name:
-        adapter = a
-        break
-if adapter is None:
-    print(json.dumps({{"error": f"Adapter {{adapter_name!r}} not found"}}))
-    sys.exit(1)
-
-if not hasattr(adapter, "read_sheet_values"):
-    print(json.dumps({{"error": f"{{adapter_name}} has no read_sheet_values"}}))
-    sys.exit(1)
-
-# Warmup
-wb = adapter.open_workbook(fixture_path)
-sheets = adapter.get_sheet_names(wb)
-data = adapter.read_sheet_values(wb, sheets[0])
-adapter.close_workbook(wb)
-row_count = len(data)
-col_count = len(data[0]) if data else 0
-del data
-gc.collect()
-
-# Timed iterations
-times = []
-for i in range(iters):
-    gc.collect()
-    t0 = time.perf_counter()
-    wb = adapter.open_workbook(fixture_path)
-    sheets = adapter.get_sheet_names(wb)
-    data = adapter.read_sheet_values(wb, sheets[0])
-    adapter.close_workbook(wb)
-    elapsed = time.perf_counter() - t0
-    times.append(elapsed)
-    del data
-
-gc.collect()
-rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-if platform.system() == "Darwin":
-    rss_mb = rss / (1024 * 1024)
-else:
-    rss_mb = rss / 1024
-
-times.sort()
-print(json.dumps({{
-    "adapter": adapter_name,
-    "op": "read",
-    "cells": row_count * col_count,
-    "times": times,
-    "min_s": round(times[0], 4),
-    "median_s": round(times[len(times) // 2], 4),
-    "max_s": round(times[-1], 4),
-    "cells_per_sec": round((row_count * col_count) / times[len(times) // 2]),
-    "rss_peak_mb": round(rss_mb, 1),
-}}))
-"""
-    try:
-        result = subprocess.run(
-            [sys.executable, "-c", script],
-            capture_output=True,
-            text=True,
-            timeout=600,
-        )
-    except subprocess.TimeoutExpired:
-        return {"adapter": adapter, "op": "read", "error": "timeout (10min)"}
-
-    if result.returncode != 0:
-        stderr = result.stderr.strip()
-        try:
-            return json.loads(result.stdout.strip())
-        except (json.JSONDecodeError, ValueError):
-            return {
-                "adapter": adapter,
-                "op": "read",
-                "error": stderr[-300:] if stderr else "unknown",
-            }
+    for adapter in get_all_adapters():
+        if adapter.name == name:
+            return adapter
+    return None
 
-    try:
-        return json.loads(result.stdout.strip())
-    except (json.JSONDecodeError, ValueError):
-        return {"adapter": adapter, "op": "read", "error": f"bad json: {result.stdout[:200]}"}
 
+def _grid_range(rows: int, cols: int) -> str:
+    from xlsxwriter.utility import xl_rowcol_to_cell
 
-def run_write_benchmark(adapter: str, rows: int, cols: int, iters: int) -> dict | None:
-    """Run a bulk-write benchmark in a subprocess."""
-    script = f"""
-import gc, json, resource, sys, time, platform, tempfile
-from pathlib import Path
+    return f"A1:{xl_rowcol_to_cell(rows - 1, cols - 1)}"
 
-adapter_name = "{adapter}"
-rows = {rows}
-cols = {cols}
-iters = {iters}
-
-from excelbench.harness.adapters import get_all_adapters
-adapter = None
-for a in get_all_adapters():
-    if a.name == adapter_name:
-        adapter = a
-        break
-if adapter is None:
-    print(json.dumps({{"error": f"Adapter {{adapter_name!r}} not found"}}))
-    sys.exit(1)
-
-if not hasattr(adapter, "write_sheet_values"):
-    print(json.dumps({{"error": f"{{adapter_name}} has no write_sheet_values"}}))
-    sys.exit(1)
-
-# Build grid data
-grid = []
-value = 1
-for r in range(rows):
-    row = []
-    for c in range(cols):
-        row.append(value)
-        value += 1
-    grid.append(row)
-
-total_cells = rows * cols
-
-# Warmup
-with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-    out_path = Path(tmp.name)
-wb = adapter.create_workbook()
-adapter.add_sheet(wb, "Sheet1")
-adapter.write_sheet_values(wb, "Sheet1", "A1", grid)
-adapter.save_workbook(wb, out_path)
-out_path.unlink(missing_ok=True)
-gc.collect()
-
-# Timed iterations
-times = []
-for i in range(iters):
-    gc.collect()
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
-        out_path = Path(tmp.name)
-    t0 = time.perf_counter()
-    wb = adapter.create_workbook()
-    adapter.add_sheet(wb, "Sheet1")
-    adapter.write_sheet_values(wb, "Sheet1", "A1", grid)
-    adapter.save_workbook(wb, out_path)
-    elapsed = time.perf_counter() - t0
-    times.append(elapsed)
-    file_size = out_path.stat().st_size
-    out_path.unlink(missing_ok=True)
-
-gc.collect()
-rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-if platform.system() == "Darwin":
-    rss_mb = rss / (1024 * 1024)
-else:
-    rss_mb = rss / 1024
-
-times.sort()
-print(json.dumps({{
-    "adapter": adapter_name,
-    "op": "write",
-    "cells": total_cells,
-    "times": times,
-    "min_s": round(times[0], 4),
-    "median_s": round(times[len(times) // 2], 4),
-    "max_s": round(times[-1], 4),
-    "cells_per_sec": round(total_cells / times[len(times) // 2]),
-    "file_size_mb": round(file_size / (1024 * 1024), 1),
-    "rss_peak_mb": round(rss_mb, 1),
-}}))
-"""
+
+def _summarize(adapter: str, op: str, res: Any) -> dict:
+    cells = int(res.op_count or 0)
+    median_s = res.wall_ms.p50 / 1000.0
+    out = {
+        "adapter": adapter,
+        "op": op,
+        "cells": cells,
+        "min_s": round(res.wall_ms.min / 1000.0, 4),
+        "median_s": round(median_s, 4),
+        "p95_s": round(res.wall_ms.p95 / 1000.0, 4),
+        "cells_per_sec": round(cells / median_s) if median_s > 0 else 0,
+        "rss_peak_mb": round(res.rss_peak_mb or 0.0, 1),
+    }
+    if res.output_bytes is not None:
+        out["file_size_mb"] = round(res.output_bytes / (1024 * 1024), 1)
+    return out
+
+
+def run_read_benchmark(adapter: str, fixture_path: str, rows: int, cols: int, iters: int) -> dict | None:
+    """Run a bulk-read benchmark in an isolated worker process."""
+    from excelbench.perf import run_isolated_workload
+
+    a = _find_adapter(adapter)
+    if a is None:
+        return {"adapter": adapter, "op": "read", "error": f"Adapter {adapter!r} not found"}
+
+    workload = {
+        "scenario": f"large_read_{rows}x{cols}",
+        "op": "bulk_sheet_values",
+        "sheet": "S1",
+        "range": _grid_range(rows, cols),
+    }
     try:
-        result = subprocess.run(
-            [sys.executable, "-c", script],
-            capture_output=True,
-            text=True,
-            timeout=600,
+        res = run_isolated_workload(
+            a,
+            workload,
+            op="read",
+            input_path=Path(fixture_path),
+            warmup=1,
+            iters=iters,
+            timeout_s=600,
         )
-    except subprocess.TimeoutExpired:
-        return {"adapter": adapter, "op": "write", "error": "timeout (10min)"}
-
-    if result.returncode != 0:
-        stderr = result.stderr.strip()
-        try:
-            return json.loads(result.stdout.strip())
-        except (json.JSONDecodeError, ValueError):
-            return {
-                "adapter": adapter,
-                "op": "write",
-                "error": stderr[-300:] if stderr else "unknown",
-            }
+    except RuntimeError as e:
+        return {"adapter": adapter, "op": "read", "error": str(e)}
+    return _summarize(adapter, "read", res)
 
+
+def run_write_benchmark(adapter: str, rows: int, cols: int, iters: int) -> dict | None:
+    """Run a bulk-write benchmark in an isolated worker process."""
+    from excelbench.perf import run_isolated_workload
+
+    a = _find_adapter(adapter)
+    if a is None:
+        return {"adapter": adapter, "op": "write", "error": f"Adapter {adapter!r} not found"}
+
+    workload = {
+        "scenario": f"large_write_{rows}x{cols}",
+        "op": "bulk_write_grid",
+        "sheet": "S1",
+        "range": _grid_range(rows, cols),
+        "start": 1,
+        "step": 1,
+    }
     try:
-        return json.loads(result.stdout.strip())
-    except (json.JSONDecodeError, ValueError):
-        return {"adapter": adapter, "op": "write", "error": f"bad json: {result.stdout[:200]}"}
+        res = run_isolated_workload(
+            a,
+            workload,
+            op="write",
+            warmup=1,
+            iters=iters,
+            timeout_s=600,
+        )
+    except RuntimeError as e:
+        return {"adapter": adapter, "op": "write", "error": str(e)}
+    return _summarize(adapter, "write", res)
 
 
 def format_throughput(cells_per_sec: int) -> str:
@@ -296,8 +207,23 @@ def main() -> None:
         action="store_true",
         help="Only run write benchmarks",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Fixture cache directory (default: ~/.cache/excelbench/fixtures)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate fixtures with xlsxwriter instead of using the fixture cache",
+    )
     args = parser.parse_args()
 
+    from excelbench.perf.fixture_cache import FixtureCache
+
+    cache = None if args.no_cache else FixtureCache(args.cache_dir)
+
     scales = [s.strip() for s in args.scales.split(",")]
     do_read = not args.write_only
     do_write = not args.read_only
@@ -319,7 +245,7 @@ def main() -> None:
 
         # Generate fixture if needed (for read benchmarks)
         if do_read and not fixture_path.exists():
-            generate_fixture(rows, cols, fixture_path)
+            generate_fixture(rows, cols, fixture_path, cache)
         elif do_read:
             size_mb = fixture_path.stat().st_size / (1024 * 1024)
             print(f"  Using existing fixture: {fixture_path} ({size_mb:.1f} MB)")
@@ -331,7 +257,7 @@ def main() -> None:
             print(f"  {'-' * 20} {'-' * 8} {'-' * 8} {'-' * 12} {'-' * 8}")
             for adapter in READ_ADAPTERS:
                 print(f"  {adapter:<20s} ", end="", flush=True)
-                r = run_read_benchmark(adapter, str(fixture_path), args.iters)
+                r = run_read_benchmark(adapter, str(fixture_path), rows, cols, args.iters)
                 if r and "error" not in r:
                     r["scale"] = scale
                     all_results.append(r)
@@ -361,7 +287,7 @@ def main() -> None:
                     tp = format_throughput(r["cells_per_sec"])
                     print(
                         f"{r['median_s']:>7.3f}s {r['min_s']:>7.3f}s "
-                        f"{tp:>12s} {r['file_size_mb']:>7.1f}M {r['rss_peak_mb']:>7.1f}M"
+                        f"{tp:>12s} {r.get('file_size_mb', 0.0):>7.1f}M {r['rss_peak_mb']:>7.1f}M"
                     )
                 elif r:
                     print(f"ERROR: {r.get('error', 'unknown')[:60]}")
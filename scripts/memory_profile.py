@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 """Memory profiling for Excel adapters at scale.
 
-Runs each adapter in a **separate subprocess** so that ru_maxrss reflects
-only that adapter's memory usage.  Also captures tracemalloc peak for
-Python-side allocations (does not include Rust/C heap).
+Runs each adapter in a **fresh worker process** (via
+``excelbench.perf.run_isolated_workload``) so that ru_maxrss reflects only
+that adapter's memory usage.  Also captures tracemalloc peak for Python-side
+allocations (does not include Rust/C heap).
 
 Usage:
     uv run python scripts/memory_profile.py [--adapters a1,a2,...] [--scales 1k,10k,100k]
@@ -13,10 +14,8 @@ from __future__ import annotations
 
 import argparse
 import json
-import subprocess
-import sys
-import textwrap
 from pathlib import Path
+from typing import Any
 
 FIXTURE_DIR = Path("test_files/throughput_xlsx/tier0")
 
@@ -31,6 +30,7 @@ READ_ADAPTERS = [
     "wolfxl",
     "openpyxl",
     "python-calamine",
+    "umya-spreadsheet",
     "pandas",
 ]
 WRITE_ADAPTERS = [
@@ -42,137 +42,84 @@ WRITE_ADAPTERS = [
     "tablib",
 ]
 
-# Worker script run in subprocess — measures one adapter/op/scale combo
-WORKER_SCRIPT = textwrap.dedent("""\
-import gc
-import json
-import resource
-import sys
-import tracemalloc
-from pathlib import Path
-
-adapter_name = sys.argv[1]
-op = sys.argv[2]  # "read" or "write"
-fixture_path = Path(sys.argv[3])
-
-# --- Resolve adapter by name ---
-from excelbench.harness.adapters import get_all_adapters
-
-adapter = None
-for a in get_all_adapters():
-    if a.name == adapter_name:
-        adapter = a
-        break
-if adapter is None:
-    print(json.dumps({"error": f"Adapter {adapter_name!r} not found"}))
-    sys.exit(1)
-
-# --- Baseline ---
-gc.collect()
-rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-tracemalloc.start()
-
-if op == "read":
-    if not hasattr(adapter, "read_sheet_values"):
-        print(json.dumps({"error": f"{adapter_name} has no read_sheet_values"}))
-        sys.exit(1)
-    wb = adapter.open_workbook(fixture_path)
-    sheets = adapter.get_sheet_names(wb)
-    data = adapter.read_sheet_values(wb, sheets[0])
-    row_count = len(data)
-    col_count = len(data[0]) if data else 0
-    adapter.close_workbook(wb)
-elif op == "write":
-    if not hasattr(adapter, "write_sheet_values"):
-        print(json.dumps({"error": f"{adapter_name} has no write_sheet_values"}))
-        sys.exit(1)
-    # Read the fixture to get the grid values
-    from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
-    ref = OpenpyxlAdapter()
-    ref_wb = ref.open_workbook(fixture_path)
-    ref_sheets = ref.get_sheet_names(ref_wb)
-    grid = ref.read_sheet_values(ref_wb, ref_sheets[0])
-    ref.close_workbook(ref_wb)
-    # Convert CellValue objects to raw Python values
-    raw_grid = []
-    for row in grid:
-        raw_row = []
-        for cell in row:
-            raw_row.append(cell.value if hasattr(cell, "value") else cell)
-        raw_grid.append(raw_row)
-    row_count = len(raw_grid)
-    col_count = len(raw_grid[0]) if raw_grid else 0
 
-    # Reset memory tracking after loading ref data
-    tracemalloc.stop()
-    gc.collect()
-    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-    tracemalloc.start()
+def _find_adapter(name: str) -> Any | None:
+    from excelbench.harness.adapters import get_all_adapters
 
-    import tempfile
-    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=True) as tmp:
-        out_path = Path(tmp.name)
-    wb = adapter.create_workbook()
-    adapter.add_sheet(wb, "Sheet1")
-    adapter.write_sheet_values(wb, "Sheet1", "A1", raw_grid)
-    adapter.save_workbook(wb, out_path)
-    out_path.unlink(missing_ok=True)
-else:
-    print(json.dumps({"error": f"Unknown op {op!r}"}))
-    sys.exit(1)
+    for adapter in get_all_adapters():
+        if adapter.name == name:
+            return adapter
+    return None
 
-# --- Measure ---
-gc.collect()
-tm_current, tm_peak = tracemalloc.get_traced_memory()
-tracemalloc.stop()
 
-rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+def _fixture_extent(fixture: Path) -> tuple[str, str]:
+    """Return (first sheet name, used range) without loading cell data."""
+    from openpyxl import load_workbook
 
-# macOS reports ru_maxrss in bytes; Linux in KB
-import platform
-if platform.system() == "Darwin":
-    rss_before_mb = rss_before / (1024 * 1024)
-    rss_after_mb = rss_after / (1024 * 1024)
-else:
-    rss_before_mb = rss_before / 1024
-    rss_after_mb = rss_after / 1024
-
-print(json.dumps({
-    "adapter": adapter_name,
-    "op": op,
-    "cells": row_count * col_count,
-    "rss_before_mb": round(rss_before_mb, 2),
-    "rss_after_mb": round(rss_after_mb, 2),
-    "rss_delta_mb": round(rss_after_mb - rss_before_mb, 2),
-    "tracemalloc_peak_mb": round(tm_peak / (1024 * 1024), 2),
-}))
-""")
+    wb = load_workbook(fixture, read_only=True)
+    try:
+        ws = wb.worksheets[0]
+        return ws.title, ws.calculate_dimension()
+    finally:
+        wb.close()
 
 
 def run_one(adapter: str, op: str, fixture: Path) -> dict | None:
-    """Run a single adapter/op measurement in a subprocess."""
-    try:
-        result = subprocess.run(
-            [sys.executable, "-c", WORKER_SCRIPT, adapter, op, str(fixture)],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-    except subprocess.TimeoutExpired:
-        return {"adapter": adapter, "op": op, "error": "timeout"}
-
-    if result.returncode != 0:
-        stderr = result.stderr.strip()
-        # Try to extract JSON from stdout even on failure
-        try:
-            return json.loads(result.stdout.strip())
-        except (json.JSONDecodeError, ValueError):
-            return {"adapter": adapter, "op": op, "error": stderr[-300:] if stderr else "unknown"}
+    """Run a single adapter/op measurement in an isolated worker process."""
+    from excelbench.perf import run_isolated_workload
+
+    a = _find_adapter(adapter)
+    if a is None:
+        return {"adapter": adapter, "op": op, "error": f"Adapter {adapter!r} not found"}
+
+    sheet, cell_range = _fixture_extent(fixture)
+    if op == "read":
+        workload: dict[str, Any] = {
+            "scenario": fixture.stem,
+            "op": "bulk_sheet_values",
+            "sheet": sheet,
+            "range": cell_range,
+        }
+        input_path: Path | None = fixture
+    elif op == "write":
+        # Write the fixture's own values; the runner loads them before taking
+        # the memory baseline, so only the writer's allocations are measured.
+        workload = {
+            "scenario": fixture.stem,
+            "op": "bulk_write_grid",
+            "sheet": "Sheet1",
+            "range": cell_range,
+            "values_from": str(fixture),
+        }
+        input_path = None
+    else:
+        return {"adapter": adapter, "op": op, "error": f"Unknown op {op!r}"}
 
     try:
-        return json.loads(result.stdout.strip())
-    except (json.JSONDecodeError, ValueError):
-        return {"adapter": adapter, "op": op, "error": f"bad json: {result.stdout[:200]}"}
+        res = run_isolated_workload(
+            a,
+            workload,
+            op=op,
+            input_path=input_path,
+            warmup=0,
+            iters=1,
+            trace_python_heap=True,
+            timeout_s=120,
+        )
+    except RuntimeError as e:
+        return {"adapter": adapter, "op": op, "error": str(e)}
+
+    rss_before = res.rss_baseline_mb or 0.0
+    rss_after = res.rss_peak_mb or 0.0
+    return {
+        "adapter": adapter,
+        "op": op,
+        "cells": int(res.op_count or 0),
+        "rss_before_mb": round(rss_before, 2),
+        "rss_after_mb": round(rss_after, 2),
+        "rss_delta_mb": round(rss_after - rss_before, 2),
+        "tracemalloc_peak_mb": round(res.py_heap_peak_mb or 0.0, 2),
+    }
 
 
 def main() -> None:
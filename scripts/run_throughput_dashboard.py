@@ -59,6 +59,12 @@ def main() -> None:
         action="store_true",
         help="Include ~100k cell fixture generation and run 100k bulk batches.",
     )
+    parser.add_argument(
+        "--fixture-jobs",
+        type=int,
+        default=1,
+        help="Worker processes for fixture generation (passed as --jobs).",
+    )
     args = parser.parse_args()
 
     tests_dir = Path(args.tests)
@@ -75,6 +81,8 @@ def main() -> None:
     ]
     if args.include_100k:
         gen_cmd.append("--include-100k")
+    if args.fixture_jobs > 1:
+        gen_cmd.extend(["--jobs", str(args.fixture_jobs)])
     _run(gen_cmd)
 
     # Validate manifest paths and obvious mixups.
@@ -106,6 +106,34 @@ def benchmark(
         "--profile",
         help="Benchmark profile: xlsx (default) or xls.",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Worker processes for (feature, adapter) pairs. 1 = serial.",
+    ),
+    verify_cache: bool = typer.Option(
+        False,
+        "--verify-cache",
+        help=(
+            "Reuse write-verification results when an adapter's output content, the "
+            "verifier version and the feature's expectations match a previous run."
+        ),
+    ),
+    verify_cache_dir: Path | None = typer.Option(
+        None,
+        "--verify-cache-dir",
+        help="Verification cache directory (default: $EXCELBENCH_VERIFY_CACHE or "
+        "~/.cache/excelbench/verify). Implies --verify-cache.",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help=(
+            "Reuse (feature, adapter) scores from the existing results.json whose "
+            "fixture, manifest entry, adapter version and harness version are unchanged."
+        ),
+    ),
 ) -> None:
     """Run benchmark against all adapters.
 
@@ -114,6 +142,7 @@ def benchmark(
     """
     from excelbench.harness.adapters import get_all_adapters
     from excelbench.harness.runner import run_benchmark
+    from excelbench.harness.verify_cache import VerificationCache
     from excelbench.models import BenchmarkResults
     from excelbench.results import render_results
 
@@ -132,6 +161,13 @@ def benchmark(
         features = None
     if adapters is not None and not isinstance(adapters, list):
         adapters = None
+    if not isinstance(jobs, int):
+        jobs = 1
+    if not isinstance(verify_cache_dir, Path):
+        verify_cache_dir = None
+    cache = None
+    if verify_cache is True or verify_cache_dir is not None:
+        cache = VerificationCache(verify_cache_dir)
 
     available = get_all_adapters()
     if profile == "xls":
@@ -158,10 +194,35 @@ def benchmark(
     console.print(f"  Profile: {profile}")
     console.print(f"  Test files: {test_dir}")
     console.print(f"  Output: {output_dir}")
+    console.print(f"  Jobs: {jobs}")
+    if cache is not None:
+        console.print(f"  Verify cache: {cache.root}")
     console.print()
 
     try:
-        results = run_benchmark(test_dir, adapters=selected, features=features, profile=profile)
+        previous = None
+        if incremental is True:
+            previous_path = Path(output_dir) / "results.json"
+            if previous_path.exists():
+                import json
+
+                with open(previous_path) as f:
+                    previous = _results_from_json(json.load(f))
+                console.print(f"  Incremental: reusing unchanged scores from {previous_path}")
+            else:
+                console.print(f"  Incremental: no {previous_path}; running everything")
+
+        results = run_benchmark(
+            test_dir,
+            adapters=selected,
+            features=features,
+            profile=profile,
+            jobs=jobs,
+            verify_cache=cache,
+            previous=previous,
+        )
+        if cache is not None and jobs == 1:
+            console.print(f"  Verify cache: {cache.hits} hit(s), {cache.misses} miss(es)")
 
         if append_results:
             import json
@@ -248,7 +309,20 @@ def perf(
     iteration_policy: str = typer.Option(
         "fixed",
         "--iteration-policy",
-        help="Repeat-run stabilization policy (currently: fixed).",
+        help=(
+            "Repeat-run policy: fixed (exactly --iters samples) or adaptive "
+            "(stop early once the p50 CI is within --ci-target or --time-budget is spent)."
+        ),
+    ),
+    ci_target: float = typer.Option(
+        0.05,
+        "--ci-target",
+        help="Adaptive policy: target p50 confidence-interval width, relative to p50.",
+    ),
+    time_budget: float = typer.Option(
+        60.0,
+        "--time-budget",
+        help="Adaptive policy: seconds of sampling per (library, feature, operation).",
     ),
     breakdown: bool = typer.Option(
         False,
@@ -260,6 +334,57 @@ def perf(
         "--profile",
         help="Benchmark profile: xlsx (default) or xls.",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Worker processes (each pinned to one CPU where supported). 1 = serial.",
+    ),
+    isolation: str = typer.Option(
+        "none",
+        "--isolation",
+        help="Measurement isolation: none (shared process) or process (fresh worker per op).",
+    ),
+    save_samples: bool = typer.Option(
+        False,
+        "--save-samples",
+        help="Also write raw timing samples to perf/samples.npz.",
+    ),
+    profile_hotspots: bool = typer.Option(
+        False,
+        "--profile-hotspots",
+        help="Profile extra untimed iterations with cProfile and record top self-time functions.",
+    ),
+    hotspots_top: int = typer.Option(
+        20,
+        "--hotspots-top",
+        help="Number of functions to keep per (library, workload, op) with --profile-hotspots.",
+    ),
+    adapter_overhead: bool = typer.Option(
+        False,
+        "--adapter-overhead",
+        help="Pair bulk reads with raw read_sheet_values_raw() runs to report adapter overhead.",
+    ),
+    sweep: bool = typer.Option(
+        False,
+        "--sweep",
+        help="Run each workload across --sweep-sizes and fit time/RSS scaling curves.",
+    ),
+    sweep_sizes: str = typer.Option(
+        "1k,4k,16k,64k,256k",
+        "--sweep-sizes",
+        help="Comma-separated cell counts for --sweep (k/m suffixes allowed).",
+    ),
+    sweep_threshold: float = typer.Option(
+        1.15,
+        "--sweep-threshold",
+        help="Flag curves whose fitted time or RSS exponent exceeds this value.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="With --sweep, regenerate grid fixtures instead of using the fixture cache.",
+    ),
 ) -> None:
     """Run performance benchmarks (speed + best-effort memory).
 
@@ -272,6 +397,30 @@ def perf(
 
     if not isinstance(iteration_policy, str):
         iteration_policy = "fixed"
+    if not isinstance(jobs, int):
+        jobs = 1
+    if not isinstance(isolation, str):
+        isolation = "none"
+    if not isinstance(save_samples, bool):
+        save_samples = False
+    if not isinstance(ci_target, float):
+        ci_target = 0.05
+    if not isinstance(time_budget, float):
+        time_budget = 60.0
+    if not isinstance(profile_hotspots, bool):
+        profile_hotspots = False
+    if not isinstance(hotspots_top, int):
+        hotspots_top = 20
+    if not isinstance(adapter_overhead, bool):
+        adapter_overhead = False
+    if not isinstance(sweep, bool):
+        sweep = False
+    if not isinstance(sweep_sizes, str):
+        sweep_sizes = "1k,4k,16k,64k,256k"
+    if not isinstance(sweep_threshold, float):
+        sweep_threshold = 1.15
+    if not isinstance(no_cache, bool):
+        no_cache = False
 
     profile = profile.strip().lower()
     if profile not in {"xlsx", "xls"}:
@@ -303,11 +452,36 @@ def perf(
     console.print(f"  Warmup: {warmup}")
     console.print(f"  Iterations: {iters}")
     console.print(f"  Iteration policy: {iteration_policy}")
+    if iteration_policy.strip().lower() == "adaptive":
+        console.print(f"  CI target: {ci_target:g} (time budget {time_budget:g}s)")
     console.print(f"  Breakdown: {breakdown}")
+    console.print(f"  Jobs: {jobs}")
+    console.print(f"  Isolation: {isolation}")
+    if profile_hotspots:
+        console.print(f"  Hotspots: top {hotspots_top} functions (cProfile)")
+    if adapter_overhead:
+        console.print("  Adapter overhead: paired raw bulk reads")
     if adapters:
         console.print(f"  Adapters: {', '.join([a.name for a in selected])}")
     console.print()
 
+    if sweep:
+        _run_perf_sweep(
+            test_dir,
+            output_dir,
+            adapters=selected,
+            features=features,
+            profile=profile,
+            warmup=warmup,
+            iters=iters,
+            jobs=jobs,
+            isolation=isolation,
+            sizes_text=sweep_sizes,
+            threshold=sweep_threshold,
+            use_cache=not no_cache,
+        )
+        return
+
     try:
         perf_results = run_perf(
             test_dir,
@@ -318,6 +492,13 @@ def perf(
             iters=iters,
             iteration_policy=iteration_policy,
             breakdown=breakdown,
+            jobs=jobs,
+            isolation=isolation,
+            ci_target=ci_target,
+            time_budget_s=time_budget,
+            save_samples=save_samples,
+            hotspots=hotspots_top if profile_hotspots else 0,
+            adapter_overhead=adapter_overhead,
         )
         render_perf_results(perf_results, output_dir)
 
@@ -335,6 +516,152 @@ def perf(
         raise typer.Exit(1)
 
 
+def _run_perf_sweep(
+    test_dir: Path,
+    output_dir: Path,
+    *,
+    adapters: list[Any],
+    features: list[str] | None,
+    profile: str,
+    warmup: int,
+    iters: int,
+    jobs: int,
+    isolation: str,
+    sizes_text: str,
+    threshold: float,
+    use_cache: bool = True,
+) -> None:
+    from excelbench.perf.fixture_cache import FixtureCache
+    from excelbench.perf.sweep import parse_sweep_sizes, render_sweep_results, run_sweep
+
+    try:
+        sizes = parse_sweep_sizes(sizes_text)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"[bold]Scaling sweep over {', '.join(f'{n:,}' for n in sizes)} cells[/bold]")
+    if isolation != "process":
+        console.print("[yellow]RSS curves need --isolation process; fitting time only.[/yellow]")
+
+    try:
+        results = run_sweep(
+            test_dir,
+            sizes=sizes,
+            adapters=adapters,
+            features=features,
+            profile=profile,
+            warmup=warmup,
+            iters=iters,
+            jobs=jobs,
+            isolation=isolation,
+            exponent_threshold=threshold,
+            fixture_cache=FixtureCache() if use_cache else None,
+        )
+        render_sweep_results(results, output_dir)
+    except (FileNotFoundError, ValueError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"[green]✓ Sweep results written to {output_dir}/perf[/green]")
+    console.print(f"  - {output_dir}/perf/sweep.json")
+    console.print(f"  - {output_dir}/perf/sweep.md")
+    for curve in results.flagged:
+        fit = curve.time_fit
+        exponent = f" (n^{fit.exponent:.2f})" if fit else ""
+        console.print(
+            f"[yellow]  superlinear: {curve.library} / {curve.feature} / {curve.op}"
+            f"{exponent}[/yellow]"
+        )
+
+
+@app.command("perf-compare")
+def perf_compare(
+    base_path: Path = typer.Argument(..., help="Baseline perf results.json."),
+    head_path: Path = typer.Argument(..., help="Candidate perf results.json."),
+    alpha: float = typer.Option(
+        0.05,
+        "--alpha",
+        help="Significance level for the wall-time test.",
+    ),
+    threshold: float = typer.Option(
+        0.05,
+        "--threshold",
+        help="Minimum relative p50 wall-time change to report (0.05 = 5%).",
+    ),
+    memory_threshold: float = typer.Option(
+        0.10,
+        "--memory-threshold",
+        help="Minimum relative peak-memory change to report (0.10 = 10%).",
+    ),
+    output_dir: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Directory to write compare.md and compare.json.",
+    ),
+) -> None:
+    """Compare two perf runs and exit non-zero on significant regressions.
+
+    Uses Mann-Whitney U on raw samples when both runs were made with
+    --save-samples, otherwise p50 confidence-interval overlap.
+    """
+    import json
+
+    from excelbench.perf.compare import (
+        compare_perf_results,
+        load_perf_run,
+        perf_comparison_to_json_dict,
+        render_perf_comparison_markdown,
+    )
+
+    for path in (base_path, head_path):
+        if not path.exists():
+            console.print(f"[red]Error: perf results not found at {path}[/red]")
+            raise typer.Exit(1)
+
+    try:
+        base, base_samples = load_perf_run(base_path)
+        head, head_samples = load_perf_run(head_path)
+        comparison = compare_perf_results(
+            base,
+            head,
+            base_samples=base_samples,
+            head_samples=head_samples,
+            alpha=alpha,
+            threshold=threshold,
+            memory_threshold=memory_threshold,
+        )
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    markdown = render_perf_comparison_markdown(comparison)
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        (output_dir / "compare.md").write_text(markdown)
+        with open(output_dir / "compare.json", "w") as f:
+            json.dump(perf_comparison_to_json_dict(comparison), f, indent=2)
+        console.print(f"Results saved to: {output_dir}")
+
+    table = Table(title="Perf Changes")
+    for col in ("Status", "Feature", "Library", "Op", "Metric", "Change"):
+        table.add_column(col)
+    for d in comparison.deltas:
+        if d.status == "unchanged":
+            continue
+        change = "—" if d.change is None else f"{d.change:+.1%}"
+        style = "red" if d.status == "regression" else None
+        table.add_row(d.status, d.feature, d.library, d.op, d.metric, change, style=style)
+    console.print(table)
+
+    regressions = comparison.regressions
+    if regressions:
+        console.print(f"[red]✗ {len(regressions)} significant regression(s)[/red]")
+        raise typer.Exit(1)
+    console.print("[green]✓ No significant regressions[/green]")
+
+
 @app.command("generate-xls")
 def generate_xls_command(
     output_dir: Path = typer.Option(
@@ -524,6 +851,7 @@ def _results_from_json(data: dict[str, Any]) -> "BenchmarkResults":
                 write_score=s["scores"].get("write"),
                 test_results=test_results,
                 notes=s.get("notes"),
+                fingerprint=s.get("fingerprint"),
             )
         )
 
@@ -1,8 +1,9 @@
 """Base adapter protocol for Excel libraries."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from excelbench.models import (
     BorderInfo,
@@ -14,10 +15,13 @@ from excelbench.models import (
     DiagnosticSeverity,
     LibraryInfo,
     OperationType,
+    SheetColumns,
 )
 
 JSONDict = dict[str, Any]
 
+T = TypeVar("T")
+
 
 def _infer_diagnostic_category(exc: Exception) -> DiagnosticCategory:
     name = type(exc).__name__.lower()
@@ -37,6 +41,20 @@ def _infer_diagnostic_category(exc: Exception) -> DiagnosticCategory:
     return DiagnosticCategory.INTERNAL
 
 
+def batch_rows(rows: Iterable[T], batch_size: int) -> Iterator[list[T]]:
+    """Group a row iterator into lists of at most ``batch_size`` rows."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    batch: list[T] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 class ExcelAdapter(ABC):
     """Abstract base class for Excel library adapters.
 
@@ -68,6 +86,10 @@ class ExcelAdapter(ABC):
         """Check if this adapter supports writing."""
         return "write" in self.capabilities
 
+    def can_modify(self) -> bool:
+        """Check if this adapter implements the open_for_modify/save_modified protocol."""
+        return type(self).open_for_modify is not ExcelAdapter.open_for_modify
+
     @property
     def output_extension(self) -> str:
         """File extension for written output (default '.xlsx')."""
@@ -308,7 +330,7 @@ class ExcelAdapter(ABC):
     # =========================================================================
 
     # =========================================================================
-    # Raw Throughput Read (optional override)
+    # Raw / Columnar / Streaming Throughput Read (optional override)
     # =========================================================================
 
     def read_sheet_values_raw(
@@ -319,15 +341,70 @@ class ExcelAdapter(ABC):
     ) -> Any:
         """Bulk read without CellValue wrapping — returns library-native data.
 
-        Used only for raw throughput measurement. Override in adapters that
-        can return data faster without the CellValue wrapping step.
-        Default delegates to read_sheet_values() (includes wrapping).
+        Used for raw throughput measurement: the perf runner pairs every
+        bulk_sheet_values iteration with this call to report the adapter's
+        conversion overhead. Every reader whose read_sheet_values() converts
+        to CellValue overrides this; the default delegates to
+        read_sheet_values(), which is correct for adapters whose bulk path
+        already returns library-native data (pandas, polars, tablib).
         """
         fn = getattr(self, "read_sheet_values", None)
         if fn is None:
             raise NotImplementedError(f"{self.name} does not support bulk reads")
         return fn(workbook, sheet, cell_range)
 
+    def read_sheet_values_columnar(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> SheetColumns:
+        """Bulk read into typed columnar buffers (see SheetColumns).
+
+        Override in adapters whose backend can fill the buffers natively, and
+        in adapters whose read_sheet_values() returns library-native data.
+        Default encodes the read_sheet_values() CellValue grid, so it
+        measures the per-cell path plus an encoding pass.
+        """
+        fn = getattr(self, "read_sheet_values", None)
+        if fn is None:
+            raise NotImplementedError(f"{self.name} does not support bulk reads")
+        grid = fn(workbook, sheet, cell_range)
+        # Spot-check the first cell; a full scan would be timed with the read.
+        first = grid[0] if isinstance(grid, list) and grid else []
+        if (
+            not isinstance(grid, list)
+            or not isinstance(first, list)
+            or (first and not isinstance(first[0], CellValue))
+        ):
+            raise NotImplementedError(
+                f"{self.name} read_sheet_values() does not return a CellValue grid"
+            )
+        return SheetColumns.from_cell_values(grid)
+
+    def iter_sheet_rows(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Any]:
+        """Stream a sheet (or range) as batches of at most ``batch_size`` rows.
+
+        Each batch supports ``len()`` (its row count) and holds rows in the
+        adapter's bulk-read representation. Override in adapters backed by a
+        row iterator so peak memory stays bounded by the batch; the default
+        slices read_sheet_values(), which materializes the whole range first.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        fn = getattr(self, "read_sheet_values", None)
+        if fn is None:
+            raise NotImplementedError(f"{self.name} does not support bulk reads")
+        rows = fn(workbook, sheet, cell_range)
+        for start in range(0, len(rows), batch_size):
+            yield rows[start : start + batch_size]
+
     def read_named_ranges(self, workbook: Any, sheet: str) -> list[JSONDict]:
         """Read named ranges.
 
@@ -523,6 +600,49 @@ class ExcelAdapter(ABC):
         """
         ...
 
+    # =========================================================================
+    # Streaming Write (optional override)
+    # =========================================================================
+
+    def create_streaming_workbook(self) -> Any:
+        """Create a workbook that will be filled only through append_rows().
+
+        Override when the library has a dedicated write-only / constant-memory
+        mode. Default delegates to create_workbook().
+        """
+        return self.create_workbook()
+
+    def append_rows(self, workbook: Any, sheet: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Write rows of raw values to ``sheet`` top-down, starting at A1.
+
+        ``rows`` may be a lazy generator; None entries leave the cell empty.
+        Call at most once per sheet, on a sheet with no other cell writes.
+        Override in adapters that can consume the rows incrementally so the
+        full grid never exists in memory; the default materializes the rows
+        and delegates to write_sheet_values().
+        """
+        fn = getattr(self, "write_sheet_values", None)
+        if fn is None:
+            raise NotImplementedError(f"{self.name} does not support bulk writes")
+        fn(workbook, sheet, "A1", [list(row) for row in rows])
+
+    # =========================================================================
+    # Modify Operations (optional override)
+    # =========================================================================
+
+    def open_for_modify(self, path: Path) -> Any:
+        """Open an existing workbook for editing.
+
+        The returned handle accepts write_cell_value(), write_cell_format() and
+        write_cell_border() and is persisted with save_modified(). Whether the
+        library patches, rewrites or rebuilds the file is up to the adapter.
+        """
+        raise NotImplementedError(f"{self.name} does not support modifying existing files")
+
+    def save_modified(self, workbook: Any, path: Path) -> None:
+        """Save a workbook opened with open_for_modify() to ``path``."""
+        raise NotImplementedError(f"{self.name} does not support modifying existing files")
+
 
 class ReadOnlyAdapter(ExcelAdapter):
     """Base class for read-only adapters.
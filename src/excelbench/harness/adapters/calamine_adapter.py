@@ -1,13 +1,15 @@
 """Adapter for python-calamine library (read-only, Rust-backed)."""
 
 import re
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime, time
+from itertools import chain, islice, repeat
 from pathlib import Path
 from typing import Any
 
 from python_calamine import CalamineWorkbook
 
-from excelbench.harness.adapters.base import ReadOnlyAdapter
+from excelbench.harness.adapters.base import ReadOnlyAdapter, batch_rows
 from excelbench.models import (
     BorderInfo,
     CellFormat,
@@ -43,6 +45,32 @@ def _parse_cell_ref(cell: str) -> tuple[int, int]:
     return row, col
 
 
+def _parse_cell_range(cell_range: str) -> tuple[int, int, int, int]:
+    """Parse A1:B2 (or a single A1) into (r0, c0, r1, c1) inclusive, 0-based."""
+    clean = cell_range.replace("$", "").upper()
+    a, b = clean.split(":", 1) if ":" in clean else (clean, clean)
+    r0, c0 = _parse_cell_ref(a)
+    r1, c1 = _parse_cell_ref(b)
+    return min(r0, r1), min(c0, c1), max(r0, r1), max(c0, c1)
+
+
+def _range_rows(rows: Iterable[list[Any]], cell_range: str | None) -> Iterable[list[Any]]:
+    """Window sheet rows to ``cell_range``, padding missing rows/cells with None.
+
+    Shared by the bulk and streaming reads so both return the same rectangle.
+    Lazy, so it works on iter_rows() without materializing the sheet.
+    """
+    if not cell_range:
+        return rows
+    r0, c0, r1, c1 = _parse_cell_range(cell_range)
+    width = c1 - c0 + 1
+    window = islice(rows, r0, r1 + 1)
+    padded = (
+        (source[c0 : c1 + 1] + [None] * width)[:width] for source in chain(window, repeat([]))
+    )
+    return islice(padded, r1 - r0 + 1)
+
+
 def _convert_value(value: Any) -> CellValue:
     """Convert a raw calamine Python value to a CellValue."""
     if value is None or value == "":
@@ -133,29 +161,9 @@ class CalamineAdapter(ReadOnlyAdapter):
         cell_range: str | None = None,
     ) -> list[list[Any]]:
         """Return raw calamine to_python() output without _convert_value() wrapping."""
-        sheet_data = workbook.get_sheet_by_name(sheet)
-        rows = sheet_data.to_python()
+        rows = workbook.get_sheet_by_name(sheet).to_python()
         if cell_range:
-            clean = cell_range.replace("$", "").upper()
-            if ":" in clean:
-                a, b = clean.split(":", 1)
-            else:
-                a, b = clean, clean
-            r0, c0 = _parse_cell_ref(a)
-            r1, c1 = _parse_cell_ref(b)
-            if r1 < r0:
-                r0, r1 = r1, r0
-            if c1 < c0:
-                c0, c1 = c1, c0
-            sliced: list[list[Any]] = []
-            for rr in range(r0, r1 + 1):
-                source = rows[rr] if rr < len(rows) else []
-                padded = [
-                    source[cc] if cc < len(source) else None
-                    for cc in range(c0, c1 + 1)
-                ]
-                sliced.append(padded)
-            return sliced
+            return list(_range_rows(rows, cell_range))
         return rows
 
     def read_cell_value(
@@ -189,32 +197,23 @@ class CalamineAdapter(ReadOnlyAdapter):
         once and converts the entire grid, avoiding the per-cell overhead
         of read_cell_value().
         """
-        sheet_data = workbook.get_sheet_by_name(sheet)
-        rows = sheet_data.to_python()
+        rows = workbook.get_sheet_by_name(sheet).to_python()
+        return [[_convert_value(v) for v in row] for row in _range_rows(rows, cell_range)]
 
-        if cell_range:
-            clean = cell_range.replace("$", "").upper()
-            if ":" in clean:
-                a, b = clean.split(":", 1)
-            else:
-                a, b = clean, clean
-            r0, c0 = _parse_cell_ref(a)
-            r1, c1 = _parse_cell_ref(b)
-            if r1 < r0:
-                r0, r1 = r1, r0
-            if c1 < c0:
-                c0, c1 = c1, c0
-            sliced: list[list[Any]] = []
-            for rr in range(r0, r1 + 1):
-                source = rows[rr] if rr < len(rows) else []
-                padded = [
-                    source[cc] if cc < len(source) else None
-                    for cc in range(c0, c1 + 1)
-                ]
-                sliced.append(padded)
-            rows = sliced
-
-        return [[_convert_value(v) for v in row] for row in rows]
+    def iter_sheet_rows(
+        self,
+        workbook: CalamineWorkbook,
+        sheet: str,
+        cell_range: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[list[CellValue]]]:
+        """Stream CellValue rows via CalamineSheet.iter_rows().
+
+        Rows are converted lazily, so the full to_python() grid is never built.
+        """
+        rows = _range_rows(workbook.get_sheet_by_name(sheet).iter_rows(), cell_range)
+        converted = ([_convert_value(v) for v in row] for row in rows)
+        yield from batch_rows(converted, batch_size)
 
     def read_cell_format(
         self,
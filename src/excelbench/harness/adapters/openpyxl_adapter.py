@@ -1,5 +1,6 @@
 """Adapter for openpyxl library."""
 
+from collections.abc import Iterable, Sequence
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -751,10 +752,20 @@ class OpenpyxlAdapter(ExcelAdapter):
                 wb.remove(default_sheet)
         return wb
 
+    def create_streaming_workbook(self) -> Workbook:
+        """Create a write-only workbook (rows are serialized as they are appended)."""
+        return Workbook(write_only=True)
+
     def add_sheet(self, workbook: Workbook, name: str) -> None:
         """Add a new sheet to a workbook."""
         workbook.create_sheet(name)
 
+    def append_rows(self, workbook: Workbook, sheet: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Stream rows through Worksheet.append(); None leaves the cell empty."""
+        ws = workbook[sheet]
+        for row in rows:
+            ws.append(row)
+
     def write_sheet_values(
         self,
         workbook: Workbook,
@@ -940,6 +951,18 @@ class OpenpyxlAdapter(ExcelAdapter):
         """Save a workbook to a file."""
         workbook.save(str(path))
 
+    # =========================================================================
+    # Modify Operations (load + full rewrite)
+    # =========================================================================
+
+    def open_for_modify(self, path: Path) -> Workbook:
+        """Load the whole workbook; edits go through the regular write methods."""
+        return openpyxl.load_workbook(str(path), data_only=False)
+
+    def save_modified(self, workbook: Workbook, path: Path) -> None:
+        """Re-serialize every part of the workbook."""
+        workbook.save(str(path))
+
     def set_row_height(
         self,
         workbook: Workbook,
@@ -6,13 +6,16 @@ lazy-loading iterators instead of building the full DOM.  Some metadata
 available — measuring the read-mode fidelity difference vs. full mode.
 """
 
+import re
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 import openpyxl
 
-from excelbench.harness.adapters.base import ReadOnlyAdapter
+from excelbench.harness.adapters.base import ReadOnlyAdapter, batch_rows
 from excelbench.models import (
     BorderInfo,
     CellFormat,
@@ -28,6 +31,101 @@ def _get_version() -> str:
     return str(openpyxl.__version__)
 
 
+def _cell_to_rc(cell: str) -> tuple[int, int]:
+    """Parse 'A1' to 1-based (row, col); unparseable refs fall back to (1, 1)."""
+    m = re.match(r"([A-Z]+)(\d+)", cell)
+    if not m:
+        return 1, 1
+    col_str, row_str = m.groups()
+    col = 0
+    for ch in col_str:
+        col = col * 26 + (ord(ch) - ord("A") + 1)
+    return int(row_str), col
+
+
+def _iter_range_rows(ws: Any, cell_range: str | None) -> Any:
+    """Return ``ws.iter_rows()`` limited to an optional A1:B2 range."""
+    if not cell_range:
+        return ws.iter_rows()
+    clean = cell_range.replace("$", "").upper()
+    a, b = clean.split(":", 1) if ":" in clean else (clean, clean)
+    r0, c0 = _cell_to_rc(a)
+    r1, c1 = _cell_to_rc(b)
+    return ws.iter_rows(
+        min_row=min(r0, r1), max_row=max(r0, r1), min_col=min(c0, c1), max_col=max(c0, c1)
+    )
+
+
+class _SheetRowIndex:
+    """Lazy, bounded row-block cache over a read-only worksheet.
+
+    A single forward cursor over ``ws.iter_rows()`` fills blocks of
+    ``block_rows`` rows; only the ``max_blocks`` most recently used blocks are
+    kept.  Forward access (the usual per-cell workload order) costs one pass
+    over the sheet XML in total; a backward jump to an evicted block restarts
+    the cursor at that block.
+    """
+
+    def __init__(self, ws: Any, block_rows: int = 256, max_blocks: int = 64) -> None:
+        self._ws = ws
+        self._block_rows = block_rows
+        self._max_blocks = max_blocks
+        self._blocks: OrderedDict[int, list[Any]] = OrderedDict()
+        self._cursor: Iterator[Any] | None = None
+        self._next_row = 1  # next row the cursor will yield
+        self._end_row: int | None = None  # first row past the sheet, once known
+
+    def cell(self, row: int, col: int) -> Any | None:
+        """Return the ReadOnlyCell at 1-based (row, col), or None past the data."""
+        if self._end_row is not None and row >= self._end_row:
+            return None
+        block_id = (row - 1) // self._block_rows
+        block = self._blocks.get(block_id)
+        if block is None:
+            block = self._load_block(block_id)
+        else:
+            self._blocks.move_to_end(block_id)
+        offset = row - 1 - block_id * self._block_rows
+        if offset >= len(block):
+            return None
+        cells = block[offset]
+        return cells[col - 1] if col - 1 < len(cells) else None
+
+    def close(self) -> None:
+        self._reset_cursor()
+        self._blocks.clear()
+
+    def _reset_cursor(self) -> None:
+        close = getattr(self._cursor, "close", None)
+        if close is not None:
+            close()  # releases the open zip member held by the generator
+        self._cursor = None
+
+    def _load_block(self, block_id: int) -> list[Any]:
+        first = block_id * self._block_rows + 1
+        last = first + self._block_rows - 1
+        if self._cursor is None or first < self._next_row:
+            self._reset_cursor()
+            self._cursor = iter(self._ws.iter_rows(min_row=first))
+            self._next_row = first
+
+        rows: list[Any] = []
+        while self._next_row <= last:
+            row = next(self._cursor, None)
+            if row is None:
+                self._end_row = self._next_row
+                self._reset_cursor()
+                break
+            if self._next_row >= first:
+                rows.append(row)
+            self._next_row += 1
+
+        self._blocks[block_id] = rows
+        if len(self._blocks) > self._max_blocks:
+            self._blocks.popitem(last=False)
+        return rows
+
+
 class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
     """openpyxl with ``read_only=True`` (streaming reads).
 
@@ -36,6 +134,9 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
     supported and raise ``NotImplementedError`` via :class:`ReadOnlyAdapter`.
     """
 
+    def __init__(self) -> None:
+        self._row_index: dict[tuple[int, str], _SheetRowIndex] = {}
+
     @property
     def info(self) -> LibraryInfo:
         return LibraryInfo(
@@ -57,6 +158,9 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
         return openpyxl.load_workbook(str(path), data_only=False, read_only=True)
 
     def close_workbook(self, workbook: Any) -> None:
+        wb_id = id(workbook)
+        for key in [k for k in self._row_index if k[0] == wb_id]:
+            self._row_index.pop(key).close()
         workbook.close()
 
     def get_sheet_names(self, workbook: Any) -> list[str]:
@@ -72,43 +176,8 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
 
         Optional helper used by performance workloads.
         """
-        ws = workbook[sheet]
-
-        if cell_range:
-            import re
-
-            clean = cell_range.replace("$", "").upper()
-            if ":" in clean:
-                a, b = clean.split(":", 1)
-            else:
-                a, b = clean, clean
-
-            def _cell_to_rc(cell: str) -> tuple[int, int]:
-                m = re.match(r"([A-Z]+)(\d+)", cell)
-                if not m:
-                    return 1, 1
-                col_str, row_str = m.groups()
-                row = int(row_str)
-                col = 0
-                for ch in col_str:
-                    col = col * 26 + (ord(ch) - ord("A") + 1)
-                return row, col
-
-            r0, c0 = _cell_to_rc(a)
-            r1, c1 = _cell_to_rc(b)
-            if r1 < r0:
-                r0, r1 = r1, r0
-            if c1 < c0:
-                c0, c1 = c1, c0
-
-            rows = ws.iter_rows(min_row=r0, max_row=r1, min_col=c0, max_col=c1)
-        else:
-            rows = ws.iter_rows()
-
-        out: list[list[CellValue]] = []
-        for row in rows:
-            out.append([self._classify_value(c) for c in row])
-        return out
+        rows = _iter_range_rows(workbook[sheet], cell_range)
+        return [[self._classify_value(c) for c in row] for row in rows]
 
     def read_sheet_values_raw(
         self,
@@ -117,37 +186,19 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
         cell_range: str | None = None,
     ) -> list[list[Any]]:
         """Return raw ReadOnlyCell rows without CellValue conversion."""
-        ws = workbook[sheet]
-        if cell_range:
-            import re
-
-            clean = cell_range.replace("$", "").upper()
-            if ":" in clean:
-                a, b = clean.split(":", 1)
-            else:
-                a, b = clean, clean
-
-            def _cell_to_rc(ref: str) -> tuple[int, int]:
-                m = re.match(r"([A-Z]+)(\d+)", ref)
-                if not m:
-                    return 1, 1
-                col_str, row_str = m.groups()
-                row = int(row_str)
-                col = 0
-                for ch in col_str:
-                    col = col * 26 + (ord(ch) - ord("A") + 1)
-                return row, col
-
-            r0, c0 = _cell_to_rc(a)
-            r1, c1 = _cell_to_rc(b)
-            if r1 < r0:
-                r0, r1 = r1, r0
-            if c1 < c0:
-                c0, c1 = c1, c0
-            return [list(row) for row in ws.iter_rows(
-                min_row=r0, max_row=r1, min_col=c0, max_col=c1
-            )]
-        return [list(row) for row in ws.iter_rows()]
+        return [list(row) for row in _iter_range_rows(workbook[sheet], cell_range)]
+
+    def iter_sheet_rows(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[list[CellValue]]]:
+        """Stream CellValue rows straight off the read-only row iterator."""
+        rows = _iter_range_rows(workbook[sheet], cell_range)
+        converted = ([self._classify_value(c) for c in row] for row in rows)
+        yield from batch_rows(converted, batch_size)
 
     def read_cell_value(
         self,
@@ -155,12 +206,9 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
         sheet: str,
         cell: str,
     ) -> CellValue:
-        ws = workbook[sheet]
-
-        # ReadOnlyWorksheet doesn't support ws[cell] random access directly.
-        # We need to use iter_rows to reach the target cell.
-        import re
-
+        # ReadOnlyWorksheet doesn't support ws[cell] random access, and each
+        # iter_rows() call re-parses the sheet XML from the start.  Serve
+        # per-cell reads from a lazily built row-block index instead.
         match = re.match(r"([A-Z]+)(\d+)", cell.upper())
         if not match:
             return CellValue(type=CellType.BLANK)
@@ -171,18 +219,15 @@ class OpenpyxlReadonlyAdapter(ReadOnlyAdapter):
         for char in col_str:
             target_col = target_col * 26 + (ord(char) - ord("A") + 1)
 
-        # iter_rows with specific range for efficiency
-        for row in ws.iter_rows(
-            min_row=target_row,
-            max_row=target_row,
-            min_col=target_col,
-            max_col=target_col,
-        ):
-            if row:
-                c = row[0]
-                return self._classify_value(c)
-
-        return CellValue(type=CellType.BLANK)
+        key = (id(workbook), sheet)
+        index = self._row_index.get(key)
+        if index is None:
+            index = self._row_index[key] = _SheetRowIndex(workbook[sheet])
+
+        c = index.cell(target_row, target_col)
+        if c is None:
+            return CellValue(type=CellType.BLANK)
+        return self._classify_value(c)
 
     @staticmethod
     def _classify_value(c: Any) -> CellValue:
@@ -21,6 +21,7 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    SheetColumns,
 )
 
 JSONDict = dict[str, Any]
@@ -66,6 +67,54 @@ def _parse_cell_range(cell_range: str) -> tuple[int, int, int, int]:
     return r0, c0, r1, c1
 
 
+def _to_cell_value(value: Any) -> CellValue:
+    """Classify one DataFrame scalar the way ``read_cell_value`` reports it."""
+    if pd.isna(value):
+        return CellValue(type=CellType.BLANK)
+
+    # bool before int — bool is a subclass of int in Python
+    if isinstance(value, (bool, np.bool_)):
+        return CellValue(type=CellType.BOOLEAN, value=bool(value))
+
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return CellValue(type=CellType.NUMBER, value=value)
+
+    if isinstance(value, pd.Timestamp):
+        dt = value.to_pydatetime()
+        is_midnight = dt.hour == 0 and dt.minute == 0 and dt.second == 0 and dt.microsecond == 0
+        if is_midnight:
+            return CellValue(type=CellType.DATE, value=dt.date())
+        return CellValue(type=CellType.DATETIME, value=dt)
+
+    if isinstance(value, datetime):
+        is_midnight = (
+            value.hour == 0 and value.minute == 0 and value.second == 0 and value.microsecond == 0
+        )
+        if is_midnight:
+            return CellValue(type=CellType.DATE, value=value.date())
+        return CellValue(type=CellType.DATETIME, value=value)
+
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return CellValue(type=CellType.DATE, value=value)
+
+    if isinstance(value, time):
+        return CellValue(
+            type=CellType.DATETIME,
+            value=datetime.combine(date.today(), value),
+        )
+
+    if isinstance(value, str):
+        if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
+            return CellValue(type=CellType.ERROR, value=value)
+        if value.startswith("#") and value.endswith("!"):
+            return CellValue(type=CellType.ERROR, value=value)
+        if value.startswith("="):
+            return CellValue(type=CellType.FORMULA, value=value, formula=value)
+        return CellValue(type=CellType.STRING, value=value)
+
+    return CellValue(type=CellType.STRING, value=str(value))
+
+
 class PandasAdapter(ExcelAdapter):
     """Adapter for pandas library (read+write, value-only).
 
@@ -127,6 +176,18 @@ class PandasAdapter(ExcelAdapter):
             return df.iloc[0:0, 0:0]
         return df.iloc[r0 : r1 + 1, c0 : c1 + 1]
 
+    def read_sheet_values_columnar(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> SheetColumns:
+        """Encode the DataFrame range into columnar buffers."""
+        df = self.read_sheet_values(workbook, sheet, cell_range)
+        return SheetColumns.from_cell_values(
+            [[_to_cell_value(v) for v in row] for row in df.itertuples(index=False, name=None)]
+        )
+
     def read_cell_value(
         self,
         workbook: Any,
@@ -145,53 +206,7 @@ class PandasAdapter(ExcelAdapter):
 
         value = df.iloc[row_idx, col_idx]
 
-        if pd.isna(value):
-            return CellValue(type=CellType.BLANK)
-
-        # bool before int — bool is a subclass of int in Python
-        if isinstance(value, (bool, np.bool_)):
-            return CellValue(type=CellType.BOOLEAN, value=bool(value))
-
-        if isinstance(value, (int, float, np.integer, np.floating)):
-            return CellValue(type=CellType.NUMBER, value=value)
-
-        if isinstance(value, pd.Timestamp):
-            dt = value.to_pydatetime()
-            is_midnight = dt.hour == 0 and dt.minute == 0 and dt.second == 0 and dt.microsecond == 0
-            if is_midnight:
-                return CellValue(type=CellType.DATE, value=dt.date())
-            return CellValue(type=CellType.DATETIME, value=dt)
-
-        if isinstance(value, datetime):
-            is_midnight = (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            )
-            if is_midnight:
-                return CellValue(type=CellType.DATE, value=value.date())
-            return CellValue(type=CellType.DATETIME, value=value)
-
-        if isinstance(value, date) and not isinstance(value, datetime):
-            return CellValue(type=CellType.DATE, value=value)
-
-        if isinstance(value, time):
-            return CellValue(
-                type=CellType.DATETIME,
-                value=datetime.combine(date.today(), value),
-            )
-
-        if isinstance(value, str):
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("="):
-                return CellValue(type=CellType.FORMULA, value=value, formula=value)
-            return CellValue(type=CellType.STRING, value=value)
-
-        return CellValue(type=CellType.STRING, value=str(value))
+        return _to_cell_value(value)
 
     def read_cell_format(self, workbook: Any, sheet: str, cell: str) -> CellFormat:
         return CellFormat()
@@ -372,3 +387,30 @@ class PandasAdapter(ExcelAdapter):
                     grid[r][c] = val
                 df = pd.DataFrame(grid)
                 df.to_excel(writer, sheet_name=name, index=False, header=False)
+
+    # =========================================================================
+    # Modify Operations (read into DataFrames + rebuild)
+    # =========================================================================
+
+    def open_for_modify(self, path: Path) -> WorkbookData:
+        """Read every sheet into a DataFrame; edits are queued as cell writes."""
+        workbook = self.create_workbook()
+        workbook["frames"] = self.open_workbook(path)["frames"]
+        for name in workbook["frames"]:
+            self.add_sheet(workbook, name)
+        return workbook
+
+    def save_modified(self, workbook: WorkbookData, path: Path) -> None:
+        """Apply queued edits to the DataFrames and write a new file from scratch."""
+        frames: dict[str, pd.DataFrame] = workbook.get("frames", {})
+        with pd.ExcelWriter(str(path), engine="openpyxl") as writer:
+            for name in workbook["_order"]:
+                df = frames.get(name, pd.DataFrame())
+                cells = workbook["sheets"].get(name, {})
+                if cells:
+                    n_rows = max(len(df), max(r for r, _ in cells.keys()) + 1)
+                    n_cols = max(len(df.columns), max(c for _, c in cells.keys()) + 1)
+                    df = df.reindex(index=range(n_rows), columns=range(n_cols)).astype(object)
+                    for (r, c), val in cells.items():
+                        df.iat[r, c] = val
+                df.to_excel(writer, sheet_name=name, index=False, header=False)
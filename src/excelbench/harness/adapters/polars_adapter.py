@@ -11,6 +11,7 @@ and the raw calamine adapter.
 """
 
 import re
+from collections.abc import Iterator
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
@@ -24,6 +25,7 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    SheetColumns,
 )
 
 JSONDict = dict[str, Any]
@@ -68,6 +70,79 @@ def _parse_cell_range(cell_range: str) -> tuple[int, int, int, int]:
     return r0, c0, r1, c1
 
 
+def _to_cell_value(value: Any) -> CellValue:
+    """Classify one polars scalar (often a String) as a CellValue."""
+    if value is None:
+        return CellValue(type=CellType.BLANK)
+
+    # polars may return native types for homogeneous columns
+    if isinstance(value, bool):
+        return CellValue(type=CellType.BOOLEAN, value=value)
+
+    if isinstance(value, (int, float)):
+        if isinstance(value, float) and (value != value):  # NaN check
+            return CellValue(type=CellType.BLANK)
+        return CellValue(type=CellType.NUMBER, value=value)
+
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return CellValue(type=CellType.DATE, value=value)
+
+    if isinstance(value, datetime):
+        if value.hour == 0 and value.minute == 0 and value.second == 0 and value.microsecond == 0:
+            return CellValue(type=CellType.DATE, value=value.date())
+        return CellValue(type=CellType.DATETIME, value=value)
+
+    # String path — parse back to native types
+    if isinstance(value, str):
+        if value == "":
+            return CellValue(type=CellType.BLANK)
+
+        # Error values
+        if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
+            return CellValue(type=CellType.ERROR, value=value)
+        if value.startswith("#") and value.endswith("!"):
+            return CellValue(type=CellType.ERROR, value=value)
+
+        # Formula
+        if value.startswith("="):
+            return CellValue(type=CellType.FORMULA, value=value, formula=value)
+
+        # Boolean
+        if value.lower() == "true":
+            return CellValue(type=CellType.BOOLEAN, value=True)
+        if value.lower() == "false":
+            return CellValue(type=CellType.BOOLEAN, value=False)
+
+        # Number
+        try:
+            num = float(value)
+            if num == int(num) and "." not in value and "e" not in value.lower():
+                return CellValue(type=CellType.NUMBER, value=int(value))
+            return CellValue(type=CellType.NUMBER, value=num)
+        except ValueError:
+            pass
+
+        # Datetime (polars stringifies as "YYYY-MM-DD HH:MM:SS")
+        try:
+            dt = datetime.fromisoformat(value)
+            if dt.hour == 0 and dt.minute == 0 and dt.second == 0 and dt.microsecond == 0:
+                return CellValue(type=CellType.DATE, value=dt.date())
+            return CellValue(type=CellType.DATETIME, value=dt)
+        except ValueError:
+            pass
+
+        # Date only (YYYY-MM-DD)
+        try:
+            d = date.fromisoformat(value)
+            return CellValue(type=CellType.DATE, value=d)
+        except ValueError:
+            pass
+
+        return CellValue(type=CellType.STRING, value=value)
+
+    return CellValue(type=CellType.STRING, value=str(value))
+
+
 class PolarsAdapter(ReadOnlyAdapter):
     """Adapter for polars library (read-only, value-only).
 
@@ -139,6 +214,35 @@ class PolarsAdapter(ReadOnlyAdapter):
         cols = df.columns[c0 : c1 + 1]
         return df.slice(r0, r1 - r0 + 1).select(cols)
 
+    def read_sheet_values_columnar(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> SheetColumns:
+        """Encode the polars range into columnar buffers, parsing String cells back."""
+        df = self.read_sheet_values(workbook, sheet, cell_range)
+        return SheetColumns.from_cell_values(
+            [[_to_cell_value(v) for v in row] for row in df.iter_rows()]
+        )
+
+    def iter_sheet_rows(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Any]:
+        """Stream a range as polars DataFrame slices of ``batch_size`` rows.
+
+        ``pl.read_excel`` is eager, so the frame is loaded at open time; the
+        slices are zero-copy views over it.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        df = self.read_sheet_values(workbook, sheet, cell_range)
+        yield from df.iter_slices(n_rows=batch_size)
+
     def read_cell_value(
         self,
         workbook: Any,
@@ -157,80 +261,7 @@ class PolarsAdapter(ReadOnlyAdapter):
 
         value = df.item(row_idx, col_idx)
 
-        if value is None:
-            return CellValue(type=CellType.BLANK)
-
-        # polars may return native types for homogeneous columns
-        if isinstance(value, bool):
-            return CellValue(type=CellType.BOOLEAN, value=value)
-
-        if isinstance(value, (int, float)):
-            if isinstance(value, float) and (value != value):  # NaN check
-                return CellValue(type=CellType.BLANK)
-            return CellValue(type=CellType.NUMBER, value=value)
-
-        if isinstance(value, date) and not isinstance(value, datetime):
-            return CellValue(type=CellType.DATE, value=value)
-
-        if isinstance(value, datetime):
-            if (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            ):
-                return CellValue(type=CellType.DATE, value=value.date())
-            return CellValue(type=CellType.DATETIME, value=value)
-
-        # String path — parse back to native types
-        if isinstance(value, str):
-            if value == "":
-                return CellValue(type=CellType.BLANK)
-
-            # Error values
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
-                return CellValue(type=CellType.ERROR, value=value)
-
-            # Formula
-            if value.startswith("="):
-                return CellValue(type=CellType.FORMULA, value=value, formula=value)
-
-            # Boolean
-            if value.lower() == "true":
-                return CellValue(type=CellType.BOOLEAN, value=True)
-            if value.lower() == "false":
-                return CellValue(type=CellType.BOOLEAN, value=False)
-
-            # Number
-            try:
-                num = float(value)
-                if num == int(num) and "." not in value and "e" not in value.lower():
-                    return CellValue(type=CellType.NUMBER, value=int(value))
-                return CellValue(type=CellType.NUMBER, value=num)
-            except ValueError:
-                pass
-
-            # Datetime (polars stringifies as "YYYY-MM-DD HH:MM:SS")
-            try:
-                dt = datetime.fromisoformat(value)
-                if dt.hour == 0 and dt.minute == 0 and dt.second == 0 and dt.microsecond == 0:
-                    return CellValue(type=CellType.DATE, value=dt.date())
-                return CellValue(type=CellType.DATETIME, value=dt)
-            except ValueError:
-                pass
-
-            # Date only (YYYY-MM-DD)
-            try:
-                d = date.fromisoformat(value)
-                return CellValue(type=CellType.DATE, value=d)
-            except ValueError:
-                pass
-
-            return CellValue(type=CellType.STRING, value=value)
-
-        return CellValue(type=CellType.STRING, value=str(value))
+        return _to_cell_value(value)
 
     def read_cell_format(self, workbook: Any, sheet: str, cell: str) -> CellFormat:
         return CellFormat()
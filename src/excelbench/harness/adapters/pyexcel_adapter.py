@@ -43,6 +43,55 @@ def _parse_cell_ref(cell: str) -> tuple[int, int]:
     return row, col
 
 
+def _parse_cell_range(cell_range: str) -> tuple[int, int, int, int]:
+    """Parse A1:B2 into (r0, c0, r1, c1) inclusive, 0-based."""
+    clean = cell_range.replace("$", "").upper()
+    a, b = clean.split(":", 1) if ":" in clean else (clean, clean)
+    r0, c0 = _parse_cell_ref(a)
+    r1, c1 = _parse_cell_ref(b)
+    return min(r0, r1), min(c0, c1), max(r0, r1), max(c0, c1)
+
+
+def _convert_value(value: Any) -> CellValue:
+    """Convert a pyexcel cell value to a CellValue."""
+    if value is None or value == "":
+        return CellValue(type=CellType.BLANK)
+
+    if isinstance(value, bool):
+        return CellValue(type=CellType.BOOLEAN, value=value)
+
+    if isinstance(value, (int, float)):
+        return CellValue(type=CellType.NUMBER, value=value)
+
+    if isinstance(value, datetime):
+        is_midnight = (
+            value.hour == 0 and value.minute == 0 and value.second == 0 and value.microsecond == 0
+        )
+        if is_midnight:
+            return CellValue(type=CellType.DATE, value=value.date())
+        return CellValue(type=CellType.DATETIME, value=value)
+
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return CellValue(type=CellType.DATE, value=value)
+
+    if isinstance(value, time):
+        return CellValue(
+            type=CellType.DATETIME,
+            value=datetime.combine(date.today(), value),
+        )
+
+    if isinstance(value, str):
+        if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
+            return CellValue(type=CellType.ERROR, value=value)
+        if value.startswith("#") and value.endswith("!"):
+            return CellValue(type=CellType.ERROR, value=value)
+        if value.startswith("="):
+            return CellValue(type=CellType.FORMULA, value=value, formula=value)
+        return CellValue(type=CellType.STRING, value=value)
+
+    return CellValue(type=CellType.STRING, value=str(value))
+
+
 class PyexcelAdapter(ExcelAdapter):
     """Adapter for pyexcel library (read+write, value-only).
 
@@ -91,47 +140,43 @@ class PyexcelAdapter(ExcelAdapter):
         if col_idx >= len(row_data):
             return CellValue(type=CellType.BLANK)
 
-        value = row_data[col_idx]
-
-        if value is None or value == "":
-            return CellValue(type=CellType.BLANK)
+        return _convert_value(row_data[col_idx])
 
-        if isinstance(value, bool):
-            return CellValue(type=CellType.BOOLEAN, value=value)
-
-        if isinstance(value, (int, float)):
-            return CellValue(type=CellType.NUMBER, value=value)
-
-        if isinstance(value, datetime):
-            is_midnight = (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            )
-            if is_midnight:
-                return CellValue(type=CellType.DATE, value=value.date())
-            return CellValue(type=CellType.DATETIME, value=value)
-
-        if isinstance(value, date) and not isinstance(value, datetime):
-            return CellValue(type=CellType.DATE, value=value)
-
-        if isinstance(value, time):
-            return CellValue(
-                type=CellType.DATETIME,
-                value=datetime.combine(date.today(), value),
-            )
-
-        if isinstance(value, str):
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("="):
-                return CellValue(type=CellType.FORMULA, value=value, formula=value)
-            return CellValue(type=CellType.STRING, value=value)
-
-        return CellValue(type=CellType.STRING, value=str(value))
+    def read_sheet_values_raw(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[Any]]:
+        """Return pyexcel row lists without _convert_value() wrapping."""
+        try:
+            ws = workbook.sheet_by_name(sheet)
+        except (KeyError, AttributeError):
+            return []
+        if not cell_range:
+            return [list(row) for row in ws.rows()]
+
+        r0, c0, r1, c1 = _parse_cell_range(cell_range)
+        width = c1 - c0 + 1
+        n_rows = ws.number_of_rows()
+        out: list[list[Any]] = []
+        for r in range(r0, r1 + 1):
+            row = ws.row_at(r)[c0 : c1 + 1] if r < n_rows else []
+            out.append(list(row) + [None] * (width - len(row)))
+        return out
+
+    def read_sheet_values(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[CellValue]]:
+        """Bulk read a rectangular range as CellValues.
+
+        Optional helper used by performance workloads.
+        """
+        raw = self.read_sheet_values_raw(workbook, sheet, cell_range)
+        return [[_convert_value(v) for v in row] for row in raw]
 
     def read_cell_format(self, workbook: Any, sheet: str, cell: str) -> CellFormat:
         return CellFormat()
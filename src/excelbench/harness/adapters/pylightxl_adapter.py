@@ -42,6 +42,60 @@ def _parse_cell_ref(cell: str) -> tuple[int, int]:
     return row, col
 
 
+def _convert_value(value: Any) -> CellValue:
+    """Convert a pylightxl cell value to a CellValue."""
+    # pylightxl returns "" for empty cells
+    if value == "":
+        return CellValue(type=CellType.BLANK)
+
+    if value is None:
+        return CellValue(type=CellType.BLANK)
+
+    # Check bool BEFORE int (bool is subclass of int)
+    if isinstance(value, bool):
+        return CellValue(type=CellType.BOOLEAN, value=value)
+
+    if isinstance(value, (int, float)):
+        return CellValue(type=CellType.NUMBER, value=value)
+
+    if isinstance(value, datetime):
+        is_midnight = (
+            value.hour == 0 and value.minute == 0 and value.second == 0 and value.microsecond == 0
+        )
+        if is_midnight:
+            return CellValue(type=CellType.DATE, value=value.date())
+        return CellValue(type=CellType.DATETIME, value=value)
+
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return CellValue(type=CellType.DATE, value=value)
+
+    if isinstance(value, str):
+        # Date strings — pylightxl returns dates as "YYYY/MM/DD" strings
+        if re.match(r"^\d{4}/\d{2}/\d{2}$", value):
+            parsed = datetime.strptime(value, "%Y/%m/%d").date()
+            return CellValue(type=CellType.DATE, value=parsed)
+
+        # DateTime strings — "YYYY/MM/DD HH:MM:SS"
+        if re.match(r"^\d{4}/\d{2}/\d{2}\s\d{2}:\d{2}:\d{2}$", value):
+            parsed_dt = datetime.strptime(value, "%Y/%m/%d %H:%M:%S")
+            return CellValue(type=CellType.DATETIME, value=parsed_dt)
+
+        # Error values — includes #N/A (no trailing !)
+        if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
+            return CellValue(type=CellType.ERROR, value=value)
+        if value.startswith("#") and value.endswith("!"):
+            return CellValue(type=CellType.ERROR, value=value)
+
+        # Formulas — pylightxl preserves formula strings
+        if value.startswith("="):
+            return CellValue(type=CellType.FORMULA, value=value, formula=value)
+
+        return CellValue(type=CellType.STRING, value=value)
+
+    # Fallback
+    return CellValue(type=CellType.STRING, value=str(value))
+
+
 class PylightxlAdapter(ExcelAdapter):
     """Adapter for pylightxl library (read/write).
 
@@ -82,61 +136,33 @@ class PylightxlAdapter(ExcelAdapter):
         sheet: str,
         cell: str,
     ) -> CellValue:
-        value = workbook.ws(ws=sheet).address(address=cell)
-
-        # pylightxl returns "" for empty cells
-        if value == "":
-            return CellValue(type=CellType.BLANK)
-
-        if value is None:
-            return CellValue(type=CellType.BLANK)
-
-        # Check bool BEFORE int (bool is subclass of int)
-        if isinstance(value, bool):
-            return CellValue(type=CellType.BOOLEAN, value=value)
-
-        if isinstance(value, (int, float)):
-            return CellValue(type=CellType.NUMBER, value=value)
-
-        if isinstance(value, datetime):
-            is_midnight = (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            )
-            if is_midnight:
-                return CellValue(type=CellType.DATE, value=value.date())
-            return CellValue(type=CellType.DATETIME, value=value)
-
-        if isinstance(value, date) and not isinstance(value, datetime):
-            return CellValue(type=CellType.DATE, value=value)
-
-        if isinstance(value, str):
-            # Date strings — pylightxl returns dates as "YYYY/MM/DD" strings
-            if re.match(r"^\d{4}/\d{2}/\d{2}$", value):
-                parsed = datetime.strptime(value, "%Y/%m/%d").date()
-                return CellValue(type=CellType.DATE, value=parsed)
-
-            # DateTime strings — "YYYY/MM/DD HH:MM:SS"
-            if re.match(r"^\d{4}/\d{2}/\d{2}\s\d{2}:\d{2}:\d{2}$", value):
-                parsed_dt = datetime.strptime(value, "%Y/%m/%d %H:%M:%S")
-                return CellValue(type=CellType.DATETIME, value=parsed_dt)
-
-            # Error values — includes #N/A (no trailing !)
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
-                return CellValue(type=CellType.ERROR, value=value)
-
-            # Formulas — pylightxl preserves formula strings
-            if value.startswith("="):
-                return CellValue(type=CellType.FORMULA, value=value, formula=value)
-
-            return CellValue(type=CellType.STRING, value=value)
-
-        # Fallback
-        return CellValue(type=CellType.STRING, value=str(value))
+        return _convert_value(workbook.ws(ws=sheet).address(address=cell))
+
+    def read_sheet_values_raw(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[Any]]:
+        """Return pylightxl range() output without _convert_value() wrapping."""
+        ws = workbook.ws(ws=sheet)
+        if not cell_range:
+            return [list(row) for row in ws.rows]
+        rows: list[list[Any]] = ws.range(address=cell_range)
+        return rows
+
+    def read_sheet_values(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[CellValue]]:
+        """Bulk read a rectangular range as CellValues.
+
+        Optional helper used by performance workloads.
+        """
+        raw = self.read_sheet_values_raw(workbook, sheet, cell_range)
+        return [[_convert_value(v) for v in row] for row in raw]
 
     def read_cell_format(
         self,
@@ -13,6 +13,7 @@ from typing import Any
 import pyumya
 
 from excelbench.harness.adapters.base import ExcelAdapter
+from excelbench.harness.adapters.rust_adapter_utils import a1_range_grid
 from excelbench.models import (
     BorderEdge,
     BorderInfo,
@@ -76,6 +77,33 @@ def _border_style(style: str) -> BorderStyle:
         return BorderStyle.NONE
 
 
+def _convert_value(value: Any) -> CellValue:
+    """Convert a pyumya cell value to a CellValue."""
+    if value is None:
+        return CellValue(type=CellType.BLANK)
+
+    if isinstance(value, bool):
+        return CellValue(type=CellType.BOOLEAN, value=value)
+
+    if isinstance(value, (int, float)):
+        return CellValue(type=CellType.NUMBER, value=value)
+
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return CellValue(type=CellType.DATE, value=value)
+
+    if isinstance(value, datetime):
+        return CellValue(type=CellType.DATETIME, value=value)
+
+    if isinstance(value, str):
+        if value.startswith("="):
+            return CellValue(type=CellType.FORMULA, value=value, formula=value)
+        if _is_error_token(value):
+            return CellValue(type=CellType.ERROR, value=value)
+        return CellValue(type=CellType.STRING, value=value)
+
+    return CellValue(type=CellType.STRING, value=str(value))
+
+
 class PyumyaAdapter(ExcelAdapter):
     @property
     def info(self) -> LibraryInfo:
@@ -101,32 +129,35 @@ class PyumyaAdapter(ExcelAdapter):
         return [str(n) for n in workbook.sheetnames]
 
     def read_cell_value(self, workbook: Any, sheet: str, cell: str) -> CellValue:
+        return _convert_value(workbook[sheet][cell].value)
+
+    def read_sheet_values_raw(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[Any]]:
+        """Return pyumya cell values without _convert_value() wrapping.
+
+        Needs an explicit ``cell_range``; pyumya exposes no used-range bounds.
+        """
+        if not cell_range:
+            raise NotImplementedError("pyumya bulk reads need an explicit cell range")
         ws = workbook[sheet]
-        value = ws[cell].value
-
-        if value is None:
-            return CellValue(type=CellType.BLANK)
-
-        if isinstance(value, bool):
-            return CellValue(type=CellType.BOOLEAN, value=value)
-
-        if isinstance(value, (int, float)):
-            return CellValue(type=CellType.NUMBER, value=value)
-
-        if isinstance(value, date) and not isinstance(value, datetime):
-            return CellValue(type=CellType.DATE, value=value)
-
-        if isinstance(value, datetime):
-            return CellValue(type=CellType.DATETIME, value=value)
-
-        if isinstance(value, str):
-            if value.startswith("="):
-                return CellValue(type=CellType.FORMULA, value=value, formula=value)
-            if _is_error_token(value):
-                return CellValue(type=CellType.ERROR, value=value)
-            return CellValue(type=CellType.STRING, value=value)
-
-        return CellValue(type=CellType.STRING, value=str(value))
+        return [[ws[a1].value for a1 in row] for row in a1_range_grid(cell_range)]
+
+    def read_sheet_values(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[CellValue]]:
+        """Bulk read a rectangular range as CellValues.
+
+        Optional helper used by performance workloads.
+        """
+        raw = self.read_sheet_values_raw(workbook, sheet, cell_range)
+        return [[_convert_value(v) for v in row] for row in raw]
 
     def read_cell_format(self, workbook: Any, sheet: str, cell: str) -> CellFormat:
         ws = workbook[sheet]
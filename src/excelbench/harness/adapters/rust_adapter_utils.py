@@ -6,9 +6,12 @@ and the Python harness.
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import date, datetime
 from typing import Any
 
+from excelbench.harness.adapters.base import batch_rows
 from excelbench.models import BorderEdge, BorderInfo, BorderStyle, CellFormat, CellType, CellValue
 
 
@@ -91,6 +94,95 @@ def cell_value_from_payload(payload: dict[str, Any]) -> CellValue:
     return CellValue(type=CellType.STRING, value=str(value) if value is not None else None)
 
 
+def _a1_to_row_col(cell: str) -> tuple[int, int]:
+    """Parse 'A1' to 0-based (row, col)."""
+    m = re.match(r"([A-Z]+)(\d+)$", cell)
+    if not m:
+        raise ValueError(f"Invalid cell reference: {cell}")
+    col_str, row_str = m.groups()
+    col = 0
+    for ch in col_str:
+        col = col * 26 + (ord(ch) - ord("A") + 1)
+    return int(row_str) - 1, col - 1
+
+
+def _col_letters(col: int) -> str:
+    """0-based column index to Excel letters."""
+    letters = ""
+    c = col + 1
+    while c > 0:
+        c, rem = divmod(c - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def a1_range_grid(cell_range: str) -> list[list[str]]:
+    """Expand "A1:C2" into row-major A1 references (bounds in either order)."""
+    clean = cell_range.replace("$", "").upper()
+    a, b = clean.split(":", 1) if ":" in clean else (clean, clean)
+    ra, ca = _a1_to_row_col(a)
+    rb, cb = _a1_to_row_col(b)
+    letters = [_col_letters(c) for c in range(min(ca, cb), max(ca, cb) + 1)]
+    return [[f"{col}{r + 1}" for col in letters] for r in range(min(ra, rb), max(ra, rb) + 1)]
+
+
+def iter_rust_sheet_rows(
+    workbook: Any,
+    sheet: str,
+    cell_range: str | None,
+    batch_size: int,
+) -> Iterator[list[list[CellValue]]]:
+    """Page through a Rust-backed sheet with windowed read_sheet_values() calls.
+
+    The backend caches the parsed sheet, so each window only materializes
+    ``batch_size`` rows of payload dicts on the Python side.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    if cell_range:
+        clean = cell_range.replace("$", "").upper()
+        a, b = clean.split(":", 1) if ":" in clean else (clean, clean)
+        ra, ca = _a1_to_row_col(a)
+        rb, cb = _a1_to_row_col(b)
+        r0, c0, r1, c1 = min(ra, rb), min(ca, cb), max(ra, rb), max(ca, cb)
+    else:
+        bounds = workbook.sheet_bounds(sheet)
+        if bounds is None:
+            return
+        r0, c0, r1, c1 = bounds
+
+    first, last = _col_letters(c0), _col_letters(c1)
+    for start in range(r0, r1 + 1, batch_size):
+        end = min(start + batch_size - 1, r1)
+        raw = workbook.read_sheet_values(sheet, f"{first}{start + 1}:{last}{end + 1}")
+        yield [
+            [
+                cell_value_from_payload(v)
+                if isinstance(v, dict)
+                else CellValue(type=CellType.BLANK)
+                for v in row
+            ]
+            for row in raw
+        ]
+
+
+def append_rust_sheet_rows(
+    workbook: Any,
+    sheet: str,
+    rows: Iterable[Sequence[Any]],
+    batch_size: int = 1000,
+) -> None:
+    """Feed a row stream to RustXlsxWriterBook.write_sheet_values() in windows.
+
+    Only ``batch_size`` rows are held on the Python side at a time; the Rust
+    book still keeps every cell until save().
+    """
+    next_row = 1
+    for batch in batch_rows(rows, batch_size):
+        workbook.write_sheet_values(sheet, f"A{next_row}", batch)
+        next_row += len(batch)
+
+
 # ---------------------------------------------------------------------------
 # CellFormat / BorderInfo <-> dict converters for the PyO3 boundary
 # ---------------------------------------------------------------------------
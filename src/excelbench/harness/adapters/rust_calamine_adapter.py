@@ -4,6 +4,7 @@ This adapter exercises the Rust calamine crate through our local PyO3 extension
 module. It is read-only.
 """
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +12,7 @@ from excelbench.harness.adapters.base import ReadOnlyAdapter
 from excelbench.harness.adapters.rust_adapter_utils import (
     cell_value_from_payload,
     get_rust_backend_version,
+    iter_rust_sheet_rows,
 )
 from excelbench.models import (
     BorderInfo,
@@ -70,6 +72,44 @@ class RustCalamineAdapter(ReadOnlyAdapter):
             return CellValue(type=CellType.STRING, value=str(payload))
         return cell_value_from_payload(payload)
 
+    def read_sheet_values(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[CellValue]]:
+        """Bulk read all values from a sheet via CalamineBook.read_sheet_values()."""
+        raw = workbook.read_sheet_values(sheet, cell_range)
+        return [
+            [
+                cell_value_from_payload(v)
+                if isinstance(v, dict)
+                else CellValue(type=CellType.BLANK)
+                for v in row
+            ]
+            for row in raw
+        ]
+
+    def read_sheet_values_raw(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[Any]]:
+        """Return raw Rust FFI output without cell_value_from_payload() wrapping."""
+        result: list[list[Any]] = workbook.read_sheet_values(sheet, cell_range)
+        return result
+
+    def iter_sheet_rows(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[list[CellValue]]]:
+        """Stream row batches via windowed CalamineBook.read_sheet_values() calls."""
+        return iter_rust_sheet_rows(workbook, sheet, cell_range, batch_size)
+
     def read_cell_format(self, workbook: Any, sheet: str, cell: str) -> CellFormat:
         return CellFormat()
 
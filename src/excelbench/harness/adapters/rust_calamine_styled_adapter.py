@@ -6,6 +6,7 @@ It is read-only and supports .xlsx files only (the styled API requires the
 Xlsx<R> reader, not the format-sniffing open_workbook_auto).
 """
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,7 @@ from excelbench.harness.adapters.rust_adapter_utils import (
     dict_to_border,
     dict_to_format,
     get_rust_backend_version,
+    iter_rust_sheet_rows,
 )
 from excelbench.models import (
     BorderInfo,
@@ -22,6 +24,7 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    SheetColumns,
 )
 
 JSONDict = dict[str, Any]
@@ -110,6 +113,38 @@ class RustCalamineStyledAdapter(ReadOnlyAdapter):
         result: list[list[Any]] = workbook.read_sheet_values(sheet, cell_range)
         return result
 
+    def read_sheet_values_columnar(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> SheetColumns:
+        """Bulk read into typed buffers via CalamineStyledBook.read_sheet_values_columnar().
+
+        The Rust side returns native-endian ``bytes``; ``memoryview.cast`` exposes
+        them as typed buffers without copying.
+        """
+        raw = workbook.read_sheet_values_columnar(sheet, cell_range)
+        return SheetColumns(
+            rows=int(raw["rows"]),
+            cols=int(raw["cols"]),
+            type_codes=memoryview(raw["type_codes"]),
+            values=memoryview(raw["values"]).cast("d"),
+            string_index=memoryview(raw["string_index"]).cast("i"),
+            strings=list(raw["strings"]),
+            formulas=dict(raw["formulas"]),
+        )
+
+    def iter_sheet_rows(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[list[CellValue]]]:
+        """Stream row batches via windowed CalamineStyledBook.read_sheet_values() calls."""
+        return iter_rust_sheet_rows(workbook, sheet, cell_range, batch_size)
+
     def read_cell_format(self, workbook: Any, sheet: str, cell: str) -> CellFormat:
         payload = workbook.read_cell_format(sheet, cell)
         if not isinstance(payload, dict) or not payload:
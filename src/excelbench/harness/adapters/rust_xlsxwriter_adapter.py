@@ -4,11 +4,13 @@ Supports Tier 0/1 cell values, formulas, and formatting (text, background,
 borders, alignment, number formats, dimensions).
 """
 
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
 from excelbench.harness.adapters.base import WriteOnlyAdapter
 from excelbench.harness.adapters.rust_adapter_utils import (
+    append_rust_sheet_rows,
     border_to_dict,
     format_to_dict,
     get_rust_backend_version,
@@ -92,6 +94,10 @@ class RustXlsxWriterAdapter(WriteOnlyAdapter):
         """Bulk write a grid of values via RustXlsxWriterBook.write_sheet_values()."""
         workbook.write_sheet_values(sheet, start_cell, values)
 
+    def append_rows(self, workbook: Any, sheet: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Stream rows into RustXlsxWriterBook in bounded write_sheet_values() batches."""
+        append_rust_sheet_rows(workbook, sheet, rows)
+
     def set_row_height(self, workbook: Any, sheet: str, row: int, height: float) -> None:
         workbook.set_row_height(sheet, row - 1, height)
 
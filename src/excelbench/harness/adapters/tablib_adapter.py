@@ -20,6 +20,7 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    SheetColumns,
 )
 
 JSONDict = dict[str, Any]
@@ -65,6 +66,43 @@ def _parse_cell_range(cell_range: str) -> tuple[int, int, int, int]:
     return r0, c0, r1, c1
 
 
+def _to_cell_value(value: Any) -> CellValue:
+    """Classify one Dataset value as a CellValue."""
+    if value is None or value == "":
+        return CellValue(type=CellType.BLANK)
+
+    if isinstance(value, bool):
+        return CellValue(type=CellType.BOOLEAN, value=value)
+
+    if isinstance(value, (int, float)):
+        return CellValue(type=CellType.NUMBER, value=value)
+
+    if isinstance(value, datetime):
+        if value.hour == 0 and value.minute == 0 and value.second == 0 and value.microsecond == 0:
+            return CellValue(type=CellType.DATE, value=value.date())
+        return CellValue(type=CellType.DATETIME, value=value)
+
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return CellValue(type=CellType.DATE, value=value)
+
+    if isinstance(value, time):
+        return CellValue(
+            type=CellType.DATETIME,
+            value=datetime.combine(date.today(), value),
+        )
+
+    if isinstance(value, str):
+        if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
+            return CellValue(type=CellType.ERROR, value=value)
+        if value.startswith("#") and value.endswith("!"):
+            return CellValue(type=CellType.ERROR, value=value)
+        if value.startswith("="):
+            return CellValue(type=CellType.FORMULA, value=value, formula=value)
+        return CellValue(type=CellType.STRING, value=value)
+
+    return CellValue(type=CellType.STRING, value=str(value))
+
+
 class TablibAdapter(ExcelAdapter):
     """Adapter for tablib library (read+write, value-only).
 
@@ -134,6 +172,16 @@ class TablibAdapter(ExcelAdapter):
             out.append(list(row[c0 : c1 + 1]))
         return out
 
+    def read_sheet_values_columnar(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> SheetColumns:
+        """Encode the Dataset range into columnar buffers."""
+        rows = self.read_sheet_values(workbook, sheet, cell_range)
+        return SheetColumns.from_cell_values([[_to_cell_value(v) for v in row] for row in rows])
+
     def read_cell_value(
         self,
         workbook: Any,
@@ -159,44 +207,7 @@ class TablibAdapter(ExcelAdapter):
 
         value = row_data[col_idx]
 
-        if value is None or value == "":
-            return CellValue(type=CellType.BLANK)
-
-        if isinstance(value, bool):
-            return CellValue(type=CellType.BOOLEAN, value=value)
-
-        if isinstance(value, (int, float)):
-            return CellValue(type=CellType.NUMBER, value=value)
-
-        if isinstance(value, datetime):
-            if (
-                value.hour == 0
-                and value.minute == 0
-                and value.second == 0
-                and value.microsecond == 0
-            ):
-                return CellValue(type=CellType.DATE, value=value.date())
-            return CellValue(type=CellType.DATETIME, value=value)
-
-        if isinstance(value, date) and not isinstance(value, datetime):
-            return CellValue(type=CellType.DATE, value=value)
-
-        if isinstance(value, time):
-            return CellValue(
-                type=CellType.DATETIME,
-                value=datetime.combine(date.today(), value),
-            )
-
-        if isinstance(value, str):
-            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("#") and value.endswith("!"):
-                return CellValue(type=CellType.ERROR, value=value)
-            if value.startswith("="):
-                return CellValue(type=CellType.FORMULA, value=value, formula=value)
-            return CellValue(type=CellType.STRING, value=value)
-
-        return CellValue(type=CellType.STRING, value=str(value))
+        return _to_cell_value(value)
 
     def read_cell_format(self, workbook: Any, sheet: str, cell: str) -> CellFormat:
         return CellFormat()
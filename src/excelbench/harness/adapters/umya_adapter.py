@@ -7,6 +7,7 @@ data validation, conditional formatting), and Tier 3 features (named ranges,
 tables).
 """
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +19,7 @@ from excelbench.harness.adapters.rust_adapter_utils import (
     dict_to_format,
     format_to_dict,
     get_rust_backend_version,
+    iter_rust_sheet_rows,
     payload_from_cell_value,
 )
 from excelbench.models import (
@@ -26,6 +28,7 @@ from excelbench.models import (
     CellType,
     CellValue,
     LibraryInfo,
+    SheetColumns,
 )
 
 JSONDict = dict[str, Any]
@@ -63,7 +66,9 @@ class UmyaAdapter(ExcelAdapter):
 
         m: Any = rust
         cls = getattr(m, "UmyaBook")
-        return cls.open(str(path))
+        # Lazy open: worksheets are deserialized on first access, so reading
+        # one sheet of a large multi-sheet workbook skips parsing the others.
+        return cls.open(str(path), lazy=True)
 
     def close_workbook(self, workbook: Any) -> None:
         return
@@ -77,6 +82,64 @@ class UmyaAdapter(ExcelAdapter):
             return CellValue(type=CellType.STRING, value=str(payload))
         return cell_value_from_payload(payload)
 
+    def read_sheet_values_raw(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[Any]]:
+        """Return raw Rust FFI output without cell_value_from_payload() wrapping."""
+        result: list[list[Any]] = workbook.read_sheet_values(sheet, cell_range)
+        return result
+
+    def read_sheet_values(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[CellValue]]:
+        """Bulk read via UmyaBook.read_sheet_values() (one FFI call per range).
+
+        Optional helper used by performance workloads.
+        """
+        return [
+            [
+                cell_value_from_payload(p)
+                if isinstance(p, dict)
+                else CellValue(type=CellType.STRING, value=str(p))
+                for p in row
+            ]
+            for row in self.read_sheet_values_raw(workbook, sheet, cell_range)
+        ]
+
+    def read_sheet_values_columnar(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> SheetColumns:
+        """Bulk read into typed buffers via UmyaBook.read_sheet_values_columnar()."""
+        raw = workbook.read_sheet_values_columnar(sheet, cell_range)
+        return SheetColumns(
+            rows=int(raw["rows"]),
+            cols=int(raw["cols"]),
+            type_codes=memoryview(raw["type_codes"]),
+            values=memoryview(raw["values"]).cast("d"),
+            string_index=memoryview(raw["string_index"]).cast("i"),
+            strings=list(raw["strings"]),
+            formulas=dict(raw["formulas"]),
+        )
+
+    def iter_sheet_rows(
+        self,
+        workbook: Any,
+        sheet: str,
+        cell_range: str | None = None,
+        batch_size: int = 1000,
+    ) -> Iterator[list[list[CellValue]]]:
+        """Stream row batches via windowed UmyaBook.read_sheet_values() calls."""
+        return iter_rust_sheet_rows(workbook, sheet, cell_range, batch_size)
+
     def read_cell_format(self, workbook: Any, sheet: str, cell: str) -> CellFormat:
         d = workbook.read_cell_format(sheet, cell)
         if not isinstance(d, dict) or not d:
@@ -4,11 +4,13 @@ Combines the fastest Rust Excel reader (calamine with style support) and the
 fastest Rust writer (rust_xlsxwriter) into a single full-fidelity R+W adapter.
 """
 
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
 from excelbench.harness.adapters.base import ExcelAdapter
 from excelbench.harness.adapters.rust_adapter_utils import (
+    append_rust_sheet_rows,
     border_to_dict,
     cell_value_from_payload,
     dict_to_border,
@@ -38,6 +40,28 @@ if getattr(_excelbench_rust, "RustXlsxWriterBook", None) is None:  # pragma: no
     raise ImportError("wolfxl._rust built without rust_xlsxwriter backend")
 
 
+class _PatchSession:
+    """Expose XlsxPatcher's queue_* API under the writer method names.
+
+    Lets the adapter's write_cell_* methods drive a modify session unchanged.
+    """
+
+    def __init__(self, patcher: Any) -> None:
+        self._patcher = patcher
+
+    def write_cell_value(self, sheet: str, cell: str, payload: JSONDict) -> None:
+        self._patcher.queue_value(sheet, cell, payload)
+
+    def write_cell_format(self, sheet: str, cell: str, format_dict: JSONDict) -> None:
+        self._patcher.queue_format(sheet, cell, format_dict)
+
+    def write_cell_border(self, sheet: str, cell: str, border_dict: JSONDict) -> None:
+        self._patcher.queue_border(sheet, cell, border_dict)
+
+    def save(self, path: str) -> None:
+        self._patcher.save(path)
+
+
 class WolfxlAdapter(ExcelAdapter):
     """Hybrid adapter: calamine-styled reads + rust_xlsxwriter writes."""
 
@@ -226,6 +250,10 @@ class WolfxlAdapter(ExcelAdapter):
         """Bulk write a grid of values via RustXlsxWriterBook.write_sheet_values()."""
         workbook.write_sheet_values(sheet, start_cell, values)
 
+    def append_rows(self, workbook: Any, sheet: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Stream rows into RustXlsxWriterBook in bounded write_sheet_values() batches."""
+        append_rust_sheet_rows(workbook, sheet, rows)
+
     def write_cell_format(self, workbook: Any, sheet: str, cell: str, format: CellFormat) -> None:
         d = format_to_dict(format)
         if d:
@@ -294,3 +322,16 @@ class WolfxlAdapter(ExcelAdapter):
 
     def save_workbook(self, workbook: Any, path: Path) -> None:
         workbook.save(str(path))
+
+    # =========================================================================
+    # Modify — delegates to XlsxPatcher (surgical ZIP patching)
+    # =========================================================================
+
+    def open_for_modify(self, path: Path) -> Any:
+        import wolfxl._rust as rust
+
+        m: Any = rust
+        return _PatchSession(getattr(m, "XlsxPatcher").open(str(path)))
+
+    def save_modified(self, workbook: Any, path: Path) -> None:
+        workbook.save(str(path))
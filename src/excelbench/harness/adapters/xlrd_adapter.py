@@ -40,6 +40,69 @@ def _parse_cell_ref(cell: str) -> tuple[int, int]:
     return row, col
 
 
+def _parse_cell_range(cell_range: str) -> tuple[int, int, int, int]:
+    """Parse A1:B2 into (r0, c0, r1, c1) inclusive, 0-based."""
+    clean = cell_range.replace("$", "").upper()
+    a, b = clean.split(":", 1) if ":" in clean else (clean, clean)
+    r0, c0 = _parse_cell_ref(a)
+    r1, c1 = _parse_cell_ref(b)
+    return min(r0, r1), min(c0, c1), max(r0, r1), max(c0, c1)
+
+
+def _convert_value(cell_type: int, value: Any, datemode: int) -> CellValue:
+    """Convert an xlrd (cell type, value) pair to a CellValue."""
+    # xlrd cell types:
+    # 0 = XL_CELL_EMPTY, 1 = XL_CELL_TEXT, 2 = XL_CELL_NUMBER
+    # 3 = XL_CELL_DATE, 4 = XL_CELL_BOOLEAN, 5 = XL_CELL_ERROR, 6 = XL_CELL_BLANK
+    if cell_type in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+        return CellValue(type=CellType.BLANK)
+
+    if cell_type == xlrd.XL_CELL_TEXT:
+        if isinstance(value, str):
+            if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
+                return CellValue(type=CellType.ERROR, value=value)
+            if value.startswith("#") and value.endswith("!"):
+                return CellValue(type=CellType.ERROR, value=value)
+            if value.startswith("="):
+                return CellValue(type=CellType.FORMULA, value=value, formula=value)
+        return CellValue(type=CellType.STRING, value=value)
+
+    if cell_type == xlrd.XL_CELL_NUMBER:
+        return CellValue(type=CellType.NUMBER, value=value)
+
+    if cell_type == xlrd.XL_CELL_DATE:
+        from datetime import date, datetime
+
+        date_tuple = xlrd.xldate_as_tuple(value, datemode)
+        year, month, day, hour, minute, second = date_tuple
+        if hour == 0 and minute == 0 and second == 0:
+            return CellValue(type=CellType.DATE, value=date(year, month, day))
+        return CellValue(
+            type=CellType.DATETIME,
+            value=datetime(year, month, day, hour, minute, second),
+        )
+
+    if cell_type == xlrd.XL_CELL_BOOLEAN:
+        return CellValue(type=CellType.BOOLEAN, value=bool(value))
+
+    if cell_type == xlrd.XL_CELL_ERROR:
+        error_map = {
+            0: "#NULL!",
+            7: "#DIV/0!",
+            15: "#VALUE!",
+            23: "#REF!",
+            29: "#NAME?",
+            36: "#NUM!",
+            42: "#N/A",
+        }
+        return CellValue(
+            type=CellType.ERROR,
+            value=error_map.get(int(value), f"#ERROR({value})"),
+        )
+
+    return CellValue(type=CellType.STRING, value=str(value))
+
+
 # xlrd border style index → ExcelBench BorderStyle
 _BORDER_STYLE_MAP: dict[int, BorderStyle] = {
     0: BorderStyle.NONE,
@@ -136,59 +199,48 @@ class XlrdAdapter(ReadOnlyAdapter):
         if row_idx >= sh.nrows or col_idx >= sh.ncols:
             return CellValue(type=CellType.BLANK)
 
-        cell_type = sh.cell_type(row_idx, col_idx)
-        value = sh.cell_value(row_idx, col_idx)
-
-        # xlrd cell types:
-        # 0 = XL_CELL_EMPTY, 1 = XL_CELL_TEXT, 2 = XL_CELL_NUMBER
-        # 3 = XL_CELL_DATE, 4 = XL_CELL_BOOLEAN, 5 = XL_CELL_ERROR, 6 = XL_CELL_BLANK
-        if cell_type in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
-            return CellValue(type=CellType.BLANK)
-
-        if cell_type == xlrd.XL_CELL_TEXT:
-            if isinstance(value, str):
-                if value in ("#N/A", "#NULL!", "#NAME?", "#REF!"):
-                    return CellValue(type=CellType.ERROR, value=value)
-                if value.startswith("#") and value.endswith("!"):
-                    return CellValue(type=CellType.ERROR, value=value)
-                if value.startswith("="):
-                    return CellValue(type=CellType.FORMULA, value=value, formula=value)
-            return CellValue(type=CellType.STRING, value=value)
-
-        if cell_type == xlrd.XL_CELL_NUMBER:
-            return CellValue(type=CellType.NUMBER, value=value)
-
-        if cell_type == xlrd.XL_CELL_DATE:
-            from datetime import date, datetime
-
-            date_tuple = xlrd.xldate_as_tuple(value, workbook.datemode)
-            year, month, day, hour, minute, second = date_tuple
-            if hour == 0 and minute == 0 and second == 0:
-                return CellValue(type=CellType.DATE, value=date(year, month, day))
-            return CellValue(
-                type=CellType.DATETIME,
-                value=datetime(year, month, day, hour, minute, second),
-            )
+        return _convert_value(
+            sh.cell_type(row_idx, col_idx), sh.cell_value(row_idx, col_idx), workbook.datemode
+        )
 
-        if cell_type == xlrd.XL_CELL_BOOLEAN:
-            return CellValue(type=CellType.BOOLEAN, value=bool(value))
-
-        if cell_type == xlrd.XL_CELL_ERROR:
-            error_map = {
-                0: "#NULL!",
-                7: "#DIV/0!",
-                15: "#VALUE!",
-                23: "#REF!",
-                29: "#NAME?",
-                36: "#NUM!",
-                42: "#N/A",
-            }
-            return CellValue(
-                type=CellType.ERROR,
-                value=error_map.get(int(value), f"#ERROR({value})"),
-            )
+    def read_sheet_values_raw(
+        self,
+        workbook: Book,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[Any]]:
+        """Return xlrd Cell rows (row_slice) without _convert_value() wrapping.
 
-        return CellValue(type=CellType.STRING, value=str(value))
+        Cells past the sheet's used area are None.
+        """
+        sh: Sheet = workbook.sheet_by_name(sheet)
+        if not cell_range:
+            return [sh.row_slice(r) for r in range(sh.nrows)]
+
+        r0, c0, r1, c1 = _parse_cell_range(cell_range)
+        width = c1 - c0 + 1
+        out: list[list[Any]] = []
+        for r in range(r0, r1 + 1):
+            row: list[Any] = sh.row_slice(r, c0, c1 + 1) if r < sh.nrows and c0 < sh.ncols else []
+            out.append(row + [None] * (width - len(row)))
+        return out
+
+    def read_sheet_values(
+        self,
+        workbook: Book,
+        sheet: str,
+        cell_range: str | None = None,
+    ) -> list[list[CellValue]]:
+        """Bulk read a rectangular range as CellValues.
+
+        Optional helper used by performance workloads.
+        """
+        datemode = workbook.datemode
+        blank = CellValue(type=CellType.BLANK)
+        return [
+            [blank if c is None else _convert_value(c.ctype, c.value, datemode) for c in row]
+            for row in self.read_sheet_values_raw(workbook, sheet, cell_range)
+        ]
 
     def read_cell_format(
         self,
@@ -1,5 +1,6 @@
 """Adapter for xlsxwriter library (write-only)."""
 
+from collections.abc import Iterable, Sequence
 from datetime import date as _date
 from datetime import datetime as _datetime
 from pathlib import Path
@@ -196,6 +197,41 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
             }
         )
 
+    def append_rows(
+        self,
+        workbook: WorkbookData,
+        sheet: str,
+        rows: Iterable[Sequence[Any]],
+    ) -> None:
+        """Queue a lazy row stream starting at A1.
+
+        The iterable is only consumed in save_workbook(), row by row, so a
+        generator never materializes on the harness side.
+        """
+        self._ensure_sheet(workbook, sheet)
+        workbook["sheets"][sheet].append({"type": "rows", "row": 0, "col": 0, "rows": rows})
+
+    @staticmethod
+    def _write_raw_rows(ws: Any, op: dict[str, Any]) -> None:
+        """Replay a queued "grid" or "rows" op onto a worksheet."""
+        rows = op.get("values") if op["type"] == "grid" else op.get("rows")
+        if rows is None:
+            return
+        start_row = op["row"]
+        start_col = op["col"]
+        for r_off, row_vals in enumerate(rows):
+            if not isinstance(row_vals, (list, tuple)):
+                continue
+            # If a row contains None values, treat them as "skip" to better
+            # model sparse bulk writes.
+            if None not in row_vals:
+                ws.write_row(start_row + r_off, start_col, row_vals)
+            else:
+                for c_off, v in enumerate(row_vals):
+                    if v is None:
+                        continue
+                    ws.write(start_row + r_off, start_col + c_off, v)
+
     def write_cell_format(
         self,
         workbook: WorkbookData,
@@ -385,23 +421,8 @@ class XlsxwriterAdapter(WriteOnlyAdapter):
                 cell_ops: dict[tuple[int, int], dict[str, Any]] = {}
 
                 for op in operations:
-                    if op["type"] == "grid":
-                        start_row = op["row"]
-                        start_col = op["col"]
-                        grid = op.get("values")
-                        if isinstance(grid, list):
-                            for r_off, row_vals in enumerate(grid):
-                                if not isinstance(row_vals, list):
-                                    continue
-                                # If a row contains None values, treat them as "skip" to better
-                                # model sparse bulk writes.
-                                if None not in row_vals:
-                                    ws.write_row(start_row + r_off, start_col, row_vals)
-                                else:
-                                    for c_off, v in enumerate(row_vals):
-                                        if v is None:
-                                            continue
-                                        ws.write(start_row + r_off, start_col + c_off, v)
+                    if op["type"] in ("grid", "rows"):
+                        self._write_raw_rows(ws, op)
                         continue
 
                     key = (op["row"], op["col"])
@@ -5,7 +5,9 @@ Identical to XlsxwriterAdapter except the workbook is created with
 (no random cell access) — measuring whether fidelity scores change.
 
 Key constraint: cells must be written top→bottom, left→right.
-The deferred buffer is sorted by (row, col) before replay.
+Bulk grids and append_rows() streams are replayed first, then the deferred
+per-cell buffer sorted by (row, col); cells landing in rows that have already
+been flushed are dropped by xlsxwriter.
 """
 
 from pathlib import Path
@@ -68,9 +70,17 @@ class XlsxwriterConstmemAdapter(XlsxwriterAdapter):
                 for cell_range in workbook["merges"].get(sheet_name, []):
                     ws.merge_range(cell_range, "")
 
+                # Bulk grids / row streams go first, in queue order: they are
+                # written top-down, and a row generator is consumed exactly once.
+                for op in operations:
+                    if op["type"] in ("grid", "rows"):
+                        self._write_raw_rows(ws, op)
+
                 # Group operations by cell, then sort by (row, col)
                 cell_ops: dict[tuple[int, int], dict[str, Any]] = {}
                 for op in operations:
+                    if op["type"] in ("grid", "rows"):
+                        continue
                     key = (op["row"], op["col"])
                     if key not in cell_ops:
                         cell_ops[key] = {"value": None, "format": None, "border": None}
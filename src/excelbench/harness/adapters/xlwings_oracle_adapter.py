@@ -125,7 +125,14 @@ def _cell_address(row: int, col: int) -> str:
 
 
 class ExcelOracleAdapter(ReadOnlyAdapter):
-    """Read-only adapter backed by Excel via xlwings."""
+    """Read-only adapter backed by Excel via xlwings.
+
+    Pass a running ``xw.App`` to open workbooks in that session instead of
+    whichever Excel instance xlwings picks (or starts) per workbook.
+    """
+
+    def __init__(self, app: Any | None = None) -> None:
+        self._app = app
 
     @property
     def info(self) -> LibraryInfo:
@@ -137,6 +144,8 @@ class ExcelOracleAdapter(ReadOnlyAdapter):
         )
 
     def open_workbook(self, path: Path) -> Any:
+        if self._app is not None:
+            return self._app.books.open(str(path))
         return xw.Book(str(path))
 
     def close_workbook(self, workbook: Any) -> None:
@@ -1,19 +1,30 @@
 """Test runner for executing benchmarks."""
 
+import copy
+import hashlib
+import json
 import os
 import platform
 import tempfile
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from excelbench import __version__
 from excelbench.generator.generate import load_manifest
+from excelbench.harness import verifier_pool
 from excelbench.harness.adapters import (
     ExcelAdapter,
     ExcelOracleAdapter,
     OpenpyxlAdapter,
     get_all_adapters,
 )
+from excelbench.harness.verify_cache import (
+    VerificationCache,
+    manifest_entry_hash,
+    output_content_hash,
+)
 from excelbench.models import (
     BenchmarkMetadata,
     BenchmarkResults,
@@ -122,17 +133,29 @@ def run_benchmark(
     adapters: list[ExcelAdapter] | None = None,
     features: list[str] | None = None,
     profile: str = "xlsx",
+    jobs: int = 1,
+    verify_cache: VerificationCache | None = None,
+    previous: BenchmarkResults | None = None,
 ) -> BenchmarkResults:
     """Run the full benchmark suite.
 
     Args:
         test_dir: Directory containing test files and manifest.json.
         adapters: List of adapters to test. If None, uses all available.
+        jobs: Worker processes for (test file, adapter) pairs. 1 runs serially;
+            any value yields scores in the same manifest x adapter order.
+        verify_cache: Reuse write-verification results for outputs whose
+            content, verifier and expectations match a previous run.
+        previous: Results of an earlier run (incremental mode). A (feature,
+            adapter) score is copied from it instead of re-tested when its
+            fingerprint (see feature_fingerprint) is unchanged.
 
     Returns:
         BenchmarkResults with all scores.
     """
     test_dir = Path(test_dir)
+    if jobs < 1:
+        raise ValueError("jobs must be >= 1")
 
     # Load manifest
     manifest_path = test_dir / "manifest.json"
@@ -164,37 +187,59 @@ def run_benchmark(
     # Collect library info
     libraries = {adapter.name: adapter.info for adapter in adapters}
 
+    prior_scores: dict[tuple[str, str], FeatureScore] = {}
+    if previous is not None and previous.metadata.profile == profile:
+        prior_scores = {(s.feature, s.library): s for s in previous.scores if s.fingerprint}
+
     # Run tests for each file
     all_scores: list[FeatureScore] = []
+    fidelity_s = 0.0
+    verify_s = 0.0
+
+    if jobs > 1:
+        all_scores, fidelity_s, verify_s = _run_features_parallel(
+            test_dir,
+            manifest.files,
+            adapters,
+            jobs,
+            verify_cache=verify_cache,
+            prior_scores=prior_scores,
+        )
+    else:
+        for test_file in manifest.files:
+            file_path = test_dir / test_file.path
 
-    for test_file in manifest.files:
-        file_path = test_dir / test_file.path
-
-        if not file_path.exists():
-            print(f"Warning: Test file not found: {file_path}")
-            continue
+            if not file_path.exists():
+                print(f"Warning: Test file not found: {file_path}")
+                continue
 
-        print(f"Testing {test_file.feature}...")
+            print(f"Testing {test_file.feature}...")
+            fixture_sha256 = output_content_hash(file_path)
 
-        for adapter in adapters:
-            score = test_feature(
-                adapter=adapter,
-                test_file=test_file,
-                file_path=file_path,
-            )
-            score = _annotate_known_limitations(score)
-            if (
-                test_file.feature == "pivot_tables"
-                and platform.system() == "Darwin"
-                and not test_file.test_cases
-                and not score.notes
-            ):
-                score.notes = (
-                    "Unsupported on macOS without a Windows-generated pivot fixture "
-                    "(fixtures/excel/tier2/15_pivot_tables.xlsx)."
+            for adapter in adapters:
+                fingerprint = feature_fingerprint(test_file, fixture_sha256, adapter)
+                reused = _reusable_score(prior_scores, test_file, adapter, fingerprint)
+                if reused is not None:
+                    all_scores.append(reused)
+                    print(f"  {adapter.name}: unchanged, reusing previous scores")
+                    continue
+                score, feature_s, feature_verify_s = _timed_test_feature(
+                    adapter, test_file, file_path, verify_cache
                 )
-            all_scores.append(score)
-            print(f"  {adapter.name}: read={score.read_score}, write={score.write_score}")
+                fidelity_s += feature_s
+                verify_s += feature_verify_s
+                score = _finalize_score(score, test_file)
+                score.fingerprint = fingerprint
+                all_scores.append(score)
+                print(f"  {adapter.name}: read={score.read_score}, write={score.write_score}")
+
+    metadata.fidelity_s = round(fidelity_s, 3)
+    metadata.verify_s = round(verify_s, 3)
+    if fidelity_s > 0:
+        print(
+            f"Write verification: {verify_s:.1f}s of {fidelity_s:.1f}s fidelity time "
+            f"({verify_s / fidelity_s:.0%})"
+        )
 
     return BenchmarkResults(
         metadata=metadata,
@@ -203,10 +248,216 @@ def run_benchmark(
     )
 
 
+def feature_fingerprint(test_file: TestFile, fixture_sha256: str, adapter: ExcelAdapter) -> str:
+    """Hash of everything a (feature, adapter) score depends on.
+
+    Covers the fixture content (``fixture_sha256``, from output_content_hash),
+    the feature's manifest entry, the adapter name and library version, and the
+    harness version. Scores are stored with their fingerprint in results.json;
+    an equal fingerprint on a later run means the score can be reused.
+    """
+    parts = {
+        "fixture_sha256": fixture_sha256,
+        "manifest_sha256": manifest_entry_hash(test_file),
+        "adapter": adapter.name,
+        "adapter_version": adapter.info.version,
+        "benchmark_version": BENCHMARK_VERSION,
+        "excelbench": __version__,
+    }
+    canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _reusable_score(
+    prior_scores: dict[tuple[str, str], FeatureScore],
+    test_file: TestFile,
+    adapter: ExcelAdapter,
+    fingerprint: str,
+) -> FeatureScore | None:
+    prior = prior_scores.get((test_file.feature, adapter.name))
+    if prior is None or prior.fingerprint != fingerprint:
+        return None
+    return copy.deepcopy(prior)
+
+
+def _timed_test_feature(
+    adapter: ExcelAdapter,
+    test_file: TestFile,
+    file_path: Path,
+    verify_cache: VerificationCache | None,
+) -> tuple[FeatureScore, float, float]:
+    """Run test_feature; also return its wall time and the verifier share of it."""
+    verify_before = verifier_pool.verification_stats().seconds
+    start = time.perf_counter()
+    score = test_feature(
+        adapter=adapter,
+        test_file=test_file,
+        file_path=file_path,
+        verify_cache=verify_cache,
+    )
+    elapsed = time.perf_counter() - start
+    return score, elapsed, verifier_pool.verification_stats().seconds - verify_before
+
+
+def _finalize_score(score: FeatureScore, test_file: TestFile) -> FeatureScore:
+    score = _annotate_known_limitations(score)
+    if (
+        test_file.feature == "pivot_tables"
+        and platform.system() == "Darwin"
+        and not test_file.test_cases
+        and not score.notes
+    ):
+        score.notes = (
+            "Unsupported on macOS without a Windows-generated pivot fixture "
+            "(fixtures/excel/tier2/15_pivot_tables.xlsx)."
+        )
+    return score
+
+
+def _run_features_parallel(
+    test_dir: Path,
+    test_files: list[TestFile],
+    adapters: list[ExcelAdapter],
+    jobs: int,
+    *,
+    verify_cache: VerificationCache | None = None,
+    prior_scores: dict[tuple[str, str], FeatureScore] | None = None,
+) -> tuple[list[FeatureScore], float, float]:
+    """Dispatch (test file, adapter) pairs to a process pool.
+
+    Workers re-instantiate adapters from their class so no workbook state is
+    shared; each worker process keeps its own verifier pool. Progress is
+    printed as scores arrive; the returned list is in manifest x adapter
+    order, matching the serial run, followed by the summed per-feature and
+    verification times. Pairs with a matching entry in ``prior_scores`` are
+    reused without being dispatched.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    prior_scores = prior_scores or {}
+    tasks: list[tuple[int, int]] = []
+    fingerprints: dict[tuple[int, int], str] = {}
+    scores: dict[tuple[int, int], FeatureScore] = {}
+    for fi, test_file in enumerate(test_files):
+        file_path = test_dir / test_file.path
+        if not file_path.exists():
+            print(f"Warning: Test file not found: {file_path}")
+            continue
+        fixture_sha256 = output_content_hash(file_path)
+        for ai, adapter in enumerate(adapters):
+            tasks.append((fi, ai))
+            fingerprint = feature_fingerprint(test_file, fixture_sha256, adapter)
+            reused = _reusable_score(prior_scores, test_file, adapter, fingerprint)
+            if reused is not None:
+                scores[(fi, ai)] = reused
+                print(f"  {test_file.feature} / {adapter.name}: unchanged, reusing previous scores")
+            fingerprints[(fi, ai)] = fingerprint
+
+    fidelity_s = 0.0
+    verify_s = 0.0
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(
+                _test_feature_worker,
+                type(adapters[ai]),
+                test_files[fi],
+                test_dir / test_files[fi].path,
+                verify_cache,
+            ): (fi, ai)
+            for fi, ai in tasks
+            if (fi, ai) not in scores
+        }
+        for future in as_completed(futures):
+            fi, ai = futures[future]
+            try:
+                raw_score, feature_s, feature_verify_s = future.result()
+            except Exception as e:
+                # The feature raised in the worker, or the worker died
+                # (BrokenProcessPool); keep the rest of the run.
+                score = _failed_feature_score(adapters[ai], test_files[fi], e)
+                scores[(fi, ai)] = score
+                print(f"  {test_files[fi].feature} / {adapters[ai].name}: {score.notes}")
+                continue
+            fidelity_s += feature_s
+            verify_s += feature_verify_s
+            score = _finalize_score(raw_score, test_files[fi])
+            score.fingerprint = fingerprints[(fi, ai)]
+            scores[(fi, ai)] = score
+            print(
+                f"  {test_files[fi].feature} / {adapters[ai].name}: "
+                f"read={score.read_score}, write={score.write_score}"
+            )
+
+    return [scores[key] for key in tasks], fidelity_s, verify_s
+
+
+def _failed_feature_score(
+    adapter: ExcelAdapter, test_file: TestFile, exc: Exception
+) -> FeatureScore:
+    """Score a (feature, adapter) pair whose worker raised instead of returning.
+
+    Every test case of each supported operation is recorded as failed with the
+    exception text. No fingerprint is set, so incremental runs retest the pair.
+    """
+    results: list[TestResult] = []
+    operations = [
+        op
+        for op, supported in (
+            (OperationType.READ, adapter.can_read()),
+            (OperationType.WRITE, adapter.can_write()),
+        )
+        if supported
+    ]
+    for op in operations:
+        for tc in test_file.test_cases:
+            results.append(
+                TestResult(
+                    test_case_id=tc.id,
+                    operation=op,
+                    passed=False,
+                    expected=tc.expected,
+                    actual={"error": str(exc)},
+                    notes="Benchmark worker failed",
+                    diagnostics=[
+                        _build_exception_diagnostic(
+                            adapter,
+                            exc=exc,
+                            feature=test_file.feature,
+                            operation=op,
+                            test_case=tc,
+                            probable_cause="Feature run raised or its worker process died.",
+                        )
+                    ],
+                    importance=tc.importance,
+                    label=tc.label,
+                )
+            )
+    read_results = [r for r in results if r.operation == OperationType.READ]
+    write_results = [r for r in results if r.operation == OperationType.WRITE]
+    return FeatureScore(
+        feature=test_file.feature,
+        library=adapter.name,
+        read_score=calculate_score(read_results) if read_results else None,
+        write_score=calculate_score(write_results) if write_results else None,
+        test_results=results,
+        notes=f"Failed: {type(exc).__name__}: {exc}",
+    )
+
+
+def _test_feature_worker(
+    adapter_cls: type[ExcelAdapter],
+    test_file: TestFile,
+    file_path: Path,
+    verify_cache: VerificationCache | None,
+) -> tuple[FeatureScore, float, float]:
+    return _timed_test_feature(adapter_cls(), test_file, file_path, verify_cache)
+
+
 def test_feature(
     adapter: ExcelAdapter,
     test_file: TestFile,
     file_path: Path,
+    verify_cache: VerificationCache | None = None,
 ) -> FeatureScore:
     """Test a single feature with a single adapter.
 
@@ -214,6 +465,7 @@ def test_feature(
         adapter: The adapter to test.
         test_file: TestFile metadata.
         file_path: Path to the test file.
+        verify_cache: Optional write-verification result cache.
 
     Returns:
         FeatureScore with results.
@@ -237,7 +489,7 @@ def test_feature(
 
     # Test writing
     if adapter.can_write():
-        write_results = test_write(adapter, test_file, file_path)
+        write_results = test_write(adapter, test_file, file_path, verify_cache)
 
     # Calculate scores
     read_score = calculate_score(read_results) if read_results else None
@@ -1081,6 +1333,7 @@ def test_write(
     adapter: ExcelAdapter,
     test_file: TestFile,
     file_path: Path,
+    verify_cache: VerificationCache | None = None,
 ) -> list[TestResult]:
     """Test writing a feature.
 
@@ -1091,6 +1344,9 @@ def test_write(
         adapter: The adapter to test.
         test_file: TestFile metadata.
         file_path: Path to the original test file (for reference).
+        verify_cache: If given, skip the verifier read when the written
+            content was already verified with the same verifier and
+            expectations, and record fresh results for the next run.
 
     Returns:
         List of TestResult for each test case.
@@ -1223,9 +1479,18 @@ def test_write(
                 )
             return results
 
+        cache_parts: JSONDict | None = None
+        if verify_cache is not None:
+            cache_parts = verify_cache.key_parts(output_path, verifier, test_file)
+            cached = verify_cache.lookup(verify_cache.key(cache_parts))
+            if cached is not None:
+                return cached
+
+        verify_start = time.perf_counter()
         try:
             verify_wb = verifier.open_workbook(output_path)
         except Exception as e:
+            verifier_pool.record_verification(time.perf_counter() - verify_start)
             for tc in test_file.test_cases:
                 results.append(
                     TestResult(
@@ -1267,7 +1532,9 @@ def test_write(
                         OperationType.WRITE,
                     )
                     results.append(result)
+                verified = True
             except Exception as e:
+                verified = False
                 for tc in test_file.test_cases:
                     results.append(
                         TestResult(
@@ -1295,6 +1562,10 @@ def test_write(
                     )
         finally:
             verifier.close_workbook(verify_wb)
+            verifier_pool.record_verification(time.perf_counter() - verify_start)
+
+        if verify_cache is not None and cache_parts is not None and verified:
+            verify_cache.store(verify_cache.key(cache_parts), results, parts=cache_parts)
 
     return results
 
@@ -1355,14 +1626,23 @@ def _deep_compare(expected: Any, actual: Any) -> bool:
 def get_write_verifier() -> ExcelAdapter:
     oracle = os.environ.get("EXCELBENCH_WRITE_ORACLE", "auto").lower()
     if oracle == "openpyxl":
-        return OpenpyxlAdapter()
+        return verifier_pool.shared_verifier(OpenpyxlAdapter)
     if oracle == "excel":
         if ExcelOracleAdapter is None:
-            return OpenpyxlAdapter()
-        return ExcelOracleAdapter()
+            return verifier_pool.shared_verifier(OpenpyxlAdapter)
+        return _excel_oracle()
     if _excel_available() and ExcelOracleAdapter is not None:
-        return ExcelOracleAdapter()
-    return OpenpyxlAdapter()
+        return _excel_oracle()
+    return verifier_pool.shared_verifier(OpenpyxlAdapter)
+
+
+def _excel_oracle() -> ExcelAdapter:
+    """Pooled Excel oracle bound to the warm Excel session when one is running."""
+    oracle_cls: Any = ExcelOracleAdapter
+    oracle: ExcelAdapter = verifier_pool.shared_verifier(
+        oracle_cls, lambda: oracle_cls(app=verifier_pool.excel_app())
+    )
+    return oracle
 
 
 def get_write_verifier_for_feature(feature: str) -> ExcelAdapter:
@@ -1379,10 +1659,10 @@ def get_write_verifier_for_feature(feature: str) -> ExcelAdapter:
     if oracle in {"openpyxl", "excel"}:
         return get_write_verifier()
     if platform.system() == "Darwin":
-        return OpenpyxlAdapter()
+        return verifier_pool.shared_verifier(OpenpyxlAdapter)
     if feature in complex_features and _excel_available() and ExcelOracleAdapter is not None:
-        return ExcelOracleAdapter()
-    return OpenpyxlAdapter()
+        return _excel_oracle()
+    return verifier_pool.shared_verifier(OpenpyxlAdapter)
 
 
 def get_write_verifier_for_adapter(adapter: ExcelAdapter, feature: str) -> ExcelAdapter:
@@ -1394,19 +1674,13 @@ def get_write_verifier_for_adapter(adapter: ExcelAdapter, feature: str) -> Excel
     if adapter.output_extension == ".xls":
         from excelbench.harness.adapters.xlrd_adapter import XlrdAdapter
 
-        return XlrdAdapter()
+        return verifier_pool.shared_verifier(XlrdAdapter)
     return get_write_verifier_for_feature(feature)
 
 
 def _excel_available() -> bool:
-    try:
-        import xlwings as xw
-
-        app = xw.App(visible=False, add_book=False)
-        app.quit()
-        return True
-    except Exception:
-        return False
+    # Probed once per process; the probe's App stays up as the oracle session.
+    return verifier_pool.excel_available()
 
 
 def _collect_sheet_names(test_file: TestFile) -> list[str]:
@@ -0,0 +1,91 @@
+"""Per-process pool of write verifiers.
+
+``test_write`` reopens every (adapter, feature) output with a verifier. This
+module keeps what that needs warm for the life of the process:
+
+- one instance per verifier class (verifiers hold no per-workbook state),
+- the Excel availability probe, run once instead of starting and quitting an
+  xlwings App every time a complex feature is verified,
+- the probed App itself, reused as the Excel oracle session and quit at exit,
+- the wall time spent verifying, so runs can report the verification share of
+  fidelity time.
+"""
+
+from __future__ import annotations
+
+import atexit
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from excelbench.harness.adapters.base import ExcelAdapter
+
+V = TypeVar("V", bound=ExcelAdapter)
+
+
+@dataclass
+class VerificationStats:
+    seconds: float = 0.0
+    workbooks: int = 0
+
+
+_instances: dict[type[ExcelAdapter], ExcelAdapter] = {}
+_excel_app: Any = None
+_excel_probed = False
+_stats = VerificationStats()
+
+
+def shared_verifier(cls: type[V], factory: Callable[[], V] | None = None) -> V:
+    """Return this process's instance of verifier ``cls``, creating it on first use."""
+    inst = _instances.get(cls)
+    if inst is None:
+        inst = factory() if factory is not None else cls()
+        _instances[cls] = inst
+    return inst  # type: ignore[return-value]
+
+
+def excel_app() -> Any | None:
+    """The warm hidden Excel session, or None when Excel/xlwings is unavailable.
+
+    The first call starts the App (this doubles as the availability probe);
+    later calls reuse it until it is quit at interpreter exit.
+    """
+    global _excel_app, _excel_probed
+    if not _excel_probed:
+        _excel_probed = True
+        try:
+            import xlwings as xw
+
+            _excel_app = xw.App(visible=False, add_book=False)
+        except Exception:
+            _excel_app = None
+        else:
+            atexit.register(shutdown)
+    return _excel_app
+
+
+def excel_available() -> bool:
+    return excel_app() is not None
+
+
+def record_verification(seconds: float) -> None:
+    _stats.seconds += seconds
+    _stats.workbooks += 1
+
+
+def verification_stats() -> VerificationStats:
+    """Snapshot of the verification time accumulated in this process."""
+    return VerificationStats(seconds=_stats.seconds, workbooks=_stats.workbooks)
+
+
+def shutdown() -> None:
+    """Quit the Excel session and drop pooled verifiers."""
+    global _excel_app, _excel_probed
+    app, _excel_app = _excel_app, None
+    _excel_probed = False
+    _instances.clear()
+    if app is not None:
+        try:
+            app.quit()
+        except Exception:
+            pass
@@ -0,0 +1,186 @@
+"""Persistent cache of write-verification results.
+
+``test_write`` saves each adapter's output and reopens it with a verifier
+(openpyxl, Excel or xlrd) to re-run every test case. When an adapter produces
+the same workbook content as on a previous run, that verifier pass would
+yield the same results, so they are stored and reused.
+
+An entry is addressed by:
+
+- the content hash of the written file (see :func:`output_content_hash`),
+- the verifier name and version,
+- the feature name and a hash of its manifest entry (expected values),
+- the ExcelBench version and the cache schema.
+
+Layout of the cache directory::
+
+    <root>/<key>.json   {"key": {...}, "results": [...]}
+
+Entries are small JSON files and are never evicted automatically; delete the
+directory to reset it.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Any
+
+from excelbench import __version__
+from excelbench.harness.adapters.base import ExcelAdapter
+from excelbench.models import (
+    Diagnostic,
+    DiagnosticCategory,
+    DiagnosticLocation,
+    DiagnosticSeverity,
+    Importance,
+    OperationType,
+    TestFile,
+    TestResult,
+)
+
+CACHE_SCHEMA = 1
+
+# Package parts that change on every save without affecting any benchmarked
+# feature (creation/modification timestamps).
+_VOLATILE_MEMBERS = frozenset({"docProps/core.xml"})
+
+_CHUNK = 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """``$EXCELBENCH_VERIFY_CACHE`` or ``$XDG_CACHE_HOME/excelbench/verify``."""
+    env = os.environ.get("EXCELBENCH_VERIFY_CACHE")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "excelbench" / "verify"
+
+
+def output_content_hash(path: Path) -> str:
+    """sha256 of a written workbook's content.
+
+    xlsx packages are hashed member by member (sorted names plus uncompressed
+    bytes) with timestamp-only parts skipped, so zip entry dates, compression
+    level and ``docProps/core.xml`` do not defeat the cache. Other formats are
+    hashed byte for byte.
+    """
+    digest = hashlib.sha256()
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            for name in sorted(zf.namelist()):
+                if name in _VOLATILE_MEMBERS:
+                    continue
+                digest.update(name.encode("utf-8") + b"\0")
+                with zf.open(name) as member:
+                    for chunk in iter(lambda: member.read(_CHUNK), b""):
+                        digest.update(chunk)
+        return digest.hexdigest()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def manifest_entry_hash(test_file: TestFile) -> str:
+    """Stable hash of a feature's manifest entry (path, cases, expectations)."""
+    canonical = json.dumps(
+        dataclasses.asdict(test_file), sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class VerificationCache:
+    """Maps (output content, verifier, feature expectations) to write results."""
+
+    def __init__(self, root: Path | None = None) -> None:
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def key_parts(
+        self, output_path: Path, verifier: ExcelAdapter, test_file: TestFile
+    ) -> dict[str, Any]:
+        return {
+            "schema": CACHE_SCHEMA,
+            "excelbench": __version__,
+            "output_sha256": output_content_hash(output_path),
+            "verifier": verifier.name,
+            "verifier_version": verifier.info.version,
+            "feature": test_file.feature,
+            "manifest_sha256": manifest_entry_hash(test_file),
+        }
+
+    @staticmethod
+    def key(parts: dict[str, Any]) -> str:
+        canonical = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def lookup(self, key: str) -> list[TestResult] | None:
+        """Return the cached results for ``key``; unreadable entries count as misses."""
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text())
+            results = [_result_from_json(r) for r in data["results"]]
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return results
+
+    def store(self, key: str, results: list[TestResult], *, parts: dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        payload = {"key": parts, "results": [_result_to_json(r) for r in results]}
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=f".{key[:12]}-", suffix=".json")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f, sort_keys=True, default=str)
+            # Atomic, so parallel benchmark workers never read a partial entry.
+            os.replace(tmp_name, self._path(key))
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+def _result_to_json(result: TestResult) -> dict[str, Any]:
+    return dataclasses.asdict(result)
+
+
+def _result_from_json(data: dict[str, Any]) -> TestResult:
+    return TestResult(
+        test_case_id=data["test_case_id"],
+        operation=OperationType(data["operation"]),
+        passed=data["passed"],
+        expected=data["expected"],
+        actual=data["actual"],
+        notes=data.get("notes"),
+        diagnostics=[
+            Diagnostic(
+                category=DiagnosticCategory(d["category"]),
+                severity=DiagnosticSeverity(d["severity"]),
+                location=DiagnosticLocation(
+                    feature=d["location"]["feature"],
+                    operation=OperationType(d["location"]["operation"]),
+                    test_case_id=d["location"].get("test_case_id"),
+                    sheet=d["location"].get("sheet"),
+                    cell=d["location"].get("cell"),
+                ),
+                adapter_message=d["adapter_message"],
+                probable_cause=d.get("probable_cause"),
+            )
+            for d in data.get("diagnostics", [])
+        ],
+        importance=Importance(data["importance"]) if data.get("importance") else None,
+        label=data.get("label"),
+    )
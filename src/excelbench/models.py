@@ -1,7 +1,9 @@
 """Core data models for ExcelBench."""
 
+import math
+from array import array
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from enum import StrEnum
 from typing import Any
 
@@ -72,6 +74,105 @@ class CellValue:
     formula: str | None = None  # If type is FORMULA, this holds the formula string
 
 
+# Type codes used by SheetColumns.type_codes (index into this tuple).
+COLUMNAR_CELL_TYPES: tuple[CellType, ...] = (
+    CellType.BLANK,
+    CellType.NUMBER,
+    CellType.STRING,
+    CellType.BOOLEAN,
+    CellType.DATE,
+    CellType.DATETIME,
+    CellType.ERROR,
+    CellType.FORMULA,
+)
+
+
+@dataclass
+class SheetColumns:
+    """Columnar bulk-read result for a rectangular ``rows x cols`` grid.
+
+    All buffers are row-major and expose the buffer protocol, so callers can
+    wrap them with ``numpy.frombuffer`` without copying:
+
+    - ``type_codes``: uint8, index into ``COLUMNAR_CELL_TYPES``
+    - ``values``: float64, numbers and booleans (0/1); NaN for other types
+    - ``string_index``: int32 index into ``strings`` (strings, ISO dates and
+      datetimes, error tokens); -1 when the cell has no string payload
+    - ``formulas``: sparse ``(row, col) -> "=..."`` map (0-based offsets)
+    """
+
+    rows: int
+    cols: int
+    type_codes: Any
+    values: Any
+    string_index: Any
+    strings: list[str] = field(default_factory=list)
+    formulas: dict[tuple[int, int], str] = field(default_factory=dict)
+
+    @classmethod
+    def from_cell_values(cls, grid: list[list[CellValue]]) -> "SheetColumns":
+        """Encode a row-major CellValue grid (ragged rows are padded blank)."""
+        rows = len(grid)
+        cols = max((len(row) for row in grid), default=0)
+        type_codes = array("B", bytes(rows * cols))
+        values = array("d", [math.nan]) * (rows * cols)
+        string_index = array("i", [-1]) * (rows * cols)
+        strings: list[str] = []
+        interned: dict[str, int] = {}
+        formulas: dict[tuple[int, int], str] = {}
+        code_of = {t: i for i, t in enumerate(COLUMNAR_CELL_TYPES)}
+
+        for r, row in enumerate(grid):
+            for c, cell in enumerate(row):
+                i = r * cols + c
+                type_codes[i] = code_of.get(cell.type, code_of[CellType.STRING])
+                if cell.type == CellType.BLANK:
+                    continue
+                if cell.type == CellType.FORMULA:
+                    formulas[(r, c)] = str(cell.formula or cell.value)
+                    continue
+                if cell.type in (CellType.NUMBER, CellType.BOOLEAN):
+                    values[i] = float(cell.value)
+                    continue
+                text = cell.value.isoformat() if isinstance(cell.value, date) else cell.value
+                text = "" if text is None else str(text)
+                idx = interned.get(text)
+                if idx is None:
+                    idx = interned[text] = len(strings)
+                    strings.append(text)
+                string_index[i] = idx
+
+        return cls(
+            rows=rows,
+            cols=cols,
+            type_codes=type_codes,
+            values=values,
+            string_index=string_index,
+            strings=strings,
+            formulas=formulas,
+        )
+
+    def cell_value(self, row: int, col: int) -> CellValue:
+        """Decode one cell (0-based offsets) back into a CellValue."""
+        i = row * self.cols + col
+        cell_type = COLUMNAR_CELL_TYPES[self.type_codes[i]]
+        if cell_type == CellType.BLANK:
+            return CellValue(type=CellType.BLANK)
+        if cell_type == CellType.FORMULA:
+            formula = self.formulas[(row, col)]
+            return CellValue(type=CellType.FORMULA, value=formula, formula=formula)
+        if cell_type == CellType.NUMBER:
+            return CellValue(type=CellType.NUMBER, value=self.values[i])
+        if cell_type == CellType.BOOLEAN:
+            return CellValue(type=CellType.BOOLEAN, value=bool(self.values[i]))
+        text = self.strings[self.string_index[i]]
+        if cell_type == CellType.DATE:
+            return CellValue(type=CellType.DATE, value=date.fromisoformat(text))
+        if cell_type == CellType.DATETIME:
+            return CellValue(type=CellType.DATETIME, value=datetime.fromisoformat(text))
+        return CellValue(type=cell_type, value=text)
+
+
 @dataclass
 class CellFormat:
     """Represents text formatting for a cell."""
@@ -440,6 +541,8 @@ class FeatureScore:
     write_score: int | None = None  # 0-3, None if not applicable
     test_results: list[TestResult] = field(default_factory=list)
     notes: str | None = None
+    # Hash of the inputs this score depends on (see runner.feature_fingerprint).
+    fingerprint: str | None = None
 
 
 @dataclass
@@ -461,6 +564,11 @@ class BenchmarkMetadata:
     excel_version: str
     platform: str
     profile: str = "xlsx"
+    # Summed per-(feature, adapter) wall time and the part spent in write
+    # verification. Run-local diagnostics: not written to results.json, which
+    # stays identical across serial and parallel runs.
+    fidelity_s: float | None = None
+    verify_s: float | None = None
 
 
 @dataclass
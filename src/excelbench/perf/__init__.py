@@ -4,7 +4,16 @@ This package measures speed (wall/CPU time) and best-effort memory for each
 library across each feature+operation in the manifest.
 """
 
+from excelbench.perf.compare import compare_perf_results
 from excelbench.perf.renderer import render_perf_results
-from excelbench.perf.runner import run_perf
+from excelbench.perf.runner import run_isolated_workload, run_perf
+from excelbench.perf.sweep import render_sweep_results, run_sweep
 
-__all__ = ["run_perf", "render_perf_results"]
+__all__ = [
+    "run_perf",
+    "run_isolated_workload",
+    "render_perf_results",
+    "compare_perf_results",
+    "run_sweep",
+    "render_sweep_results",
+]
@@ -0,0 +1,397 @@
+"""Regression gate comparing two perf result sets.
+
+Rows are matched by (feature, library, workload_size, op). Wall-time changes
+are only reported as regressions/improvements when they are both larger than a
+relative threshold *and* statistically significant:
+
+- Mann-Whitney U on the raw samples when both runs saved ``samples.npz``.
+- Otherwise, non-overlap of the p50 confidence intervals in results.json.
+- Older results without CIs fall back to the threshold alone.
+
+Memory (peak RSS / Python heap) is a single observation per op, so it is gated
+on the relative threshold only, and only when both runs used
+``isolation="process"``. Without isolation ``ru_maxrss`` is cumulative over the
+run and depends on measurement order, so memory changes are reported as
+``info`` and never fail the comparison.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+SampleMap = dict[tuple[str, str, str, str], list[float]]
+_MatchKey = tuple[str, str, str, str]
+
+_MEMORY_METRICS = ("rss_peak_mb", "py_heap_peak_mb")
+_STATUS_ORDER = {
+    "regression": 0,
+    "incomparable": 1,
+    "removed": 2,
+    "added": 3,
+    "improvement": 4,
+    "info": 5,
+    "unchanged": 6,
+}
+
+
+@dataclass(frozen=True)
+class PerfDelta:
+    feature: str
+    library: str
+    workload_size: str
+    op: str
+    metric: str
+    base: float | None
+    head: float | None
+    change: float | None  # (head - base) / base
+    method: str  # mann-whitney | ci-overlap | threshold | n/a
+    p_value: float | None
+    # regression | improvement | unchanged | incomparable | added | removed | info
+    status: str
+
+
+@dataclass(frozen=True)
+class PerfComparison:
+    base_commit: str | None
+    head_commit: str | None
+    alpha: float
+    threshold: float
+    memory_threshold: float
+    deltas: list[PerfDelta]
+
+    @property
+    def regressions(self) -> list[PerfDelta]:
+        return [d for d in self.deltas if d.status == "regression"]
+
+
+def load_perf_run(path: Path) -> tuple[dict[str, Any], SampleMap | None]:
+    """Load a perf results.json plus its sibling samples.npz.
+
+    Samples are only loaded when the run itself was made with
+    ``save_samples``; a leftover samples.npz from an earlier run in the same
+    directory is ignored.
+    """
+    from excelbench.perf.renderer import load_perf_samples
+
+    path = Path(path)
+    with open(path) as f:
+        data = json.load(f)
+    config = (data.get("metadata") or {}).get("config") or {}
+    samples_path = path.parent / "samples.npz"
+    samples = None
+    if config.get("save_samples") and samples_path.exists():
+        samples = load_perf_samples(samples_path)
+    return data, samples
+
+
+def compare_perf_results(
+    base: dict[str, Any],
+    head: dict[str, Any],
+    *,
+    base_samples: SampleMap | None = None,
+    head_samples: SampleMap | None = None,
+    alpha: float = 0.05,
+    threshold: float = 0.05,
+    memory_threshold: float = 0.10,
+) -> PerfComparison:
+    """Compare two perf results.json payloads (as produced by ``perf_results_to_json_dict``)."""
+    if not 0 < alpha < 1:
+        raise ValueError("alpha must be in (0, 1)")
+    if threshold < 0 or memory_threshold < 0:
+        raise ValueError("threshold and memory_threshold must be >= 0")
+
+    base_ops = _index_ops(base)
+    head_ops = _index_ops(head)
+    gate_memory = _isolated(base) and _isolated(head)
+
+    deltas: list[PerfDelta] = []
+    for key in sorted(base_ops.keys() | head_ops.keys()):
+        feature, library, workload_size, op_name = key
+        b = base_ops.get(key)
+        h = head_ops.get(key)
+        if b is None or h is None:
+            status = "added" if b is None else "removed"
+            deltas.append(
+                PerfDelta(
+                    feature=feature,
+                    library=library,
+                    workload_size=workload_size,
+                    op=op_name,
+                    metric="wall_ms",
+                    base=_p50(b),
+                    head=_p50(h),
+                    change=None,
+                    method="n/a",
+                    p_value=None,
+                    status=status,
+                )
+            )
+            continue
+
+        sample_key = (feature, library, op_name, "wall_ms")
+        deltas.append(
+            _compare_wall(
+                key,
+                b,
+                h,
+                base_samples=base_samples.get(sample_key) if base_samples else None,
+                head_samples=head_samples.get(sample_key) if head_samples else None,
+                alpha=alpha,
+                threshold=threshold,
+            )
+        )
+        for metric in _MEMORY_METRICS:
+            delta = _compare_memory(key, metric, b, h, memory_threshold, gate=gate_memory)
+            if delta is not None:
+                deltas.append(delta)
+
+    deltas.sort(key=lambda d: (_STATUS_ORDER.get(d.status, 99), d.feature, d.library, d.op))
+    return PerfComparison(
+        base_commit=(base.get("metadata") or {}).get("commit"),
+        head_commit=(head.get("metadata") or {}).get("commit"),
+        alpha=alpha,
+        threshold=threshold,
+        memory_threshold=memory_threshold,
+        deltas=deltas,
+    )
+
+
+def _isolated(data: dict[str, Any]) -> bool:
+    config = (data.get("metadata") or {}).get("config") or {}
+    return config.get("isolation") == "process"
+
+
+def _index_ops(data: dict[str, Any]) -> dict[_MatchKey, dict[str, Any]]:
+    out: dict[_MatchKey, dict[str, Any]] = {}
+    for r in data.get("results", []):
+        for op_name, op in (r.get("perf") or {}).items():
+            if not isinstance(op, dict) or not isinstance(op.get("wall_ms"), dict):
+                continue
+            key = (
+                str(r["feature"]),
+                str(r["library"]),
+                str(r.get("workload_size", "")),
+                str(op_name),
+            )
+            out[key] = op
+    return out
+
+
+def _p50(op: dict[str, Any] | None) -> float | None:
+    if op is None:
+        return None
+    value = op["wall_ms"].get("p50")
+    return float(value) if value is not None else None
+
+
+def _relative_change(base: float, head: float) -> float:
+    if base == 0:
+        return 0.0 if head == 0 else math.inf
+    return (head - base) / base
+
+
+def _compare_wall(
+    key: _MatchKey,
+    base: dict[str, Any],
+    head: dict[str, Any],
+    *,
+    base_samples: list[float] | None,
+    head_samples: list[float] | None,
+    alpha: float,
+    threshold: float,
+) -> PerfDelta:
+    feature, library, workload_size, op_name = key
+    base_wall = base["wall_ms"]
+    head_wall = head["wall_ms"]
+    base_p50 = float(base_wall["p50"])
+    head_p50 = float(head_wall["p50"])
+
+    def _delta(change: float | None, method: str, p: float | None, status: str) -> PerfDelta:
+        return PerfDelta(
+            feature=feature,
+            library=library,
+            workload_size=workload_size,
+            op=op_name,
+            metric="wall_ms",
+            base=base_p50,
+            head=head_p50,
+            change=change,
+            method=method,
+            p_value=p,
+            status=status,
+        )
+
+    # A different op_count means the workload itself changed; times aren't comparable.
+    if (
+        base.get("op_count") is not None
+        and head.get("op_count") is not None
+        and base["op_count"] != head["op_count"]
+    ):
+        return _delta(None, "n/a", None, "incomparable")
+
+    change = _relative_change(base_p50, head_p50)
+    p_value: float | None = None
+    if base_samples and head_samples and len(base_samples) > 1 and len(head_samples) > 1:
+        method = "mann-whitney"
+        _, p_value = mann_whitney_u(base_samples, head_samples)
+        significant = p_value < alpha
+    else:
+        base_ci = _ci(base_wall)
+        head_ci = _ci(head_wall)
+        if base_ci is not None and head_ci is not None:
+            method = "ci-overlap"
+            significant = head_ci[0] > base_ci[1] or head_ci[1] < base_ci[0]
+        else:
+            method = "threshold"
+            significant = True
+
+    if significant and change > threshold:
+        status = "regression"
+    elif significant and change < -threshold:
+        status = "improvement"
+    else:
+        status = "unchanged"
+    return _delta(change, method, p_value, status)
+
+
+def _ci(stats: dict[str, Any]) -> tuple[float, float] | None:
+    for lo_key, hi_key in (("boot_ci_low", "boot_ci_high"), ("ci_low", "ci_high")):
+        lo = stats.get(lo_key)
+        hi = stats.get(hi_key)
+        if lo is not None and hi is not None:
+            return float(lo), float(hi)
+    return None
+
+
+def _compare_memory(
+    key: _MatchKey,
+    metric: str,
+    base: dict[str, Any],
+    head: dict[str, Any],
+    memory_threshold: float,
+    *,
+    gate: bool,
+) -> PerfDelta | None:
+    base_value = base.get(metric)
+    head_value = head.get(metric)
+    if base_value is None or head_value is None:
+        return None
+    feature, library, workload_size, op_name = key
+    change = _relative_change(float(base_value), float(head_value))
+    if abs(change) <= memory_threshold:
+        status = "unchanged"
+    elif not gate:
+        status = "info"
+    elif change > 0:
+        status = "regression"
+    else:
+        status = "improvement"
+    return PerfDelta(
+        feature=feature,
+        library=library,
+        workload_size=workload_size,
+        op=op_name,
+        metric=metric,
+        base=float(base_value),
+        head=float(head_value),
+        change=change,
+        method="threshold" if gate else "informational",
+        p_value=None,
+        status=status,
+    )
+
+
+def mann_whitney_u(x: list[float], y: list[float]) -> tuple[float, float]:
+    """Two-sided Mann-Whitney U test; returns ``(U for x, p-value)``.
+
+    Uses the tie-corrected normal approximation with continuity correction,
+    which is adequate for the sample counts the perf runner produces (p-values
+    are conservative for very small samples).
+    """
+    import numpy as np
+
+    n1 = len(x)
+    n2 = len(y)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("Both samples must be non-empty")
+
+    combined = np.concatenate([np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)])
+    order = np.argsort(combined, kind="mergesort")
+    sorted_vals = combined[order]
+    # Average ranks over ties.
+    _, first_idx, counts = np.unique(sorted_vals, return_index=True, return_counts=True)
+    avg_rank = first_idx + (counts + 1) / 2.0
+    ranks = np.empty_like(combined)
+    ranks[order] = np.repeat(avg_rank, counts)
+
+    u1 = float(ranks[:n1].sum() - n1 * (n1 + 1) / 2.0)
+    mean_u = n1 * n2 / 2.0
+    n = n1 + n2
+    tie_term = float((counts**3 - counts).sum()) / (n * (n - 1)) if n > 1 else 0.0
+    var_u = n1 * n2 / 12.0 * ((n + 1) - tie_term)
+    if var_u <= 0:
+        return u1, 1.0
+    z = (abs(u1 - mean_u) - 0.5) / math.sqrt(var_u)
+    p = math.erfc(max(z, 0.0) / math.sqrt(2.0))
+    return u1, min(p, 1.0)
+
+
+def perf_comparison_to_json_dict(comparison: PerfComparison) -> dict[str, Any]:
+    return {
+        "base_commit": comparison.base_commit,
+        "head_commit": comparison.head_commit,
+        "alpha": comparison.alpha,
+        "threshold": comparison.threshold,
+        "memory_threshold": comparison.memory_threshold,
+        "regressions": len(comparison.regressions),
+        "deltas": [asdict(d) for d in comparison.deltas],
+    }
+
+
+def render_perf_comparison_markdown(comparison: PerfComparison) -> str:
+    counts: dict[str, int] = {}
+    for d in comparison.deltas:
+        counts[d.status] = counts.get(d.status, 0) + 1
+
+    lines = [
+        "# Perf Comparison",
+        "",
+        f"*Base: {comparison.base_commit or 'unknown'} → "
+        f"Head: {comparison.head_commit or 'unknown'}*",
+        f"*alpha={comparison.alpha} threshold={comparison.threshold:.0%} "
+        f"memory_threshold={comparison.memory_threshold:.0%}*",
+        "",
+        "Summary: "
+        + ", ".join(f"{counts[s]} {s}" for s in sorted(counts, key=lambda s: _STATUS_ORDER[s])),
+        "",
+    ]
+    changed = [d for d in comparison.deltas if d.status != "unchanged"]
+    if not changed:
+        lines.append("No significant changes.")
+        return "\n".join(lines) + "\n"
+
+    lines.append("| Status | Feature | Library | Op | Metric | Base | Head | Change | Test |")
+    lines.append("|--------|---------|---------|----|--------|------|------|--------|------|")
+    for d in changed:
+        test = d.method if d.p_value is None else f"{d.method} (p={d.p_value:.3g})"
+        lines.append(
+            f"| {d.status} | {d.feature} | {d.library} | {d.op} | {d.metric} | "
+            f"{_fmt(d.base)} | {_fmt(d.head)} | {_fmt_change(d.change)} | {test} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _fmt(v: float | None) -> str:
+    return "—" if v is None else f"{v:.3f}"
+
+
+def _fmt_change(v: float | None) -> str:
+    if v is None:
+        return "—"
+    if math.isinf(v):
+        return "+inf"
+    return f"{v:+.1%}"
@@ -0,0 +1,187 @@
+"""Content-addressed cache for generated benchmark fixtures.
+
+Large throughput fixtures (1M-10M cells) take minutes to write with
+xlsxwriter. Generators describe each file with a JSON-serializable spec
+(scenario, shape, value type, sparsity, generator version); the spec hash
+addresses a cached copy, so unchanged fixtures are copied instead of rebuilt.
+
+Layout of the cache directory::
+
+    <root>/<sha256(spec)>.xlsx   generated file
+    <root>/<sha256(spec)>.json   {"spec": ..., "sha256": ..., "size": ...}
+
+Every hit re-hashes the cached file against the recorded checksum; corrupt
+entries are dropped and rebuilt. Entry mtimes are bumped on use and the
+least recently used entries are evicted once the directory exceeds
+``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+_CHUNK = 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    """``$EXCELBENCH_FIXTURE_CACHE`` or ``$XDG_CACHE_HOME/excelbench/fixtures``."""
+    env = os.environ.get("EXCELBENCH_FIXTURE_CACHE")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "excelbench" / "fixtures"
+
+
+def spec_key(spec: Mapping[str, Any]) -> str:
+    """Stable hash of a generator spec (key order does not matter)."""
+    canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FixtureCache:
+    """Spec-addressed store of generated fixture files with an LRU size cap."""
+
+    def __init__(self, root: Path | None = None, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+        self.root = Path(root) if root is not None else default_cache_dir()
+        self.max_bytes = max_bytes
+
+    def _data_path(self, key: str) -> Path:
+        return self.root / f"{key}.xlsx"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _entries(self) -> list[Path]:
+        # Dot-prefixed names are in-flight scratch files from store().
+        return sorted(p for p in self.root.glob("*.xlsx") if not p.name.startswith("."))
+
+    def lookup(self, spec: Mapping[str, Any]) -> Path | None:
+        """Return the cached file for ``spec`` if present and intact."""
+        key = spec_key(spec)
+        data, meta_path = self._data_path(key), self._meta_path(key)
+        if not data.exists() or not meta_path.exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            meta = {}
+        if meta.get("sha256") != file_sha256(data):
+            self._remove(key)
+            return None
+        os.utime(data)
+        return data
+
+    def fetch(
+        self,
+        spec: Mapping[str, Any],
+        dest: Path,
+        build: Callable[[Path], None],
+    ) -> bool:
+        """Materialize the fixture for ``spec`` at ``dest``.
+
+        Copies the cached file on a hit; otherwise calls ``build(path)`` to
+        generate it, stores the result and then copies it. Returns True on a
+        cache hit.
+        """
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        cached = self.lookup(spec)
+        if cached is not None:
+            shutil.copyfile(cached, dest)
+            return True
+        self.store(spec, build)
+        stored = self._data_path(spec_key(spec))
+        shutil.copyfile(stored, dest)
+        return False
+
+    def store(self, spec: Mapping[str, Any], build: Callable[[Path], None]) -> Path:
+        """Run ``build`` into a scratch file and add it to the cache."""
+        key = spec_key(spec)
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=f".{key[:12]}-", suffix=".xlsx")
+        os.close(fd)
+        tmp = Path(tmp_name)
+        tmp_meta = tmp.with_suffix(".json")
+        try:
+            build(tmp)
+            meta = {
+                "spec": dict(spec),
+                "sha256": file_sha256(tmp),
+                "size": tmp.stat().st_size,
+            }
+            tmp_meta.write_text(json.dumps(meta, sort_keys=True, default=str))
+            # Both renames are atomic, so concurrent writers of the same spec
+            # (e.g. parallel generator workers) never expose a partial file.
+            os.replace(tmp, self._data_path(key))
+            os.replace(tmp_meta, self._meta_path(key))
+        finally:
+            tmp.unlink(missing_ok=True)
+            tmp_meta.unlink(missing_ok=True)
+        self.evict(keep=key)
+        return self._data_path(key)
+
+    def verify(self) -> list[str]:
+        """Check every entry against its checksum; return keys of corrupt entries.
+
+        Corrupt entries are removed so the next fetch rebuilds them.
+        """
+        bad: list[str] = []
+        for data in self._entries():
+            key = data.stem
+            try:
+                meta = json.loads(self._meta_path(key).read_text())
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get("sha256") != file_sha256(data):
+                bad.append(key)
+                self._remove(key)
+        return bad
+
+    def total_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self._entries())
+
+    def evict(self, *, keep: str | None = None) -> list[str]:
+        """Drop least recently used entries until the cache fits ``max_bytes``."""
+        if not self.root.exists():
+            return []
+        entries: list[tuple[float, int, str]] = []
+        for p in self._entries():
+            try:
+                st = p.stat()
+            except FileNotFoundError:  # removed by a concurrent evict
+                continue
+            entries.append((st.st_mtime, st.st_size, p.stem))
+        entries.sort()
+        total = sum(size for _mtime, size, _key in entries)
+        evicted: list[str] = []
+        for _mtime, size, key in entries:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._remove(key)
+            total -= size
+            evicted.append(key)
+        return evicted
+
+    def _remove(self, key: str) -> None:
+        self._data_path(key).unlink(missing_ok=True)
+        self._meta_path(key).unlink(missing_ok=True)
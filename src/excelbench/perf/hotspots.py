@@ -0,0 +1,142 @@
+"""cProfile hotspot attribution for perf iterations.
+
+Profiling runs as a separate pass after the timed samples, so profiler
+overhead never leaks into reported wall/CPU times. The profiler is only
+enabled around the exercise phase of each iteration, so open, save and close
+costs are excluded and the summary lines up with the ``exercise`` breakdown.
+
+Every profiled function is classified by where its code lives:
+
+- ``adapter``: ExcelBench adapter glue (``excelbench/harness/adapters``),
+  e.g. payload conversion such as ``cell_value_from_payload``.
+- ``harness``: the rest of ExcelBench (perf runner, fidelity helpers).
+- ``library``: third-party packages, including C/Rust extension methods.
+- ``python``: the standard library and interpreter builtins.
+
+Self times are divided by the number of profiled iterations, so the numbers
+read as milliseconds per iteration.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import re
+import sys
+import sysconfig
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import excelbench
+
+HOTSPOT_CATEGORIES = ("library", "adapter", "harness", "python")
+
+# The installed excelbench package, as given and with symlinks resolved.
+# Matched as a path prefix: a bare "/excelbench/" substring would also catch
+# third-party code in e.g. an in-tree ``excelbench/.venv``.
+_PACKAGE_DIRS = tuple(
+    dict.fromkeys(
+        (
+            Path(excelbench.__file__).parent.as_posix() + "/",
+            Path(excelbench.__file__).resolve().parent.as_posix() + "/",
+        )
+    )
+)
+_ADAPTER_SUBDIR = "harness/adapters/"
+_SITE_MARKERS = ("/site-packages/", "/dist-packages/")
+# "<method 'read' of 'wolfxl._rust.Book' objects>" / "<built-in method numpy.empty>"
+_BUILTIN_OWNER_RE = re.compile(r"of '([\w.]+)'|built-in method ([\w.]+)")
+
+
+def profile_hotspots(
+    run: Callable[[cProfile.Profile], Any], *, iters: int, top: int
+) -> dict[str, Any]:
+    """Call ``run`` with a cProfile profiler and summarize the top-``top`` self-time functions.
+
+    ``run`` must execute ``iters`` iterations of the operation, enabling the
+    profiler around the code to attribute; times in the returned summary are
+    per iteration::
+
+        {"iters": 3, "self_ms_by_category": {...}, "top": [{...}, ...]}
+    """
+    if iters < 1 or top < 1:
+        raise ValueError("iters and top must be >= 1")
+    profiler = cProfile.Profile()
+    try:
+        run(profiler)
+    finally:
+        profiler.disable()
+    return summarize_profile(pstats.Stats(profiler), iters=iters, top=top)
+
+
+def summarize_profile(stats: pstats.Stats, *, iters: int, top: int) -> dict[str, Any]:
+    by_category = dict.fromkeys(HOTSPOT_CATEGORIES, 0.0)
+    rows: list[dict[str, Any]] = []
+    raw: dict[tuple[str, int, str], tuple[Any, ...]] = stats.stats  # type: ignore[attr-defined]
+    for (filename, line, name), (_cc, ncalls, tottime, cumtime, _callers) in raw.items():
+        if "_lsprof.Profiler" in name:
+            # The profiler's own disable() call.
+            continue
+        category = classify_function(filename, name)
+        self_ms = tottime * 1000.0 / iters
+        by_category[category] += self_ms
+        rows.append(
+            {
+                "function": _function_label(filename, line, name),
+                "category": category,
+                "self_ms": round(self_ms, 4),
+                "cum_ms": round(cumtime * 1000.0 / iters, 4),
+                "calls": ncalls // iters,
+            }
+        )
+    rows.sort(key=lambda r: r["self_ms"], reverse=True)
+    return {
+        "iters": iters,
+        "self_ms_by_category": {k: round(v, 4) for k, v in by_category.items()},
+        "top": rows[:top],
+    }
+
+
+def classify_function(filename: str, name: str) -> str:
+    path = filename.replace("\\", "/")
+    if path == "~":
+        return _classify_builtin(name)
+    for package_dir in _PACKAGE_DIRS:
+        if path.startswith(package_dir):
+            return "adapter" if path.startswith(_ADAPTER_SUBDIR, len(package_dir)) else "harness"
+    if any(marker in path for marker in _SITE_MARKERS):
+        return "library"
+    if path.startswith("<") or path.startswith(_stdlib_prefix()):
+        return "python"
+    return "library"
+
+
+def _classify_builtin(name: str) -> str:
+    m = _BUILTIN_OWNER_RE.search(name)
+    owner = (m.group(1) or m.group(2)) if m else ""
+    if "." not in owner:
+        # Unqualified owners are builtin types ('list', 'dict', 'str') or builtins.
+        return "python"
+    top = owner.split(".", 1)[0]
+    if owner.startswith("builtins.") or top in sys.stdlib_module_names:
+        return "python"
+    return "library"
+
+
+def _stdlib_prefix() -> str:
+    return sysconfig.get_paths()["stdlib"].replace("\\", "/")
+
+
+def _function_label(filename: str, line: int, name: str) -> str:
+    if filename == "~":
+        return name
+    path = filename.replace("\\", "/")
+    for marker in (*_SITE_MARKERS, "/src/"):
+        if marker in path:
+            path = path.split(marker, 1)[1]
+            break
+    else:
+        if path.startswith(_stdlib_prefix()):
+            path = path[len(_stdlib_prefix()) :].lstrip("/")
+    return f"{path}:{line}({name})"
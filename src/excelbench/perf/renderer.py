@@ -5,6 +5,7 @@ Writes into `<output_root>/perf/`:
 - README.md
 - matrix.csv
 - history.jsonl
+- samples.npz (only when the run was configured with ``save_samples``)
 """
 
 from __future__ import annotations
@@ -51,6 +52,11 @@ def render_perf_results(results: PerfResults, output_root: Path) -> None:
     render_perf_markdown(results, perf_dir / "README.md")
     render_perf_csv(results, perf_dir / "matrix.csv")
     append_perf_history(results, perf_dir / "history.jsonl")
+    if results.metadata.config.save_samples:
+        render_perf_samples(results, perf_dir / "samples.npz")
+    else:
+        # Never leave an earlier run's samples next to this run's results.
+        (perf_dir / "samples.npz").unlink(missing_ok=True)
 
 
 def render_perf_json(results: PerfResults, path: Path) -> None:
@@ -58,6 +64,43 @@ def render_perf_json(results: PerfResults, path: Path) -> None:
         json.dump(perf_results_to_json_dict(results), f, indent=2)
 
 
+def render_perf_samples(results: PerfResults, path: Path) -> None:
+    """Persist raw timed samples as a compressed NumPy archive.
+
+    Arrays are keyed ``"<feature>:<library>:<op>:<wall_ms|cpu_ms>"``; use
+    :func:`load_perf_samples` to read them back.
+    """
+    import numpy as np
+
+    arrays: dict[str, Any] = {}
+    for r in results.results:
+        for op_name, op in r.perf.items():
+            if op is None:
+                continue
+            prefix = f"{r.feature}:{r.library}:{op_name}"
+            if op.wall_samples_ms is not None:
+                arrays[f"{prefix}:wall_ms"] = np.asarray(op.wall_samples_ms, dtype=np.float64)
+            if op.cpu_samples_ms is not None:
+                arrays[f"{prefix}:cpu_ms"] = np.asarray(op.cpu_samples_ms, dtype=np.float64)
+    with open(path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+
+
+def load_perf_samples(path: Path) -> dict[tuple[str, str, str, str], list[float]]:
+    """Load a ``samples.npz`` written by :func:`render_perf_samples`.
+
+    Returns ``{(feature, library, op, metric): samples}``.
+    """
+    import numpy as np
+
+    out: dict[tuple[str, str, str, str], list[float]] = {}
+    with np.load(path) as archive:
+        for key in archive.files:
+            feature, library, op_name, metric = key.rsplit(":", 3)
+            out[(feature, library, op_name, metric)] = archive[key].tolist()
+    return out
+
+
 def render_perf_markdown(results: PerfResults, path: Path) -> None:
     data = perf_results_to_json_dict(results)
     libs = sorted(data["libraries"].keys())
@@ -83,7 +126,14 @@ def render_perf_markdown(results: PerfResults, path: Path) -> None:
             f"warmup={cfg.get('warmup')} "
             f"iters={cfg.get('iters')} "
             f"iteration_policy={cfg.get('iteration_policy', 'fixed')} "
-            f"breakdown={cfg.get('breakdown')}*"
+            + (
+                f"ci_target={cfg.get('ci_target')} time_budget_s={cfg.get('time_budget_s')} "
+                if cfg.get("iteration_policy") == "adaptive"
+                else ""
+            )
+            + f"breakdown={cfg.get('breakdown')} "
+            f"jobs={cfg.get('jobs', 1)} "
+            f"isolation={cfg.get('isolation', 'none')}*"
         )
     lines.append("")
 
@@ -95,8 +145,13 @@ def render_perf_markdown(results: PerfResults, path: Path) -> None:
     )
     lines.append("")
 
-    workload_features = _collect_workload_features(libs, features, lookup)
-    fidelity_features = [f for f in features if f not in workload_features]
+    modify_features = _collect_modify_features(libs, features, lookup)
+    workload_features = [
+        f for f in _collect_workload_features(libs, features, lookup) if f not in modify_features
+    ]
+    fidelity_features = [
+        f for f in features if f not in workload_features and f not in modify_features
+    ]
 
     if fidelity_features:
         lines.append("## Summary (p50 wall time)")
@@ -140,6 +195,14 @@ def render_perf_markdown(results: PerfResults, path: Path) -> None:
             lines.append("")
 
     _append_throughput_section(lines, data, libs, workload_features, lookup)
+    _append_adapter_overhead_section(lines, libs, workload_features, lookup)
+    _append_modify_section(lines, libs, modify_features, lookup)
+
+    if cfg.get("isolation") == "process":
+        _append_rss_section(lines, data, libs, features, lookup)
+
+    if cfg.get("hotspots"):
+        _append_hotspots_section(lines, data)
 
     issues: list[str] = []
     for r in data["results"]:
@@ -177,6 +240,113 @@ def _collect_workload_features(
     return workload_features
 
 
+def _collect_modify_features(
+    libs: list[str],
+    features: list[str],
+    lookup: dict[tuple[str, str], dict[str, Any]],
+) -> list[str]:
+    modify_features: list[str] = []
+    for feat in features:
+        for lib in libs:
+            entry = lookup.get((feat, lib))
+            perf = entry.get("perf") if entry else None
+            if isinstance(perf, dict) and "modify" in perf:
+                modify_features.append(feat)
+                break
+    return modify_features
+
+
+def _append_modify_section(
+    lines: list[str],
+    libs: list[str],
+    modify_features: list[str],
+    lookup: dict[tuple[str, str], dict[str, Any]],
+) -> None:
+    if not modify_features:
+        return
+
+    def _modify_op(feat: str, lib: str) -> dict[str, Any] | None:
+        entry = lookup.get((feat, lib))
+        perf = entry.get("perf") if entry else None
+        op_data = perf.get("modify") if isinstance(perf, dict) else None
+        return op_data if isinstance(op_data, dict) else None
+
+    modify_libs = [lib for lib in libs if any(_modify_op(f, lib) for f in modify_features)]
+    if not modify_libs:
+        return
+
+    def _meta(feat: str) -> tuple[int, int]:
+        for lib in modify_libs:
+            op_data = _modify_op(feat, lib)
+            if op_data is not None:
+                return int(op_data.get("input_bytes") or 0), int(op_data.get("op_count") or 0)
+        return 0, 0
+
+    lines.append("## Modify (open → edit → save, p50 wall ms)")
+    lines.append("")
+    lines.append(
+        "Rows are ordered by input file size, then edited-cell count, so each "
+        "library column reads as a time-vs-file-size / time-vs-patch-count curve."
+    )
+    lines.append("")
+
+    header = "| Scenario | Input MB | Cells edited |"
+    sep = "|----------|----------|--------------|"
+    for lib in modify_libs:
+        header += f" {lib} |"
+        sep += "--------|"
+    lines.append(header)
+    lines.append(sep)
+
+    for feat in sorted(modify_features, key=lambda f: (*_meta(f), f)):
+        input_bytes, op_count = _meta(feat)
+        row = f"| {feat} | {input_bytes / (1024 * 1024):.2f} | {op_count} |"
+        for lib in modify_libs:
+            row += f" {_fmt_p50_ms(lookup.get((feat, lib), {}).get('perf'), 'modify')} |"
+        lines.append(row)
+    lines.append("")
+
+
+# Functions listed per (scenario, library, op) in README.md; results.json keeps all.
+_README_HOTSPOTS = 5
+
+
+def _append_hotspots_section(lines: list[str], data: dict[str, Any]) -> None:
+    from excelbench.perf.hotspots import HOTSPOT_CATEGORIES
+
+    entries = [
+        (r["feature"], r["library"], op, op_data["hotspots"])
+        for r in data["results"]
+        for op, op_data in (r.get("perf") or {}).items()
+        if isinstance(op_data, dict) and op_data.get("hotspots")
+    ]
+    if not entries:
+        return
+
+    lines.append("## Hotspots (cProfile self time, ms per iteration)")
+    lines.append("")
+    lines.append(
+        "Profiled in separate untimed iterations. Self time is split by where the "
+        "code lives: the library, ExcelBench adapter glue, the perf harness, or "
+        "the Python stdlib/builtins."
+    )
+    lines.append("")
+    lines.append(
+        "| Scenario | Library | Op | "
+        + " | ".join(HOTSPOT_CATEGORIES)
+        + f" | Top {_README_HOTSPOTS} functions (self ms) |"
+    )
+    lines.append("|---|---|---|" + "---:|" * len(HOTSPOT_CATEGORIES) + "---|")
+    for feat, lib, op, hs in sorted(entries, key=lambda e: e[:3]):
+        by_cat = hs.get("self_ms_by_category") or {}
+        top = "<br>".join(
+            f"`{h['function']}` {h['self_ms']:.2f}" for h in hs.get("top", [])[:_README_HOTSPOTS]
+        )
+        cats = " | ".join(f"{float(by_cat.get(c) or 0.0):.1f}" for c in HOTSPOT_CATEGORIES)
+        lines.append(f"| {feat} | {lib} | {op} | {cats} | {top} |")
+    lines.append("")
+
+
 def _append_throughput_section(
     lines: list[str],
     data: dict[str, Any],
@@ -210,6 +380,42 @@ def _append_throughput_section(
         lines.append("")
 
 
+def _append_adapter_overhead_section(
+    lines: list[str],
+    libs: list[str],
+    workload_features: list[str],
+    lookup: dict[tuple[str, str], dict[str, Any]],
+) -> None:
+    def _overhead(feat: str, lib: str) -> float | None:
+        perf = (lookup.get((feat, lib)) or {}).get("perf") or {}
+        read = perf.get("read")
+        return read.get("adapter_overhead_pct") if isinstance(read, dict) else None
+
+    feats = [f for f in workload_features if any(_overhead(f, lib) is not None for lib in libs)]
+    if not feats:
+        return
+    overhead_libs = [lib for lib in libs if any(_overhead(f, lib) is not None for f in feats)]
+
+    lines.append("## Adapter Overhead (bulk read)")
+    lines.append("")
+    lines.append(
+        "Share of each bulk-read iteration spent in ExcelBench's conversion to "
+        "CellValue: median over paired iterations of (wrapped - raw) / wrapped, "
+        "where raw is `read_sheet_values_raw()` on the same range. Near 0% means "
+        "the bulk path already returns library-native data."
+    )
+    lines.append("")
+    lines.append("| Scenario |" + "".join(f" {lib} |" for lib in overhead_libs))
+    lines.append("|----------|" + "--------|" * len(overhead_libs))
+    for feat in feats:
+        row = f"| {feat} |"
+        for lib in overhead_libs:
+            pct = _overhead(feat, lib)
+            row += " — |" if pct is None else f" {pct:.1f}% |"
+        lines.append(row)
+    lines.append("")
+
+
 def _append_throughput_table(
     lines: list[str],
     data: dict[str, Any],
@@ -245,6 +451,60 @@ def _append_throughput_table(
         lines.append(row)
 
 
+def _append_rss_section(
+    lines: list[str],
+    data: dict[str, Any],
+    libs: list[str],
+    features: list[str],
+    lookup: dict[tuple[str, str], dict[str, Any]],
+) -> None:
+    lines.append("## Peak RSS (process-isolated, MB)")
+    lines.append("")
+    lines.append("Each (library, scenario, op) ran in a fresh worker process.")
+    lines.append("")
+
+    header = "| Scenario |"
+    sep = "|----------|"
+    for lib in libs:
+        caps = set(data["libraries"][lib].get("capabilities", []))
+        if "read" in caps:
+            header += f" {lib} (R MB) |"
+            sep += "------------|"
+        if "write" in caps:
+            header += f" {lib} (W MB) |"
+            sep += "------------|"
+    lines.append(header)
+    lines.append(sep)
+
+    for feat in features:
+        row = f"| {feat} |"
+        for lib in libs:
+            caps = set(data["libraries"][lib].get("capabilities", []))
+            entry = lookup.get((feat, lib))
+            perf = entry.get("perf") if entry else None
+            if "read" in caps:
+                row += f" {_fmt_rss_mb(perf, 'read')} |"
+            if "write" in caps:
+                row += f" {_fmt_rss_mb(perf, 'write')} |"
+        lines.append(row)
+    lines.append("")
+
+
+def _fmt_rss_mb(perf: dict[str, Any] | None, op: str) -> str:
+    if not perf or not isinstance(perf, dict):
+        return "—"
+    op_data = perf.get(op)
+    if not isinstance(op_data, dict):
+        return "—"
+    rss = op_data.get("rss_peak_mb")
+    if rss is None:
+        return "—"
+    try:
+        return f"{float(rss):.1f}"
+    except (TypeError, ValueError):
+        return "—"
+
+
 def _feature_op_meta(
     libs: list[str],
     lookup: dict[tuple[str, str], dict[str, Any]],
@@ -325,14 +585,19 @@ def render_perf_csv(results: PerfResults, path: Path) -> None:
     data = perf_results_to_json_dict(results)
     lines = [
         "library,feature,read_p50_wall_ms,read_p95_wall_ms,read_op_count,read_op_unit,read_p50_units_per_sec,"
-        "write_p50_wall_ms,write_p95_wall_ms,write_op_count,write_op_unit,write_p50_units_per_sec",
+        "write_p50_wall_ms,write_p95_wall_ms,write_op_count,write_op_unit,write_p50_units_per_sec,"
+        "modify_p50_wall_ms,modify_op_count,modify_input_bytes,write_harness_setup_ms,"
+        "read_raw_p50_wall_ms,read_adapter_overhead_pct",
     ]
     for r in data["results"]:
         perf = r.get("perf") or {}
         read = perf.get("read") or {}
         write = perf.get("write") or {}
+        modify = perf.get("modify") or {}
         read_wall = (read.get("wall_ms") or {}) if isinstance(read, dict) else {}
         write_wall = (write.get("wall_ms") or {}) if isinstance(write, dict) else {}
+        modify_wall = (modify.get("wall_ms") or {}) if isinstance(modify, dict) else {}
+        read_raw_wall = (read.get("raw_wall_ms") or {}) if isinstance(read, dict) else {}
 
         read_count = read.get("op_count") if isinstance(read, dict) else None
         read_unit = read.get("op_unit") if isinstance(read, dict) else None
@@ -365,6 +630,12 @@ def render_perf_csv(results: PerfResults, path: Path) -> None:
                     _f(write_count),
                     _f(write_unit),
                     _rate(write_count, write_wall.get("p50")),
+                    _f(modify_wall.get("p50")),
+                    _f(modify.get("op_count") if isinstance(modify, dict) else None),
+                    _f(modify.get("input_bytes") if isinstance(modify, dict) else None),
+                    _f(write.get("harness_setup_ms") if isinstance(write, dict) else None),
+                    _f(read_raw_wall.get("p50")),
+                    _f(read.get("adapter_overhead_pct") if isinstance(read, dict) else None),
                 ]
             )
         )
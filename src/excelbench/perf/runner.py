@@ -8,7 +8,11 @@ Design principles:
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+import contextlib
+import cProfile
+import functools
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -20,6 +24,13 @@ class PerfConfig:
     iters: int
     iteration_policy: str
     breakdown: bool
+    jobs: int = 1
+    isolation: str = "none"
+    ci_target: float | None = None
+    time_budget_s: float | None = None
+    save_samples: bool = False
+    hotspots: int = 0
+    adapter_overhead: bool = False
 
 
 @dataclass(frozen=True)
@@ -27,6 +38,33 @@ class PerfStats:
     min: float
     p50: float
     p95: float
+    n: int | None = None
+    ci_low: float | None = None  # ~95% distribution-free CI for p50
+    ci_high: float | None = None
+    cv: float | None = None  # coefficient of variation (stdev / mean)
+    mean: float | None = None
+    stddev: float | None = None
+    p99: float | None = None
+    max: float | None = None
+    mad: float | None = None  # median absolute deviation
+    outliers_low: int | None = None  # below Q1 - 1.5 * IQR
+    outliers_high: int | None = None  # above Q3 + 1.5 * IQR
+    boot_ci_low: float | None = None  # 95% bootstrap (percentile) CI for p50
+    boot_ci_high: float | None = None
+
+
+@dataclass(frozen=True)
+class AdaptiveSampling:
+    """Stopping rule for ``iteration_policy="adaptive"``.
+
+    Sampling stops once the p50 confidence interval is narrower than
+    ``ci_target`` (relative to p50) or ``time_budget_s`` has been spent on the
+    (adapter, workload, op); ``iters`` remains the upper bound on samples.
+    """
+
+    ci_target: float = 0.05
+    time_budget_s: float = 60.0
+    min_iters: int = 5
 
 
 @dataclass(frozen=True)
@@ -38,6 +76,24 @@ class PerfOpResult:
     phase_attribution_ms: dict[str, float] | None = None
     op_count: int | None = None
     op_unit: str | None = None
+    rss_baseline_mb: float | None = None
+    py_heap_peak_mb: float | None = None
+    output_bytes: int | None = None
+    input_bytes: int | None = None
+    # Untimed harness work done once before sampling (e.g. building the
+    # bulk_write_grid value grid); reported so it is not mistaken for adapter cost.
+    harness_setup_ms: float | None = None
+    # Top self-time functions from a separate, untimed cProfile pass
+    # (``hotspots > 0``); see ``excelbench.perf.hotspots``.
+    hotspots: dict[str, Any] | None = None
+    # bulk_sheet_values only: paired read_sheet_values_raw() timings and the
+    # median per-iteration share of wall time spent in adapter conversion.
+    raw_wall_ms: PerfStats | None = None
+    adapter_overhead_pct: float | None = None
+    # Raw timed samples; kept out of results.json and persisted only when
+    # ``save_samples`` is set (see ``render_perf_samples``).
+    wall_samples_ms: tuple[float, ...] | None = field(default=None, repr=False)
+    cpu_samples_ms: tuple[float, ...] | None = field(default=None, repr=False)
 
 
 @dataclass(frozen=True)
@@ -70,6 +126,17 @@ class PerfResults:
 
 BENCHMARK_VERSION = "0.1.0"
 
+# Operation kinds measured per (feature, library); "modify" only runs for
+# workloads that opt in via ``"operations": ["modify"]``.
+_PERF_OPS = ("read", "write", "modify")
+
+# Write workload ops that feed a lazy row generator to append_rows() on a
+# create_streaming_workbook() workbook instead of materializing the grid.
+_STREAM_WRITE_OPS = ("stream_write_rows",)
+
+# Read workload ops that take the range string rather than per-cell refs.
+_BULK_READ_OPS = ("bulk_sheet_values", "bulk_sheet_values_raw", "bulk_sheet_values_columnar")
+
 
 def run_perf(
     test_dir: Path,
@@ -81,6 +148,13 @@ def run_perf(
     iters: int = 25,
     iteration_policy: str = "fixed",
     breakdown: bool = False,
+    jobs: int = 1,
+    isolation: str = "none",
+    ci_target: float = 0.05,
+    time_budget_s: float = 60.0,
+    save_samples: bool = False,
+    hotspots: int = 0,
+    adapter_overhead: bool = False,
 ) -> PerfResults:
     import platform as _platform
 
@@ -94,9 +168,21 @@ def run_perf(
 
     if warmup < 0 or iters <= 0:
         raise ValueError("warmup must be >= 0 and iters must be > 0")
+    if jobs < 1:
+        raise ValueError("jobs must be >= 1")
+    if hotspots < 0:
+        raise ValueError("hotspots must be >= 0")
     iteration_policy_normalized = iteration_policy.strip().lower()
-    if iteration_policy_normalized != "fixed":
-        raise ValueError("iteration_policy must be 'fixed'")
+    if iteration_policy_normalized not in {"fixed", "adaptive"}:
+        raise ValueError("iteration_policy must be one of: fixed, adaptive")
+    adaptive: AdaptiveSampling | None = None
+    if iteration_policy_normalized == "adaptive":
+        if ci_target <= 0 or time_budget_s <= 0:
+            raise ValueError("ci_target and time_budget_s must be > 0")
+        adaptive = AdaptiveSampling(ci_target=ci_target, time_budget_s=time_budget_s)
+    isolation_normalized = isolation.strip().lower()
+    if isolation_normalized not in {"none", "process"}:
+        raise ValueError("isolation must be one of: none, process")
 
     manifest = load_manifest(manifest_path)
 
@@ -123,81 +209,663 @@ def run_perf(
             iters=iters,
             iteration_policy=iteration_policy_normalized,
             breakdown=breakdown,
+            jobs=jobs,
+            isolation=isolation_normalized,
+            ci_target=adaptive.ci_target if adaptive else None,
+            time_budget_s=adaptive.time_budget_s if adaptive else None,
+            save_samples=save_samples,
+            hotspots=hotspots,
+            adapter_overhead=adapter_overhead,
         ),
     )
 
     libraries = {a.name: _library_info_dict(a.info) for a in adapters}
 
+    with _grid_cache_scope():
+        if isolation_normalized == "process":
+            results = _run_isolated_matrix(
+                test_dir=test_dir,
+                test_files=list(manifest.files),
+                adapters=adapters,
+                warmup=warmup,
+                iters=iters,
+                breakdown=breakdown,
+                adaptive=adaptive,
+                jobs=jobs,
+                hotspots=hotspots,
+                adapter_overhead=adapter_overhead,
+            )
+        elif jobs > 1:
+            results = _run_parallel(
+                test_dir=test_dir,
+                test_files=list(manifest.files),
+                adapters=adapters,
+                warmup=warmup,
+                iters=iters,
+                breakdown=breakdown,
+                adaptive=adaptive,
+                jobs=jobs,
+                hotspots=hotspots,
+                adapter_overhead=adapter_overhead,
+            )
+        else:
+            results = _run_serial(
+                test_dir=test_dir,
+                test_files=list(manifest.files),
+                adapters=adapters,
+                warmup=warmup,
+                iters=iters,
+                breakdown=breakdown,
+                adaptive=adaptive,
+                hotspots=hotspots,
+                adapter_overhead=adapter_overhead,
+            )
+
+    return PerfResults(metadata=metadata, libraries=libraries, results=results)
+
+
+def _run_serial(
+    *,
+    test_dir: Path,
+    test_files: list[Any],
+    adapters: list[Any],
+    warmup: int,
+    iters: int,
+    breakdown: bool,
+    adaptive: AdaptiveSampling | None = None,
+    hotspots: int = 0,
+    adapter_overhead: bool = False,
+) -> list[PerfFeatureResult]:
     results: list[PerfFeatureResult] = []
-    for test_file in manifest.files:
+    for test_file in test_files:
+        for adapter in adapters:
+            op_results: dict[str, PerfOpResult | None] = {}
+            notes_parts = _capability_notes(adapter=adapter, test_file=test_file)
+            for op in _PERF_OPS:
+                res, note = _bench_op(
+                    adapter=adapter,
+                    test_file=test_file,
+                    test_dir=test_dir,
+                    op=op,
+                    warmup=warmup,
+                    iters=iters,
+                    breakdown=breakdown,
+                    adaptive=adaptive,
+                    hotspots=hotspots,
+                    adapter_overhead=adapter_overhead,
+                )
+                op_results[op] = res
+                if note:
+                    notes_parts.append(note)
+            results.append(
+                _feature_result(
+                    adapter_name=adapter.name,
+                    test_file=test_file,
+                    op_results=op_results,
+                    notes_parts=notes_parts,
+                )
+            )
+    return results
+
+
+def _capability_notes(*, adapter: Any, test_file: Any) -> list[str]:
+    workload_ops = _workload_operations(_extract_single_workload(test_file))
+    notes: list[str] = []
+    if "read" in workload_ops and not adapter.can_read():
+        notes.append("Read unsupported")
+    if "write" in workload_ops and not adapter.can_write():
+        notes.append("Write unsupported")
+    if "modify" in workload_ops and not adapter.can_modify():
+        notes.append("Modify unsupported")
+    return notes
+
+
+def _adapter_supports_op(adapter: Any, op: str) -> bool:
+    if op == "read":
+        return bool(adapter.can_read())
+    if op == "write":
+        return bool(adapter.can_write())
+    return bool(adapter.can_modify())
+
+
+def _bench_op(
+    *,
+    adapter: Any,
+    test_file: Any,
+    test_dir: Path,
+    op: str,
+    warmup: int,
+    iters: int,
+    breakdown: bool,
+    adaptive: AdaptiveSampling | None = None,
+    hotspots: int = 0,
+    adapter_overhead: bool = False,
+    on_ready: Callable[[], None] | None = None,
+) -> tuple[PerfOpResult | None, str | None]:
+    """Benchmark one operation of one (test file, adapter) pair.
+
+    Returns the op result (or None when skipped/failed) plus an optional note.
+    ``on_ready`` is called once the workload inputs (cell refs, value grid)
+    are built, just before the first iteration. ``adapter_overhead`` pairs
+    bulk reads with raw iterations (see ``_bench_read_workload``).
+    """
+    workload_ops = _workload_operations(_extract_single_workload(test_file))
+    if op not in workload_ops:
+        # Workload explicitly excludes this operation.
+        return None, None
+
+    bench: Any
+    if op == "read":
+        if not adapter.can_read():
+            return None, None
+        file_path = test_dir / test_file.path
+        if not file_path.exists():
+            return None, f"Read skipped: missing input file {test_file.path}"
+        if not adapter.supports_read_path(file_path):
+            return None, (
+                f"Read not applicable: {adapter.name} does not support "
+                f"{file_path.suffix} input"
+            )
+        bench = functools.partial(
+            _bench_read,
+            adapter=adapter,
+            test_file=test_file,
+            file_path=file_path,
+            pair_raw=adapter_overhead,
+        )
+    elif op == "write":
+        if not adapter.can_write():
+            return None, None
+        bench = functools.partial(_bench_write, adapter=adapter, test_file=test_file)
+    elif op == "modify":
         workload = _extract_single_workload(test_file)
-        workload_ops = _workload_operations(workload)
+        if workload is None or not adapter.can_modify():
+            return None, None
         file_path = test_dir / test_file.path
-        file_exists = file_path.exists()
+        if not file_path.exists():
+            return None, f"Modify skipped: missing input file {test_file.path}"
+        if not adapter.supports_read_path(file_path):
+            return None, (
+                f"Modify not applicable: {adapter.name} does not support "
+                f"{file_path.suffix} input"
+            )
+        bench = functools.partial(
+            _bench_modify_workload, adapter=adapter, file_path=file_path, workload=workload
+        )
+    else:
+        raise ValueError(f"Unknown perf operation: {op}")
 
-        for adapter in adapters:
-            notes_parts: list[str] = []
-            read_res: PerfOpResult | None = None
-            write_res: PerfOpResult | None = None
-
-            if "read" in workload_ops and not adapter.can_read():
-                notes_parts.append("Read unsupported")
-            if "write" in workload_ops and not adapter.can_write():
-                notes_parts.append("Write unsupported")
-
-            if adapter.can_read():
-                if "read" not in workload_ops:
-                    # Workload explicitly excludes read.
-                    pass
-                elif not file_exists:
-                    notes_parts.append(f"Read skipped: missing input file {test_file.path}")
-                elif not adapter.supports_read_path(file_path):
-                    notes_parts.append(
-                        f"Read not applicable: {adapter.name} does not support "
-                        f"{file_path.suffix} input"
-                    )
-                else:
-                    try:
-                        read_res = _bench_read(
-                            adapter=adapter,
-                            test_file=test_file,
-                            file_path=file_path,
-                            warmup=warmup,
-                            iters=iters,
-                            breakdown=breakdown,
-                        )
-                    except Exception as e:
-                        notes_parts.append(f"Read failed: {type(e).__name__}: {e}")
-
-            if adapter.can_write():
-                if "write" not in workload_ops:
-                    # Workload explicitly excludes write.
-                    pass
-                else:
-                    try:
-                        write_res = _bench_write(
-                            adapter=adapter,
-                            test_file=test_file,
-                            warmup=warmup,
-                            iters=iters,
-                            breakdown=breakdown,
-                        )
-                    except Exception as e:
-                        notes_parts.append(f"Write failed: {type(e).__name__}: {e}")
+    label = op.capitalize()
+    try:
+        res: PerfOpResult = bench(
+            warmup=warmup, iters=iters, breakdown=breakdown, adaptive=adaptive, on_ready=on_ready
+        )
+    except Exception as e:
+        return None, f"{label} failed: {type(e).__name__}: {e}"
 
+    if hotspots > 0:
+        if op == "read":
+            # Raw pairing would double the profiled work; profile the wrapped read only.
+            bench = functools.partial(bench, pair_raw=False)
+        try:
+            res = _with_hotspots(res, bench, iters=iters, top=hotspots)
+        except Exception as e:
+            return res, f"{label} hotspot profiling failed: {type(e).__name__}: {e}"
+    return res, None
+
+
+# Profiled iterations per op; cProfile slows pure-Python code several-fold.
+_HOTSPOT_MAX_ITERS = 3
+
+
+def _with_hotspots(res: PerfOpResult, bench: Any, *, iters: int, top: int) -> PerfOpResult:
+    """Attach a cProfile hotspot summary from extra, untimed iterations.
+
+    Only the exercise phase of each iteration is profiled; open, save and
+    close are left out so the summary matches the ``exercise`` breakdown.
+    """
+    from dataclasses import replace
+
+    from excelbench.perf.hotspots import profile_hotspots
+
+    n = min(iters, _HOTSPOT_MAX_ITERS)
+
+    def run(profiler: cProfile.Profile) -> None:
+        with _exercise_profiling(profiler):
+            bench(warmup=0, iters=n, breakdown=False, adaptive=None)
+
+    summary = profile_hotspots(run, iters=n, top=top)
+    return replace(res, hotspots=summary)
+
+
+# Profiler toggled around each exercise phase; only set by _with_hotspots().
+_exercise_profiler: cProfile.Profile | None = None
+
+
+@contextlib.contextmanager
+def _exercise_profiling(profiler: cProfile.Profile) -> Iterator[None]:
+    global _exercise_profiler
+    _exercise_profiler = profiler
+    try:
+        yield
+    finally:
+        _exercise_profiler = None
+
+
+@contextlib.contextmanager
+def _profile_exercise() -> Iterator[None]:
+    profiler = _exercise_profiler
+    if profiler is None:
+        yield
+        return
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+
+
+def _feature_result(
+    *,
+    adapter_name: str,
+    test_file: Any,
+    op_results: dict[str, PerfOpResult | None],
+    notes_parts: list[str],
+) -> PerfFeatureResult:
+    workload = _extract_single_workload(test_file)
+    perf = {"read": op_results.get("read"), "write": op_results.get("write")}
+    if "modify" in _workload_operations(workload):
+        perf["modify"] = op_results.get("modify")
+    return PerfFeatureResult(
+        feature=test_file.feature,
+        library=adapter_name,
+        workload_size=_standardize_workload_size(test_file=test_file, workload=workload),
+        perf=perf,
+        notes="; ".join(notes_parts) if notes_parts else None,
+    )
+
+
+def _matrix_tasks(test_files: list[Any], adapters: list[Any]) -> list[tuple[int, int, str]]:
+    """List the (file index, adapter index, op) cells that actually need measuring."""
+    tasks: list[tuple[int, int, str]] = []
+    for fi, test_file in enumerate(test_files):
+        ops = _workload_operations(_extract_single_workload(test_file))
+        for ai, adapter in enumerate(adapters):
+            for op in _PERF_OPS:
+                if op in ops and _adapter_supports_op(adapter, op):
+                    tasks.append((fi, ai, op))
+    return tasks
+
+
+def _merge_outcomes(
+    *,
+    test_files: list[Any],
+    adapters: list[Any],
+    outcomes: dict[tuple[int, int, str], tuple[PerfOpResult | None, str | None]],
+) -> list[PerfFeatureResult]:
+    """Assemble per-op outcomes in manifest x adapter order, matching the serial runner."""
+    results: list[PerfFeatureResult] = []
+    for fi, test_file in enumerate(test_files):
+        for ai, adapter in enumerate(adapters):
+            op_results: dict[str, PerfOpResult | None] = {}
+            notes_parts = _capability_notes(adapter=adapter, test_file=test_file)
+            for op in _PERF_OPS:
+                res, note = outcomes.get((fi, ai, op), (None, None))
+                op_results[op] = res
+                if note:
+                    notes_parts.append(note)
             results.append(
-                PerfFeatureResult(
-                    feature=test_file.feature,
-                    library=adapter.name,
-                    workload_size=_standardize_workload_size(
-                        test_file=test_file, workload=workload
-                    ),
-                    perf={"read": read_res, "write": write_res},
-                    notes="; ".join(notes_parts) if notes_parts else None,
+                _feature_result(
+                    adapter_name=adapter.name,
+                    test_file=test_file,
+                    op_results=op_results,
+                    notes_parts=notes_parts,
                 )
             )
+    return results
+
+
+def _run_parallel(
+    *,
+    test_dir: Path,
+    test_files: list[Any],
+    adapters: list[Any],
+    warmup: int,
+    iters: int,
+    breakdown: bool,
+    adaptive: AdaptiveSampling | None = None,
+    jobs: int,
+    hotspots: int = 0,
+    adapter_overhead: bool = False,
+) -> list[PerfFeatureResult]:
+    """Shard the (test file, adapter, op) matrix over a process pool.
+
+    Each worker is pinned to its own CPU (where the platform supports it) and
+    re-instantiates adapters from their class, so no state leaks between
+    tasks. Results are merged back in manifest x adapter order, matching the
+    serial runner.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    ctx = multiprocessing.get_context()
+    cpu_queue = ctx.Queue()
+    for cpu in _worker_cpus(jobs):
+        cpu_queue.put(cpu)
+
+    outcomes: dict[tuple[int, int, str], tuple[PerfOpResult | None, str | None]] = {}
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=ctx,
+        initializer=_pin_worker_cpu,
+        initargs=(cpu_queue,),
+    ) as pool:
+        futures = {
+            pool.submit(
+                _bench_op_worker,
+                type(adapters[ai]),
+                test_files[fi],
+                test_dir,
+                op,
+                warmup,
+                iters,
+                breakdown,
+                adaptive,
+                hotspots,
+                adapter_overhead,
+            ): (fi, ai, op)
+            for fi, ai, op in _matrix_tasks(test_files, adapters)
+        }
+        for future, key in futures.items():
+            try:
+                outcomes[key] = future.result()
+            except Exception as e:
+                # Worker crashed or result failed to unpickle.
+                outcomes[key] = (None, f"{key[2].capitalize()} failed: {type(e).__name__}: {e}")
+
+    return _merge_outcomes(test_files=test_files, adapters=adapters, outcomes=outcomes)
+
+
+def _bench_op_worker(
+    adapter_cls: type,
+    test_file: Any,
+    test_dir: Path,
+    op: str,
+    warmup: int,
+    iters: int,
+    breakdown: bool,
+    adaptive: AdaptiveSampling | None = None,
+    hotspots: int = 0,
+    adapter_overhead: bool = False,
+) -> tuple[PerfOpResult | None, str | None]:
+    return _bench_op(
+        adapter=adapter_cls(),
+        test_file=test_file,
+        test_dir=test_dir,
+        op=op,
+        warmup=warmup,
+        iters=iters,
+        breakdown=breakdown,
+        adaptive=adaptive,
+        hotspots=hotspots,
+        adapter_overhead=adapter_overhead,
+    )
+
+
+def _worker_cpus(jobs: int) -> list[int]:
+    """Return up to `jobs` distinct CPU ids available to this process."""
+    import os
+
+    getaffinity = getattr(os, "sched_getaffinity", None)
+    if getaffinity is None:
+        return []
+    return sorted(getaffinity(0))[:jobs]
+
+
+def _pin_worker_cpu(cpu_queue: Any) -> None:
+    """Pool initializer: pin this worker to one CPU (Linux only, best-effort)."""
+    import queue
+
+    try:
+        cpu = cpu_queue.get_nowait()
+    except queue.Empty:
+        # More workers than CPUs: leave this one unpinned.
+        return
+    _pin_to_cpu(cpu)
 
-    return PerfResults(metadata=metadata, libraries=libraries, results=results)
+
+def _pin_to_cpu(cpu: int) -> None:
+    import os
+
+    setaffinity = getattr(os, "sched_setaffinity", None)
+    if setaffinity is None:
+        return
+    try:
+        setaffinity(0, {cpu})
+    except OSError:
+        pass
+
+
+# =============================================================================
+# Process isolation
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class IsolatedOpRequest:
+    """Work order for one measurement executed in a fresh interpreter."""
+
+    adapter_cls: type
+    test_file: Any
+    test_dir: Path
+    op: str
+    warmup: int
+    iters: int
+    breakdown: bool
+    cpu: int | None = None
+    trace_python_heap: bool = False
+    adaptive: AdaptiveSampling | None = None
+    hotspots: int = 0
+    adapter_overhead: bool = False
+
+
+def run_isolated_op(
+    request: IsolatedOpRequest,
+    *,
+    timeout_s: float | None = None,
+) -> tuple[PerfOpResult | None, str | None]:
+    """Run one (adapter, workload, op) measurement in a freshly spawned process.
+
+    The worker starts from a clean interpreter (spawn, not fork), so its
+    ``ru_maxrss`` reflects only the adapter under test. The outcome is sent
+    back over a pipe; crashes and timeouts are reported as notes.
+    """
+    import multiprocessing
+
+    ctx = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(target=_isolated_worker_main, args=(child_conn, request), daemon=True)
+    proc.start()
+    child_conn.close()
+
+    label = request.op.capitalize()
+    try:
+        if not parent_conn.poll(timeout_s):
+            proc.kill()
+            return None, f"{label} failed: isolated worker timed out after {timeout_s:g}s"
+        try:
+            outcome: tuple[PerfOpResult | None, str | None] = parent_conn.recv()
+        except EOFError:
+            proc.join()
+            return None, f"{label} failed: isolated worker exited with code {proc.exitcode}"
+    finally:
+        parent_conn.close()
+        proc.join()
+    return outcome
+
+
+def _isolated_worker_main(conn: Any, request: IsolatedOpRequest) -> None:
+    import gc
+    import resource
+    import tracemalloc
+    from dataclasses import replace
+
+    try:
+        if request.cpu is not None:
+            _pin_to_cpu(request.cpu)
+        adapter = request.adapter_cls()
+        baseline: list[float] = []
+
+        def _start_memory_tracking() -> None:
+            # Taken after the harness has built the workload inputs, so the
+            # peak RSS / heap deltas cover the library under test only.
+            gc.collect()
+            baseline.append(_ru_maxrss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+            if request.trace_python_heap:
+                tracemalloc.start()
+
+        res, note = _bench_op(
+            adapter=adapter,
+            test_file=request.test_file,
+            test_dir=request.test_dir,
+            op=request.op,
+            warmup=request.warmup,
+            iters=request.iters,
+            breakdown=request.breakdown,
+            adaptive=request.adaptive,
+            hotspots=request.hotspots,
+            adapter_overhead=request.adapter_overhead,
+            on_ready=_start_memory_tracking,
+        )
+        heap_peak_mb: float | None = None
+        if tracemalloc.is_tracing():
+            _, heap_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            heap_peak_mb = heap_peak / (1024.0 * 1024.0)
+        if res is not None:
+            res = replace(
+                res,
+                rss_baseline_mb=baseline[0] if baseline else None,
+                py_heap_peak_mb=heap_peak_mb,
+            )
+        conn.send((res, note))
+    except Exception as e:
+        conn.send((None, f"{request.op.capitalize()} failed: {type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+def _run_isolated_matrix(
+    *,
+    test_dir: Path,
+    test_files: list[Any],
+    adapters: list[Any],
+    warmup: int,
+    iters: int,
+    breakdown: bool,
+    adaptive: AdaptiveSampling | None = None,
+    jobs: int,
+    hotspots: int = 0,
+    adapter_overhead: bool = False,
+) -> list[PerfFeatureResult]:
+    """Run every matrix cell in its own spawned worker, up to `jobs` at a time."""
+    import queue
+    from concurrent.futures import ThreadPoolExecutor
+
+    free_cpus: queue.Queue[int] = queue.Queue()
+    for cpu in _worker_cpus(jobs):
+        free_cpus.put(cpu)
+
+    def _one(fi: int, ai: int, op: str) -> tuple[PerfOpResult | None, str | None]:
+        try:
+            cpu: int | None = free_cpus.get_nowait()
+        except queue.Empty:
+            cpu = None
+        try:
+            return run_isolated_op(
+                IsolatedOpRequest(
+                    adapter_cls=type(adapters[ai]),
+                    test_file=test_files[fi],
+                    test_dir=test_dir,
+                    op=op,
+                    warmup=warmup,
+                    iters=iters,
+                    breakdown=breakdown,
+                    cpu=cpu,
+                    adaptive=adaptive,
+                    hotspots=hotspots,
+                    adapter_overhead=adapter_overhead,
+                )
+            )
+        finally:
+            if cpu is not None:
+                free_cpus.put(cpu)
+
+    outcomes: dict[tuple[int, int, str], tuple[PerfOpResult | None, str | None]] = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(_one, *key): key for key in _matrix_tasks(test_files, adapters)}
+        for future, key in futures.items():
+            outcomes[key] = future.result()
+
+    return _merge_outcomes(test_files=test_files, adapters=adapters, outcomes=outcomes)
+
+
+def run_isolated_workload(
+    adapter: Any,
+    workload: dict[str, Any],
+    *,
+    op: str,
+    input_path: Path | None = None,
+    warmup: int = 1,
+    iters: int = 3,
+    breakdown: bool = False,
+    trace_python_heap: bool = False,
+    timeout_s: float | None = None,
+) -> PerfOpResult:
+    """Measure a single ad-hoc workload for one adapter in a fresh process.
+
+    Convenience wrapper for scripts that don't have a manifest. Raises
+    RuntimeError with the runner's note if the measurement was skipped or failed.
+    """
+    from excelbench.models import TestCase, TestFile
+
+    scenario = str(workload.get("scenario") or "workload")
+    if input_path is not None:
+        test_dir = Path(input_path).parent
+        rel_path = Path(input_path).name
+    else:
+        test_dir = Path(".")
+        rel_path = f"{scenario}.xlsx"
+
+    test_file = TestFile(
+        path=rel_path,
+        feature=scenario,
+        tier=0,
+        test_cases=[
+            TestCase(
+                id=scenario,
+                label=scenario,
+                row=1,
+                expected={"workload": {**workload, "operations": [op]}},
+            )
+        ],
+    )
+    res, note = run_isolated_op(
+        IsolatedOpRequest(
+            adapter_cls=type(adapter),
+            test_file=test_file,
+            test_dir=test_dir,
+            op=op,
+            warmup=warmup,
+            iters=iters,
+            breakdown=breakdown,
+            trace_python_heap=trace_python_heap,
+        ),
+        timeout_s=timeout_s,
+    )
+    if res is None:
+        raise RuntimeError(note or f"{op} not measured for {adapter.name}")
+    return res
 
 
 def perf_results_to_json_dict(results: PerfResults) -> dict[str, Any]:
@@ -222,10 +890,7 @@ def _feature_result_to_dict(r: PerfFeatureResult) -> dict[str, Any]:
         "feature": r.feature,
         "library": r.library,
         "workload_size": r.workload_size,
-        "perf": {
-            "read": _op_result_to_dict(r.perf.get("read")),
-            "write": _op_result_to_dict(r.perf.get("write")),
-        },
+        "perf": {op: _op_result_to_dict(res) for op, res in r.perf.items()},
         "notes": r.notes,
     }
 
@@ -241,6 +906,14 @@ def _op_result_to_dict(op: PerfOpResult | None) -> dict[str, Any] | None:
         "phase_attribution_ms": op.phase_attribution_ms,
         "op_count": op.op_count,
         "op_unit": op.op_unit,
+        "rss_baseline_mb": op.rss_baseline_mb,
+        "py_heap_peak_mb": op.py_heap_peak_mb,
+        "output_bytes": op.output_bytes,
+        "input_bytes": op.input_bytes,
+        "harness_setup_ms": op.harness_setup_ms,
+        "hotspots": op.hotspots,
+        "raw_wall_ms": asdict(op.raw_wall_ms) if op.raw_wall_ms is not None else None,
+        "adapter_overhead_pct": op.adapter_overhead_pct,
     }
 
 
@@ -278,6 +951,9 @@ def _bench_read(
     warmup: int,
     iters: int,
     breakdown: bool,
+    adaptive: AdaptiveSampling | None = None,
+    on_ready: Callable[[], None] | None = None,
+    pair_raw: bool = False,
 ) -> PerfOpResult:
     workload = _extract_single_workload(test_file)
     if workload is not None:
@@ -287,9 +963,15 @@ def _bench_read(
             warmup=warmup,
             iters=iters,
             breakdown=breakdown,
+            adaptive=adaptive,
+            on_ready=on_ready,
             workload=workload,
+            pair_raw=pair_raw,
         )
 
+    if on_ready is not None:
+        on_ready()
+
     wall_samples: list[float] = []
     cpu_samples: list[float] = []
     rss_samples: list[float] = []
@@ -297,7 +979,9 @@ def _bench_read(
     phase_samples: dict[str, list[float]] = {"open": [], "sheets": [], "exercise": [], "close": []}
     attribution_samples: dict[str, list[float]] = {"parse": [], "write": [], "verify": []}
 
-    for i in range(warmup + iters):
+    for i in _iteration_indices(
+        warmup=warmup, iters=iters, samples=wall_samples, adaptive=adaptive
+    ):
         m = _measure_read_iteration(
             adapter=adapter,
             test_file=test_file,
@@ -319,14 +1003,16 @@ def _bench_read(
 
     breakdown_out: dict[str, float] | None = None
     if breakdown:
-        breakdown_out = {k: _stats(v).p50 for k, v in phase_samples.items() if v}
+        breakdown_out = {k: _median(v) for k, v in phase_samples.items() if v}
 
     return PerfOpResult(
         wall_ms=_stats(wall_samples),
         cpu_ms=_stats(cpu_samples),
+        wall_samples_ms=tuple(wall_samples),
+        cpu_samples_ms=tuple(cpu_samples),
         rss_peak_mb=max(rss_samples) if rss_samples else None,
         breakdown_ms=breakdown_out,
-        phase_attribution_ms={k: _stats(v).p50 for k, v in attribution_samples.items() if v},
+        phase_attribution_ms={k: _median(v) for k, v in attribution_samples.items() if v},
     )
 
 
@@ -337,10 +1023,29 @@ def _bench_read_workload(
     warmup: int,
     iters: int,
     breakdown: bool,
+    adaptive: AdaptiveSampling | None = None,
+    on_ready: Callable[[], None] | None = None,
     workload: dict[str, Any],
+    pair_raw: bool = False,
 ) -> PerfOpResult:
-    cells = _cells_from_range(workload["range"])
-    op_count = len(cells)
+    read_op = str(workload.get("op") or "")
+    op_unit = "cells"
+    if read_op == "stream_rows":
+        # Streaming throughput is reported per row (rows/s). As with
+        # stream_write_rows, the count comes from the range bounds so the
+        # harness holds no per-cell state during a constant-memory read.
+        cells: list[str] = []
+        start, end = _split_range(str(workload["range"]))
+        op_count = abs(_cell_to_coord(end)[0] - _cell_to_coord(start)[0]) + 1
+        op_unit = "rows"
+    elif read_op in _BULK_READ_OPS:
+        # Bulk reads take the range string; a per-cell ref list would only
+        # inflate harness-side memory.
+        cells = []
+        op_count = _range_cell_count(str(workload["range"]))
+    else:
+        cells = _cells_from_range(workload["range"])
+        op_count = len(cells)
 
     wall_samples: list[float] = []
     cpu_samples: list[float] = []
@@ -348,7 +1053,31 @@ def _bench_read_workload(
     phase_samples: dict[str, list[float]] = {"open": [], "sheets": [], "exercise": [], "close": []}
     attribution_samples: dict[str, list[float]] = {"parse": [], "write": [], "verify": []}
 
-    for i in range(warmup + iters):
+    # With pair_raw, bulk_sheet_values is paired with an unwrapped
+    # read_sheet_values_raw() iteration so the CellValue conversion cost can
+    # be reported per adapter. Off by default: it doubles the read work.
+    raw_workload: dict[str, Any] | None = None
+    if pair_raw and read_op == "bulk_sheet_values":
+        raw_workload = {**workload, "op": "bulk_sheet_values_raw"}
+    raw_samples: list[float] = []
+    overhead_samples: list[float] = []
+
+    def _raw_iteration_ms(raw: dict[str, Any]) -> float:
+        m = _measure_read_workload_iteration(
+            adapter=adapter, file_path=file_path, workload=raw, cells=cells, breakdown=False
+        )
+        return float(m["wall_ms"])
+
+    if on_ready is not None:
+        on_ready()
+
+    for i in _iteration_indices(
+        warmup=warmup, iters=iters, samples=wall_samples, adaptive=adaptive
+    ):
+        raw_ms: float | None = None
+        if raw_workload is not None and i % 2:
+            # Alternate the pair order so drift and cache warmth don't favor one side.
+            raw_ms = _raw_iteration_ms(raw_workload)
         m = _measure_read_workload_iteration(
             adapter=adapter,
             file_path=file_path,
@@ -356,8 +1085,14 @@ def _bench_read_workload(
             cells=cells,
             breakdown=breakdown,
         )
+        if raw_workload is not None and raw_ms is None:
+            raw_ms = _raw_iteration_ms(raw_workload)
         if i < warmup:
             continue
+        if raw_ms is not None:
+            raw_samples.append(raw_ms)
+            if m["wall_ms"] > 0:
+                overhead_samples.append((m["wall_ms"] - raw_ms) / m["wall_ms"] * 100.0)
         wall_samples.append(m["wall_ms"])
         cpu_samples.append(m["cpu_ms"])
         if m.get("rss_peak_mb") is not None:
@@ -371,16 +1106,20 @@ def _bench_read_workload(
 
     breakdown_out: dict[str, float] | None = None
     if breakdown:
-        breakdown_out = {k: _stats(v).p50 for k, v in phase_samples.items() if v}
+        breakdown_out = {k: _median(v) for k, v in phase_samples.items() if v}
 
     return PerfOpResult(
         wall_ms=_stats(wall_samples),
         cpu_ms=_stats(cpu_samples),
+        wall_samples_ms=tuple(wall_samples),
+        cpu_samples_ms=tuple(cpu_samples),
         rss_peak_mb=max(rss_samples) if rss_samples else None,
         breakdown_ms=breakdown_out,
-        phase_attribution_ms={k: _stats(v).p50 for k, v in attribution_samples.items() if v},
+        phase_attribution_ms={k: _median(v) for k, v in attribution_samples.items() if v},
         op_count=op_count,
-        op_unit="cells",
+        op_unit=op_unit,
+        raw_wall_ms=_stats(raw_samples) if raw_samples else None,
+        adapter_overhead_pct=_median(overhead_samples) if overhead_samples else None,
     )
 
 
@@ -417,15 +1156,16 @@ def _measure_read_iteration(
         phases["sheets"] = _ns_to_ms(t1 - t0)
 
     t0 = time.perf_counter_ns()
-    for tc in test_file.test_cases:
-        _exercise_read_case(
-            fidelity=fidelity,
-            adapter=adapter,
-            workbook=workbook,
-            default_sheet=default_sheet,
-            test_case=tc,
-            feature=test_file.feature,
-        )
+    with _profile_exercise():
+        for tc in test_file.test_cases:
+            _exercise_read_case(
+                fidelity=fidelity,
+                adapter=adapter,
+                workbook=workbook,
+                default_sheet=default_sheet,
+                test_case=tc,
+                feature=test_file.feature,
+            )
     t1 = time.perf_counter_ns()
     if breakdown:
         phases["exercise"] = _ns_to_ms(t1 - t0)
@@ -508,6 +1248,8 @@ def _bench_write(
     warmup: int,
     iters: int,
     breakdown: bool,
+    adaptive: AdaptiveSampling | None = None,
+    on_ready: Callable[[], None] | None = None,
 ) -> PerfOpResult:
     workload = _extract_single_workload(test_file)
     if workload is not None:
@@ -516,11 +1258,16 @@ def _bench_write(
             warmup=warmup,
             iters=iters,
             breakdown=breakdown,
+            adaptive=adaptive,
+            on_ready=on_ready,
             workload=workload,
         )
 
     import tempfile
 
+    if on_ready is not None:
+        on_ready()
+
     wall_samples: list[float] = []
     cpu_samples: list[float] = []
     rss_samples: list[float] = []
@@ -540,7 +1287,9 @@ def _bench_write(
         out_dir.mkdir(parents=True, exist_ok=True)
         out_path = out_dir / f"{feature_stem}{ext}"
 
-        for i in range(warmup + iters):
+        for i in _iteration_indices(
+            warmup=warmup, iters=iters, samples=wall_samples, adaptive=adaptive
+        ):
             m = _measure_write_iteration(
                 adapter=adapter,
                 test_file=test_file,
@@ -560,16 +1309,21 @@ def _bench_write(
             for k, v in coarse.items():
                 attribution_samples.setdefault(k, []).append(float(v))
 
+        output_bytes = out_path.stat().st_size if out_path.exists() else None
+
     breakdown_out: dict[str, float] | None = None
     if breakdown:
-        breakdown_out = {k: _stats(v).p50 for k, v in phase_samples.items() if v}
+        breakdown_out = {k: _median(v) for k, v in phase_samples.items() if v}
 
     return PerfOpResult(
         wall_ms=_stats(wall_samples),
         cpu_ms=_stats(cpu_samples),
+        wall_samples_ms=tuple(wall_samples),
+        cpu_samples_ms=tuple(cpu_samples),
         rss_peak_mb=max(rss_samples) if rss_samples else None,
         breakdown_ms=breakdown_out,
-        phase_attribution_ms={k: _stats(v).p50 for k, v in attribution_samples.items() if v},
+        phase_attribution_ms={k: _median(v) for k, v in attribution_samples.items() if v},
+        output_bytes=output_bytes,
     )
 
 
@@ -579,18 +1333,36 @@ def _bench_write_workload(
     warmup: int,
     iters: int,
     breakdown: bool,
+    adaptive: AdaptiveSampling | None = None,
+    on_ready: Callable[[], None] | None = None,
     workload: dict[str, Any],
 ) -> PerfOpResult:
     import tempfile
 
-    cells = _cells_from_range(workload["range"])
-    op_count = len(cells)
-    if str(workload.get("op") or "") == "bulk_write_grid":
+    write_op = str(workload.get("op") or "")
+    if write_op in ("bulk_write_grid", *_STREAM_WRITE_OPS):
+        # Grid and streaming workloads never need cell refs; skip building the
+        # list so harness-side RSS stays flat at 10M+ cells.
+        cells: list[str] = []
+        op_count = _range_cell_count(str(workload["range"]))
+    else:
+        cells = _cells_from_range(workload["range"])
+        op_count = len(cells)
+    if write_op in ("bulk_write_grid", *_STREAM_WRITE_OPS):
         sparse_every = workload.get("sparse_every")
         if isinstance(sparse_every, int) and sparse_every > 1:
             # Count only the filled cells for throughput reporting.
             op_count = (op_count + sparse_every - 1) // sparse_every
 
+    grid: list[list[Any]] | None = None
+    harness_setup_ms: float | None = None
+    if write_op == "bulk_write_grid":
+        # Built outside the timed window and shared by every iteration.
+        grid, harness_setup_ms = _workload_grid(workload)
+
+    if on_ready is not None:
+        on_ready()
+
     wall_samples: list[float] = []
     cpu_samples: list[float] = []
     rss_samples: list[float] = []
@@ -610,13 +1382,16 @@ def _bench_write_workload(
         out_dir.mkdir(parents=True, exist_ok=True)
         out_path = out_dir / f"{feature_stem}{ext}"
 
-        for i in range(warmup + iters):
+        for i in _iteration_indices(
+            warmup=warmup, iters=iters, samples=wall_samples, adaptive=adaptive
+        ):
             m = _measure_write_workload_iteration(
                 adapter=adapter,
                 output_path=out_path,
                 workload=workload,
                 cells=cells,
                 breakdown=breakdown,
+                grid=grid,
             )
             if i < warmup:
                 continue
@@ -631,18 +1406,103 @@ def _bench_write_workload(
             for k, v in coarse.items():
                 attribution_samples.setdefault(k, []).append(float(v))
 
+        output_bytes = out_path.stat().st_size if out_path.exists() else None
+
     breakdown_out: dict[str, float] | None = None
     if breakdown:
-        breakdown_out = {k: _stats(v).p50 for k, v in phase_samples.items() if v}
+        breakdown_out = {k: _median(v) for k, v in phase_samples.items() if v}
 
     return PerfOpResult(
         wall_ms=_stats(wall_samples),
         cpu_ms=_stats(cpu_samples),
+        wall_samples_ms=tuple(wall_samples),
+        cpu_samples_ms=tuple(cpu_samples),
         rss_peak_mb=max(rss_samples) if rss_samples else None,
         breakdown_ms=breakdown_out,
-        phase_attribution_ms={k: _stats(v).p50 for k, v in attribution_samples.items() if v},
+        phase_attribution_ms={k: _median(v) for k, v in attribution_samples.items() if v},
         op_count=op_count,
         op_unit="cells",
+        output_bytes=output_bytes,
+        harness_setup_ms=harness_setup_ms,
+    )
+
+
+def _bench_modify_workload(
+    *,
+    adapter: Any,
+    file_path: Path,
+    warmup: int,
+    iters: int,
+    breakdown: bool,
+    adaptive: AdaptiveSampling | None = None,
+    on_ready: Callable[[], None] | None = None,
+    workload: dict[str, Any],
+) -> PerfOpResult:
+    """Time open_for_modify -> edit ``workload["range"]`` -> save_modified.
+
+    Every iteration starts from the untouched input and saves to a scratch
+    path. ``op_count`` is the number of edited cells and ``input_bytes`` the
+    size of the source file, so results can be plotted against either.
+    """
+    import tempfile
+
+    cells = _cells_from_range(workload["range"])
+    input_bytes = file_path.stat().st_size
+
+    if on_ready is not None:
+        on_ready()
+
+    wall_samples: list[float] = []
+    cpu_samples: list[float] = []
+    rss_samples: list[float] = []
+    phase_samples: dict[str, list[float]] = {"open": [], "exercise": [], "save": []}
+    attribution_samples: dict[str, list[float]] = {"parse": [], "write": [], "verify": []}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out_path = Path(tmpdir) / f"{file_path.stem}.modified{file_path.suffix}"
+
+        for i in _iteration_indices(
+            warmup=warmup, iters=iters, samples=wall_samples, adaptive=adaptive
+        ):
+            m = _measure_modify_workload_iteration(
+                adapter=adapter,
+                input_path=file_path,
+                output_path=out_path,
+                workload=workload,
+                cells=cells,
+                breakdown=breakdown,
+            )
+            if i < warmup:
+                continue
+            wall_samples.append(m["wall_ms"])
+            cpu_samples.append(m["cpu_ms"])
+            if m.get("rss_peak_mb") is not None:
+                rss_samples.append(float(m["rss_peak_mb"]))
+            if breakdown and m.get("breakdown_ms"):
+                for k, v in m["breakdown_ms"].items():
+                    phase_samples.setdefault(k, []).append(float(v))
+            coarse = _phase_attribution_from_measurement(op_kind="modify", measurement=m)
+            for k, v in coarse.items():
+                attribution_samples.setdefault(k, []).append(float(v))
+
+        output_bytes = out_path.stat().st_size if out_path.exists() else None
+
+    breakdown_out: dict[str, float] | None = None
+    if breakdown:
+        breakdown_out = {k: _median(v) for k, v in phase_samples.items() if v}
+
+    return PerfOpResult(
+        wall_ms=_stats(wall_samples),
+        cpu_ms=_stats(cpu_samples),
+        wall_samples_ms=tuple(wall_samples),
+        cpu_samples_ms=tuple(cpu_samples),
+        rss_peak_mb=max(rss_samples) if rss_samples else None,
+        breakdown_ms=breakdown_out,
+        phase_attribution_ms={k: _median(v) for k, v in attribution_samples.items() if v},
+        op_count=len(cells),
+        op_unit="cells",
+        output_bytes=output_bytes,
+        input_bytes=input_bytes,
     )
 
 
@@ -677,7 +1537,8 @@ def _measure_read_workload_iteration(
         phases["sheets"] = _ns_to_ms(t1 - t0)
 
     t0 = time.perf_counter_ns()
-    _run_workload_read(adapter=adapter, workbook=workbook, workload=workload, cells=cells)
+    with _profile_exercise():
+        _run_workload_read(adapter=adapter, workbook=workbook, workload=workload, cells=cells)
     t1 = time.perf_counter_ns()
     if breakdown:
         phases["exercise"] = _ns_to_ms(t1 - t0)
@@ -709,6 +1570,7 @@ def _measure_write_workload_iteration(
     workload: dict[str, Any],
     cells: list[str],
     breakdown: bool,
+    grid: list[list[Any]] | None = None,
 ) -> dict[str, Any]:
     import resource
     import time
@@ -721,7 +1583,10 @@ def _measure_write_workload_iteration(
     phases: dict[str, float] = {}
 
     t0 = time.perf_counter_ns()
-    workbook = adapter.create_workbook()
+    if str(workload.get("op") or "") in _STREAM_WRITE_OPS:
+        workbook = adapter.create_streaming_workbook()
+    else:
+        workbook = adapter.create_workbook()
     t1 = time.perf_counter_ns()
     if breakdown:
         phases["create"] = _ns_to_ms(t1 - t0)
@@ -734,7 +1599,10 @@ def _measure_write_workload_iteration(
         phases["add_sheets"] = _ns_to_ms(t1 - t0)
 
     t0 = time.perf_counter_ns()
-    _run_workload_write(adapter=adapter, workbook=workbook, workload=workload, cells=cells)
+    with _profile_exercise():
+        _run_workload_write(
+            adapter=adapter, workbook=workbook, workload=workload, cells=cells, grid=grid
+        )
     t1 = time.perf_counter_ns()
     if breakdown:
         phases["exercise"] = _ns_to_ms(t1 - t0)
@@ -759,6 +1627,58 @@ def _measure_write_workload_iteration(
     }
 
 
+def _measure_modify_workload_iteration(
+    *,
+    adapter: Any,
+    input_path: Path,
+    output_path: Path,
+    workload: dict[str, Any],
+    cells: list[str],
+    breakdown: bool,
+) -> dict[str, Any]:
+    import resource
+    import time
+
+    rss_before = _ru_maxrss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+    wall0 = time.perf_counter_ns()
+    cpu0 = time.process_time_ns()
+
+    phases: dict[str, float] = {}
+
+    t0 = time.perf_counter_ns()
+    workbook = adapter.open_for_modify(input_path)
+    t1 = time.perf_counter_ns()
+    if breakdown:
+        phases["open"] = _ns_to_ms(t1 - t0)
+
+    t0 = time.perf_counter_ns()
+    with _profile_exercise():
+        _run_workload_modify(adapter=adapter, workbook=workbook, workload=workload, cells=cells)
+    t1 = time.perf_counter_ns()
+    if breakdown:
+        phases["exercise"] = _ns_to_ms(t1 - t0)
+
+    t0 = time.perf_counter_ns()
+    adapter.save_modified(workbook, output_path)
+    t1 = time.perf_counter_ns()
+    if breakdown:
+        phases["save"] = _ns_to_ms(t1 - t0)
+
+    wall1 = time.perf_counter_ns()
+    cpu1 = time.process_time_ns()
+
+    rss_after = _ru_maxrss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+    rss_peak = max(rss_before, rss_after)
+
+    return {
+        "wall_ms": _ns_to_ms(wall1 - wall0),
+        "cpu_ms": _ns_to_ms(cpu1 - cpu0),
+        "rss_peak_mb": rss_peak,
+        "breakdown_ms": phases if breakdown else None,
+    }
+
+
 def _run_workload_read(
     *, adapter: Any, workbook: Any, workload: dict[str, Any], cells: list[str]
 ) -> None:
@@ -816,6 +1736,28 @@ def _run_workload_read(
             _ = data
         return
 
+    if op == "bulk_sheet_values_columnar":
+        fn = getattr(adapter, "read_sheet_values_columnar", None)
+        if fn is None:
+            raise ValueError(f"Adapter {adapter.name} does not support columnar bulk reads")
+        cell_range = str(workload.get("range") or "")
+        columns = fn(workbook, sheet, cell_range or None)
+        # Touch the buffers so lazily-built views are materialized.
+        _ = (len(columns.type_codes), len(columns.values), len(columns.strings))
+        return
+
+    if op == "stream_rows":
+        fn = getattr(adapter, "iter_sheet_rows", None)
+        if fn is None:
+            raise ValueError(f"Adapter {adapter.name} does not support streaming row reads")
+        cell_range = str(workload.get("range") or "")
+        batch_size = int(workload.get("batch_size") or 1000)
+        rows = 0
+        for batch in fn(workbook, sheet, cell_range or None, batch_size=batch_size):
+            rows += len(batch)
+        _ = rows
+        return
+
     if op == "bg_color":
         for cell in cells:
             fmt = adapter.read_cell_format(workbook, sheet, cell)
@@ -848,12 +1790,209 @@ def _run_workload_read(
     raise ValueError(f"Unsupported workload op for read: {op}")
 
 
+_GRID_CACHE_KEYS = (
+    "range",
+    "value_type",
+    "start",
+    "step",
+    "string_prefix",
+    "string_mode",
+    "string_value",
+    "string_length",
+    "sparse_every",
+    "values_from",
+)
+
+
+def _workload_grid(workload: dict[str, Any]) -> tuple[list[list[Any]], float]:
+    """Return the pre-built ``bulk_write_grid`` grid and its build time in ms.
+
+    The grid is generated from the value spec, or read from the first sheet of
+    the ``values_from`` workbook when the workload names one.
+
+    Inside a ``run_perf()`` call the most recent grid is reused across
+    adapters (the build time is then reported as 0), so every adapter writes
+    the same row lists; adapters must treat them as read-only.
+    """
+    import json
+    import time
+
+    key = json.dumps({k: workload.get(k) for k in _GRID_CACHE_KEYS}, sort_keys=True)
+    if _grid_cache is not None and key in _grid_cache:
+        return _grid_cache[key], 0.0
+
+    t0 = time.perf_counter_ns()
+    spec = json.loads(key)
+    grid = _fixture_grid(spec) if spec.get("values_from") else _build_workload_grid(spec)
+    build_ms = _ns_to_ms(time.perf_counter_ns() - t0)
+    if _grid_cache is not None:
+        # Keep only one grid alive so earlier workloads' grids don't inflate
+        # the peak RSS of adapters measured later in the run.
+        _grid_cache.clear()
+        _grid_cache[key] = grid
+    return grid, build_ms
+
+
+# bulk_write_grid grids shared across adapters; only set during run_perf().
+_grid_cache: dict[str, list[list[Any]]] | None = None
+
+
+@contextlib.contextmanager
+def _grid_cache_scope() -> Iterator[None]:
+    global _grid_cache
+    _grid_cache = {}
+    try:
+        yield
+    finally:
+        _grid_cache = None
+
+
+def _fixture_grid(workload: dict[str, Any]) -> list[list[Any]]:
+    """Raw values of ``range`` on the first sheet of ``workload["values_from"]``."""
+    from openpyxl import load_workbook
+
+    start_cell, end_cell = _split_range(str(workload.get("range") or "A1"))
+    r0, c0 = _cell_to_coord(start_cell)
+    r1, c1 = _cell_to_coord(end_cell)
+    wb = load_workbook(str(workload["values_from"]), read_only=True, data_only=True)
+    try:
+        ws = wb.worksheets[0]
+        return [
+            list(row)
+            for row in ws.iter_rows(
+                min_row=r0, max_row=r1, min_col=c0, max_col=c1, values_only=True
+            )
+        ]
+    finally:
+        wb.close()
+
+
+def _build_workload_grid(workload: dict[str, Any]) -> list[list[Any]]:
+    """Materialize the same grid as ``_iter_workload_rows`` without per-cell loops.
+
+    Numeric values come from a NumPy arange; a repeated string is padded once
+    and interned so every filled cell shares one object; unique strings are
+    formatted only for filled cells.
+    """
+    import sys
+
+    import numpy as np
+
+    start_cell, end_cell = _split_range(str(workload.get("range") or "A1"))
+    r0, c0 = _cell_to_coord(start_cell)
+    r1, c1 = _cell_to_coord(end_cell)
+    rows = r1 - r0 + 1
+    cols = c1 - c0 + 1
+    n = rows * cols
+
+    value_type = str(workload.get("value_type") or "number").strip().lower()
+    if value_type not in ("number", "string"):
+        raise ValueError(f"Unsupported bulk_write_grid value_type: {value_type}")
+
+    start = int(workload.get("start") or 1)
+    step = int(workload.get("step") or 1)
+
+    sparse_every = workload.get("sparse_every")
+    if not isinstance(sparse_every, int) or sparse_every < 1:
+        sparse_every = 1
+
+    filled_values: list[int] = (
+        start + step * np.arange(0, n, sparse_every, dtype=np.int64)
+    ).tolist()
+
+    filled: list[Any]
+    if value_type == "number":
+        filled = filled_values
+    else:
+        string_mode = str(workload.get("string_mode") or "unique").strip().lower()
+        string_length_raw = workload.get("string_length")
+        string_length = int(string_length_raw) if isinstance(string_length_raw, int) else None
+        if string_mode == "repeated":
+            s = sys.intern(
+                _pad_workload_string(str(workload.get("string_value") or "X"), string_length)
+            )
+            filled = [s] * len(filled_values)
+        else:
+            prefix = str(workload.get("string_prefix") or "V")
+            filled = [_pad_workload_string(f"{prefix}{v}", string_length) for v in filled_values]
+
+    if sparse_every == 1:
+        flat = filled
+    else:
+        flat = [None] * n
+        flat[::sparse_every] = filled
+    return [flat[i : i + cols] for i in range(0, n, cols)]
+
+
+def _pad_workload_string(s: str, length: int | None) -> str:
+    if length is None or length <= 0:
+        return s
+    if len(s) < length:
+        return s + ("x" * (length - len(s)))
+    return s[:length]
+
+
+def _iter_workload_rows(workload: dict[str, Any]) -> Iterator[list[Any]]:
+    """Lazily generate the raw value rows of a bulk/stream write workload.
+
+    Honors ``value_type`` (number/string), ``start``/``step``, the string
+    options and ``sparse_every`` (unfilled cells are None). Only one row is
+    alive at a time, so streaming writers can be measured without the
+    harness holding the grid.
+    """
+    start_cell, end_cell = _split_range(str(workload.get("range") or "A1"))
+    r0, c0 = _cell_to_coord(start_cell)
+    r1, c1 = _cell_to_coord(end_cell)
+    rows = r1 - r0 + 1
+    cols = c1 - c0 + 1
+
+    value_type = str(workload.get("value_type") or "number").strip().lower()
+    if value_type not in ("number", "string"):
+        raise ValueError(f"Unsupported bulk_write_grid value_type: {value_type}")
+
+    start = int(workload.get("start") or 1)
+    step = int(workload.get("step") or 1)
+
+    string_prefix = str(workload.get("string_prefix") or "V")
+    string_mode = str(workload.get("string_mode") or "unique").strip().lower()
+    string_value = str(workload.get("string_value") or "X")
+    string_length_raw = workload.get("string_length")
+    string_length = int(string_length_raw) if isinstance(string_length_raw, int) else None
+
+    sparse_every = workload.get("sparse_every")
+    if not isinstance(sparse_every, int) or sparse_every < 1:
+        sparse_every = 1
+
+    v = start
+    linear_idx = 0
+    for _r in range(rows):
+        row_vals: list[Any] = []
+        for _c in range(cols):
+            filled = (linear_idx % sparse_every) == 0
+            linear_idx += 1
+
+            if not filled:
+                row_vals.append(None)
+                v += step
+                continue
+
+            if value_type == "number":
+                row_vals.append(v)
+            else:
+                s = string_value if string_mode == "repeated" else f"{string_prefix}{v}"
+                row_vals.append(_pad_workload_string(s, string_length))
+
+            v += step
+        yield row_vals
+
+
 def _run_workload_write(
     *,
     adapter: Any,
     workbook: Any,
     workload: dict[str, Any],
     cells: list[str],
+    grid: list[list[Any]] | None = None,
 ) -> None:
     from excelbench.models import (
         BorderEdge,
@@ -871,62 +2010,17 @@ def _run_workload_write(
         fn = getattr(adapter, "write_sheet_values", None)
         if fn is None:
             raise ValueError(f"Adapter does not support bulk sheet writes: {adapter.name}")
+        start_cell, _end_cell = _split_range(str(workload.get("range") or "A1"))
+        if grid is None:
+            grid, _build_ms = _workload_grid(workload)
+        fn(workbook, sheet, start_cell, grid)
+        return
 
-        start_cell, end_cell = _split_range(str(workload.get("range") or "A1"))
-        r0, c0 = _cell_to_coord(start_cell)
-        r1, c1 = _cell_to_coord(end_cell)
-        rows = r1 - r0 + 1
-        cols = c1 - c0 + 1
-
-        value_type = str(workload.get("value_type") or "number").strip().lower()
-
-        start = int(workload.get("start") or 1)
-        step = int(workload.get("step") or 1)
-
-        string_prefix = str(workload.get("string_prefix") or "V")
-        string_mode = str(workload.get("string_mode") or "unique").strip().lower()
-        string_value = str(workload.get("string_value") or "X")
-        string_length_raw = workload.get("string_length")
-        string_length = int(string_length_raw) if isinstance(string_length_raw, int) else None
-
-        sparse_every = workload.get("sparse_every")
-        if not isinstance(sparse_every, int) or sparse_every < 1:
-            sparse_every = 1
-
-        values: list[list[Any]] = []
-        v = start
-        linear_idx = 0
-        for _r in range(rows):
-            row_vals: list[Any] = []
-            for _c in range(cols):
-                filled = (linear_idx % sparse_every) == 0
-                linear_idx += 1
-
-                if not filled:
-                    row_vals.append(None)
-                    v += step
-                    continue
-
-                if value_type == "number":
-                    row_vals.append(v)
-                elif value_type == "string":
-                    if string_mode == "repeated":
-                        s = string_value
-                    else:
-                        s = f"{string_prefix}{v}"
-                    if string_length is not None and string_length > 0:
-                        if len(s) < string_length:
-                            s = s + ("x" * (string_length - len(s)))
-                        else:
-                            s = s[:string_length]
-                    row_vals.append(s)
-                else:
-                    raise ValueError(f"Unsupported bulk_write_grid value_type: {value_type}")
-
-                v += step
-            values.append(row_vals)
-
-        fn(workbook, sheet, start_cell, values)
+    if op == "stream_write_rows":
+        start_cell, _end_cell = _split_range(str(workload.get("range") or "A1"))
+        if start_cell != "A1":
+            raise ValueError(f"stream_write_rows range must start at A1, got {start_cell}")
+        adapter.append_rows(workbook, sheet, _iter_workload_rows(workload))
         return
 
     if op == "bulk_write_styled_grid":
@@ -1079,6 +2173,43 @@ def _run_workload_write(
     raise ValueError(f"Unsupported workload op for write: {op}")
 
 
+def _run_workload_modify(
+    *,
+    adapter: Any,
+    workbook: Any,
+    workload: dict[str, Any],
+    cells: list[str],
+) -> None:
+    from excelbench.models import CellFormat, CellType, CellValue
+
+    sheet = str(workload.get("sheet") or "S1")
+    op = str(workload.get("op") or "modify_patch_cells")
+
+    # Patching existing cells and appending rows past the used range issue the
+    # same writes; the fixture decides whether ``range`` overlaps existing data.
+    if op in {"modify_patch_cells", "modify_append_rows"}:
+        start = int(workload.get("start") or 1)
+        step = int(workload.get("step") or 1)
+        value = start
+        for cell in cells:
+            adapter.write_cell_value(
+                workbook, sheet, cell, CellValue(type=CellType.NUMBER, value=value)
+            )
+            value += step
+        return
+
+    if op == "modify_restyle_range":
+        palette = workload.get("palette")
+        if not isinstance(palette, list) or not palette:
+            palette = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00"]
+        formats = [CellFormat(bg_color=str(color)) for color in palette]
+        for idx, cell in enumerate(cells):
+            adapter.write_cell_format(workbook, sheet, cell, formats[idx % len(formats)])
+        return
+
+    raise ValueError(f"Unsupported workload op for modify: {op}")
+
+
 def _extract_single_workload(test_file: Any) -> dict[str, Any] | None:
     """Return workload spec if the test file is a single-workload scenario."""
     tcs = getattr(test_file, "test_cases", None)
@@ -1102,6 +2233,8 @@ def _workload_operations(workload: dict[str, Any] | None) -> set[str]:
     Default is both read+write. A workload may restrict operations by specifying:
 
         {"operations": ["read"]}
+
+    The modify (open -> patch -> save) op only runs when listed explicitly.
     """
     if workload is None:
         return {"read", "write"}
@@ -1113,12 +2246,11 @@ def _workload_operations(workload: dict[str, Any] | None) -> set[str]:
         if not isinstance(op, str):
             continue
         op_n = op.strip().lower()
-        if op_n in {"read", "write"}:
+        if op_n in _PERF_OPS:
             out.add(op_n)
     return out or {"read", "write"}
 
 
-
 def _phase_attribution_from_measurement(
     *, op_kind: str, measurement: dict[str, Any]
 ) -> dict[str, float]:
@@ -1143,11 +2275,14 @@ def _phase_attribution_from_measurement(
                 + float(breakdown.get("save", 0.0))
             )
             return {"parse": 0.0, "write": write, "verify": 0.0}
+        if op_kind == "modify":
+            write = float(breakdown.get("exercise", 0.0)) + float(breakdown.get("save", 0.0))
+            return {"parse": float(breakdown.get("open", 0.0)), "write": write, "verify": 0.0}
 
     wall_ms = float(measurement.get("wall_ms", 0.0))
     if op_kind == "read":
         return {"parse": wall_ms, "write": 0.0, "verify": 0.0}
-    if op_kind == "write":
+    if op_kind in {"write", "modify"}:
         return {"parse": 0.0, "write": wall_ms, "verify": 0.0}
     return {"parse": 0.0, "write": 0.0, "verify": 0.0}
 
@@ -1155,7 +2290,7 @@ def _phase_attribution_from_measurement(
 def _standardize_workload_size(*, test_file: Any, workload: dict[str, Any] | None) -> str:
     if workload is not None:
         try:
-            op_count = len(_cells_from_range(str(workload["range"])))
+            op_count = _range_cell_count(str(workload["range"]))
         except (TypeError, ValueError, KeyError):
             op_count = 0
         return _size_from_count(op_count)
@@ -1171,6 +2306,14 @@ def _size_from_count(count: int) -> str:
         return "medium"
     return "large"
 
+
+def _range_cell_count(range_str: str) -> int:
+    start, end = _split_range(range_str)
+    r0, c0 = _cell_to_coord(start)
+    r1, c1 = _cell_to_coord(end)
+    return (abs(r1 - r0) + 1) * (abs(c1 - c0) + 1)
+
+
 def _cells_from_range(range_str: str) -> list[str]:
     start, end = _split_range(range_str)
     return _cells_in_range(start, end)
@@ -1252,20 +2395,21 @@ def _measure_write_iteration(
         phases["add_sheets"] = _ns_to_ms(t1 - t0)
 
     t0 = time.perf_counter_ns()
-    for tc in test_file.test_cases:
-        if isinstance(tc.expected, dict) and "sheet_names" in tc.expected:
-            continue
-        target_sheet = tc.sheet or test_file.feature
-        target_cell = tc.cell or f"B{tc.row}"
-        _exercise_write_case(
-            fidelity=fidelity,
-            adapter=adapter,
-            workbook=workbook,
-            feature=test_file.feature,
-            sheet=target_sheet,
-            cell=target_cell,
-            test_case=tc,
-        )
+    with _profile_exercise():
+        for tc in test_file.test_cases:
+            if isinstance(tc.expected, dict) and "sheet_names" in tc.expected:
+                continue
+            target_sheet = tc.sheet or test_file.feature
+            target_cell = tc.cell or f"B{tc.row}"
+            _exercise_write_case(
+                fidelity=fidelity,
+                adapter=adapter,
+                workbook=workbook,
+                feature=test_file.feature,
+                sheet=target_sheet,
+                cell=target_cell,
+                test_case=tc,
+            )
     t1 = time.perf_counter_ns()
     if breakdown:
         phases["exercise"] = _ns_to_ms(t1 - t0)
@@ -1337,11 +2481,120 @@ def _exercise_write_case(
         fidelity._write_freeze_panes_case(adapter, workbook, sheet, expected)  # noqa: SLF001
 
 
+def _iteration_indices(
+    *,
+    warmup: int,
+    iters: int,
+    samples: list[float],
+    adaptive: AdaptiveSampling | None,
+) -> Iterator[int]:
+    """Yield iteration indices; indices below ``warmup`` are warmup runs.
+
+    The fixed policy yields exactly ``warmup + iters`` indices. The adaptive
+    policy inspects ``samples`` (the caller's timed wall-time list, appended
+    between yields) and stops early once the p50 CI is narrow enough or the
+    time budget is spent.
+    """
+    if adaptive is None:
+        yield from range(warmup + iters)
+        return
+
+    import time
+
+    t0 = time.perf_counter()
+    min_samples = min(iters, adaptive.min_iters)
+    for i in range(warmup + iters):
+        yield i
+        if i < warmup or not samples:
+            continue
+        if time.perf_counter() - t0 >= adaptive.time_budget_s:
+            return
+        if len(samples) >= min_samples and _relative_ci_width(samples) <= adaptive.ci_target:
+            return
+
+
 def _stats(samples: list[float]) -> PerfStats:
     if not samples:
         raise ValueError("No samples")
+    import numpy as np
+
+    s = sorted(samples)
+    arr = np.asarray(s, dtype=np.float64)
+    n = len(s)
+    p50 = _quantile_sorted(s, 0.50)
+    ci_low, ci_high = _median_ci_sorted(s)
+    boot_low, boot_high = _bootstrap_median_ci(arr)
+    mean = float(arr.mean())
+    stddev = float(arr.std(ddof=1)) if n > 1 else 0.0
+    q1, q3 = np.percentile(arr, [25.0, 75.0])
+    fence = 1.5 * (q3 - q1)
+    return PerfStats(
+        min=s[0],
+        p50=p50,
+        p95=_quantile_sorted(s, 0.95),
+        n=n,
+        ci_low=ci_low,
+        ci_high=ci_high,
+        cv=stddev / mean if mean > 0 else 0.0,
+        mean=mean,
+        stddev=stddev,
+        p99=_quantile_sorted(s, 0.99),
+        max=s[-1],
+        mad=float(np.median(np.abs(arr - np.median(arr)))),
+        outliers_low=int(np.count_nonzero(arr < q1 - fence)),
+        outliers_high=int(np.count_nonzero(arr > q3 + fence)),
+        boot_ci_low=boot_low,
+        boot_ci_high=boot_high,
+    )
+
+
+def _median(samples: list[float]) -> float:
+    """p50 alone, for phase and overhead summaries that don't need ``_stats()``'s CIs."""
+    if not samples:
+        raise ValueError("No samples")
+    return _quantile_sorted(sorted(samples), 0.50)
+
+
+_BOOTSTRAP_RESAMPLES = 2000
+_BOOTSTRAP_SEED = 0x5EED
+
+
+def _bootstrap_median_ci(arr: Any) -> tuple[float, float]:
+    """95% percentile-bootstrap CI for the median, resampled in one vectorized pass.
+
+    The generator is seeded so re-rendering the same samples yields the same CI.
+    """
+    import numpy as np
+
+    n = int(arr.shape[0])
+    if n == 1:
+        v = float(arr[0])
+        return v, v
+    rng = np.random.default_rng(_BOOTSTRAP_SEED)
+    idx = rng.integers(0, n, size=(_BOOTSTRAP_RESAMPLES, n))
+    medians = np.median(arr[idx], axis=1)
+    lo, hi = np.percentile(medians, [2.5, 97.5])
+    return float(lo), float(hi)
+
+
+def _median_ci_sorted(sorted_samples: list[float]) -> tuple[float, float]:
+    """Distribution-free ~95% CI for the median from binomial order statistics."""
+    import math
+
+    n = len(sorted_samples)
+    half_width = 1.96 * math.sqrt(n) / 2.0
+    lo = max(math.floor(n / 2.0 - half_width) - 1, 0)
+    hi = min(math.ceil(n / 2.0 + half_width), n - 1)
+    return sorted_samples[lo], sorted_samples[hi]
+
+
+def _relative_ci_width(samples: list[float]) -> float:
     s = sorted(samples)
-    return PerfStats(min=s[0], p50=_quantile_sorted(s, 0.50), p95=_quantile_sorted(s, 0.95))
+    p50 = _quantile_sorted(s, 0.50)
+    lo, hi = _median_ci_sorted(s)
+    if p50 <= 0:
+        return 0.0 if hi == lo else float("inf")
+    return (hi - lo) / p50
 
 
 def _quantile_sorted(sorted_samples: list[float], q: float) -> float:
@@ -0,0 +1,448 @@
+"""Scaling-curve mode: run workloads across a geometric series of sizes.
+
+Each selected workload is rescaled so its range covers roughly ``n`` cells
+(column count kept, rows adjusted) for every ``n`` in the sweep, and the
+whole matrix is measured with :func:`run_perf`. Read workloads run against a
+generated numeric grid of the matching shape (served from the fixture cache
+when one is given); modify workloads are not swept.
+
+Per (feature, library, op) the p50 wall time and the peak RSS are then fitted
+against ``n``:
+
+- ``exponent``: slope of the log-log least-squares line (``t ~ n^b``).
+- ``model``: the best of ``n``, ``n log n`` and ``n^2`` (each with an
+  intercept for fixed overhead), by relative residual.
+- ``per_cell``: slope of the linear model (ms or MB per cell).
+
+Curves whose time or RSS exponent exceeds ``exponent_threshold`` are flagged
+as superlinear. RSS is only fitted with ``isolation="process"``, where each
+op's peak is measured above a fresh worker's baseline.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from excelbench.perf.fixture_cache import FixtureCache
+from excelbench.perf.runner import (
+    PerfMetadata,
+    _cell_to_coord,
+    _coord_to_cell,
+    _extract_single_workload,
+    _range_cell_count,
+    _split_range,
+    _workload_operations,
+    run_perf,
+)
+
+SWEEP_MODELS = ("n", "n log n", "n^2")
+DEFAULT_SWEEP_SIZES = (1_000, 4_000, 16_000, 64_000, 256_000)
+DEFAULT_EXPONENT_THRESHOLD = 1.15
+
+_SWEEP_OPS = ("read", "write")
+_SIZE_SUFFIXES = {"": 1, "k": 1_000, "m": 1_000_000}
+
+
+@dataclass(frozen=True)
+class SweepPoint:
+    n: int  # cells in the scaled range
+    wall_p50_ms: float
+    rss_mb: float | None  # peak RSS above the worker baseline (process isolation only)
+
+
+@dataclass(frozen=True)
+class ScalingFit:
+    exponent: float
+    model: str
+    coefficient: float  # c in y = a + c * model(n)
+    per_cell: float  # slope of the linear model
+    per_cell_growth: float  # (y/n at the largest n) / (y/n at the smallest n)
+
+
+@dataclass(frozen=True)
+class SweepCurve:
+    feature: str
+    library: str
+    op: str
+    points: list[SweepPoint]
+    time_fit: ScalingFit | None
+    rss_fit: ScalingFit | None
+    superlinear: bool
+    notes: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class SweepResults:
+    metadata: PerfMetadata
+    sizes: list[int]
+    exponent_threshold: float
+    curves: list[SweepCurve]
+
+    @property
+    def flagged(self) -> list[SweepCurve]:
+        return [c for c in self.curves if c.superlinear]
+
+
+def parse_sweep_sizes(text: str) -> list[int]:
+    """Parse ``"1k,4k,16k"`` style size lists (suffixes k/m, case-insensitive)."""
+    sizes: list[int] = []
+    for part in text.split(","):
+        token = part.strip().lower().replace("_", "")
+        if not token:
+            continue
+        m = re.fullmatch(r"(\d+(?:\.\d+)?)([km]?)", token)
+        if not m:
+            raise ValueError(f"Invalid sweep size: {part.strip()!r}")
+        sizes.append(int(float(m.group(1)) * _SIZE_SUFFIXES[m.group(2)]))
+    return _validate_sizes(sizes)
+
+
+def _validate_sizes(sizes: list[int]) -> list[int]:
+    out = sorted(set(sizes))
+    if len(out) < 3:
+        raise ValueError("A sweep needs at least 3 distinct sizes to fit a curve")
+    if out[0] < 1:
+        raise ValueError("Sweep sizes must be >= 1")
+    return out
+
+
+def run_sweep(
+    test_dir: Path,
+    *,
+    sizes: list[int] | tuple[int, ...] = DEFAULT_SWEEP_SIZES,
+    adapters: list[Any] | None = None,
+    features: list[str] | None = None,
+    profile: str = "xlsx",
+    warmup: int = 1,
+    iters: int = 5,
+    jobs: int = 1,
+    isolation: str = "none",
+    exponent_threshold: float = DEFAULT_EXPONENT_THRESHOLD,
+    fixture_cache: FixtureCache | None = None,
+) -> SweepResults:
+    """Measure every swept workload at each size and fit scaling curves."""
+    from excelbench.generator.generate import load_manifest, write_manifest
+    from excelbench.models import Manifest
+
+    test_dir = Path(test_dir)
+    manifest_path = test_dir / "manifest.json"
+    if not manifest_path.exists():
+        raise FileNotFoundError(f"Manifest not found: {manifest_path}")
+    sizes = _validate_sizes(list(sizes))
+
+    manifest = load_manifest(manifest_path)
+    files = list(manifest.files)
+    if features:
+        wanted = {f.strip().lower() for f in features if f.strip()}
+        files = [f for f in files if f.feature in wanted]
+    workloads = [(f, w) for f in files if (w := _sweepable_workload(f)) is not None]
+    if not workloads:
+        raise ValueError("No sweepable workloads (need a range and a read or write op)")
+
+    points: dict[tuple[str, str, str], list[SweepPoint]] = {}
+    notes: dict[tuple[str, str, str], list[str]] = {}
+    metadata: PerfMetadata | None = None
+
+    with tempfile.TemporaryDirectory(prefix="excelbench-sweep-") as tmp:
+        for n in sizes:
+            suite = Path(tmp) / f"n{n}"
+            scaled = [
+                _scaled_test_file(f, w, n, suite, fixture_cache=fixture_cache) for f, w in workloads
+            ]
+            write_manifest(
+                Manifest(
+                    generated_at=manifest.generated_at,
+                    excel_version=manifest.excel_version,
+                    generator_version=manifest.generator_version,
+                    file_format=manifest.file_format,
+                    files=scaled,
+                ),
+                suite / "manifest.json",
+            )
+            results = run_perf(
+                suite,
+                adapters=adapters,
+                profile=profile,
+                warmup=warmup,
+                iters=iters,
+                jobs=jobs,
+                isolation=isolation,
+            )
+            metadata = metadata or results.metadata
+            cells = {
+                tf.feature: _range_cell_count(str(_extract_single_workload(tf)["range"]))  # type: ignore[index]
+                for tf in scaled
+            }
+            for r in results.results:
+                for op in _SWEEP_OPS:
+                    res = r.perf.get(op)
+                    key = (r.feature, r.library, op)
+                    if res is None:
+                        if r.notes and op in _workload_operations(
+                            _workload_for(workloads, r.feature)
+                        ):
+                            notes.setdefault(key, []).append(f"n={n}: {r.notes}")
+                        continue
+                    rss = None
+                    if res.rss_baseline_mb is not None and res.rss_peak_mb is not None:
+                        rss = max(0.0, res.rss_peak_mb - res.rss_baseline_mb)
+                    points.setdefault(key, []).append(
+                        SweepPoint(n=cells[r.feature], wall_p50_ms=res.wall_ms.p50, rss_mb=rss)
+                    )
+
+    assert metadata is not None
+    curves: list[SweepCurve] = []
+    for (feature, library, op), pts in sorted(points.items()):
+        time_fit = fit_scaling([p.n for p in pts], [p.wall_p50_ms for p in pts])
+        rss_pts = [p for p in pts if p.rss_mb is not None and p.rss_mb > 0]
+        rss_fit = fit_scaling([p.n for p in rss_pts], [float(p.rss_mb or 0.0) for p in rss_pts])
+        superlinear = any(
+            fit is not None and fit.exponent > exponent_threshold for fit in (time_fit, rss_fit)
+        )
+        curves.append(
+            SweepCurve(
+                feature=feature,
+                library=library,
+                op=op,
+                points=pts,
+                time_fit=time_fit,
+                rss_fit=rss_fit,
+                superlinear=superlinear,
+                notes=notes.get((feature, library, op), []),
+            )
+        )
+    return SweepResults(
+        metadata=metadata,
+        sizes=sizes,
+        exponent_threshold=exponent_threshold,
+        curves=curves,
+    )
+
+
+def fit_scaling(ns: list[int], ys: list[float]) -> ScalingFit | None:
+    """Fit ``ys`` against ``ns``; None with fewer than 3 positive points."""
+    import numpy as np
+
+    pairs = sorted((n, y) for n, y in zip(ns, ys, strict=True) if n > 0 and y > 0)
+    if len(pairs) < 3 or pairs[0][0] == pairs[-1][0]:
+        return None
+    n_arr = np.asarray([p[0] for p in pairs], dtype=np.float64)
+    y_arr = np.asarray([p[1] for p in pairs], dtype=np.float64)
+
+    exponent = float(np.polyfit(np.log(n_arr), np.log(y_arr), 1)[0])
+
+    basis = {
+        "n": n_arr,
+        "n log n": n_arr * np.log2(n_arr),
+        "n^2": n_arr**2,
+    }
+    coefficients: dict[str, float] = {}
+    errors: dict[str, float] = {}
+    for name in SWEEP_MODELS:
+        design = np.column_stack([np.ones_like(n_arr), basis[name]])
+        (intercept, coef), *_ = np.linalg.lstsq(design, y_arr, rcond=None)
+        coefficients[name] = float(coef)
+        if coef < 0:
+            # A negative growth term is not a plausible cost model.
+            errors[name] = math.inf
+            continue
+        pred = intercept + coef * basis[name]
+        errors[name] = float(np.sum(((pred - y_arr) / y_arr) ** 2))
+    best = min(SWEEP_MODELS, key=lambda m: errors[m])
+
+    first, last = pairs[0], pairs[-1]
+    growth = (last[1] / last[0]) / (first[1] / first[0])
+    return ScalingFit(
+        exponent=exponent,
+        model=best,
+        coefficient=coefficients[best],
+        per_cell=coefficients["n"],
+        per_cell_growth=growth,
+    )
+
+
+def _sweepable_workload(test_file: Any) -> dict[str, Any] | None:
+    workload = _extract_single_workload(test_file)
+    if workload is None:
+        return None
+    if not _workload_operations(workload) & set(_SWEEP_OPS):
+        return None
+    return workload
+
+
+def _workload_for(workloads: list[tuple[Any, dict[str, Any]]], feature: str) -> dict[str, Any]:
+    return next(w for f, w in workloads if f.feature == feature)
+
+
+def _scaled_shape(workload: dict[str, Any], n: int) -> tuple[int, int]:
+    start, end = _split_range(str(workload["range"]))
+    _r0, c0 = _cell_to_coord(start)
+    _r1, c1 = _cell_to_coord(end)
+    cols = max(1, min(c1 - c0 + 1, n))
+    rows = max(1, round(n / cols))
+    return rows, cols
+
+
+def _scaled_test_file(
+    test_file: Any,
+    workload: dict[str, Any],
+    n: int,
+    suite: Path,
+    *,
+    fixture_cache: FixtureCache | None,
+) -> Any:
+    """Copy ``test_file`` with its workload range rescaled to ~``n`` cells."""
+    from excelbench.models import TestCase, TestFile
+
+    rows, cols = _scaled_shape(workload, n)
+    ops = sorted(_workload_operations(workload) & set(_SWEEP_OPS))
+    sheet = str(workload.get("sheet") or "S1")
+    scaled = {
+        **workload,
+        "range": f"A1:{_coord_to_cell(rows, cols)}",
+        "operations": ops,
+    }
+    rel = f"grids/{sheet}_{rows}x{cols}.xlsx"
+    if "read" in ops:
+        _ensure_grid_fixture(suite / rel, sheet, rows, cols, fixture_cache)
+
+    tc = test_file.test_cases[0]
+    return TestFile(
+        path=rel,
+        feature=test_file.feature,
+        tier=test_file.tier,
+        file_format=test_file.file_format,
+        test_cases=[
+            TestCase(
+                id=tc.id,
+                label=tc.label,
+                row=tc.row,
+                expected={**tc.expected, "workload": scaled},
+                sheet=tc.sheet,
+                cell=tc.cell,
+                importance=tc.importance,
+            )
+        ],
+    )
+
+
+def _ensure_grid_fixture(
+    path: Path, sheet: str, rows: int, cols: int, fixture_cache: FixtureCache | None
+) -> None:
+    # Always (re)materialize: reuse goes through the spec-keyed cache so a
+    # stale grid at ``path`` is never trusted.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fixture_cache is None:
+        _write_grid_fixture(path, sheet, rows, cols)
+        return
+    spec = {
+        "scenario": "sweep_cell_values",
+        "sheet": sheet,
+        "rows": rows,
+        "cols": cols,
+        "value_type": "number",
+        "generator_version": "sweep-0.1.0",
+    }
+    fixture_cache.fetch(spec, path, lambda tmp: _write_grid_fixture(tmp, sheet, rows, cols))
+
+
+def _write_grid_fixture(path: Path, sheet: str, rows: int, cols: int) -> None:
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(str(path), {"constant_memory": True})
+    try:
+        ws = wb.add_worksheet(sheet)
+        value = 1
+        for r in range(rows):
+            ws.write_row(r, 0, range(value, value + cols))
+            value += cols
+    finally:
+        wb.close()
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+
+def sweep_results_to_json_dict(results: SweepResults) -> dict[str, Any]:
+    meta = results.metadata
+    return {
+        "metadata": {
+            "benchmark_version": meta.benchmark_version,
+            "run_date": meta.run_date.isoformat(),
+            "platform": meta.platform,
+            "profile": meta.profile,
+            "python": meta.python,
+            "commit": meta.commit,
+            "config": asdict(meta.config),
+        },
+        "sizes": results.sizes,
+        "exponent_threshold": results.exponent_threshold,
+        "models": list(SWEEP_MODELS),
+        "curves": [asdict(c) for c in results.curves],
+    }
+
+
+def render_sweep_results(results: SweepResults, output_root: Path) -> None:
+    perf_dir = Path(output_root) / "perf"
+    perf_dir.mkdir(parents=True, exist_ok=True)
+    with open(perf_dir / "sweep.json", "w") as f:
+        json.dump(sweep_results_to_json_dict(results), f, indent=2)
+    (perf_dir / "sweep.md").write_text(render_sweep_markdown(results))
+
+
+def render_sweep_markdown(results: SweepResults) -> str:
+    sizes = ", ".join(f"{n:,}" for n in results.sizes)
+    lines = [
+        "# Scaling Sweep",
+        "",
+        f"Sizes (cells): {sizes}. Fits: log-log exponent and best of "
+        f"{', '.join(SWEEP_MODELS)} (with intercept). "
+        f"⚠ marks time or RSS exponent > {results.exponent_threshold:g}.",
+        "",
+        "| Feature | Library | Op | Time exp | Time fit | ns/cell | Per-cell growth "
+        "| RSS exp | RSS fit | KB/1k cells | |",
+        "|---|---|---|---:|---|---:|---:|---:|---|---:|---|",
+    ]
+    for c in results.curves:
+        t, m = c.time_fit, c.rss_fit
+        lines.append(
+            "| "
+            + " | ".join(
+                [
+                    c.feature,
+                    c.library,
+                    c.op,
+                    _fmt(t.exponent if t else None, ".2f"),
+                    t.model if t else "—",
+                    _fmt(t.per_cell * 1e6 if t else None, ".1f"),
+                    _fmt(t.per_cell_growth if t else None, ".2f", suffix="x"),
+                    _fmt(m.exponent if m else None, ".2f"),
+                    m.model if m else "—",
+                    _fmt(m.per_cell * 1024 * 1000 if m else None, ".1f"),
+                    "⚠" if c.superlinear else "",
+                ]
+            )
+            + " |"
+        )
+    flagged = results.flagged
+    lines.append("")
+    if flagged:
+        lines.append(f"**{len(flagged)} superlinear curve(s):**")
+        for c in flagged:
+            lines.append(f"- {c.library} / {c.feature} / {c.op}")
+    else:
+        lines.append("No superlinear curves.")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _fmt(v: float | None, spec: str, *, suffix: str = "") -> str:
+    return "—" if v is None else f"{v:{spec}}{suffix}"
@@ -251,6 +251,12 @@ def _fmt_rate(op_count: int | None, p50_ms: float | None) -> str:
     return f"{rate:.0f}"
 
 
+def _fmt_pct(val: float | None) -> str:
+    if val is None:
+        return "\u2014"
+    return f"{val:.1f}%"
+
+
 def _fmt_mb(val: float | None) -> str:
     if val is None:
         return "\u2014"
@@ -1912,6 +1918,8 @@ def _section_performance(perf: dict[str, Any] | None) -> str:
                 "<th class='sort' data-type='n'>CPU p50</th>"
                 "<th class='sort' data-type='n'>RSS (MB)</th>"
                 "<th class='sort'>Throughput</th>"
+                "<th class='sort' data-type='n' title='Bulk read time spent converting to "
+                "CellValue (wrapped vs raw)'>Glue %</th>"
                 "<th>Phase Breakdown</th>"
                 "</tr></thead><tbody>"
             )
@@ -1934,6 +1942,7 @@ def _section_performance(perf: dict[str, Any] | None) -> str:
                 rss = od.get("rss_peak_mb")
                 oc = od.get("op_count")
                 rate = _fmt_rate(oc, wall.get("p50"))
+                glue = od.get("adapter_overhead_pct")
 
                 # Breakdown bar
                 bd = od.get("breakdown_ms", {})
@@ -1961,10 +1970,12 @@ def _section_performance(perf: dict[str, Any] | None) -> str:
                     f"<td data-v='{cpu.get('p50', 9e9)}'>{_fmt_ms(cpu.get('p50'))}</td>"
                     f"<td data-v='{rss or 9e9}'>{_fmt_mb(rss)}</td>"
                     f"<td>{rate}</td>"
+                    f"<td data-v='{glue if glue is not None else -1}'>{_fmt_pct(glue)}</td>"
                     f"<td>{bar_html}</td></tr>"
                 )
 
             rows.append("</tbody></table></div>")
+            rows.append(_perf_hotspots_html(sorted_entries, op))
 
         rows.append("</div></details>")
 
@@ -1972,6 +1983,36 @@ def _section_performance(perf: dict[str, Any] | None) -> str:
     return "\n".join(rows)
 
 
+def _perf_hotspots_html(entries: list[dict[str, Any]], op: str) -> str:
+    """Per-library cProfile hotspot tables (only present with --profile-hotspots)."""
+    parts: list[str] = []
+    for entry in entries:
+        od = (entry.get("perf") or {}).get(op) or {}
+        hs = od.get("hotspots")
+        if not hs:
+            continue
+        by_cat = hs.get("self_ms_by_category") or {}
+        split = " &middot; ".join(f"{_esc(cat)} {_fmt_ms(ms)}" for cat, ms in by_cat.items())
+        fn_rows = "".join(
+            f"<tr><td><code>{_esc(h.get('function'))}</code></td>"
+            f"<td>{_esc(h.get('category'))}</td>"
+            f"<td data-v='{h.get('self_ms', 0)}'>{_fmt_ms(h.get('self_ms'))}</td>"
+            f"<td data-v='{h.get('cum_ms', 0)}'>{_fmt_ms(h.get('cum_ms'))}</td>"
+            f"<td data-v='{h.get('calls', 0)}'>{_esc(h.get('calls'))}</td></tr>"
+            for h in hs.get("top", [])
+        )
+        parts.append(
+            f"<details class='expandable'><summary>{_esc(entry['library'])} hotspots "
+            f"&mdash; {split} per iteration</summary><div class='table-scroll'><table>"
+            "<thead><tr><th>Function</th><th class='sort'>Category</th>"
+            "<th class='sort' data-type='n'>Self</th>"
+            "<th class='sort' data-type='n'>Cumulative</th>"
+            "<th class='sort' data-type='n'>Calls</th></tr></thead>"
+            f"<tbody>{fn_rows}</tbody></table></div></details>"
+        )
+    return "".join(parts)
+
+
 def _section_memory(memory: list[dict[str, Any]] | None) -> str:
     if not memory:
         return ""
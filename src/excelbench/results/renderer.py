@@ -123,6 +123,7 @@ def render_json(results: BenchmarkResults, path: Path) -> None:
                 },
                 "test_cases": _group_test_cases(score.test_results),
                 "notes": score.notes,
+                "fingerprint": score.fingerprint,
             }
             for score in results.scores
         ],
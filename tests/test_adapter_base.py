@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +17,7 @@ from excelbench.models import (
     DiagnosticCategory,
     LibraryInfo,
     OperationType,
+    SheetColumns,
 )
 
 JSONDict = dict[str, Any]
@@ -344,3 +346,59 @@ def test_tier3_defaults_raise_not_implemented() -> None:
         adapter.read_tables(None, "S")
     with pytest.raises(NotImplementedError, match="table writes"):
         adapter.add_table(None, "S", {})
+
+
+def test_columnar_default_encodes_read_sheet_values_grid() -> None:
+    grid = [
+        [
+            CellValue(type=CellType.NUMBER, value=1.5),
+            CellValue(type=CellType.STRING, value="x"),
+            CellValue(type=CellType.BOOLEAN, value=True),
+        ],
+        [
+            CellValue(type=CellType.STRING, value="x"),
+            CellValue(type=CellType.DATE, value=date(2024, 6, 15)),
+            CellValue(type=CellType.FORMULA, value="=A1*2", formula="=A1*2"),
+        ],
+        [
+            CellValue(type=CellType.DATETIME, value=datetime(2024, 6, 15, 10, 30)),
+            CellValue(type=CellType.ERROR, value="#N/A"),
+        ],
+    ]
+
+    class BulkReadOnly(ConcreteReadOnly):
+        def read_sheet_values(
+            self, workbook: Any, sheet: str, cell_range: str | None = None
+        ) -> list[list[CellValue]]:
+            return grid
+
+    cols = BulkReadOnly().read_sheet_values_columnar(None, "S")
+    assert isinstance(cols, SheetColumns)
+    assert (cols.rows, cols.cols) == (3, 3)
+    assert memoryview(cols.type_codes).itemsize == 1
+    assert memoryview(cols.values).itemsize == 8
+    assert memoryview(cols.string_index).itemsize == 4
+    # Repeated strings are interned once.
+    assert cols.strings.count("x") == 1
+    assert cols.formulas == {(1, 2): "=A1*2"}
+    for r, row in enumerate(grid):
+        for c, expected in enumerate(row):
+            assert cols.cell_value(r, c) == expected
+    # Ragged rows are padded with blanks.
+    assert cols.cell_value(2, 2) == CellValue(type=CellType.BLANK)
+
+
+def test_columnar_default_requires_bulk_reads() -> None:
+    with pytest.raises(NotImplementedError, match="bulk reads"):
+        ConcreteReadOnly().read_sheet_values_columnar(None, "S")
+
+
+def test_columnar_default_rejects_native_bulk_results() -> None:
+    class NativeBulk(ConcreteReadOnly):
+        def read_sheet_values(
+            self, workbook: Any, sheet: str, cell_range: str | None = None
+        ) -> list[list[Any]]:
+            return [[1, "x"]]
+
+    with pytest.raises(NotImplementedError, match="CellValue grid"):
+        NativeBulk().read_sheet_values_columnar(None, "S")
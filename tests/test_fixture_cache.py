@@ -0,0 +1,91 @@
+import os
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from excelbench.perf.fixture_cache import FixtureCache, spec_key
+
+
+def _builder(payload: bytes, calls: list[Path]) -> Callable[[Path], None]:
+    def build(path: Path) -> None:
+        calls.append(path)
+        path.write_bytes(payload)
+
+    return build
+
+
+def test_spec_key_ignores_key_order() -> None:
+    assert spec_key({"rows": 10, "cols": 5}) == spec_key({"cols": 5, "rows": 10})
+    assert spec_key({"rows": 10, "cols": 5}) != spec_key({"rows": 10, "cols": 6})
+
+
+def test_fetch_builds_once_then_copies(tmp_path: Path) -> None:
+    cache = FixtureCache(tmp_path / "cache")
+    spec = {"scenario": "grid", "rows": 2, "cols": 2, "generator_version": "t"}
+    calls: list[Path] = []
+
+    assert cache.fetch(spec, tmp_path / "a.xlsx", _builder(b"abc", calls)) is False
+    assert cache.fetch(spec, tmp_path / "b" / "b.xlsx", _builder(b"zzz", calls)) is True
+
+    assert len(calls) == 1
+    assert (tmp_path / "a.xlsx").read_bytes() == b"abc"
+    assert (tmp_path / "b" / "b.xlsx").read_bytes() == b"abc"
+
+
+def test_corrupt_entry_is_rebuilt(tmp_path: Path) -> None:
+    cache = FixtureCache(tmp_path / "cache")
+    spec = {"scenario": "grid", "generator_version": "t"}
+    calls: list[Path] = []
+    cache.fetch(spec, tmp_path / "a.xlsx", _builder(b"good", calls))
+
+    (tmp_path / "cache" / f"{spec_key(spec)}.xlsx").write_bytes(b"bad")
+    assert cache.verify() == [spec_key(spec)]
+
+    assert cache.fetch(spec, tmp_path / "b.xlsx", _builder(b"good", calls)) is False
+    assert len(calls) == 2
+    assert cache.verify() == []
+
+
+def test_eviction_drops_least_recently_used(tmp_path: Path) -> None:
+    cache = FixtureCache(tmp_path / "cache", max_bytes=25)
+    calls: list[Path] = []
+    specs = [{"scenario": name} for name in ("a", "b", "c")]
+    for i, spec in enumerate(specs[:2]):
+        cache.fetch(spec, tmp_path / f"{i}.xlsx", _builder(b"x" * 10, calls))
+        data = tmp_path / "cache" / f"{spec_key(spec)}.xlsx"
+        os.utime(data, (1_000 + i, 1_000 + i))
+
+    # Touch "a" so "b" becomes the least recently used entry.
+    assert cache.lookup(specs[0]) is not None
+    cache.fetch(specs[2], tmp_path / "2.xlsx", _builder(b"x" * 10, calls))
+
+    assert cache.lookup(specs[0]) is not None
+    assert cache.lookup(specs[1]) is None
+    assert cache.lookup(specs[2]) is not None
+    assert cache.total_bytes() == 20
+
+
+def test_failed_build_leaves_no_entry(tmp_path: Path) -> None:
+    cache = FixtureCache(tmp_path / "cache")
+
+    def boom(path: Path) -> None:
+        path.write_bytes(b"partial")
+        raise RuntimeError("generator failed")
+
+    with pytest.raises(RuntimeError):
+        cache.fetch({"scenario": "x"}, tmp_path / "x.xlsx", boom)
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+def test_scratch_files_are_not_entries(tmp_path: Path) -> None:
+    root = tmp_path / "cache"
+    root.mkdir()
+    scratch = root / ".abc123-tmp.xlsx"
+    scratch.write_bytes(b"x" * 100)
+    cache = FixtureCache(root, max_bytes=10)
+
+    assert cache.evict() == []
+    assert cache.verify() == []
+    assert cache.total_bytes() == 0
+    assert scratch.exists()
@@ -1167,6 +1167,17 @@ class TestXlsxwriterWriteRoundtrip:
 # ═════════════════════════════════════════════════
 
 
+class _ExplodingOpenpyxl(OpenpyxlAdapter):
+    """Raises out of test_feature, so the parallel worker future fails."""
+
+    @property
+    def name(self) -> str:
+        return "exploding-openpyxl"
+
+    def supports_read_path(self, path: Path) -> bool:
+        raise RuntimeError("adapter blew up")
+
+
 class TestBenchmarkPipeline:
     """End-to-end test: load manifest → run benchmark on canonical fixtures."""
 
@@ -1186,3 +1197,61 @@ class TestBenchmarkPipeline:
         assert score.library == "openpyxl"
         assert score.read_score is not None
         assert score.read_score >= 2  # openpyxl should handle basics well
+
+    def test_parallel_benchmark_matches_serial_json(self, tmp_path: Path) -> None:
+        """jobs > 1 yields a byte-identical results.json to the serial run."""
+        from dataclasses import replace
+
+        from excelbench.harness.runner import run_benchmark
+        from excelbench.results.renderer import render_json
+
+        kwargs: dict[str, Any] = {
+            "test_dir": FIXTURES_DIR,
+            "adapters": [OpenpyxlAdapter(), CalamineAdapter(), XlsxwriterAdapter()],
+            "features": ["cell_values", "formulas"],
+        }
+        serial = run_benchmark(**kwargs)
+        parallel = run_benchmark(**kwargs, jobs=2)
+        parallel = replace(
+            parallel,
+            metadata=replace(parallel.metadata, run_date=serial.metadata.run_date),
+        )
+
+        render_json(serial, tmp_path / "serial.json")
+        render_json(parallel, tmp_path / "parallel.json")
+        assert (tmp_path / "serial.json").read_bytes() == (tmp_path / "parallel.json").read_bytes()
+        assert [(s.feature, s.library) for s in parallel.scores] == [
+            (s.feature, s.library) for s in serial.scores
+        ]
+
+    def test_parallel_benchmark_records_failed_worker(self) -> None:
+        """A feature that raises in a worker is scored as failed; others finish."""
+        from excelbench.harness.runner import run_benchmark
+
+        results = run_benchmark(
+            FIXTURES_DIR,
+            adapters=[OpenpyxlAdapter(), _ExplodingOpenpyxl()],
+            features=["cell_values", "formulas"],
+            jobs=2,
+        )
+
+        assert [(s.feature, s.library) for s in results.scores] == [
+            ("cell_values", "openpyxl"),
+            ("cell_values", "exploding-openpyxl"),
+            ("formulas", "openpyxl"),
+            ("formulas", "exploding-openpyxl"),
+        ]
+        for score in results.scores:
+            if score.library == "openpyxl":
+                assert score.read_score is not None and score.read_score >= 2
+                continue
+            assert score.notes == "Failed: RuntimeError: adapter blew up"
+            assert score.read_score == 0 and score.write_score == 0
+            assert score.fingerprint is None
+            assert score.test_results and not any(r.passed for r in score.test_results)
+
+    def test_benchmark_rejects_non_positive_jobs(self) -> None:
+        from excelbench.harness.runner import run_benchmark
+
+        with pytest.raises(ValueError, match="jobs"):
+            run_benchmark(FIXTURES_DIR, adapters=[OpenpyxlAdapter()], jobs=0)
@@ -0,0 +1,98 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from excelbench.cli import _results_from_json
+from excelbench.harness import runner
+from excelbench.harness.adapters.calamine_adapter import CalamineAdapter
+from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
+from excelbench.models import BenchmarkResults, LibraryInfo
+from excelbench.results.renderer import render_json
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures" / "excel"
+
+
+class _BumpedCalamine(CalamineAdapter):
+    @property
+    def info(self) -> LibraryInfo:
+        base = super().info
+        return LibraryInfo(
+            name=base.name,
+            version=base.version + ".post1",
+            language=base.language,
+            capabilities=base.capabilities,
+        )
+
+
+def _roundtrip(results: BenchmarkResults, tmp_path: Path) -> BenchmarkResults:
+    render_json(results, tmp_path / "results.json")
+    return _results_from_json(json.loads((tmp_path / "results.json").read_text()))
+
+
+def _tested(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    calls: list[str] = []
+    real = runner.test_feature
+
+    def spy(adapter: Any, test_file: Any, file_path: Path, verify_cache: Any = None) -> Any:
+        calls.append(adapter.name)
+        return real(adapter, test_file, file_path, verify_cache)
+
+    monkeypatch.setattr(runner, "test_feature", spy)
+    return calls
+
+
+def test_incremental_run_retests_only_changed_adapter(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    kwargs: dict[str, Any] = {"features": ["cell_values", "formulas"]}
+    first = runner.run_benchmark(
+        FIXTURES_DIR, adapters=[OpenpyxlAdapter(), CalamineAdapter()], **kwargs
+    )
+    assert all(s.fingerprint for s in first.scores)
+    previous = _roundtrip(first, tmp_path)
+
+    calls = _tested(monkeypatch)
+    unchanged = runner.run_benchmark(
+        FIXTURES_DIR, adapters=[OpenpyxlAdapter(), CalamineAdapter()], previous=previous, **kwargs
+    )
+    assert calls == []
+    assert unchanged.scores == previous.scores
+
+    bumped = runner.run_benchmark(
+        FIXTURES_DIR, adapters=[OpenpyxlAdapter(), _BumpedCalamine()], previous=previous, **kwargs
+    )
+    assert calls == ["python-calamine", "python-calamine"]
+    assert [(s.feature, s.library) for s in bumped.scores] == [
+        (s.feature, s.library) for s in first.scores
+    ]
+    old_fp = {(s.feature, s.library): s.fingerprint for s in first.scores}
+    for score in bumped.scores:
+        changed = old_fp[(score.feature, score.library)] != score.fingerprint
+        assert changed == (score.library == "python-calamine")
+
+
+def test_incremental_parallel_run_skips_unchanged_pairs(tmp_path: Path) -> None:
+    kwargs: dict[str, Any] = {
+        "adapters": [OpenpyxlAdapter(), CalamineAdapter()],
+        "features": ["cell_values"],
+    }
+    previous = _roundtrip(runner.run_benchmark(FIXTURES_DIR, **kwargs), tmp_path)
+    previous.scores = [s for s in previous.scores if s.library == "openpyxl"]
+
+    results = runner.run_benchmark(FIXTURES_DIR, jobs=2, previous=previous, **kwargs)
+
+    assert [s.library for s in results.scores] == ["openpyxl", "python-calamine"]
+    assert results.scores[0] == previous.scores[0]
+    assert results.scores[1].fingerprint is not None
+
+
+def test_incremental_ignores_other_profile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    kwargs: dict[str, Any] = {"adapters": [OpenpyxlAdapter()], "features": ["cell_values"]}
+    previous = _roundtrip(runner.run_benchmark(FIXTURES_DIR, **kwargs), tmp_path)
+    previous.metadata.profile = "xls"
+
+    calls = _tested(monkeypatch)
+    runner.run_benchmark(FIXTURES_DIR, previous=previous, **kwargs)
+    assert calls == ["openpyxl"]
@@ -10,6 +10,7 @@ from datetime import date, datetime
 from pathlib import Path
 
 import pytest
+from openpyxl import Workbook
 
 from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
 from excelbench.harness.adapters.pyexcel_adapter import PyexcelAdapter
@@ -578,6 +579,68 @@ class TestCalamineReadCellValue:
         assert adapter.read_column_width(wb, "S1", "A") is None
         adapter.close_workbook(wb)
 
+    def test_iter_sheet_rows_matches_bulk_read(
+        self, opxl: OpenpyxlAdapter, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "fixture.xlsx"
+        _write_openpyxl_fixture(opxl, path)
+        adapter = CalamineAdapter()
+        wb = adapter.open_workbook(path)
+        # Range extends past the used area: rows/cells are padded blank.
+        batches = list(adapter.iter_sheet_rows(wb, "S1", "A2:B12", batch_size=4))
+        assert [len(b) for b in batches] == [4, 4, 3]
+        streamed = [row for b in batches for row in b]
+        assert streamed == adapter.read_sheet_values(wb, "S1", "A2:B12")
+        adapter.close_workbook(wb)
+
+    def test_reversed_range_same_across_read_paths(
+        self, opxl: OpenpyxlAdapter, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "fixture.xlsx"
+        _write_openpyxl_fixture(opxl, path)
+        adapter = CalamineAdapter()
+        wb = adapter.open_workbook(path)
+        # Reversed corners, absolute refs and a window past the used area.
+        cell_range = "$C$9:a3"
+        raw = adapter.read_sheet_values_raw(wb, "S1", cell_range)
+        bulk = adapter.read_sheet_values(wb, "S1", cell_range)
+        streamed = [row for b in adapter.iter_sheet_rows(wb, "S1", cell_range) for row in b]
+        assert len(raw) == len(bulk) == 7
+        assert all(len(row) == 3 for row in raw)
+        assert streamed == bulk
+        assert bulk[0][0] == adapter.read_cell_value(wb, "S1", "A3")
+        assert bulk[-1] == [CellValue(type=CellType.BLANK)] * 3
+        adapter.close_workbook(wb)
+
+
+# ═════════════════════════════════════════════════════════════════════════
+# Bulk raw / wrapped reads
+# ═════════════════════════════════════════════════════════════════════════
+
+
+@pytest.mark.parametrize("adapter_cls", [PyexcelAdapter, PylightxlAdapter])
+def test_bulk_read_matches_per_cell_reads(
+    adapter_cls: type[PyexcelAdapter] | type[PylightxlAdapter],
+    opxl: OpenpyxlAdapter,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "fixture.xlsx"
+    _write_openpyxl_fixture(opxl, path)
+    adapter = adapter_cls()
+    wb = adapter.open_workbook(path)
+
+    # Range extends past the used area: raw cells are padded, wrapped cells are blank.
+    raw = adapter.read_sheet_values_raw(wb, "S1", "A1:B9")
+    wrapped = adapter.read_sheet_values(wb, "S1", "A1:B9")
+    assert len(raw) == len(wrapped) == 9
+    assert all(len(row) == 2 for row in raw + wrapped)
+    assert not any(isinstance(v, CellValue) for row in raw for v in row)
+    assert [row[0] for row in wrapped] == [
+        adapter.read_cell_value(wb, "S1", f"A{r}") for r in range(1, 10)
+    ]
+    assert all(row[1].type == CellType.BLANK for row in wrapped)
+    adapter.close_workbook(wb)
+
 
 # ═════════════════════════════════════════════════════════════════════════
 # UmyaAdapter tests (read/write via PyO3)
@@ -722,6 +785,57 @@ class TestUmyaWriteRoundtrip:
         assert cv.value == "hello"
         adapter.close_workbook(wb)
 
+    def test_lazy_open_loads_only_touched_sheets(self, tmp_path: Path) -> None:
+        path = tmp_path / "multi.xlsx"
+        wb = Workbook()
+        for name in ("S1", "S2", "S3"):
+            ws = wb.create_sheet(name)
+            ws["A1"] = name.lower()
+        wb.remove(wb["Sheet"])
+        wb.save(path)
+
+        adapter = UmyaAdapter()
+        rb = adapter.open_workbook(path)
+        assert adapter.get_sheet_names(rb) == ["S1", "S2", "S3"]
+        assert rb.loaded_sheets() == []
+        assert adapter.read_cell_value(rb, "S2", "A1").value == "s2"
+        assert rb.loaded_sheets() == ["S2"]
+        rb.preload(["S3"])
+        assert rb.loaded_sheets() == ["S2", "S3"]
+        with pytest.raises(ValueError):
+            rb.preload(["Nope"])
+        adapter.close_workbook(rb)
+
+    def test_bulk_read_matches_per_cell(self, tmp_path: Path) -> None:
+        path = tmp_path / "bulk.xlsx"
+        wb = Workbook()
+        ws = wb.active
+        assert ws is not None
+        ws.title = "S1"
+        ws["A1"] = "name"
+        ws["B1"] = 1.5
+        ws["A2"] = True
+        ws["C2"] = "=B1*2"
+        wb.save(path)
+
+        adapter = UmyaAdapter()
+        rb = adapter.open_workbook(path)
+        grid = adapter.read_sheet_values(rb, "S1")
+        assert len(grid) == 2 and all(len(row) == 3 for row in grid)
+        for r, row in enumerate(grid):
+            for c, cv in enumerate(row):
+                assert cv == adapter.read_cell_value(rb, "S1", f"{'ABC'[c]}{r + 1}")
+        assert rb.sheet_bounds("S1") == (0, 0, 1, 2)
+        assert adapter.read_sheet_values(rb, "S1", "B1:B2")[0][0].value == 1.5
+
+        cols = adapter.read_sheet_values_columnar(rb, "S1")
+        assert (cols.rows, cols.cols) == (2, 3)
+        assert cols.strings == ["name"]
+        assert cols.formulas == {(1, 2): "=B1*2"}
+        batches = list(adapter.iter_sheet_rows(rb, "S1", batch_size=1))
+        assert [row for batch in batches for row in batch] == grid
+        adapter.close_workbook(rb)
+
     def test_write_noop_methods(self) -> None:
         adapter = UmyaAdapter()
         wb = adapter.create_workbook()
@@ -182,6 +182,90 @@ class TestReadonlyReadCellValue:
         ro.close_workbook(wb)  # Should not raise
 
 
+# ═════════════════════════════════════════════════════════════════════════
+# TestReadonlyRowIndex
+# ═════════════════════════════════════════════════════════════════════════
+
+
+class TestReadonlyRowIndex:
+    """Per-cell reads are served from a lazy row-block index."""
+
+    def _grid(self, tmp_path: Path) -> Path:
+        import openpyxl
+
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        assert ws is not None
+        ws.title = "S1"
+        for r in range(1, 11):
+            for c in range(1, 4):
+                ws.cell(row=r, column=c, value=r * 10 + c)
+        path = tmp_path / "grid.xlsx"
+        wb.save(path)
+        return path
+
+    def test_any_access_order_matches_bulk_read(
+        self, ro: OpenpyxlReadonlyAdapter, tmp_path: Path
+    ) -> None:
+        wb = ro.open_workbook(self._grid(tmp_path))
+        expected = {
+            f"{col}{row}": CellValue(type=CellType.NUMBER, value=row * 10 + c)
+            for row in range(1, 11)
+            for c, col in enumerate("ABC", start=1)
+        }
+        refs = list(expected)
+        for ref in reversed(refs):
+            assert ro.read_cell_value(wb, "S1", ref) == expected[ref]
+        for ref in refs[::7] + refs[::-5]:
+            assert ro.read_cell_value(wb, "S1", ref) == expected[ref]
+        assert ro.read_cell_value(wb, "S1", "D1").type == CellType.BLANK
+        assert ro.read_cell_value(wb, "S1", "A500").type == CellType.BLANK
+        ro.close_workbook(wb)
+        assert ro._row_index == {}
+
+    def test_evicted_blocks_are_reloaded(self, tmp_path: Path) -> None:
+        import openpyxl
+
+        from excelbench.harness.adapters.openpyxl_readonly_adapter import _SheetRowIndex
+
+        wb = openpyxl.load_workbook(self._grid(tmp_path), read_only=True)
+        index = _SheetRowIndex(wb["S1"], block_rows=2, max_blocks=1)
+        for row in (9, 1, 5, 10, 2):
+            c = index.cell(row, 2)
+            assert c is not None and c.value == row * 10 + 2
+        assert index.cell(11, 1) is None
+        index.close()
+        wb.close()
+
+
+# ═════════════════════════════════════════════════════════════════════════
+# TestReadonlyStreaming
+# ═════════════════════════════════════════════════════════════════════════
+
+
+class TestReadonlyStreaming:
+    def test_iter_sheet_rows_batches_match_bulk_read(
+        self, ro: OpenpyxlReadonlyAdapter, opxl: OpenpyxlAdapter, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "fixture.xlsx"
+        _write_fixture(opxl, path)
+        wb = ro.open_workbook(path)
+        batches = list(ro.iter_sheet_rows(wb, "S1", "A1:A7", batch_size=3))
+        assert [len(b) for b in batches] == [3, 3, 1]
+        assert [row for b in batches for row in b] == ro.read_sheet_values(wb, "S1", "A1:A7")
+        ro.close_workbook(wb)
+
+    def test_iter_sheet_rows_rejects_bad_batch_size(
+        self, ro: OpenpyxlReadonlyAdapter, opxl: OpenpyxlAdapter, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "fixture.xlsx"
+        _write_fixture(opxl, path)
+        wb = ro.open_workbook(path)
+        with pytest.raises(ValueError, match="batch_size"):
+            list(ro.iter_sheet_rows(wb, "S1", batch_size=0))
+        ro.close_workbook(wb)
+
+
 # ═════════════════════════════════════════════════════════════════════════
 # TestReadonlyStubs
 # ═════════════════════════════════════════════════════════════════════════
@@ -0,0 +1,182 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+import typer
+
+from excelbench.cli import perf_compare
+from excelbench.perf.compare import compare_perf_results, load_perf_run, mann_whitney_u
+
+
+def _run(
+    p50: float,
+    *,
+    ci: tuple[float, float] | None = None,
+    rss: float | None = None,
+    op_count: int = 100,
+    commit: str = "abc",
+    isolation: str = "process",
+    save_samples: bool = False,
+) -> dict[str, Any]:
+    wall: dict[str, Any] = {"min": p50, "p50": p50, "p95": p50}
+    if ci is not None:
+        wall["boot_ci_low"], wall["boot_ci_high"] = ci
+    return {
+        "metadata": {
+            "commit": commit,
+            "config": {"isolation": isolation, "save_samples": save_samples},
+        },
+        "results": [
+            {
+                "feature": "cell_values_10k_bulk_read",
+                "library": "openpyxl",
+                "workload_size": "medium",
+                "perf": {
+                    "read": {
+                        "wall_ms": wall,
+                        "cpu_ms": wall,
+                        "op_count": op_count,
+                        "rss_peak_mb": rss,
+                    },
+                    "write": None,
+                },
+            }
+        ],
+    }
+
+
+def test_mann_whitney_u_separates_shifted_samples() -> None:
+    base = [10.0, 10.1, 10.2, 9.9, 10.0, 10.3, 9.8, 10.1]
+    head = [12.0, 12.1, 11.9, 12.2, 12.0, 12.3, 11.8, 12.1]
+
+    u, p = mann_whitney_u(base, head)
+    assert u == 0.0
+    assert p < 0.01
+
+    _, p_same = mann_whitney_u(base, list(base))
+    assert p_same > 0.5
+
+
+def test_compare_flags_significant_slowdown_from_ci_overlap() -> None:
+    base = _run(10.0, ci=(9.8, 10.2))
+    head = _run(12.0, ci=(11.8, 12.2))
+
+    cmp = compare_perf_results(base, head)
+
+    assert [(d.metric, d.status, d.method) for d in cmp.regressions] == [
+        ("wall_ms", "regression", "ci-overlap")
+    ]
+    assert cmp.regressions[0].change == pytest.approx(0.2)
+
+
+def test_compare_ignores_overlapping_or_small_changes() -> None:
+    # Overlapping CIs: not significant even though p50 moved by 10%.
+    cmp = compare_perf_results(_run(10.0, ci=(9.0, 12.0)), _run(11.0, ci=(10.0, 13.0)))
+    assert cmp.regressions == []
+
+    # Significant but below the threshold.
+    cmp = compare_perf_results(
+        _run(10.0, ci=(9.99, 10.01)), _run(10.2, ci=(10.19, 10.21)), threshold=0.05
+    )
+    assert cmp.regressions == []
+    assert cmp.deltas[0].status == "unchanged"
+
+
+def test_compare_prefers_raw_samples_and_reports_improvements() -> None:
+    key = ("cell_values_10k_bulk_read", "openpyxl", "read", "wall_ms")
+    cmp = compare_perf_results(
+        _run(10.0, ci=(9.0, 11.0)),
+        _run(8.0, ci=(7.5, 9.5)),
+        base_samples={key: [10.0, 10.1, 9.9, 10.2, 9.8, 10.0]},
+        head_samples={key: [8.0, 8.1, 7.9, 8.2, 7.8, 8.0]},
+    )
+
+    delta = cmp.deltas[0]
+    assert delta.method == "mann-whitney"
+    assert delta.status == "improvement"
+    assert delta.p_value is not None and delta.p_value < 0.05
+
+
+def test_compare_memory_and_unmatched_rows() -> None:
+    base = _run(10.0, ci=(9.9, 10.1), rss=100.0)
+    head = _run(10.0, ci=(9.9, 10.1), rss=150.0)
+    head["results"].append({**head["results"][0], "library": "pandas"})
+
+    cmp = compare_perf_results(base, head)
+
+    statuses = {(d.library, d.metric): d.status for d in cmp.deltas}
+    assert statuses[("openpyxl", "rss_peak_mb")] == "regression"
+    assert statuses[("openpyxl", "wall_ms")] == "unchanged"
+    assert statuses[("pandas", "wall_ms")] == "added"
+
+    changed = compare_perf_results(_run(10.0, op_count=100), _run(20.0, op_count=200))
+    assert changed.deltas[0].status == "incomparable"
+    assert changed.regressions == []
+
+
+def test_compare_memory_is_informational_without_process_isolation() -> None:
+    base = _run(10.0, ci=(9.9, 10.1), rss=100.0, isolation="none")
+    head = _run(10.0, ci=(9.9, 10.1), rss=150.0)
+
+    cmp = compare_perf_results(base, head)
+
+    rss = next(d for d in cmp.deltas if d.metric == "rss_peak_mb")
+    assert (rss.status, rss.method) == ("info", "informational")
+    assert cmp.regressions == []
+
+
+def test_load_perf_run_ignores_stale_samples(tmp_path: Path) -> None:
+    import numpy as np
+
+    path = tmp_path / "results.json"
+    arrays: dict[str, Any] = {"f:openpyxl:read:wall_ms": np.array([1.0, 2.0])}
+    np.savez(tmp_path / "samples.npz", **arrays)
+
+    path.write_text(json.dumps(_run(10.0)))
+    assert load_perf_run(path)[1] is None
+
+    path.write_text(json.dumps(_run(10.0, save_samples=True)))
+    samples = load_perf_run(path)[1]
+    assert samples == {("f", "openpyxl", "read", "wall_ms"): [1.0, 2.0]}
+
+
+def test_perf_compare_command_exit_status_and_reports(tmp_path: Path) -> None:
+    base_path = tmp_path / "base" / "results.json"
+    head_path = tmp_path / "head" / "results.json"
+    for path, run in (
+        (base_path, _run(10.0, ci=(9.8, 10.2))),
+        (head_path, _run(15.0, ci=(14.8, 15.2), commit="def")),
+    ):
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps(run))
+
+    out = tmp_path / "compare"
+    with pytest.raises(typer.Exit) as exc:
+        perf_compare(
+            base_path=base_path,
+            head_path=head_path,
+            alpha=0.05,
+            threshold=0.05,
+            memory_threshold=0.10,
+            output_dir=out,
+        )
+    assert exc.value.exit_code == 1
+
+    report = json.loads((out / "compare.json").read_text())
+    assert report["regressions"] == 1
+    assert report["head_commit"] == "def"
+    assert (
+        "| regression | cell_values_10k_bulk_read | openpyxl | read | wall_ms |"
+        in (out / "compare.md").read_text()
+    )
+
+    # Same run on both sides passes the gate.
+    perf_compare(
+        base_path=base_path,
+        head_path=base_path,
+        alpha=0.05,
+        threshold=0.05,
+        memory_threshold=0.10,
+        output_dir=None,
+    )
@@ -0,0 +1,162 @@
+import cProfile
+import json
+import sysconfig
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+import excelbench
+from excelbench.generator.generate import write_manifest
+from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
+from excelbench.models import Importance, Manifest
+from excelbench.models import TestCase as BenchCase
+from excelbench.models import TestFile as BenchFile
+from excelbench.perf.hotspots import HOTSPOT_CATEGORIES, classify_function, profile_hotspots
+from excelbench.perf.renderer import render_perf_results
+from excelbench.perf.runner import run_perf
+from excelbench.results.html_dashboard import _perf_hotspots_html
+
+_PKG = Path(excelbench.__file__).parent.as_posix()
+
+
+@pytest.mark.parametrize(
+    ("filename", "name", "category"),
+    [
+        (f"{_PKG}/harness/adapters/wolfxl_adapter.py", "read", "adapter"),
+        (f"{_PKG}/perf/runner.py", "_bench_op", "harness"),
+        ("/venv/lib/python3.12/site-packages/openpyxl/cell/cell.py", "value", "library"),
+        # A venv inside the checkout must not be mistaken for harness code.
+        (
+            "/home/u/excelbench/.venv/lib/python3.12/site-packages/openpyxl/cell/cell.py",
+            "value",
+            "library",
+        ),
+        ("/home/u/excelbench/harness/adapters/other.py", "read", "library"),
+        (sysconfig.get_paths()["stdlib"] + "/zipfile.py", "read", "python"),
+        ("~", "<built-in method builtins.len>", "python"),
+        ("~", "<method 'append' of 'list' objects>", "python"),
+        ("~", "<method 'write' of '_io.BufferedWriter' objects>", "python"),
+        ("~", "<method 'read_sheet_values' of 'wolfxl._rust.Book' objects>", "library"),
+    ],
+)
+def test_classify_function(filename: str, name: str, category: str) -> None:
+    assert classify_function(filename, name) == category
+
+
+def test_profile_hotspots_reports_per_iteration_self_time() -> None:
+    def run(profiler: cProfile.Profile) -> None:
+        for _ in range(2):
+            sorted(str(i) for i in range(20_000))  # not profiled
+            profiler.enable()
+            sorted(str(i) for i in range(20_000))
+            profiler.disable()
+
+    summary = profile_hotspots(run, iters=2, top=3)
+
+    assert summary["iters"] == 2
+    assert set(summary["self_ms_by_category"]) == set(HOTSPOT_CATEGORIES)
+    assert len(summary["top"]) == 2
+    genexpr = next(h for h in summary["top"] if "<genexpr>" in h["function"])
+    assert genexpr["calls"] == 20_001  # only the enabled half of each iteration
+    selfs = [h["self_ms"] for h in summary["top"]]
+    assert selfs == sorted(selfs, reverse=True)
+    assert not any("_lsprof" in h["function"] for h in summary["top"])
+
+
+def _write_suite(suite: Path) -> None:
+    (suite / "tier0").mkdir(parents=True)
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "S1"
+    for r in range(1, 11):
+        for c in range(1, 11):
+            ws.cell(row=r, column=c, value=r * 100 + c)
+    wb.save(suite / "tier0" / "cells.xlsx")
+
+    workload = {"op": "cell_value", "sheet": "S1", "range": "A1:J10", "start": 1, "step": 1}
+    write_manifest(
+        Manifest(
+            generated_at=datetime.now(UTC),
+            excel_version="test",
+            generator_version="test",
+            file_format="xlsx",
+            files=[
+                BenchFile(
+                    path="tier0/cells.xlsx",
+                    feature="cells_100",
+                    tier=0,
+                    file_format="xlsx",
+                    test_cases=[
+                        BenchCase(
+                            id="cells_100",
+                            label="cells",
+                            row=1,
+                            expected={"workload": workload},
+                            importance=Importance.BASIC,
+                        )
+                    ],
+                )
+            ],
+        ),
+        suite / "manifest.json",
+    )
+
+
+def test_run_perf_attaches_hotspots(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    _write_suite(suite)
+
+    results = run_perf(suite, adapters=[OpenpyxlAdapter()], warmup=0, iters=2, hotspots=4)
+
+    assert results.metadata.config.hotspots == 4
+    row = results.results[0]
+    for op in ("read", "write"):
+        res = row.perf[op]
+        assert res is not None and res.hotspots is not None
+        assert res.hotspots["iters"] == 2
+        assert 0 < len(res.hotspots["top"]) <= 4
+        by_cat = res.hotspots["self_ms_by_category"]
+        assert by_cat["library"] > 0
+        assert by_cat["adapter"] > 0
+
+    render_perf_results(results, tmp_path / "out")
+    readme = (tmp_path / "out" / "perf" / "README.md").read_text()
+    assert "## Hotspots" in readme
+
+    data = json.loads((tmp_path / "out" / "perf" / "results.json").read_text())
+    html = _perf_hotspots_html(data["results"], "read")
+    assert "openpyxl hotspots" in html
+
+
+def test_run_perf_without_hotspots_leaves_field_empty(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    _write_suite(suite)
+
+    results = run_perf(suite, adapters=[OpenpyxlAdapter()], warmup=0, iters=1)
+
+    read = results.results[0].perf["read"]
+    assert read is not None
+    assert read.hotspots is None
+
+
+def test_run_perf_hotspots_profile_exercise_phase_only(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    _write_suite(suite)
+
+    results = run_perf(suite, adapters=[OpenpyxlAdapter()], warmup=0, iters=1, hotspots=500)
+
+    row = results.results[0]
+    functions = [
+        h["function"]
+        for op in ("read", "write")
+        for h in (row.perf[op].hotspots or {}).get("top", [])  # type: ignore[union-attr]
+    ]
+    assert functions
+    assert not any(
+        name in f
+        for f in functions
+        for name in ("save_workbook", "load_workbook", "close_workbook")
+    )
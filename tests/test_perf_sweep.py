@@ -0,0 +1,171 @@
+import json
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+import typer
+
+from excelbench.generator.generate import write_manifest
+from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
+from excelbench.models import Importance, Manifest
+from excelbench.models import TestCase as BenchCase
+from excelbench.models import TestFile as BenchFile
+from excelbench.perf.fixture_cache import FixtureCache
+from excelbench.perf.sweep import fit_scaling, parse_sweep_sizes, render_sweep_results, run_sweep
+
+
+def test_parse_sweep_sizes() -> None:
+    assert parse_sweep_sizes("16k, 1k,4K,1m") == [1_000, 4_000, 16_000, 1_000_000]
+    assert parse_sweep_sizes("100,200,1.5k") == [100, 200, 1_500]
+    with pytest.raises(ValueError):
+        parse_sweep_sizes("1k,2k")
+    with pytest.raises(ValueError):
+        parse_sweep_sizes("1k,2x,3k")
+
+
+@pytest.mark.parametrize(
+    ("f", "model", "exponent"),
+    [
+        (lambda n: 0.1 + 0.002 * n, "n", 1.0),
+        (lambda n: 1e-6 * n * n, "n^2", 2.0),
+    ],
+)
+def test_fit_scaling_recovers_model(f: Callable[[int], float], model: str, exponent: float) -> None:
+    ns = [1_000, 4_000, 16_000, 64_000, 256_000]
+    fit = fit_scaling(ns, [f(n) for n in ns])
+
+    assert fit is not None
+    assert fit.model == model
+    assert fit.exponent == pytest.approx(exponent, abs=0.1)
+
+
+def test_fit_scaling_needs_three_points() -> None:
+    assert fit_scaling([10, 100], [1.0, 10.0]) is None
+    assert fit_scaling([10, 100, 1000], [1.0, 0.0, 10.0]) is None
+
+
+def test_run_sweep_scales_read_and_write_workloads(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    files = [
+        BenchFile(
+            path=f"tier0/{feature}.xlsx",
+            feature=feature,
+            tier=0,
+            file_format="xlsx",
+            test_cases=[
+                BenchCase(
+                    id=feature,
+                    label=feature,
+                    row=1,
+                    expected={"workload": workload},
+                    importance=Importance.BASIC,
+                )
+            ],
+        )
+        for feature, workload in [
+            (
+                "bulk_read",
+                {
+                    "op": "bulk_sheet_values",
+                    "operations": ["read"],
+                    "sheet": "S1",
+                    "range": "A1:J100",
+                },
+            ),
+            (
+                "bulk_write",
+                {
+                    "op": "bulk_write_grid",
+                    "operations": ["write", "modify"],
+                    "sheet": "S1",
+                    "range": "A1:J100",
+                    "start": 1,
+                    "step": 1,
+                },
+            ),
+        ]
+    ]
+    write_manifest(
+        Manifest(
+            generated_at=datetime.now(UTC),
+            excel_version="test",
+            generator_version="test",
+            file_format="xlsx",
+            files=files,
+        ),
+        suite / "manifest.json",
+    )
+
+    results = run_sweep(
+        suite,
+        sizes=[20, 80, 320],
+        adapters=[OpenpyxlAdapter()],
+        warmup=0,
+        iters=1,
+        fixture_cache=FixtureCache(tmp_path / "cache"),
+    )
+
+    keys = {(c.feature, c.op) for c in results.curves}
+    assert keys == {("bulk_read", "read"), ("bulk_write", "write")}
+    for curve in results.curves:
+        assert [p.n for p in curve.points] == [20, 80, 320]
+        assert all(p.rss_mb is None for p in curve.points)
+        assert curve.rss_fit is None
+    # One cached grid per read size.
+    assert len(list((tmp_path / "cache").glob("*.xlsx"))) == 3
+
+    render_sweep_results(results, tmp_path / "out")
+    payload = json.loads((tmp_path / "out" / "perf" / "sweep.json").read_text())
+    assert payload["sizes"] == [20, 80, 320]
+    assert len(payload["curves"]) == 2
+    assert "Scaling Sweep" in (tmp_path / "out" / "perf" / "sweep.md").read_text()
+
+
+def test_ensure_grid_fixture_replaces_stale_file(tmp_path: Path) -> None:
+    from excelbench.perf.sweep import _ensure_grid_fixture
+
+    path = tmp_path / "grids" / "S1_4x3.xlsx"
+    path.parent.mkdir()
+    path.write_bytes(b"stale")
+
+    cache = FixtureCache(tmp_path / "cache")
+    _ensure_grid_fixture(path, "S1", 4, 3, cache)
+
+    (cached,) = (tmp_path / "cache").glob("*.xlsx")
+    assert path.read_bytes() == cached.read_bytes()
+
+
+def test_cli_sweep_passes_fixture_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from excelbench import cli
+    from excelbench.perf import sweep
+
+    seen: list[object] = []
+
+    def fake_run_sweep(*_args: object, fixture_cache: object = None, **_kwargs: object) -> None:
+        seen.append(fixture_cache)
+        raise ValueError("stop")
+
+    monkeypatch.setattr(sweep, "run_sweep", fake_run_sweep)
+    monkeypatch.setenv("EXCELBENCH_FIXTURE_CACHE", str(tmp_path / "cache"))
+    for use_cache in (True, False):
+        with pytest.raises(typer.Exit):
+            cli._run_perf_sweep(
+                tmp_path,
+                tmp_path / "out",
+                adapters=[],
+                features=None,
+                profile="xlsx",
+                warmup=0,
+                iters=1,
+                jobs=1,
+                isolation="none",
+                sizes_text="1k,2k,4k",
+                threshold=1.15,
+                use_cache=use_cache,
+            )
+
+    assert isinstance(seen[0], FixtureCache)
+    assert seen[0].root == tmp_path / "cache"
+    assert seen[1] is None
@@ -1,11 +1,17 @@
+import json
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
+import pytest
 from openpyxl import Workbook
 from openpyxl.styles import Border, PatternFill, Side
 
 from excelbench.generator.generate import write_manifest
+from excelbench.harness.adapters.base import ExcelAdapter
 from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
+from excelbench.harness.adapters.openpyxl_readonly_adapter import OpenpyxlReadonlyAdapter
 from excelbench.harness.adapters.pandas_adapter import PandasAdapter
 from excelbench.harness.adapters.tablib_adapter import TablibAdapter
 from excelbench.models import Importance, Manifest
@@ -14,7 +20,19 @@ from excelbench.models import TestFile as BenchFile
 from excelbench.perf.runner import run_perf
 
 
-def test_perf_workload_cell_values_records_op_count(tmp_path: Path) -> None:
+def test_perf_workload_cell_values_records_op_count(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from excelbench.perf import runner
+
+    bootstraps: list[int] = []
+    real_bootstrap = runner._bootstrap_median_ci
+
+    def counting_bootstrap(arr: Any) -> tuple[float, float]:
+        bootstraps.append(len(arr))
+        return real_bootstrap(arr)
+
+    monkeypatch.setattr(runner, "_bootstrap_median_ci", counting_bootstrap)
     suite = tmp_path / "suite"
     suite.mkdir(parents=True, exist_ok=True)
 
@@ -81,6 +99,9 @@ def test_perf_workload_cell_values_records_op_count(tmp_path: Path) -> None:
     assert row.perf["read"].op_unit == "cells"
     assert row.perf["write"].op_count == 9
     assert row.perf["write"].op_unit == "cells"
+    assert row.perf["read"].breakdown_ms
+    # Only the headline wall/CPU stats are bootstrapped, not phase medians.
+    assert len(bootstraps) == 4
 
 
 def test_perf_workload_bg_color_records_op_count(tmp_path: Path) -> None:
@@ -412,6 +433,212 @@ def test_perf_workload_bulk_read_skips_write(tmp_path: Path) -> None:
     assert row.notes is None
 
 
+def test_perf_bulk_read_pairs_raw_iterations_for_adapter_overhead(tmp_path: Path) -> None:
+    from excelbench.perf.renderer import render_perf_results
+
+    suite = tmp_path / "suite"
+    (suite / "tier0").mkdir(parents=True)
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "S1"
+    for r in range(1, 21):
+        ws.append([r * 10 + c for c in range(10)])
+    wb.save(suite / "tier0" / "bulk_200.xlsx")
+
+    workload = {"op": "bulk_sheet_values", "operations": ["read"], "sheet": "S1", "range": "A1:J20"}
+    write_manifest(
+        Manifest(
+            generated_at=datetime.now(UTC),
+            excel_version="test",
+            generator_version="test",
+            file_format="xlsx",
+            files=[
+                BenchFile(
+                    path="tier0/bulk_200.xlsx",
+                    feature="bulk_200_bulk_read",
+                    tier=0,
+                    file_format="xlsx",
+                    test_cases=[
+                        BenchCase(
+                            id="bulk_200",
+                            label="bulk read",
+                            row=1,
+                            expected={"workload": workload},
+                            importance=Importance.BASIC,
+                        )
+                    ],
+                )
+            ],
+        ),
+        suite / "manifest.json",
+    )
+
+    unpaired = run_perf(suite, adapters=[OpenpyxlAdapter()], warmup=0, iters=1)
+    read = unpaired.results[0].perf["read"]
+    assert read is not None and read.raw_wall_ms is None
+
+    results = run_perf(
+        suite,
+        adapters=[OpenpyxlAdapter(), PandasAdapter()],
+        warmup=1,
+        iters=3,
+        breakdown=False,
+        adapter_overhead=True,
+    )
+    assert results.metadata.config.adapter_overhead
+
+    for row in results.results:
+        read = row.perf["read"]
+        assert read is not None
+        assert read.raw_wall_ms is not None and read.raw_wall_ms.n == 3
+        assert read.adapter_overhead_pct is not None
+        assert read.adapter_overhead_pct < 100.0
+
+    render_perf_results(results, tmp_path / "out")
+    csv_header = (tmp_path / "out" / "perf" / "matrix.csv").read_text().splitlines()[0]
+    assert csv_header.endswith("read_raw_p50_wall_ms,read_adapter_overhead_pct")
+    readme = (tmp_path / "out" / "perf" / "README.md").read_text()
+    assert "## Adapter Overhead (bulk read)" in readme
+
+
+def test_perf_workload_bulk_read_columnar_runs_for_every_adapter(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    (suite / "tier0").mkdir(parents=True, exist_ok=True)
+
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "S1"
+    ws["A1"] = 1
+    ws["B1"] = "x"
+    ws["A2"] = True
+    wb.save(suite / "tier0" / "00_bulk_columnar.xlsx")
+
+    workload = {
+        "scenario": "bulk_columnar",
+        "op": "bulk_sheet_values_columnar",
+        "operations": ["read"],
+        "sheet": "S1",
+        "range": "A1:B2",
+    }
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[
+            BenchFile(
+                path="tier0/00_bulk_columnar.xlsx",
+                feature="bulk_columnar",
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    BenchCase(
+                        id="bulk_columnar",
+                        label="Throughput: columnar bulk read 4 cells",
+                        row=1,
+                        expected={"workload": workload},
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        ],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+    # pandas, polars and tablib return native frames from read_sheet_values().
+    from excelbench.harness.adapters.polars_adapter import PolarsAdapter
+
+    adapters: list[ExcelAdapter] = [
+        OpenpyxlAdapter(),
+        PandasAdapter(),
+        PolarsAdapter(),
+        TablibAdapter(),
+    ]
+    results = run_perf(suite, adapters=adapters, warmup=0, iters=1)
+
+    assert len(results.results) == len(adapters)
+    for row in results.results:
+        assert row.notes is None, row.library
+        assert row.perf["read"] is not None
+        assert row.perf["read"].op_count == 4
+
+    for adapter in adapters[1:]:
+        wb = adapter.open_workbook(suite / "tier0" / "00_bulk_columnar.xlsx")
+        cols = adapter.read_sheet_values_columnar(wb, "S1", "A1:B2")
+        assert (cols.rows, cols.cols) == (2, 2), adapter.name
+        for r in range(2):
+            for c in range(2):
+                expected = adapter.read_cell_value(wb, "S1", f"{'AB'[c]}{r + 1}")
+                assert cols.cell_value(r, c) == expected, adapter.name
+        adapter.close_workbook(wb)
+
+
+def test_perf_workload_stream_rows_reports_rows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from excelbench.perf import runner
+
+    def no_cell_refs(_range: str) -> list[str]:
+        raise AssertionError("stream_rows must not build per-cell refs")
+
+    monkeypatch.setattr(runner, "_cells_from_range", no_cell_refs)
+    suite = tmp_path / "suite"
+    (suite / "tier0").mkdir(parents=True, exist_ok=True)
+
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "S1"
+    for r in range(1, 6):
+        ws.cell(row=r, column=1, value=r)
+        ws.cell(row=r, column=2, value=f"s{r}")
+    wb.save(suite / "tier0" / "00_stream.xlsx")
+
+    workload = {
+        "scenario": "stream",
+        "op": "stream_rows",
+        "operations": ["read"],
+        "sheet": "S1",
+        "range": "A1:B5",
+        "batch_size": 2,
+    }
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[
+            BenchFile(
+                path="tier0/00_stream.xlsx",
+                feature="stream",
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    BenchCase(
+                        id="stream",
+                        label="Throughput: streaming row read 5 rows",
+                        row=1,
+                        expected={"workload": workload},
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        ],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+    results = run_perf(suite, adapters=[OpenpyxlReadonlyAdapter()], warmup=0, iters=1)
+
+    row = results.results[0]
+    assert row.notes is None
+    read = row.perf["read"]
+    assert read is not None
+    assert (read.op_count, read.op_unit) == (5, "rows")
+    assert read.rss_peak_mb is not None
+
+
 def test_perf_workload_bulk_write_skips_read(tmp_path: Path) -> None:
     suite = tmp_path / "suite"
     suite.mkdir(parents=True, exist_ok=True)
@@ -652,3 +879,735 @@ def test_perf_workload_standardizes_size_and_phase_attribution(tmp_path: Path) -
     assert read_phase is not None and read_phase["parse"] > 0
     assert write_phase is not None and write_phase["write"] > 0
     assert write_phase["verify"] == 0.0
+
+
+def test_perf_parallel_jobs_merge_in_serial_order(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    (suite / "tier0").mkdir(parents=True, exist_ok=True)
+
+    files: list[BenchFile] = []
+    for name in ("bulk_a", "bulk_b"):
+        wb = Workbook()
+        ws = wb.active
+        assert ws is not None
+        ws.title = "S1"
+        ws["A1"] = 1
+        ws["B2"] = 2
+        wb.save(suite / "tier0" / f"{name}.xlsx")
+        workload = {
+            "scenario": name,
+            "op": "bulk_sheet_values",
+            "operations": ["read"],
+            "sheet": "S1",
+            "range": "A1:B2",
+        }
+        files.append(
+            BenchFile(
+                path=f"tier0/{name}.xlsx",
+                feature=name,
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    BenchCase(
+                        id=name,
+                        label=name,
+                        row=1,
+                        expected={"workload": workload},
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        )
+
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=files,
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+    results = run_perf(
+        suite,
+        adapters=[OpenpyxlAdapter(), PandasAdapter()],
+        warmup=0,
+        iters=1,
+        jobs=2,
+    )
+
+    assert results.metadata.config.jobs == 2
+    assert [(r.feature, r.library) for r in results.results] == [
+        ("bulk_a", "openpyxl"),
+        ("bulk_a", "pandas"),
+        ("bulk_b", "openpyxl"),
+        ("bulk_b", "pandas"),
+    ]
+    for row in results.results:
+        assert row.perf["read"] is not None
+        assert row.perf["read"].op_count == 4
+        assert row.notes is None
+
+
+def test_perf_rejects_non_positive_jobs(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    suite.mkdir(parents=True, exist_ok=True)
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+    with pytest.raises(ValueError, match="jobs"):
+        run_perf(suite, adapters=[OpenpyxlAdapter()], jobs=0)
+
+
+def test_perf_process_isolation_reports_baseline_and_peak_rss(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    (suite / "tier0").mkdir(parents=True, exist_ok=True)
+
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "S1"
+    ws["A1"] = 1
+    ws["B2"] = 2
+    wb.save(suite / "tier0" / "bulk_iso.xlsx")
+
+    workload = {"scenario": "bulk_iso", "op": "bulk_sheet_values", "sheet": "S1", "range": "A1:B2"}
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[
+            BenchFile(
+                path="tier0/bulk_iso.xlsx",
+                feature="bulk_iso",
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    BenchCase(
+                        id="bulk_iso",
+                        label="bulk_iso",
+                        row=1,
+                        expected={"workload": {**workload, "operations": ["read"]}},
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        ],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+    results = run_perf(
+        suite,
+        adapters=[OpenpyxlAdapter()],
+        warmup=0,
+        iters=1,
+        isolation="process",
+    )
+
+    assert results.metadata.config.isolation == "process"
+    read = results.results[0].perf["read"]
+    assert read is not None
+    assert read.op_count == 4
+    assert read.rss_baseline_mb is not None
+    assert read.rss_peak_mb is not None
+    assert read.rss_peak_mb >= read.rss_baseline_mb
+
+
+def test_run_isolated_workload_surfaces_failures_as_runtime_error(tmp_path: Path) -> None:
+    from excelbench.perf import run_isolated_workload
+
+    workload = {"scenario": "missing", "op": "bulk_sheet_values", "sheet": "S1", "range": "A1:B2"}
+    with pytest.raises(RuntimeError, match="missing input file"):
+        run_isolated_workload(
+            OpenpyxlAdapter(),
+            workload,
+            op="read",
+            input_path=tmp_path / "missing.xlsx",
+            warmup=0,
+            iters=1,
+        )
+
+    res = run_isolated_workload(
+        OpenpyxlAdapter(),
+        {"scenario": "grid", "op": "bulk_write_grid", "sheet": "S1", "range": "A1:B2"},
+        op="write",
+        warmup=0,
+        iters=1,
+        trace_python_heap=True,
+    )
+    assert res.op_count == 4
+    assert res.output_bytes is not None and res.output_bytes > 0
+    assert res.py_heap_peak_mb is not None
+
+
+def test_perf_rejects_unknown_isolation(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    suite.mkdir(parents=True, exist_ok=True)
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+    with pytest.raises(ValueError, match="isolation"):
+        run_perf(suite, adapters=[OpenpyxlAdapter()], isolation="thread")
+
+
+def _write_bulk_suite(suite: Path) -> None:
+    (suite / "tier0").mkdir(parents=True, exist_ok=True)
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "S1"
+    ws["A1"] = 1
+    ws["B2"] = 2
+    wb.save(suite / "tier0" / "bulk_adaptive.xlsx")
+
+    workload = {
+        "scenario": "bulk_adaptive",
+        "op": "bulk_sheet_values",
+        "operations": ["read"],
+        "sheet": "S1",
+        "range": "A1:B2",
+    }
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[
+            BenchFile(
+                path="tier0/bulk_adaptive.xlsx",
+                feature="bulk_adaptive",
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    BenchCase(
+                        id="bulk_adaptive",
+                        label="bulk_adaptive",
+                        row=1,
+                        expected={"workload": workload},
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        ],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+
+def test_perf_fixed_policy_records_sample_count_and_ci(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    _write_bulk_suite(suite)
+
+    results = run_perf(suite, adapters=[OpenpyxlAdapter()], warmup=0, iters=3)
+
+    assert results.metadata.config.ci_target is None
+    read = results.results[0].perf["read"]
+    assert read is not None
+    assert read.wall_ms.n == 3
+    assert read.wall_ms.ci_low is not None and read.wall_ms.ci_high is not None
+    assert read.wall_ms.ci_low <= read.wall_ms.p50 <= read.wall_ms.ci_high
+    assert read.wall_ms.cv is not None
+
+
+def test_perf_adaptive_policy_stops_once_ci_target_is_met(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    _write_bulk_suite(suite)
+
+    # A very loose target is met as soon as the minimum sample count is reached,
+    # well before the iteration cap.
+    results = run_perf(
+        suite,
+        adapters=[OpenpyxlAdapter()],
+        warmup=0,
+        iters=50,
+        iteration_policy="adaptive",
+        ci_target=1e9,
+    )
+
+    assert results.metadata.config.iteration_policy == "adaptive"
+    assert results.metadata.config.ci_target == 1e9
+    read = results.results[0].perf["read"]
+    assert read is not None
+    assert read.wall_ms.n == 5
+
+
+def test_perf_adaptive_policy_respects_time_budget(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    _write_bulk_suite(suite)
+
+    # An unreachable target with a tiny budget stops after the first sample.
+    results = run_perf(
+        suite,
+        adapters=[OpenpyxlAdapter()],
+        warmup=0,
+        iters=50,
+        iteration_policy="adaptive",
+        ci_target=1e-12,
+        time_budget_s=1e-9,
+    )
+
+    read = results.results[0].perf["read"]
+    assert read is not None
+    assert read.wall_ms.n == 1
+
+
+def test_perf_rejects_unknown_iteration_policy(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    _write_bulk_suite(suite)
+
+    with pytest.raises(ValueError, match="iteration_policy"):
+        run_perf(suite, adapters=[OpenpyxlAdapter()], iteration_policy="auto")
+    with pytest.raises(ValueError, match="ci_target"):
+        run_perf(suite, adapters=[OpenpyxlAdapter()], iteration_policy="adaptive", ci_target=0)
+
+
+def test_perf_stats_summarize_spread_and_outliers() -> None:
+    from excelbench.perf.runner import _stats
+
+    samples = [10.0, 11.0, 10.5, 10.2, 10.8, 10.1, 10.4, 50.0]
+    st = _stats(samples)
+
+    assert st.n == 8
+    assert st.max == 50.0
+    assert st.p99 == 11.0  # nearest-rank (lower), consistent with p95
+    assert st.mean == pytest.approx(sum(samples) / len(samples))
+    assert st.stddev is not None and st.stddev > 0
+    assert st.mad == pytest.approx(0.35)
+    assert st.outliers_low == 0
+    assert st.outliers_high == 1
+    assert st.boot_ci_low is not None and st.boot_ci_high is not None
+    assert st.boot_ci_low <= st.p50 <= st.boot_ci_high
+    # Seeded resampling keeps the CI reproducible.
+    assert _stats(samples).boot_ci_low == st.boot_ci_low
+
+    single = _stats([3.0])
+    assert single.stddev == 0.0
+    assert single.boot_ci_low == single.boot_ci_high == 3.0
+
+
+def test_perf_save_samples_writes_side_file(tmp_path: Path) -> None:
+    from excelbench.perf.renderer import load_perf_samples, render_perf_results
+
+    suite = tmp_path / "suite"
+    _write_bulk_suite(suite)
+
+    results = run_perf(suite, adapters=[OpenpyxlAdapter()], warmup=0, iters=3, save_samples=True)
+    render_perf_results(results, tmp_path / "out")
+
+    samples = load_perf_samples(tmp_path / "out" / "perf" / "samples.npz")
+    wall = samples[("bulk_adaptive", "openpyxl", "read", "wall_ms")]
+    assert len(wall) == 3
+    read = results.results[0].perf["read"]
+    assert read is not None
+    assert min(wall) == read.wall_ms.min
+    assert ("bulk_adaptive", "openpyxl", "read", "cpu_ms") in samples
+
+    data = json.loads((tmp_path / "out" / "perf" / "results.json").read_text())
+    assert "wall_samples_ms" not in data["results"][0]["perf"]["read"]
+    assert data["results"][0]["perf"]["read"]["wall_ms"]["p99"] is not None
+
+
+def test_perf_without_save_samples_skips_side_file(tmp_path: Path) -> None:
+    from excelbench.perf.renderer import render_perf_results
+
+    suite = tmp_path / "suite"
+    _write_bulk_suite(suite)
+
+    results = run_perf(suite, adapters=[OpenpyxlAdapter()], warmup=0, iters=1)
+    render_perf_results(results, tmp_path / "out")
+
+    assert not (tmp_path / "out" / "perf" / "samples.npz").exists()
+
+
+def _write_modify_suite(suite: Path, workloads: dict[str, dict[str, object]]) -> None:
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "S1"
+    for r in range(1, 4):
+        for c in range(1, 4):
+            ws.cell(row=r, column=c, value=r * 10 + c)
+    (suite / "tier0").mkdir(parents=True, exist_ok=True)
+    wb.save(suite / "tier0" / "grid.xlsx")
+
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[
+            BenchFile(
+                path="tier0/grid.xlsx",
+                feature=feature,
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    BenchCase(
+                        id=feature,
+                        label=feature,
+                        row=1,
+                        expected={
+                            "workload": {
+                                "scenario": feature,
+                                "operations": ["modify"],
+                                "sheet": "S1",
+                                **workload,
+                            }
+                        },
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+            for feature, workload in workloads.items()
+        ],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+
+def test_perf_modify_workloads_record_patch_count_and_input_size(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    _write_modify_suite(
+        suite,
+        {
+            "modify_patch": {"op": "modify_patch_cells", "range": "A1:B2"},
+            "modify_restyle": {"op": "modify_restyle_range", "range": "A1:C1"},
+            "modify_append": {"op": "modify_append_rows", "range": "A4:C5"},
+        },
+    )
+    input_bytes = (suite / "tier0" / "grid.xlsx").stat().st_size
+
+    results = run_perf(
+        suite,
+        adapters=[OpenpyxlAdapter(), PandasAdapter(), OpenpyxlReadonlyAdapter()],
+        warmup=0,
+        iters=1,
+        breakdown=True,
+    )
+
+    by_key = {(r.feature, r.library): r for r in results.results}
+    for feature, count in (("modify_patch", 4), ("modify_restyle", 3), ("modify_append", 6)):
+        for lib in ("openpyxl", "pandas"):
+            row = by_key[(feature, lib)]
+            assert row.perf["read"] is None
+            assert row.perf["write"] is None
+            modify = row.perf["modify"]
+            assert modify is not None, row.notes
+            assert modify.op_count == count
+            assert modify.input_bytes == input_bytes
+            assert modify.breakdown_ms is not None
+            assert set(modify.breakdown_ms) == {"open", "exercise", "save"}
+
+    readonly = by_key[("modify_patch", "openpyxl-readonly")]
+    assert readonly.perf["modify"] is None
+    assert readonly.notes == "Modify unsupported"
+
+
+def test_perf_modify_key_absent_for_read_write_workloads(tmp_path: Path) -> None:
+    suite = tmp_path / "suite"
+    _write_bulk_suite(suite)
+
+    results = run_perf(suite, adapters=[OpenpyxlAdapter()], warmup=0, iters=1)
+
+    assert set(results.results[0].perf) == {"read", "write"}
+
+
+def test_pandas_save_modified_applies_patches_and_appends_rows(tmp_path: Path) -> None:
+    from openpyxl import load_workbook
+
+    from excelbench.models import CellType, CellValue
+
+    src = tmp_path / "src.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.title = "S1"
+    ws["A1"] = 1
+    ws["B1"] = 2
+    wb.save(src)
+
+    adapter = PandasAdapter()
+    handle = adapter.open_for_modify(src)
+    adapter.write_cell_value(handle, "S1", "B1", CellValue(type=CellType.NUMBER, value=20))
+    adapter.write_cell_value(handle, "S1", "C3", CellValue(type=CellType.STRING, value="new"))
+    out = tmp_path / "out.xlsx"
+    adapter.save_modified(handle, out)
+
+    ws_out = load_workbook(out)["S1"]
+    assert ws_out["A1"].value == 1
+    assert ws_out["B1"].value == 20
+    assert ws_out["C3"].value == "new"
+
+
+def test_perf_stream_write_rows_uses_streaming_workbook(tmp_path: Path) -> None:
+    from excelbench.harness.adapters.xlsxwriter_constmem_adapter import (
+        XlsxwriterConstmemAdapter,
+    )
+
+    suite = tmp_path / "suite"
+    (suite / "tier0").mkdir(parents=True, exist_ok=True)
+    workload = {
+        "scenario": "stream_write_12",
+        "op": "stream_write_rows",
+        "operations": ["write"],
+        "sheet": "S1",
+        "range": "A1:C4",
+        "start": 1,
+        "step": 1,
+        "sparse_every": 2,
+    }
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[
+            BenchFile(
+                path="tier0/does_not_matter.xlsx",
+                feature="stream_write_12",
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    BenchCase(
+                        id="stream_write_12",
+                        label="Throughput: streaming row write",
+                        row=1,
+                        expected={"workload": workload},
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        ],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+    results = run_perf(
+        suite,
+        adapters=[OpenpyxlAdapter(), XlsxwriterConstmemAdapter(), PandasAdapter()],
+        warmup=0,
+        iters=1,
+        breakdown=False,
+    )
+
+    assert len(results.results) == 3
+    for row in results.results:
+        assert row.perf["read"] is None
+        assert row.perf["write"] is not None, row.notes
+        # sparse_every=2 over 12 cells fills indices 0,2,...,10 => 6 cells.
+        assert row.perf["write"].op_count == 6
+        assert row.perf["write"].op_unit == "cells"
+
+
+@pytest.mark.parametrize(
+    "adapter_name", ["openpyxl", "xlsxwriter", "xlsxwriter-constmem", "pandas"]
+)
+def test_append_rows_writes_generator_from_a1(tmp_path: Path, adapter_name: str) -> None:
+    from openpyxl import load_workbook
+
+    from excelbench.harness.adapters.xlsxwriter_adapter import XlsxwriterAdapter
+    from excelbench.harness.adapters.xlsxwriter_constmem_adapter import (
+        XlsxwriterConstmemAdapter,
+    )
+
+    adapters: dict[str, ExcelAdapter] = {
+        "openpyxl": OpenpyxlAdapter(),
+        "xlsxwriter": XlsxwriterAdapter(),
+        "xlsxwriter-constmem": XlsxwriterConstmemAdapter(),
+        "pandas": PandasAdapter(),
+    }
+    adapter = adapters[adapter_name]
+    consumed: list[int] = []
+
+    def rows() -> Iterator[list[object]]:
+        for r in range(3):
+            consumed.append(r)
+            yield [r * 10 + 1, None if r == 1 else f"s{r}", r * 10 + 3]
+
+    wb = adapter.create_streaming_workbook()
+    adapter.add_sheet(wb, "S1")
+    adapter.append_rows(wb, "S1", rows())
+    out = tmp_path / "out.xlsx"
+    adapter.save_workbook(wb, out)
+
+    assert consumed == [0, 1, 2]
+    ws = load_workbook(out)["S1"]
+    assert [[c.value for c in row] for row in ws.iter_rows(min_row=1, max_row=3, max_col=3)] == [
+        [1, "s0", 3],
+        [11, None, 13],
+        [21, "s2", 23],
+    ]
+
+
+def test_xlsxwriter_constmem_saves_bulk_grid(tmp_path: Path) -> None:
+    from openpyxl import load_workbook
+
+    from excelbench.harness.adapters.xlsxwriter_constmem_adapter import (
+        XlsxwriterConstmemAdapter,
+    )
+
+    adapter = XlsxwriterConstmemAdapter()
+    wb = adapter.create_workbook()
+    adapter.add_sheet(wb, "S1")
+    adapter.write_sheet_values(wb, "S1", "B2", [[1, 2], [3, 4]])
+    out = tmp_path / "out.xlsx"
+    adapter.save_workbook(wb, out)
+
+    ws = load_workbook(out)["S1"]
+    assert [ws["B2"].value, ws["C2"].value, ws["B3"].value, ws["C3"].value] == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize(
+    "workload",
+    [
+        {"range": "A1:J7", "start": 5, "step": 2, "sparse_every": 3},
+        {"range": "B2:E6", "value_type": "string", "string_length": 6, "sparse_every": 4},
+        {
+            "range": "A1:D4",
+            "value_type": "string",
+            "string_mode": "repeated",
+            "string_value": "abc",
+            "string_length": 5,
+        },
+    ],
+)
+def test_prebuilt_grid_matches_row_generator(workload: dict[str, object]) -> None:
+    from excelbench.perf.runner import _build_workload_grid, _iter_workload_rows
+
+    assert _build_workload_grid(workload) == list(_iter_workload_rows(workload))
+
+
+def test_perf_bulk_write_reports_harness_setup_and_reuses_grid(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    suite = tmp_path / "suite"
+    (suite / "tier0").mkdir(parents=True, exist_ok=True)
+    workload = {
+        "scenario": "bulk_write_prebuilt",
+        "op": "bulk_write_grid",
+        "operations": ["write"],
+        "sheet": "S1",
+        "range": "A1:C3",
+    }
+    manifest = Manifest(
+        generated_at=datetime.now(UTC),
+        excel_version="test",
+        generator_version="test",
+        file_format="xlsx",
+        files=[
+            BenchFile(
+                path="tier0/does_not_matter.xlsx",
+                feature="bulk_write_prebuilt",
+                tier=0,
+                file_format="xlsx",
+                test_cases=[
+                    BenchCase(
+                        id="bulk_write_prebuilt",
+                        label="bulk_write_prebuilt",
+                        row=1,
+                        expected={"workload": workload},
+                        importance=Importance.BASIC,
+                    )
+                ],
+            )
+        ],
+    )
+    write_manifest(manifest, suite / "manifest.json")
+
+    grids: list[int] = []
+    adapter = OpenpyxlAdapter()
+    original = adapter.write_sheet_values
+
+    def spy(wb: Workbook, sheet: str, start: str, values: list[list[object]]) -> None:
+        grids.append(id(values))
+        original(wb, sheet, start, values)
+
+    monkeypatch.setattr(adapter, "write_sheet_values", spy)
+    results = run_perf(suite, adapters=[adapter], warmup=1, iters=2)
+
+    write = results.results[0].perf["write"]
+    assert write is not None
+    assert write.op_count == 9
+    assert write.harness_setup_ms is not None and write.harness_setup_ms >= 0
+    # Warmup and timed iterations all receive the same pre-built grid object.
+    assert len(grids) == 3 and len(set(grids)) == 1
+
+    # A second adapter in the same run reuses the grid and reports no setup
+    # cost; the cache does not outlive the run_perf() call.
+    from excelbench.perf import runner
+
+    grids.clear()
+    results = run_perf(suite, adapters=[adapter, OpenpyxlAdapter()], warmup=0, iters=1)
+    setup = [r.perf["write"].harness_setup_ms for r in results.results if r.perf["write"]]
+    assert setup[0] is not None and setup[0] >= 0 and setup[1] == 0.0
+    assert runner._grid_cache is None
+
+
+def test_bench_op_builds_inputs_before_memory_baseline(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from excelbench.perf import runner
+
+    src = tmp_path / "src.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws.append(["a", 1.5])
+    ws.append([True, None])
+    wb.save(src)
+
+    def no_cell_refs(_range: str) -> list[str]:
+        raise AssertionError("bulk ops must not build per-cell refs")
+
+    monkeypatch.setattr(runner, "_cells_from_range", no_cell_refs)
+    events: list[str] = []
+    adapter = OpenpyxlAdapter()
+    written: list[list[list[object]]] = []
+    original = adapter.write_sheet_values
+
+    def spy(wb: Workbook, sheet: str, start: str, values: list[list[object]]) -> None:
+        events.append("write")
+        written.append(values)
+        original(wb, sheet, start, values)
+
+    monkeypatch.setattr(adapter, "write_sheet_values", spy)
+    workload = {
+        "scenario": "from_fixture",
+        "op": "bulk_write_grid",
+        "operations": ["write"],
+        "sheet": "S1",
+        "range": "A1:B2",
+        "values_from": str(src),
+    }
+    test_file = BenchFile(
+        path="from_fixture.xlsx",
+        feature="from_fixture",
+        tier=0,
+        test_cases=[
+            BenchCase(id="w", label="w", row=1, expected={"workload": workload}),
+        ],
+    )
+    res, note = runner._bench_op(
+        adapter=adapter,
+        test_file=test_file,
+        test_dir=tmp_path,
+        op="write",
+        warmup=0,
+        iters=2,
+        breakdown=False,
+        on_ready=lambda: events.append("ready"),
+    )
+
+    assert note is None and res is not None
+    assert events == ["ready", "write", "write"]
+    assert written[0] == [["a", 1.5], [True, None]]
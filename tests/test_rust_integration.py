@@ -81,6 +81,42 @@ def test_rust_calamine_datetime_semantics() -> None:
         path.unlink(missing_ok=True)
 
 
+def test_rust_calamine_bulk_read_matches_per_cell() -> None:
+    rust = pytest.importorskip("wolfxl._rust")
+    enabled = _enabled_backends(rust)
+    if "calamine" not in enabled:
+        pytest.skip("wolfxl._rust compiled without calamine backend")
+
+    from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
+    from excelbench.harness.adapters.rust_calamine_adapter import RustCalamineAdapter
+    from excelbench.models import CellType, CellValue
+
+    f = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
+    path = Path(f.name)
+    f.close()
+    try:
+        openpyxl = OpenpyxlAdapter()
+        wb = openpyxl.create_workbook()
+        openpyxl.add_sheet(wb, "S")
+        openpyxl.write_cell_value(wb, "S", "A1", CellValue(type=CellType.NUMBER, value=1))
+        openpyxl.write_cell_value(wb, "S", "B1", CellValue(type=CellType.STRING, value="x"))
+        openpyxl.write_cell_value(wb, "S", "B2", CellValue(type=CellType.BOOLEAN, value=True))
+        openpyxl.save_workbook(wb, path)
+
+        adapter = RustCalamineAdapter()
+        wb2 = adapter.open_workbook(path)
+        grid = adapter.read_sheet_values(wb2, "S", "A1:B2")
+        assert [[c.type for c in row] for row in grid] == [
+            [CellType.NUMBER, CellType.STRING],
+            [CellType.BLANK, CellType.BOOLEAN],
+        ]
+        for r, row in enumerate(grid, start=1):
+            for c, cell in zip("AB", row):
+                assert cell == adapter.read_cell_value(wb2, "S", f"{c}{r}")
+    finally:
+        path.unlink(missing_ok=True)
+
+
 def test_rust_xlsxwriter_preserves_sheet_insertion_order() -> None:
     rust = pytest.importorskip("wolfxl._rust")
     enabled = _enabled_backends(rust)
@@ -343,6 +379,52 @@ def test_rust_xlsxwriter_writes_font_and_bg_color() -> None:
         path.unlink(missing_ok=True)
 
 
+def test_rust_xlsxwriter_shared_styles_roundtrip() -> None:
+    """Cells sharing interned styles keep their own format, border and date format."""
+    _skip_unless_rust_xlsxwriter()
+
+    import openpyxl
+
+    from excelbench.harness.adapters.rust_xlsxwriter_adapter import RustXlsxWriterAdapter
+    from excelbench.models import CellType, CellValue
+
+    palette = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00"]
+    f = tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False)
+    path = Path(f.name)
+    f.close()
+    try:
+        adapter = RustXlsxWriterAdapter()
+        wb = adapter.create_workbook()
+        adapter.add_sheet(wb, "S")
+        for r in range(1, 41):
+            cell = f"A{r}"
+            adapter.write_cell_value(wb, "S", cell, CellValue(type=CellType.NUMBER, value=r))
+            adapter.write_cell_format(wb, "S", cell, CellFormat(bg_color=palette[r % 4]))
+            if r % 2 == 0:
+                adapter.write_cell_border(
+                    wb, "S", cell, BorderInfo(top=BorderEdge(style=BorderStyle.THIN))
+                )
+        adapter.write_cell_value(
+            wb, "S", "B1", CellValue(type=CellType.DATE, value=date(2024, 1, 2))
+        )
+        adapter.write_cell_format(wb, "S", "B1", CellFormat(bg_color=palette[1]))
+        adapter.save_workbook(wb, path)
+
+        wb2 = openpyxl.load_workbook(str(path))
+        ws = wb2["S"]
+        for r in range(1, 41):
+            c = ws[f"A{r}"]
+            assert c.fill.fgColor.rgb == "FF" + palette[r % 4][1:]
+            assert (c.border.top.style == "thin") is (r % 2 == 0)
+        # Same bg as A1 but still picks up the default date number format.
+        assert ws["B1"].fill.fgColor.rgb == ws["A1"].fill.fgColor.rgb
+        assert ws["B1"].number_format == "yyyy-mm-dd"
+        assert ws["A1"].number_format == "General"
+        wb2.close()
+    finally:
+        path.unlink(missing_ok=True)
+
+
 def test_rust_xlsxwriter_writes_borders() -> None:
     """Write borders via rust_xlsxwriter, verify with openpyxl."""
     _skip_unless_rust_xlsxwriter()
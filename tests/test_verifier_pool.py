@@ -0,0 +1,81 @@
+import sys
+import types
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from excelbench.harness import verifier_pool
+from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
+from excelbench.harness.runner import get_write_verifier_for_adapter, run_benchmark
+
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures" / "excel"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pool() -> Iterator[None]:
+    verifier_pool.shutdown()
+    yield
+    verifier_pool.shutdown()
+
+
+def test_verifiers_are_shared_per_process(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("EXCELBENCH_WRITE_ORACLE", "openpyxl")
+    xlsx, xls = MagicMock(output_extension=".xlsx"), MagicMock(output_extension=".xls")
+
+    first = get_write_verifier_for_adapter(xlsx, "cell_values")
+    assert get_write_verifier_for_adapter(xlsx, "borders") is first
+    assert isinstance(first, OpenpyxlAdapter)
+    xlrd = get_write_verifier_for_adapter(xls, "cell_values")
+    assert xlrd.name == "xlrd"
+    assert get_write_verifier_for_adapter(xls, "borders") is xlrd
+
+
+def test_excel_probe_runs_once_and_keeps_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    apps: list[Any] = []
+
+    def make_app(**_kwargs: Any) -> Any:
+        app = MagicMock()
+        apps.append(app)
+        return app
+
+    monkeypatch.setitem(sys.modules, "xlwings", types.SimpleNamespace(App=make_app))
+
+    assert verifier_pool.excel_available()
+    assert verifier_pool.excel_available()
+    (app,) = apps
+    quit_app = app.quit
+    assert verifier_pool.excel_app() is app
+
+    verifier_pool.shutdown()
+    quit_app.assert_called_once()
+
+
+def test_missing_excel_is_probed_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+
+    def no_excel(**_kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        raise OSError("Excel not installed")
+
+    monkeypatch.setitem(sys.modules, "xlwings", types.SimpleNamespace(App=no_excel))
+
+    assert not verifier_pool.excel_available()
+    assert not verifier_pool.excel_available()
+    assert calls == 1
+
+
+def test_run_benchmark_reports_verification_share(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("EXCELBENCH_WRITE_ORACLE", "openpyxl")
+    before = verifier_pool.verification_stats()
+
+    results = run_benchmark(FIXTURES_DIR, adapters=[OpenpyxlAdapter()], features=["cell_values"])
+
+    after = verifier_pool.verification_stats()
+    assert after.workbooks == before.workbooks + 1
+    meta = results.metadata
+    assert meta.fidelity_s is not None and meta.verify_s is not None
+    assert 0 < meta.verify_s <= meta.fidelity_s
@@ -0,0 +1,100 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+from openpyxl import Workbook
+
+from excelbench.harness import runner
+from excelbench.harness.adapters.openpyxl_adapter import OpenpyxlAdapter
+from excelbench.harness.verify_cache import VerificationCache, output_content_hash
+from excelbench.models import OperationType, TestCase, TestFile
+
+
+class _CountingVerifier(OpenpyxlAdapter):
+    def __init__(self) -> None:
+        self.opens = 0
+
+    def open_workbook(self, path: Path) -> Any:
+        self.opens += 1
+        return super().open_workbook(path)
+
+
+def _cell_values_file() -> TestFile:
+    return TestFile(
+        path="tier1/01_cell_values.xlsx",
+        feature="cell_values",
+        tier=1,
+        test_cases=[
+            TestCase(
+                id="string",
+                label="String value",
+                row=2,
+                expected={"type": "string", "value": "hello"},
+                sheet="cell_values",
+                cell="B2",
+            ),
+            TestCase(
+                id="number",
+                label="Number value",
+                row=3,
+                expected={"type": "number", "value": 42},
+                sheet="cell_values",
+                cell="B3",
+            ),
+        ],
+    )
+
+
+def test_output_content_hash_ignores_save_timestamps(tmp_path: Path) -> None:
+    paths = []
+    for i, modified in enumerate([datetime(2024, 1, 1), datetime(2025, 6, 1, 12, 30)]):
+        wb = Workbook()
+        ws = wb.active
+        assert ws is not None
+        ws["A1"] = "same"
+        wb.properties.created = modified
+        wb.properties.modified = modified
+        path = tmp_path / f"out{i}.xlsx"
+        wb.save(path)
+        paths.append(path)
+    assert output_content_hash(paths[0]) == output_content_hash(paths[1])
+
+    wb = Workbook()
+    ws = wb.active
+    assert ws is not None
+    ws["A1"] = "different"
+    wb.save(tmp_path / "other.xlsx")
+    assert output_content_hash(tmp_path / "other.xlsx") != output_content_hash(paths[0])
+
+
+def test_write_reuses_cached_verification(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    verifier = _CountingVerifier()
+    monkeypatch.setattr(runner, "get_write_verifier_for_adapter", lambda _a, _f: verifier)
+    cache = VerificationCache(tmp_path / "cache")
+    test_file = _cell_values_file()
+
+    first = runner.test_write(OpenpyxlAdapter(), test_file, tmp_path / "in.xlsx", cache)
+    assert (cache.hits, cache.misses, verifier.opens) == (0, 1, 1)
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    second = runner.test_write(OpenpyxlAdapter(), test_file, tmp_path / "in.xlsx", cache)
+    assert (cache.hits, cache.misses, verifier.opens) == (1, 1, 1)
+    assert second == first
+    assert all(r.operation == OperationType.WRITE and r.passed for r in second)
+
+    # Same output bytes, but a changed manifest entry invalidates the entry.
+    test_file.test_cases[1].label = "Integer value"
+    third = runner.test_write(OpenpyxlAdapter(), test_file, tmp_path / "in.xlsx", cache)
+    assert (cache.hits, cache.misses, verifier.opens) == (1, 2, 2)
+    assert third[1].label == "Integer value"
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path) -> None:
+    cache = VerificationCache(tmp_path)
+    key = "0" * 64
+    (tmp_path / f"{key}.json").write_text("{not json")
+
+    assert cache.lookup(key) is None
+    assert cache.misses == 1
+    assert not (tmp_path / f"{key}.json").exists()
@@ -631,3 +631,27 @@ class TestXlrdInfo:
 
     def test_supported_extensions(self, xlrd: XlrdAdapter) -> None:
         assert ".xls" in xlrd.supported_read_extensions
+
+
+def test_xlrd_bulk_read_matches_per_cell_reads(
+    xlwt: XlwtAdapter, xlrd: XlrdAdapter, tmp_path: Path
+) -> None:
+    path = tmp_path / "bulk.xls"
+    wb = xlwt.create_workbook()
+    xlwt.add_sheet(wb, "S1")
+    xlwt.write_cell_value(wb, "S1", "A1", CellValue(type=CellType.STRING, value="hello"))
+    xlwt.write_cell_value(wb, "S1", "B1", CellValue(type=CellType.NUMBER, value=42.5))
+    xlwt.write_cell_value(wb, "S1", "A2", CellValue(type=CellType.BOOLEAN, value=True))
+    xlwt.write_cell_value(wb, "S1", "B2", CellValue(type=CellType.DATE, value=date(2024, 6, 15)))
+    xlwt.save_workbook(wb, path)
+
+    book = xlrd.open_workbook(path)
+    raw = xlrd.read_sheet_values_raw(book, "S1", "A1:C3")
+    wrapped = xlrd.read_sheet_values(book, "S1", "A1:C3")
+
+    assert [len(row) for row in raw] == [3, 3, 3]
+    assert raw[2] == [None, None, None]
+    assert wrapped == [
+        [xlrd.read_cell_value(book, "S1", f"{col}{r}") for col in "ABC"] for r in (1, 2, 3)
+    ]
+    xlrd.close_workbook(book)